@@ -0,0 +1,6 @@
+"""
+모범 답안(standalone/)·학습자 제출물 규모별 벤치마크
+
+- workloads: 대상별 합성 워크로드 생성기 (seed 고정)
+- runner: 실행 + 처리량/지연 시간 백분위/최대 메모리 측정, JSON 이력 누적 (python -m benchmarks.runner)
+"""
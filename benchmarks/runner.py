@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+규모별 벤치마크 실행기
+
+대상 스크립트(모범 답안 또는 학습자 제출물)를 규모 10^3~10^6의 합성 워크로드
+(benchmarks.workloads)로 실행하고 처리량·지연 시간 백분위·최대 메모리를 JSON 이력 파일에 누적.
+
+- 실행: core.sandbox.run (벽시계 시간 + wait4 CPU 시간/최대 RSS)
+- 지연 시간: REPL 대상은 core/clock_shim의 명령별 처리 시간 기록(GRADER_LATENCY_FILE),
+  batch 대상은 반복 실행별 전체 소요 시간
+- 처리량: 처리 단위 수(명령/입력 행) ÷ 벽시계 시간 (인터프리터 기동 포함)
+
+사용 예:
+    python -m benchmarks.runner --target mini_redis
+    python -m benchmarks.runner --target mini_redis --solution sample_submissions/ds_level1_mission01/cli.py \\
+        --label sample --scales 1000,100000
+    python -m benchmarks.runner --compare --target mini_redis
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from array import array
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from benchmarks.workloads import REPL, TARGETS, Target, build_workload  # noqa: E402
+from core import sandbox  # noqa: E402
+from core.async_repl import SHIM_DIR  # noqa: E402
+
+DEFAULT_SCALES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+DEFAULT_HISTORY = os.path.join(_ROOT, "benchmarks", "history.json")
+DEFAULT_TIMEOUT = 600.0
+PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class BenchmarkRecord:
+    """
+    규모 1개 벤치마크 결과 (이력 파일의 항목 1개)
+
+    Attributes:
+        target: 대상 이름 (benchmarks.workloads.TARGETS)
+        label: 비교용 이름 (예: "reference", 학습자 ID)
+        solution: 실행한 스크립트 경로
+        scale: 워크로드 규모
+        ops: 처리 단위 수
+        repeats: 반복 실행 수
+        wall_time: 벽시계 시간 중앙값 (초)
+        cpu_time: CPU 시간 중앙값 (초)
+        throughput: ops / wall_time (초당)
+        latency_ms: 지연 시간 백분위 (ms, "p50"/"p90"/"p99"/"max")
+        latency_source: "command"(REPL 명령별) 또는 "run"(실행 1회 전체)
+        peak_rss_kb: 최대 상주 메모리 최댓값 (KB)
+        error: 실패 사유 (시간 초과, 비정상 종료)
+    """
+    target: str
+    label: str
+    solution: str
+    scale: int
+    ops: int
+    repeats: int
+    wall_time: Optional[float] = None
+    cpu_time: Optional[float] = None
+    throughput: Optional[float] = None
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    latency_source: str = "run"
+    peak_rss_kb: Optional[int] = None
+    error: Optional[str] = None
+    recorded_at: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    python: str = field(default_factory=platform.python_version)
+    machine: str = field(default_factory=platform.node)
+
+
+def percentiles(values: Sequence[float], points: Sequence[int] = PERCENTILES) -> Dict[str, float]:
+    """nearest-rank 백분위 + 최댓값 (값이 없으면 빈 딕셔너리)"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    result = {}
+    for point in points:
+        rank = max(1, -(-point * len(ordered) // 100))  # ceil(p/100 · n)
+        result[f"p{point}"] = ordered[rank - 1]
+    result["max"] = ordered[-1]
+    return result
+
+
+def _median(values: Sequence[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def _read_latencies(path: str) -> List[float]:
+    """명령별 처리 시간(ms) — 연속한 stdin 읽기 시각의 차이"""
+    stamps = array("q")
+    try:
+        with open(path, "rb") as f:
+            stamps.frombytes(f.read())
+    except OSError:
+        return []
+    return [(later - earlier) / 1e6 for earlier, later in zip(stamps, stamps[1:])]
+
+
+def run_benchmark(target: Target, scale: int, solution: Optional[str] = None,
+                  label: str = "reference", repeats: int = 3, seed: int = 0,
+                  timeout: float = DEFAULT_TIMEOUT) -> BenchmarkRecord:
+    """
+    대상 스크립트를 규모 scale 워크로드로 repeats회 실행
+
+    Args:
+        target: 벤치마크 대상
+        scale: 워크로드 규모
+        solution: 실행할 스크립트 (None이면 모범 답안)
+        label: 비교용 이름
+        repeats: 반복 실행 수 (시간은 중앙값, 메모리는 최댓값)
+        seed: 워크로드 seed (같은 seed면 같은 입력)
+        timeout: 실행 1회 벽시계 제한 (초)
+
+    Returns:
+        BenchmarkRecord (실패 시 error 기록)
+    """
+    script = os.path.abspath(solution or target.reference)
+    with tempfile.TemporaryDirectory(prefix="bench_") as workdir:
+        workload = build_workload(target, scale, workdir, seed)
+        record = BenchmarkRecord(target=target.name, label=label, solution=script,
+                                 scale=scale, ops=workload.ops, repeats=repeats)
+        stdin = "\n".join(workload.commands + ["exit"]) + "\n" if target.kind == REPL else None
+        latency_file = os.path.join(workdir, "latency.bin")
+        env = _latency_env(latency_file) if target.kind == REPL else None
+
+        walls: List[float] = []
+        cpus: List[float] = []
+        latencies: List[float] = []
+        peak_rss = 0
+        for _ in range(repeats):
+            for path in workload.outputs:
+                if os.path.exists(path):
+                    os.remove(path)
+            start = time.perf_counter()
+            try:
+                proc = sandbox.run([sys.executable, script] + workload.args, input=stdin,
+                                   cwd=os.path.dirname(script), timeout=timeout, env=env)
+            except subprocess.TimeoutExpired:
+                record.error = f"{timeout:g}초 제한 시간 초과"
+                return record
+            walls.append(time.perf_counter() - start)
+            if proc.returncode != 0:
+                last_line = (proc.stderr.strip().splitlines() or [""])[-1]
+                record.error = f"비정상 종료 (종료 코드 {proc.returncode}) {last_line}".strip()
+                return record
+            if proc.usage is not None:
+                cpus.append(proc.usage.cpu_time)
+                peak_rss = max(peak_rss, proc.usage.max_rss_kb)
+            if env is not None:
+                latencies.extend(_read_latencies(latency_file))
+
+    record.wall_time = round(_median(walls), 4)
+    record.cpu_time = round(_median(cpus), 4) if cpus else None
+    record.throughput = round(record.ops / record.wall_time, 1) if record.wall_time else None
+    record.peak_rss_kb = peak_rss or None
+    if latencies:
+        record.latency_source = "command"
+        samples = latencies
+    else:
+        samples = [wall * 1000 for wall in walls]
+    record.latency_ms = {key: round(value, 4) for key, value in percentiles(samples).items()}
+    return record
+
+
+def _latency_env(latency_file: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    paths = [SHIM_DIR] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    env["PYTHONPATH"] = os.pathsep.join(paths)
+    env["GRADER_LATENCY_FILE"] = latency_file
+    return env
+
+
+# -- 이력 파일 --
+
+def load_history(path: str) -> List[Dict[str, Any]]:
+    """이력 파일의 기록 목록 (없거나 손상되면 빈 목록)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return data.get("records", []) if isinstance(data, dict) else []
+
+
+def append_history(path: str, records: Sequence[BenchmarkRecord]) -> None:
+    """이력 파일에 기록 추가 (임시 파일에 쓴 뒤 교체)"""
+    history = load_history(path) + [asdict(record) for record in records]
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"records": history}, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def format_table(records: Sequence[Dict[str, Any]]) -> str:
+    """대상·규모별로 label을 나란히 비교하는 표 (라벨별 최신 기록)"""
+    latest: Dict[tuple, Dict[str, Any]] = {}
+    for record in records:
+        latest[(record["target"], record["scale"], record["label"])] = record
+
+    lines = [f"{'target':<16} {'scale':>8} {'label':<14} {'ops/s':>12} "
+             f"{'p50 ms':>9} {'p99 ms':>9} {'peak MB':>8}"]
+    for (target, scale, label), record in sorted(latest.items()):
+        if record.get("error"):
+            lines.append(f"{target:<16} {scale:>8} {label:<14} {record['error']}")
+            continue
+        latency = record.get("latency_ms") or {}
+        rss = record.get("peak_rss_kb")
+        lines.append(
+            f"{target:<16} {scale:>8} {label:<14} {record.get('throughput') or 0:>12,.0f} "
+            f"{latency.get('p50', 0):>9.3f} {latency.get('p99', 0):>9.3f} "
+            f"{(rss or 0) / 1024:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="모범 답안/학습자 제출물 규모별 벤치마크")
+    parser.add_argument("--target", action="append", choices=sorted(TARGETS),
+                        help="벤치마크 대상 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--solution", default=None,
+                        help="실행할 스크립트 경로 (기본: standalone/의 모범 답안, --target 1개일 때만)")
+    parser.add_argument("--label", default="reference", help="이력에 남길 비교용 이름")
+    parser.add_argument("--scales", default=",".join(str(s) for s in DEFAULT_SCALES),
+                        help="쉼표로 구분한 규모 목록 (기본: 1000,10000,100000,1000000)")
+    parser.add_argument("--repeats", type=int, default=3, help="규모별 반복 실행 수")
+    parser.add_argument("--seed", type=int, default=0, help="워크로드 seed")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="실행 1회 벽시계 제한 (초)")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON 이력 파일 경로")
+    parser.add_argument("--compare", action="store_true",
+                        help="실행하지 않고 이력 파일의 최신 기록을 label별로 비교 출력")
+    args = parser.parse_args(argv)
+
+    targets = [TARGETS[name] for name in (args.target or sorted(TARGETS))]
+    if args.compare:
+        names = {target.name for target in targets}
+        print(format_table([r for r in load_history(args.history) if r["target"] in names]))
+        return 0
+    if args.solution and len(targets) != 1:
+        parser.error("--solution은 --target 1개와 함께 지정하세요")
+
+    scales = [int(float(value)) for value in args.scales.split(",") if value.strip()]
+    records = []
+    for target in targets:
+        for scale in scales:
+            record = run_benchmark(target, scale, solution=args.solution, label=args.label,
+                                   repeats=args.repeats, seed=args.seed, timeout=args.timeout)
+            records.append(record)
+            status = record.error or (f"{record.throughput:,.0f} ops/s, "
+                                      f"p99 {record.latency_ms.get('p99', 0):.3f}ms, "
+                                      f"peak {(record.peak_rss_kb or 0) / 1024:.1f}MB")
+            print(f"[{target.name} n={scale}] {status}")
+            # 긴 실행 중 중단되어도 끝난 규모까지는 남도록 규모마다 저장
+            append_history(args.history, [record])
+
+    print()
+    print(format_table([asdict(record) for record in records]))
+    return 1 if any(record.error for record in records) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""
+벤치마크용 합성 워크로드 생성기
+
+대상(target)마다 규모 scale(명령 수 또는 입력 행 수)의 입력을 seed로 결정적으로 생성.
+모범 답안(standalone/)과 학습자 제출물은 같은 CLI 규약(REPL stdin / 명령행 인자)을 따르므로
+같은 워크로드를 그대로 실행해 같은 축에서 비교할 수 있음
+
+- repl: 명령 목록을 stdin으로 일괄 전달 (mini_redis, mini_git)
+- batch: 작업 디렉토리에 입력 파일을 쓰고 명령행 인자로 실행 (commit_analyzer, log_analyzer, auditor)
+"""
+import csv
+import os
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from plugins.db.validators._synthetic import generate_repository
+
+REPL = "repl"
+BATCH = "batch"
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class Workload:
+    """
+    생성된 워크로드 1건
+
+    Attributes:
+        ops: 처리 단위 수 (REPL 명령 수 또는 입력 행 수) — 처리량 계산 기준
+        args: 스크립트 뒤에 붙일 명령행 인자
+        commands: REPL에 보낼 명령 목록 (batch면 빈 목록)
+        outputs: 스크립트가 만드는 파일 (반복 실행 전마다 삭제 — 기존 DB에 이어 쓰지 않도록)
+    """
+    ops: int
+    args: List[str] = field(default_factory=list)
+    commands: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Target:
+    """
+    벤치마크 대상
+
+    Attributes:
+        name: 대상 이름
+        kind: REPL 또는 BATCH
+        reference: 모범 답안 스크립트 경로
+        build: (scale, 작업 디렉토리, rng) → Workload
+    """
+    name: str
+    kind: str
+    reference: str
+    build: Callable[[int, str, random.Random], Workload]
+
+
+def build_workload(target: Target, scale: int, workdir: str, seed: int = 0) -> Workload:
+    """target의 규모 scale 워크로드 생성 (같은 seed면 같은 입력)"""
+    return target.build(scale, workdir, random.Random(f"{target.name}:{scale}:{seed}"))
+
+
+# -- mini_redis (DS) --
+
+def _redis_workload(scale: int, workdir: str, rng: random.Random) -> Workload:
+    """키 공간 scale/2, maxmemory scale/4 — SET/GET 위주에 제거·TTL 명령 혼합"""
+    key_space = max(scale // 2, 1)
+    commands = [f"CONFIG SET maxmemory {max(scale // 4, 1)}"]
+    for i in range(scale - 1):
+        key = f"key:{rng.randrange(key_space)}"
+        roll = rng.random()
+        if roll < 0.45:
+            commands.append(f"SET {key} value{i}")
+        elif roll < 0.85:
+            commands.append(f"GET {key}")
+        elif roll < 0.90:
+            commands.append(f"EXISTS {key}")
+        elif roll < 0.95:
+            commands.append(f"DEL {key}")
+        elif roll < 0.98:
+            commands.append(f"EXPIRE {key} 3600")
+        else:
+            commands.append(f"TTL {key}")
+    return Workload(ops=len(commands), commands=commands)
+
+
+# -- mini_git (Algo) --
+
+def _git_workload(scale: int, workdir: str, rng: random.Random) -> Workload:
+    """
+    COMMIT 위주 + 고유 토큰 SEARCH + BRANCH/SWITCH
+
+    결과가 커밋 수에 비례하는 명령(LOG, 작성자 SEARCH, ANCESTORS)은 출력 비용이
+    자료구조 비용을 가리므로 제외
+    """
+    commands = ["INIT bench"]
+    branches = ["main"]
+    commits = 0
+    for i in range(scale - 1):
+        roll = rng.random()
+        if roll < 0.80 or commits == 0:
+            commands.append(f'COMMIT "update module{rng.randrange(100)} t{i}"')
+            commits += 1
+        elif roll < 0.95:
+            commands.append(f'SEARCH "t{rng.randrange(i)}"')
+        elif roll < 0.975:
+            branches.append(f"b{i}")
+            commands.append(f"BRANCH b{i}")
+        else:
+            commands.append(f"SWITCH {rng.choice(branches)}")
+    return Workload(ops=len(commands), commands=commands)
+
+
+# -- commit_analyzer (DB) --
+
+def _write_csv(path: str, header: List[str], rows) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def _db_workload(scale: int, workdir: str, rng: random.Random) -> Workload:
+    """
+    커밋 scale개 합성 저장소 (plugins.db.validators._synthetic — DB 미션 성능 등급과 같은 생성기)
+
+    커밋이 없는 작성자·자체 커밋이 없는 브랜치·root commit 2개를 포함하여
+    LEFT JOIN/재귀 쿼리 경로도 실제로 실행되게 함
+    """
+    data_dir = os.path.join(workdir, "data")
+    expected = generate_repository(data_dir, scale, seed=rng.randrange(2 ** 32))
+    report_path = os.path.join(workdir, "report.txt")
+    db_path = os.path.join(workdir, "analysis.db")
+    return Workload(ops=expected.total_rows,
+                    args=["--data-dir", data_dir, "--output", report_path, "--db", db_path],
+                    outputs=[report_path, db_path])
+
+
+# -- log_analyzer (Python) --
+
+_ENDPOINTS = ["/api/users", "/api/products", "/api/orders", "/api/health",
+              "/api/search", "/api/cart", "/api/auth", "/api/payments"]
+_METHODS = ["GET", "GET", "GET", "POST", "PUT", "DELETE"]
+_STATUS_CODES = [200] * 14 + [201, 204, 301, 304, 400, 403, 404, 500, 503, 101]
+
+
+def _log_workload(scale: int, workdir: str, rng: random.Random) -> Workload:
+    """접근 로그 scale행 (IP scale/20개, 빈 IP·1xx·소수 응답 시간 포함)"""
+    log_path = os.path.join(workdir, "access_log.csv")
+    ip_count = max(scale // 20, 10)
+    start = datetime(2026, 3, 15, 9, 0, 0)
+
+    def rows():
+        for i in range(scale):
+            # 제곱 분포로 일부 IP에 접근 집중 (Top 5가 의미 있게)
+            k = int(ip_count * rng.random() ** 2)
+            ip = "" if rng.random() < 0.01 else f"10.{k >> 16 & 255}.{k >> 8 & 255}.{k & 255}"
+            yield ((start + timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%S"), ip,
+                   rng.choice(_METHODS), rng.choice(_ENDPOINTS), rng.choice(_STATUS_CODES),
+                   round(rng.expovariate(1 / 80), 1))
+
+    ops = _write_csv(log_path, ["timestamp", "ip", "method", "endpoint", "status_code",
+                                "response_time_ms"], rows())
+    return Workload(ops=ops, args=["--log", log_path,
+                                   "--output", os.path.join(workdir, "report.txt")])
+
+
+# -- auditor (Linux) --
+
+_SSHD_CONFIG = """\
+Port 20022
+PermitRootLogin prohibit-password
+PasswordAuthentication yes
+PubkeyAuthentication yes
+MaxAuthTries 3
+"""
+
+_UFW_HEADER = """\
+Status: active
+Logging: on (low)
+Default: deny (incoming), allow (outgoing), disabled (routed)
+
+To                         Action      From
+--                         ------      ----
+"""
+
+
+def _auditor_workload(scale: int, workdir: str, rng: random.Random) -> Workload:
+    """
+    monitor.log scale줄 (1%는 형식 오류) + 규칙·계정·디렉토리 각 scale/100개
+
+    로그 파싱(정규식)이 지배적인 실제 감사 입력 비율을 흉내 냄
+    """
+    config_dir = os.path.join(workdir, "config")
+    os.makedirs(config_dir)
+    side = max(scale // 100, 3)
+
+    with open(os.path.join(config_dir, "sshd_config"), "w", encoding="utf-8") as f:
+        f.write(_SSHD_CONFIG)
+    with open(os.path.join(config_dir, "ufw_status.txt"), "w", encoding="utf-8") as f:
+        f.write(_UFW_HEADER)
+        for _ in range(side):
+            port = rng.choice(["20022", "15034", "23", "21", "8080", "161", "443"])
+            f.write(f"{port}/tcp                  ALLOW IN    Anywhere\n")
+    ops = side + 5
+
+    ops += _write_csv(
+        os.path.join(config_dir, "accounts.csv"), ["username", "uid", "groups", "home", "shell"],
+        ((f"agent-u{i}", 1000 + i, rng.choice(["agent-common", "agent-common;agent-core"]),
+          f"/home/agent-u{i}", "/bin/bash") for i in range(side)),
+    )
+    ops += _write_csv(
+        os.path.join(config_dir, "directories.csv"), ["path", "owner", "group", "octal_permission"],
+        ((f"/srv/app/{rng.choice(['data', 'api_keys', 'upload', 'secret_store', 'bin'])}{i}",
+          "agent-admin", rng.choice(["agent-admin", "agent-common"]),
+          rng.choice(["755", "775", "770", "700"])) for i in range(side)),
+    )
+
+    start = datetime(2025, 12, 24, 9, 0, 0)
+    with open(os.path.join(config_dir, "monitor.log"), "w", encoding="utf-8") as f:
+        for i in range(scale):
+            if rng.random() < 0.01:
+                f.write("[INVALID] This line has bad format\n")
+                continue
+            f.write(f"[{(start + timedelta(minutes=i)).strftime('%Y-%m-%d %H:%M:%S')}] "
+                    f"PID:{rng.randint(1000, 65000)} CPU:{rng.uniform(0, 100):.1f}% "
+                    f"MEM:{rng.uniform(0, 100):.1f}% DISK:{rng.randint(1, 500)}G\n")
+    ops += scale
+
+    with open(os.path.join(config_dir, "crontab.txt"), "w", encoding="utf-8") as f:
+        f.write("# m h dom mon dow command\n")
+        f.write("* * * * * /srv/app/bin/monitor.sh >> /var/log/app/monitor.log 2>&1\n")
+    ops += 1
+
+    return Workload(ops=ops, args=["--config-dir", config_dir,
+                                   "--output", os.path.join(workdir, "report.txt")])
+
+
+TARGETS: Dict[str, Target] = {
+    target.name: target for target in (
+        Target("mini_redis", REPL,
+               os.path.join(_ROOT, "standalone", "ds_level1_mission01", "mini_redis.py"),
+               _redis_workload),
+        Target("mini_git", REPL,
+               os.path.join(_ROOT, "standalone", "algo_level2_mission01", "mini_git.py"),
+               _git_workload),
+        Target("commit_analyzer", BATCH,
+               os.path.join(_ROOT, "standalone", "db_level3_mission01", "commit_analyzer.py"),
+               _db_workload),
+        Target("log_analyzer", BATCH,
+               os.path.join(_ROOT, "standalone", "python_level1_mission02", "log_analyzer.py"),
+               _log_workload),
+        Target("auditor", BATCH,
+               os.path.join(_ROOT, "standalone", "linux_level2_mission01", "auditor.py"),
+               _auditor_workload),
+    )
+}
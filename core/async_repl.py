@@ -0,0 +1,320 @@
+"""
+asyncio 기반 대화형 REPL 드라이버
+
+stdin 스크립트를 한 번에 밀어 넣고 프로세스가 끝나기를 기다리는 대신,
+asyncio.create_subprocess_exec로 학습자 스크립트를 띄우고 명령을 1줄씩 주고받음.
+
+- 동기화 지점: 학습자 코드가 stdin에서 한 줄을 읽으려는 순간
+  (core/clock_shim/_grader_input.py가 stdout에 INPUT_MARKER를 출력 → 여기서 제거)
+  프롬프트 문자열에 의존하지 않으므로 "mini-redis>" REPL과 메뉴형 프로그램 모두 동작
+- 명령별 응답 출력과 지연 시간(Exchange)을 기록
+- 스레드를 점유하지 않으므로 한 이벤트 루프에서 수백 개의 학습자 REPL을 동시에 구동 가능
+  (run_scripts_async)
+
+명령별 제한 시간을 넘기면 남은 명령을 한꺼번에 보내고 stdin을 닫는 방식으로 전환하므로,
+최종 stdout은 run_script(subprocess)와 같음 (입력을 줄 단위로 읽지 않는 프로그램도 채점 가능)
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from .sandbox import SandboxLimits, limit_process, wrap_command
+
+# core/clock_shim: 입력 대기 신호 + 가상 시계 sitecustomize 훅
+SHIM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "clock_shim")
+
+# core/clock_shim/_grader_input.py의 INPUT_MARKER와 같은 값
+INPUT_MARKER = b"\x00__grader_input__\x00"
+
+# 동시에 구동할 학습자 프로세스 기본 상한
+DEFAULT_CONCURRENCY = 64
+
+_READ_CHUNK = 65536
+
+
+class ReplTimeout(Exception):
+    """명령 응답(다음 입력 대기)이 제한 시간 안에 오지 않음"""
+
+
+@dataclass
+class Exchange:
+    """
+    명령 1건의 주고받기 기록
+
+    Attributes:
+        command: 보낸 명령 (줄바꿈 제외)
+        output: 명령 전송 후 다음 입력 대기까지의 stdout (다음 프롬프트 포함)
+        latency: 명령 전송부터 다음 입력 대기(또는 종료)까지 걸린 시간 (초)
+        waiting: 응답 후 학습자 프로세스가 다음 입력을 기다리는 중인지 (False면 종료됨)
+    """
+    command: str
+    output: str
+    latency: float
+    waiting: bool
+
+
+def session_env(virtual_clock: bool = False) -> dict:
+    """입력 대기 신호(+가상 시계) 훅을 설치하는 학습자 프로세스 환경 변수"""
+    env = dict(os.environ)
+    paths = [SHIM_DIR] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    env["PYTHONPATH"] = os.pathsep.join(paths)
+    env["GRADER_INPUT_MARKER"] = "1"
+    if virtual_clock:
+        env["GRADER_VIRTUAL_CLOCK"] = "1"
+    return env
+
+
+class AsyncReplSession:
+    """
+    학습자 스크립트 1개와의 대화 세션
+
+    사용 예:
+        session = AsyncReplSession(cli_path, cwd)
+        banner = await session.start(timeout=5)
+        exchange = await session.send("SET a 1", timeout=2)
+        stdout, stderr, returncode = await session.close(timeout=5)
+    """
+
+    def __init__(self, script_path: str, cwd: str, virtual_clock: bool = False,
+                 limits: Optional[SandboxLimits] = None):
+        self.script_path = script_path
+        self.cwd = cwd
+        self.virtual_clock = virtual_clock
+        self.limits = limits
+        self.exchanges: List[Exchange] = []
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._pending = bytearray()       # 아직 응답으로 소비하지 않은 stdout
+        self._stdout = bytearray()        # 마커를 제거한 전체 stdout
+        self._stderr = bytearray()
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._eof = False
+
+    @property
+    def waiting(self) -> bool:
+        """학습자 프로세스가 다음 입력을 기다리는 중인지"""
+        return not self._eof
+
+    async def start(self, timeout: float) -> str:
+        """
+        프로세스를 띄우고 첫 입력 대기(또는 종료)까지의 출력 반환
+
+        Raises:
+            ReplTimeout: timeout초 안에 입력 대기/종료하지 않음
+            OSError: 실행 실패
+        """
+        self._proc = await asyncio.create_subprocess_exec(
+            *wrap_command([sys.executable, self.script_path], self.limits),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.cwd,
+            env=session_env(self.virtual_clock),
+        )
+        limit_process(self._proc.pid, self.limits)
+        self._stderr_task = asyncio.ensure_future(self._pump_stderr())
+        output, _ = await self._read_until_input(timeout)
+        return output
+
+    async def send(self, command: str, timeout: float) -> Exchange:
+        """
+        명령 1줄을 보내고 다음 입력 대기(또는 종료)까지의 출력 수집
+
+        Raises:
+            ReplTimeout: timeout초 안에 응답이 끝나지 않음
+        """
+        start = time.perf_counter()
+        if not self._eof:
+            await self._write((command + "\n").encode("utf-8"))
+        output, waiting = await self._read_until_input(timeout)
+        exchange = Exchange(command, output, time.perf_counter() - start, waiting)
+        self.exchanges.append(exchange)
+        return exchange
+
+    async def feed(self, text: str) -> None:
+        """응답을 기다리지 않고 원문 그대로 전송 (제한 시간 초과 후 나머지 입력 전달용)"""
+        if not self._eof:
+            await self._write(text.encode("utf-8"))
+
+    async def close(self, timeout: float) -> Tuple[str, str, Optional[int]]:
+        """
+        stdin을 닫고 종료를 기다린 뒤 (stdout, stderr, returncode) 반환
+
+        Raises:
+            ReplTimeout: timeout초 안에 종료하지 않음 (프로세스는 강제 종료)
+        """
+        if self._proc is None:
+            return "", "", None
+        try:
+            self._close_stdin()
+            await asyncio.wait_for(self._drain_stdout(), timeout)
+            returncode = await asyncio.wait_for(self._proc.wait(), timeout)
+            if self._stderr_task is not None:
+                await asyncio.wait_for(self._stderr_task, timeout)
+        except asyncio.TimeoutError as e:
+            await self.kill()
+            raise ReplTimeout(f"{timeout}초 안에 종료하지 않음") from e
+        return self.stdout, self.stderr, returncode
+
+    async def kill(self) -> None:
+        """프로세스 강제 종료 (이미 종료됐으면 무시)"""
+        if self._proc is None or self._proc.returncode is not None:
+            return
+        try:
+            self._proc.kill()
+        except ProcessLookupError:
+            pass
+        await self._proc.wait()
+        if self._stderr_task is not None:
+            self._stderr_task.cancel()
+
+    @property
+    def stdout(self) -> str:
+        return self._stdout.decode("utf-8", errors="replace")
+
+    @property
+    def stderr(self) -> str:
+        return self._stderr.decode("utf-8", errors="replace")
+
+    # -- 내부 --
+
+    async def _write(self, data: bytes) -> None:
+        try:
+            self._proc.stdin.write(data)
+            await self._proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # 학습자 프로세스가 먼저 종료됨 → 남은 출력은 _read_until_input에서 수집
+            pass
+
+    def _close_stdin(self) -> None:
+        try:
+            if not self._proc.stdin.is_closing():
+                self._proc.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    async def _read_until_input(self, timeout: float) -> Tuple[str, bool]:
+        """다음 INPUT_MARKER(또는 EOF)까지의 출력과 입력 대기 여부"""
+        try:
+            return await asyncio.wait_for(self._next_chunk(), timeout)
+        except asyncio.TimeoutError as e:
+            raise ReplTimeout(f"{timeout}초 안에 응답하지 않음") from e
+
+    async def _next_chunk(self) -> Tuple[str, bool]:
+        while True:
+            idx = self._pending.find(INPUT_MARKER)
+            if idx >= 0:
+                chunk = bytes(self._pending[:idx])
+                del self._pending[:idx + len(INPUT_MARKER)]
+                self._stdout += chunk
+                return chunk.decode("utf-8", errors="replace"), True
+            if self._eof:
+                chunk = bytes(self._pending)
+                self._pending.clear()
+                self._stdout += chunk
+                return chunk.decode("utf-8", errors="replace"), False
+            data = await self._proc.stdout.read(_READ_CHUNK)
+            if not data:
+                self._eof = True
+            self._pending += data
+
+    async def _drain_stdout(self) -> None:
+        """EOF까지 남은 stdout 수집 (stdin을 닫은 뒤의 입력 대기 마커는 제거)"""
+        while True:
+            _, waiting = await self._next_chunk()
+            if not waiting:
+                return
+
+    async def _pump_stderr(self) -> None:
+        """stderr 파이프가 가득 차 학습자 프로세스가 멈추지 않도록 계속 읽음"""
+        while True:
+            data = await self._proc.stderr.read(_READ_CHUNK)
+            if not data:
+                return
+            self._stderr += data
+
+
+async def run_script_async(script_path: str, stdin_text: str, cwd: str,
+                           timeout: float = 10,
+                           command_timeout: Optional[float] = None,
+                           virtual_clock: bool = False,
+                           exchanges: Optional[List[Exchange]] = None,
+                           limits: Optional[SandboxLimits] = None,
+                           ) -> Optional[subprocess.CompletedProcess]:
+    """
+    stdin_text를 1줄씩 대화형으로 보내며 실행 (core.repl.run_script의 asyncio 버전)
+
+    Args:
+        script_path: 실행할 스크립트 경로
+        stdin_text: 보낼 입력 (줄 단위)
+        cwd: 작업 디렉토리
+        timeout: 전체 실행 제한 시간 (초)
+        command_timeout: 명령 1건의 응답 제한 시간 (None이면 남은 전체 시간).
+            초과하면 남은 입력을 한꺼번에 보내고 종료를 기다림
+        virtual_clock: True면 가상 시계를 설치하고 실행
+        exchanges: 지정 시 명령별 기록(Exchange)을 이 리스트에 추가
+        limits: 자원 제한 (core.sandbox, None이면 제한 없음)
+
+    Returns:
+        CompletedProcess 또는 None (전체 제한 시간 초과, 실행 실패)
+    """
+    deadline = time.monotonic() + timeout
+    session = AsyncReplSession(script_path, cwd, virtual_clock=virtual_clock, limits=limits)
+    lines = stdin_text.splitlines(keepends=True)
+
+    def remaining() -> float:
+        return max(0.0, deadline - time.monotonic())
+
+    try:
+        await session.start(remaining())
+        for idx, line in enumerate(lines):
+            if not session.waiting:
+                break
+            limit = remaining() if command_timeout is None else min(command_timeout, remaining())
+            try:
+                await session.send(line.rstrip("\r\n"), limit)
+            except ReplTimeout:
+                # 줄 단위로 응답하지 않는 프로그램 → 남은 입력을 한꺼번에 전달
+                await session.feed("".join(lines[idx + 1:]))
+                break
+        stdout, stderr, returncode = await session.close(remaining())
+    except (ReplTimeout, OSError):
+        await session.kill()
+        return None
+    finally:
+        if exchanges is not None:
+            exchanges.extend(session.exchanges)
+
+    return subprocess.CompletedProcess([sys.executable, script_path], returncode, stdout, stderr)
+
+
+async def run_scripts_async(requests: Sequence[Tuple[str, str, str]],
+                            timeout: float = 10,
+                            virtual_clock: bool = False,
+                            concurrency: int = DEFAULT_CONCURRENCY,
+                            limits: Optional[SandboxLimits] = None,
+                            ) -> List[Optional[subprocess.CompletedProcess]]:
+    """
+    여러 (script_path, stdin_text, cwd) 실행을 한 이벤트 루프에서 동시에 구동
+
+    Args:
+        requests: (스크립트 경로, stdin 입력, 작업 디렉토리) 목록
+        timeout: 실행 1건의 제한 시간 (초)
+        virtual_clock: True면 가상 시계를 설치하고 실행
+        concurrency: 동시에 떠 있는 학습자 프로세스 최대 수
+        limits: 자원 제한 (core.sandbox, None이면 제한 없음)
+
+    Returns:
+        requests와 같은 순서의 CompletedProcess/None 리스트
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(script_path: str, stdin_text: str, cwd: str):
+        async with semaphore:
+            return await run_script_async(script_path, stdin_text, cwd, timeout=timeout,
+                                          virtual_clock=virtual_clock, limits=limits)
+
+    return list(await asyncio.gather(*(_one(*req) for req in requests)))
@@ -2,9 +2,13 @@
 BaseValidator 추상 클래스
 모든 플러그인 검증기는 이 클래스를 상속받아야 함
 """
+import cProfile
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from .checklist import Checklist
+from .grading_context import GradingContext
+from .sandbox import collect_usage, summarize_usage
 
 
 class BaseValidator(ABC):
@@ -20,11 +24,21 @@ class BaseValidator(ABC):
             mission_config: 미션 설정 딕셔너리 (config.yaml에서 로드)
         """
         self.config = mission_config
+        execution = mission_config.get("execution") or {}
         self.checklist = Checklist(
             name=mission_config.get("name", "Unknown Mission"),
             description=mission_config.get("description", ""),
-            passing_score=mission_config.get("passing_score", 70)
+            passing_score=mission_config.get("passing_score", 70),
+            max_workers=int(execution.get("parallel_items") or 1)
         )
+        # 채점 1회 동안 검증기 간 공유 저장소 (Grader가 공통 인스턴스로 교체)
+        self.context = GradingContext()
+        # cProfile 결과 저장 경로 (Grader가 프로파일링 요청 시 설정)
+        self.profile_path: Optional[str] = None
+        # 대화형 세션의 명령별 지연 시간 ({"command", "latency"}, core.repl_session 참고)
+        self.command_timings: List[Dict[str, Any]] = []
+        # 선행 조건 ("검증기" 또는 "검증기.항목ID", Grader가 config.yaml의 requires로 설정)
+        self.requires: List[str] = []
 
     @abstractmethod
     def setup(self) -> None:
@@ -54,21 +68,85 @@ class BaseValidator(ABC):
         """
         전체 검증 프로세스 실행
 
+        단계별 소요 시간(setup, build_checklist, execute, teardown, total)을
+        결과의 "timings"에 초 단위로 기록하고, profile_path가 설정되어 있으면
+        검증기 스레드의 cProfile 통계를 저장.
+        command_timings가 기록되어 있으면 결과의 "command_timings"에,
+        이 검증기에서 실행한 학습자 프로세스의 자원 사용량(core.sandbox) 요약은 "resource_usage"에 포함
+
         Returns:
             검증 결과 딕셔너리
         """
+        timings: Dict[str, float] = {}
+        profiler = cProfile.Profile() if self.profile_path else None
+        if profiler:
+            profiler.enable()
+        start = time.perf_counter()
+        phase_start = start
+
+        def end_phase(name: str) -> None:
+            nonlocal phase_start
+            now = time.perf_counter()
+            timings[name] = round(now - phase_start, 4)
+            phase_start = now
+
+        with collect_usage() as usages:
+            try:
+                self.setup()
+                end_phase("setup")
+                self.build_checklist()
+                end_phase("build_checklist")
+                result = self.checklist.execute_all()
+                end_phase("execute")
+            except Exception as e:
+                end_phase("error")
+                result = {
+                    "error": str(e),
+                    "is_passed": False,
+                    "score": 0,
+                    "name": self.config.get("name", "Unknown"),
+                    "description": self.config.get("description", "")
+                }
+            finally:
+                try:
+                    self.teardown()
+                finally:
+                    end_phase("teardown")
+                    timings["total"] = round(time.perf_counter() - start, 4)
+                    if profiler:
+                        profiler.disable()
+                        profiler.dump_stats(self.profile_path)
+
+        result["timings"] = timings
+        if self.command_timings:
+            result["command_timings"] = list(self.command_timings)
+        # setup/teardown 단계 실행 + 항목별 실행 (항목 실행은 CheckItem이 따로 수집)
+        usages = usages + [u for item in self.checklist.items for u in item.resource_usage]
+        if usages:
+            result["resource_usage"] = summarize_usage(usages)
+        return result
+
+    def skip(self, reason: str) -> Dict[str, Any]:
+        """
+        선행 조건 실패로 setup(학습자 코드 실행)을 생략하고 전 항목을 SKIPPED로 기록
+
+        build_checklist()만 호출하므로 리포트에는 항목 목록이 그대로 남음
+
+        Returns:
+            검증 결과 딕셔너리 (0점, "skipped"에 사유)
+        """
+        start = time.perf_counter()
         try:
-            self.setup()
             self.build_checklist()
-            result = self.checklist.execute_all()
-            return result
+            result = self.checklist.skip_all(reason)
         except Exception as e:
-            return {
+            result = {
                 "error": str(e),
                 "is_passed": False,
                 "score": 0,
                 "name": self.config.get("name", "Unknown"),
                 "description": self.config.get("description", "")
             }
-        finally:
-            self.teardown()
+        result["skipped"] = reason
+        result["timings"] = {"total": round(time.perf_counter() - start, 4)}
+        return result
@@ -0,0 +1,463 @@
+"""
+배치 채점 실행기
+
+submissions/ 아래 학습자 디렉토리(또는 매니페스트 CSV)를 수집하여
+프로세스 풀로 Grader.execute()를 병렬 실행하고,
+학습자별 JSON/Markdown 리포트와 코호트 요약 리포트를 생성
+"""
+import copy
+import csv
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from utils.config_loader import load_mission_config
+
+from .grader import Grader
+from .incremental import (core_fingerprint, grading_fingerprint, load_previous,
+                          mission_fingerprint, save_state, validator_source_dirs)
+from .interpreter_pool import get_shared_pool
+from .transcript_cache import TranscriptCache, get_shared_cache
+
+
+@dataclass
+class GradingJob:
+    """
+    채점 작업 1건
+
+    Attributes:
+        student_id: 학습자 ID
+        mission_id: 미션 ID (예: "ds_level1_mission01")
+        submission_dir: 제출물 디렉토리 절대 경로
+    """
+    student_id: str
+    mission_id: str
+    submission_dir: str
+
+
+def discover_jobs(submissions_root: str, mission_id: str) -> List[GradingJob]:
+    """
+    submissions_root 바로 아래의 디렉토리를 학습자 제출물로 간주하여 작업 목록 생성
+
+    디렉토리 이름이 학습자 ID가 됨 (숨김 디렉토리 제외, 이름순 정렬)
+
+    Args:
+        submissions_root: 제출물 루트 디렉토리 (예: "submissions")
+        mission_id: 모든 학습자에게 적용할 미션 ID
+
+    Returns:
+        GradingJob 리스트
+    """
+    root = Path(submissions_root).resolve()
+    if not root.is_dir():
+        return []
+
+    jobs = []
+    for entry in sorted(root.iterdir()):
+        if entry.is_dir() and not entry.name.startswith("."):
+            jobs.append(GradingJob(entry.name, mission_id, str(entry)))
+    return jobs
+
+
+def load_manifest(manifest_path: str, default_mission_id: Optional[str] = None) -> List[GradingJob]:
+    """
+    매니페스트 CSV에서 작업 목록 로드
+
+    필수 컬럼: student_id, submission_dir
+    선택 컬럼: mission_id (없으면 default_mission_id 사용)
+    submission_dir이 상대 경로면 매니페스트 파일 기준으로 해석
+
+    Args:
+        manifest_path: 매니페스트 CSV 경로
+        default_mission_id: mission_id 컬럼이 비어 있을 때 사용할 미션 ID
+
+    Returns:
+        GradingJob 리스트
+
+    Raises:
+        ValueError: 필수 컬럼 누락 또는 미션 ID를 결정할 수 없는 행
+    """
+    manifest = Path(manifest_path).resolve()
+    jobs = []
+    with open(manifest, "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        missing = {"student_id", "submission_dir"} - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"매니페스트 필수 컬럼 누락: {', '.join(sorted(missing))}")
+
+        for line_no, row in enumerate(reader, start=2):
+            mission_id = (row.get("mission_id") or "").strip() or default_mission_id
+            if not mission_id:
+                raise ValueError(f"매니페스트 {line_no}행: mission_id가 없습니다")
+            submission_dir = Path(row["submission_dir"].strip())
+            if not submission_dir.is_absolute():
+                submission_dir = manifest.parent / submission_dir
+            jobs.append(GradingJob(
+                student_id=row["student_id"].strip(),
+                mission_id=mission_id,
+                submission_dir=str(submission_dir.resolve()),
+            ))
+    return jobs
+
+
+# 이 프로세스가 import한 프레임워크 코드의 지문 (core/는 다시 로드할 수 없으므로 시작 시점 고정)
+_PROCESS_CORE_FINGERPRINT = core_fingerprint()
+
+
+@dataclass
+class LoadedMission:
+    """
+    워커 프로세스가 채점에 쓰는 미션 설정과, 로드한 코드의 지문
+
+    Attributes:
+        config: 미션 설정
+        sources: (core_fingerprint, mission_fingerprint) — 증분 채점 기록에 사용
+    """
+    config: Dict[str, Any]
+    sources: Tuple[str, str]
+
+
+_loaded_missions: Dict[str, LoadedMission] = {}
+
+
+def load_mission(mission_id: str) -> Optional[LoadedMission]:
+    """
+    미션 설정과 검증기 모듈을 프로세스당 1회 로드 (없는 미션이면 None)
+
+    상주 워커가 오래 살아도 수정 사항을 반영하도록, 작업마다 config.yaml·검증기 소스의
+    지문을 확인하여 바뀌었으면 설정을 다시 읽고 검증기 모듈을 새로 import.
+    지문은 로드 전에 계산하므로 그 사이 수정되면 다음 작업에서 다시 로드될 뿐,
+    이전 코드로 낸 결과가 새 지문으로 기록되지 않음.
+    core/가 바뀐 경우는 다시 로드하지 않고 시작 시점 지문을 유지 (재시작 전까지 재채점 대상)
+    """
+    loaded = _loaded_missions.get(mission_id)
+    if loaded is not None:
+        if mission_fingerprint(mission_id, loaded.config) == loaded.sources[1]:
+            return loaded
+        _unload_validator_modules(loaded.config)
+        del _loaded_missions[mission_id]
+
+    config = load_mission_config(mission_id)
+    if not config:
+        return None
+    fingerprint = mission_fingerprint(mission_id, config)
+    # 검증기 목록을 알기 위해 읽은 설정보다 지문이 새로울 수 있으므로 지문 계산 후 다시 읽음
+    config = load_mission_config(mission_id)
+    if not config:
+        return None
+    for vc in config.get("validators", []):
+        try:
+            importlib.import_module(vc["module"])
+        except Exception:
+            # 잘못된 검증기는 실제 채점에서 오류로 기록됨
+            pass
+    loaded = _loaded_missions[mission_id] = LoadedMission(
+        config, (_PROCESS_CORE_FINGERPRINT, fingerprint))
+    return loaded
+
+
+def _unload_validator_modules(config: Dict[str, Any]) -> None:
+    """검증기 패키지 디렉토리의 모듈(_helpers 포함)을 sys.modules에서 내려 다음 import 때 새로 로드"""
+    dirs = tuple(os.path.join(d, "") for d in validator_source_dirs(config))
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None) or ""
+        if module_file.startswith(dirs):
+            del sys.modules[name]
+
+
+@contextmanager
+def _isolated_student_imports(submission_dir: str) -> Iterator[None]:
+    """
+    채점 중 추가된 sys.path 항목과 학생 모듈을 채점 후 제거
+
+    풀 워커는 여러 학습자를 연속 채점하므로, 이전 학습자의 models/storage 등이
+    sys.modules에 남아 다음 학습자 채점에 섞이지 않도록 격리
+    """
+    saved_path = list(sys.path)
+    saved_modules = set(sys.modules)
+    prefix = str(Path(submission_dir).resolve())
+    try:
+        yield
+    finally:
+        sys.path[:] = saved_path
+        for name in set(sys.modules) - saved_modules:
+            module_file = getattr(sys.modules.get(name), "__file__", None) or ""
+            if module_file.startswith(prefix):
+                del sys.modules[name]
+
+
+def grade_job(job: GradingJob, output_dir: str,
+              cache_dir: Optional[str] = None,
+              incremental: bool = False,
+              warm_pool: bool = False,
+              profile_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    작업 1건 채점 + 리포트 저장 (프로세스 풀에서 실행되는 단위)
+
+    Args:
+        job: 채점 작업
+        output_dir: 리포트 저장 디렉토리
+        cache_dir: 실행 기록 캐시 디렉토리 (None이면 캐시 미사용)
+        incremental: True면 제출물/설정/검증기 지문이 이전 채점과 같을 때 채점 생략
+        warm_pool: True면 워커 프로세스 공용 웜 인터프리터 풀로 학습자 스크립트 실행
+        profile_dir: 검증기별 cProfile 통계 저장 디렉토리 (None이면 프로파일링 안 함)
+
+    Returns:
+        학습자별 요약 딕셔너리 (점수, 합격 여부, 리포트 경로, 소요 시간, 오류)
+    """
+    start = time.perf_counter()
+    summary: Dict[str, Any] = {
+        "student_id": job.student_id,
+        "mission_id": job.mission_id,
+        "submission_dir": job.submission_dir,
+        "overall_passed": False,
+        "overall_score": 0.0,
+        "json_path": None,
+        "md_path": None,
+        "error": None,
+        "skipped": False,
+        "timings": None,
+    }
+
+    mission = load_mission(job.mission_id)
+    if mission is None:
+        summary["error"] = f"미션 설정을 찾을 수 없습니다 - {job.mission_id}"
+    elif not os.path.isdir(job.submission_dir):
+        summary["error"] = f"제출물 디렉토리가 없습니다 - {job.submission_dir}"
+    else:
+        config = copy.deepcopy(mission.config)
+        config["submission_dir"] = job.submission_dir
+        fingerprint = None
+        previous = None
+        if incremental:
+            try:
+                # 디스크가 아니라 이 프로세스가 로드한 코드 기준 지문
+                fingerprint = grading_fingerprint(job.mission_id, config, job.submission_dir,
+                                                  sources=mission.sources)
+            except OSError:
+                # 읽을 수 없는 파일이 있으면 항상 재채점
+                fingerprint = None
+            if fingerprint:
+                previous = load_previous(output_dir, job.student_id, job.mission_id, fingerprint)
+
+        if previous:
+            # 변경 없음 → 이전 리포트 재사용
+            summary.update({
+                "overall_passed": previous["overall_passed"],
+                "overall_score": previous["overall_score"],
+                "json_path": previous["json_path"],
+                "md_path": previous["md_path"],
+                "skipped": True,
+            })
+        else:
+            try:
+                with _isolated_student_imports(job.submission_dir):
+                    cache = get_shared_cache(cache_dir) if cache_dir else None
+                    pool = get_shared_pool() if warm_pool else None
+                    result = Grader(job.student_id, job.mission_id, config,
+                                    transcript_cache=cache,
+                                    interpreter_pool=pool,
+                                    profile_dir=profile_dir).execute()
+                json_path, md_path = result.save(Path(output_dir))
+                summary.update({
+                    "overall_passed": result.overall_passed,
+                    "overall_score": round(result.overall_score, 2),
+                    "json_path": str(json_path),
+                    "md_path": str(md_path),
+                    "timings": result.timing_summary(),
+                })
+                if fingerprint:
+                    save_state(output_dir, job.student_id, job.mission_id, fingerprint,
+                               result.overall_passed, result.overall_score,
+                               json_path, md_path)
+            except Exception as e:
+                summary["error"] = f"채점 실패: {str(e)}"
+
+    summary["elapsed"] = round(time.perf_counter() - start, 3)
+    return summary
+
+
+def run_batch(jobs: List[GradingJob], output_dir: str, workers: int = 1,
+              on_done: Optional[Callable[[Dict[str, Any]], None]] = None,
+              cache_dir: Optional[str] = None,
+              incremental: bool = False,
+              warm_pool: bool = False,
+              profile_dir: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    작업 목록을 프로세스 풀로 채점
+
+    Args:
+        jobs: 채점 작업 목록
+        output_dir: 리포트 저장 디렉토리
+        workers: 워커 프로세스 수 (1 이하면 현재 프로세스에서 순차 실행)
+        on_done: 작업 1건 완료 시 호출되는 콜백 (진행 상황 출력용)
+        cache_dir: 실행 기록 캐시 디렉토리 (워커 프로세스 간 공유, None이면 미사용)
+        incremental: True면 이전 채점 이후 변경이 없는 제출물은 채점 생략
+        warm_pool: True면 워커 프로세스마다 웜 인터프리터 풀을 두고 재사용
+        profile_dir: 검증기별 cProfile 통계 저장 디렉토리 (None이면 프로파일링 안 함)
+
+    Returns:
+        작업 순서와 동일한 순서의 요약 리스트
+    """
+    summaries: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+
+    if workers <= 1 or len(jobs) <= 1:
+        for idx, job in enumerate(jobs):
+            summaries[idx] = grade_job(job, output_dir, cache_dir, incremental, warm_pool, profile_dir)
+            if on_done:
+                on_done(summaries[idx])
+    else:
+        _run_pool(jobs, summaries, output_dir, workers, on_done, cache_dir, incremental,
+                  warm_pool, profile_dir)
+
+    if cache_dir:
+        # 워커별 크기 추정치는 다른 워커의 쓰기를 모르므로 배치 끝에 1번 전체 정리
+        TranscriptCache(cache_dir).evict()
+    return summaries
+
+
+def _run_pool(jobs: List[GradingJob], summaries: List[Optional[Dict[str, Any]]],
+              output_dir: str, workers: int,
+              on_done: Optional[Callable[[Dict[str, Any]], None]],
+              cache_dir: Optional[str], incremental: bool, warm_pool: bool,
+              profile_dir: Optional[str]) -> None:
+    """프로세스 풀로 채점하여 summaries[작업 순서]에 기록"""
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = {pool.submit(grade_job, job, output_dir, cache_dir, incremental, warm_pool,
+                               profile_dir): idx for idx, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                summaries[idx] = future.result()
+            except Exception as e:
+                # 워커 프로세스 비정상 종료 등
+                job = jobs[idx]
+                summaries[idx] = {
+                    **asdict(job),
+                    "overall_passed": False,
+                    "overall_score": 0.0,
+                    "json_path": None,
+                    "md_path": None,
+                    "error": f"워커 실행 실패: {str(e)}",
+                    "skipped": False,
+                    "timings": None,
+                    "elapsed": 0.0,
+                }
+            if on_done:
+                on_done(summaries[idx])
+
+
+def build_cohort_summary(summaries: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """학습자별 요약을 코호트 통계로 집계"""
+    graded = [s for s in summaries if not s.get("error")]
+    scores = [s["overall_score"] for s in graded]
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "total_students": len(summaries),
+        "graded": len(graded),
+        "errors": len(summaries) - len(graded),
+        "skipped": sum(1 for s in summaries if s.get("skipped")),
+        "passed": sum(1 for s in graded if s["overall_passed"]),
+        "average_score": round(sum(scores) / len(scores), 2) if scores else 0.0,
+        "min_score": min(scores) if scores else 0.0,
+        "max_score": max(scores) if scores else 0.0,
+        "elapsed": round(elapsed, 3),
+        "timing_summary": build_timing_summary(summaries),
+        "students": summaries,
+    }
+
+
+def build_timing_summary(summaries: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    검증기별 소요 시간 집계 (실제로 채점한 학습자만, 변경 없음/오류 제외)
+
+    Returns:
+        {검증기명: {"count", "mean", "max", "total", "phases": {단계: 평균}}} (평균 소요 시간 내림차순)
+    """
+    samples: Dict[str, List[Dict[str, float]]] = {}
+    for s in summaries:
+        for name, timings in ((s.get("timings") or {}).get("validators") or {}).items():
+            if timings:
+                samples.setdefault(name, []).append(timings)
+
+    summary = {}
+    for name, runs in samples.items():
+        totals = [t.get("total", 0.0) for t in runs]
+        phases = {}
+        for phase in ("setup", "build_checklist", "execute", "teardown"):
+            values = [t[phase] for t in runs if phase in t]
+            if values:
+                phases[phase] = round(sum(values) / len(values), 4)
+        summary[name] = {
+            "count": len(runs),
+            "mean": round(sum(totals) / len(totals), 4),
+            "max": round(max(totals), 4),
+            "total": round(sum(totals), 4),
+            "phases": phases,
+        }
+    return dict(sorted(summary.items(), key=lambda kv: kv[1]["mean"], reverse=True))
+
+
+def cohort_summary_to_markdown(cohort: Dict[str, Any]) -> str:
+    """코호트 요약 Markdown 리포트 생성"""
+    md = "# 코호트 채점 요약\n\n"
+    md += f"- **채점 시각**: {cohort['timestamp']}\n"
+    md += f"- **학습자 수**: {cohort['total_students']}명 (채점 {cohort['graded']}, 오류 {cohort['errors']})\n"
+    if cohort.get("skipped"):
+        md += f"- **변경 없음(이전 결과 재사용)**: {cohort['skipped']}명\n"
+    md += f"- **합격**: {cohort['passed']}명\n"
+    md += f"- **평균 점수**: {cohort['average_score']}점 (최저 {cohort['min_score']}, 최고 {cohort['max_score']})\n"
+    md += f"- **총 소요 시간**: {cohort['elapsed']}초\n\n"
+
+    if cohort.get("timing_summary"):
+        md += "## 검증기별 소요 시간\n\n"
+        md += "| 검증기 | 채점 수 | 평균(초) | 최대(초) | setup 평균 | execute 평균 |\n"
+        md += "|--------|---------|----------|----------|------------|--------------|\n"
+        for name, t in cohort["timing_summary"].items():
+            phases = t["phases"]
+            md += (f"| {name} | {t['count']} | {t['mean']} | {t['max']} | "
+                   f"{phases.get('setup', '-')} | {phases.get('execute', '-')} |\n")
+        md += "\n## 학습자별 결과\n\n"
+
+    md += "| 학습자 ID | 미션 ID | 결과 | 점수 | 소요(초) | 비고 |\n"
+    md += "|-----------|---------|------|------|----------|------|\n"
+    for s in cohort["students"]:
+        if s.get("error"):
+            status = "⚠️ 오류"
+        else:
+            status = "✅ PASS" if s["overall_passed"] else "❌ FAIL"
+        note = s.get("error") or ("변경 없음" if s.get("skipped") else "")
+        md += (f"| {s['student_id']} | {s['mission_id']} | {status} | "
+               f"{s['overall_score']} | {s.get('elapsed', 0)} | {note} |\n")
+
+    return md
+
+
+def save_cohort_summary(cohort: Dict[str, Any], output_dir: str, label: str) -> Tuple[Path, Path]:
+    """
+    코호트 요약을 JSON + Markdown으로 저장
+
+    파일명: cohort_{label}_{타임스탬프}.json / .md
+    """
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    timestamp = cohort["timestamp"].replace(":", "").replace("-", "").split(".")[0]
+    stem = f"cohort_{label}_{timestamp}"
+
+    json_path = out / f"{stem}.json"
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(cohort, f, indent=2, ensure_ascii=False)
+
+    md_path = out / f"{stem}.md"
+    with open(md_path, "w", encoding="utf-8") as f:
+        f.write(cohort_summary_to_markdown(cohort))
+
+    return json_path, md_path
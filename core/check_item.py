@@ -1,10 +1,12 @@
 """
 개별 체크 항목 클래스
 """
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
+from .sandbox import ResourceUsage, collect_usage, summarize_usage
+
 
 class CheckStatus(Enum):
     """체크 상태 열거형"""
@@ -12,6 +14,7 @@ class CheckStatus(Enum):
     PASSED = "passed"        # 통과
     FAILED = "failed"        # 실패
     ERROR = "error"          # 에러 발생
+    SKIPPED = "skipped"      # 선행 조건 실패로 실행 안 함 (실패로 집계)
 
 
 @dataclass
@@ -26,6 +29,11 @@ class CheckItem:
         validator: 검증 함수 (Callable, 반환값: bool)
         hint: 실패 시 힌트 메시지
         ai_trap: AI가 놓치기 쉬운 함정 요소 여부
+        independent: 다른 항목과 상태를 공유하지 않아 동시 실행 가능한지 여부
+            (False면 앞선 모든 항목이 끝난 뒤 실행 — 기존 순차 동작)
+        depends_on: 먼저 실행되어야 하는 항목 ID 목록 (실행 순서 제약)
+        requires: 통과해야 실행되는 항목 ID 목록 (하나라도 통과하지 못하면
+            실행하지 않고 SKIPPED로 기록, depends_on처럼 실행 순서도 보장)
     """
     id: str
     description: str
@@ -33,11 +41,16 @@ class CheckItem:
     validator: Callable[[], bool]
     hint: Optional[str] = None
     ai_trap: bool = False
+    independent: bool = False
+    depends_on: List[str] = field(default_factory=list)
+    requires: List[str] = field(default_factory=list)
 
     # 실행 결과 (dataclass field로 기본값 설정)
     status: CheckStatus = field(default=CheckStatus.PENDING)
     error_message: Optional[str] = field(default=None)
     execution_time: float = field(default=0.0)
+    # 검증 함수 안에서 실행한 학습자 프로세스의 자원 사용량 (core.sandbox)
+    resource_usage: List[ResourceUsage] = field(default_factory=list)
 
     def execute(self) -> bool:
         """
@@ -47,10 +60,11 @@ class CheckItem:
             검증 성공 여부
         """
         import time
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            result = self.validator()
+            with collect_usage() as self.resource_usage:
+                result = self.validator()
             self.status = CheckStatus.PASSED if result else CheckStatus.FAILED
             return result
         except Exception as e:
@@ -58,17 +72,32 @@ class CheckItem:
             self.error_message = str(e)
             return False
         finally:
-            self.execution_time = time.time() - start_time
+            self.execution_time = time.perf_counter() - start_time
+
+    def skip(self, reason: str) -> bool:
+        """
+        선행 조건 실패로 검증 함수를 실행하지 않고 건너뜀
+
+        Returns:
+            항상 False (실패로 집계)
+        """
+        self.status = CheckStatus.SKIPPED
+        self.error_message = reason
+        self.execution_time = 0.0
+        return False
 
     def to_dict(self) -> dict:
-        """딕셔너리로 변환 (결과 저장용)"""
-        return {
+        """딕셔너리로 변환 (결과 저장용, 학습자 프로세스를 실행한 항목은 resource_usage 포함)"""
+        data = {
             "id": self.id,
             "description": self.description,
             "points": self.points,
             "status": self.status.value,
             "error_message": self.error_message,
-            "execution_time": round(self.execution_time, 3),
+            "execution_time": round(self.execution_time, 4),
             "ai_trap": self.ai_trap,
             "hint": self.hint if self.status != CheckStatus.PASSED else None
         }
+        if self.resource_usage:
+            data["resource_usage"] = summarize_usage(self.resource_usage)
+        return data
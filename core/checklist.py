@@ -1,7 +1,8 @@
 """
 체크리스트 관리 클래스
 """
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Dict, Any, Set
 from .check_item import CheckItem, CheckStatus
 
 
@@ -9,16 +10,19 @@ class Checklist:
     """
     체크리스트 (여러 CheckItem의 집합)
     """
-    def __init__(self, name: str, description: str, passing_score: int = 70):
+    def __init__(self, name: str, description: str, passing_score: int = 70,
+                 max_workers: int = 1):
         """
         Args:
             name: 체크리스트 이름
             description: 설명
             passing_score: 합격 기준 점수 (기본 70점)
+            max_workers: 동시 실행 가능한 최대 항목 수 (1이면 순차 실행)
         """
         self.name = name
         self.description = description
         self.passing_score = passing_score
+        self.max_workers = max_workers
         self.items: List[CheckItem] = []
 
     def add_item(self, item: CheckItem) -> None:
@@ -29,16 +33,46 @@ class Checklist:
         """
         모든 체크 항목 실행
 
+        independent 항목은 max_workers 범위 내에서 동시 실행되며,
+        점수 집계와 items 순서는 등록 순서 그대로 유지됨.
+        requires 항목 중 통과하지 못한 것이 있으면 검증 함수를 실행하지 않고 SKIPPED로 기록
+
         Returns:
             실행 결과 딕셔너리
         """
+        prerequisites = self._build_prerequisites()
+
+        if self.max_workers > 1 and any(item.independent for item in self.items):
+            outcomes = self._execute_concurrent(prerequisites)
+        else:
+            outcomes = {}
+            for idx in self._execution_order(prerequisites):
+                outcomes[idx] = self._run_item(idx, outcomes)
+
+        return self._summarize(outcomes)
+
+    def skip_all(self, reason: str) -> Dict[str, Any]:
+        """
+        모든 항목을 실행하지 않고 SKIPPED로 기록 (검증기 단위 선행 조건 실패)
+
+        Returns:
+            execute_all()과 같은 형식의 결과 딕셔너리 (0점)
+        """
+        return self._summarize({idx: item.skip(reason) for idx, item in enumerate(self.items)})
+
+    def get_total_points(self) -> int:
+        """총 배점 계산"""
+        return sum(item.points for item in self.items)
+
+    def _summarize(self, outcomes: Dict[int, bool]) -> Dict[str, Any]:
+        """항목별 성공 여부로 점수/합격 여부 집계 (items는 등록 순서)"""
         results = []
         passed_count = 0
         total_points = 0
         earned_points = 0
 
-        for item in self.items:
-            success = item.execute()
+        for idx, item in enumerate(self.items):
+            success = outcomes[idx]
             results.append(item.to_dict())
 
             total_points += item.points
@@ -54,6 +88,7 @@ class Checklist:
             "description": self.description,
             "total_items": len(self.items),
             "passed_items": passed_count,
+            "skipped_items": sum(1 for item in self.items if item.status == CheckStatus.SKIPPED),
             "total_points": total_points,
             "earned_points": earned_points,
             "score": round(score, 2),
@@ -62,6 +97,88 @@ class Checklist:
             "items": results
         }
 
-    def get_total_points(self) -> int:
-        """총 배점 계산"""
-        return sum(item.points for item in self.items)
+    # -- 스케줄링 헬퍼 --
+
+    def _build_prerequisites(self) -> List[Set[int]]:
+        """
+        항목별 선행 항목 인덱스 집합 계산
+
+        - depends_on/requires에 명시한 항목
+        - independent가 아니면 앞선 모든 항목 (기존 순차 실행 의미 보존)
+
+        Raises:
+            ValueError: 존재하지 않는 항목 ID 참조
+        """
+        index_of = {item.id: idx for idx, item in enumerate(self.items)}
+        prerequisites = []
+        for idx, item in enumerate(self.items):
+            prereq = set() if item.independent else set(range(idx))
+            for dep_id in item.depends_on + item.requires:
+                if dep_id not in index_of:
+                    raise ValueError(f"'{item.id}'의 의존 항목 '{dep_id}'이(가) 존재하지 않습니다")
+                prereq.add(index_of[dep_id])
+            prerequisites.append(prereq)
+        return prerequisites
+
+    def _execution_order(self, prerequisites: List[Set[int]]) -> List[int]:
+        """
+        선행 조건을 만족하는 실행 순서 (등록 순서 우선 위상 정렬)
+
+        Raises:
+            ValueError: 의존 관계에 순환이 있는 경우
+        """
+        remaining = list(range(len(self.items)))
+        done: Set[int] = set()
+        order = []
+        while remaining:
+            for idx in remaining:
+                if prerequisites[idx] <= done:
+                    break
+            else:
+                cycle = ", ".join(self.items[i].id for i in remaining)
+                raise ValueError(f"체크 항목 의존 관계에 순환이 있습니다: {cycle}")
+            remaining.remove(idx)
+            done.add(idx)
+            order.append(idx)
+        return order
+
+    def _unmet_requirements(self, idx: int, outcomes: Dict[int, bool]) -> List[str]:
+        """requires 항목 중 통과하지 못한 항목 ID"""
+        index_of = {item.id: i for i, item in enumerate(self.items)}
+        return [dep_id for dep_id in self.items[idx].requires
+                if not outcomes.get(index_of[dep_id], False)]
+
+    def _run_item(self, idx: int, outcomes: Dict[int, bool]) -> bool:
+        """선행 조건을 확인한 뒤 항목 실행 (미충족 시 건너뜀)"""
+        unmet = self._unmet_requirements(idx, outcomes)
+        if unmet:
+            return self.items[idx].skip(f"선행 항목 실패: {', '.join(unmet)}")
+        return self.items[idx].execute()
+
+    def _execute_concurrent(self, prerequisites: List[Set[int]]) -> Dict[int, bool]:
+        """선행 항목이 끝난 항목부터 스레드 풀에 제출하여 실행"""
+        # 순환 의존은 실행 전에 검출
+        self._execution_order(prerequisites)
+
+        outcomes: Dict[int, bool] = {}
+        pending = set(range(len(self.items)))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+            while pending or running:
+                for idx in sorted(pending):
+                    if prerequisites[idx] <= outcomes.keys():
+                        pending.discard(idx)
+                        if self._unmet_requirements(idx, outcomes):
+                            # 건너뛰는 항목은 스레드 풀에 제출하지 않음
+                            outcomes[idx] = self._run_item(idx, outcomes)
+                        else:
+                            running[pool.submit(self.items[idx].execute)] = idx
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    outcomes[running.pop(future)] = future.result()
+
+        return outcomes
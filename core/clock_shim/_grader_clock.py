@@ -0,0 +1,158 @@
+"""
+학습자 프로세스용 가상 시계 (virtual clock)
+
+install()을 호출하면
+- time.time / time.monotonic / time.perf_counter (및 *_ns)가 실제 시각 + 가상 오프셋을 반환
+- datetime.datetime.now/utcnow/today, datetime.date.today도 같은 가상 시각을 사용
+  (datetime 모듈의 datetime/date를 하위 클래스로 교체, isinstance 판정은 원래 클래스와 동일)
+- sys.stdin에서 제어 줄 `__grader_clock__ advance <초>`를 가로채 오프셋을 증가
+  (제어 줄은 학습자 코드에 전달되지 않으므로 REPL 응답 순서가 바뀌지 않음)
+
+TTL 만료 검증에서 time.sleep() 대신 시계를 앞당겨, 학습자의 실제 lazy deletion
+경로(time.time() 또는 datetime.now() 비교)를 수 밀리초 안에 실행하기 위한 용도.
+학습자 프로세스 안에서 실행되므로 표준 라이브러리만 사용
+"""
+import datetime
+import sys
+import time
+
+CONTROL_PREFIX = "__grader_clock__"
+
+_offset = 0.0
+_installed = False
+
+
+def advance(seconds: float) -> None:
+    """가상 시계를 seconds만큼 앞당김"""
+    global _offset
+    _offset += seconds
+
+
+def _handle_control(line: str) -> bool:
+    """제어 줄이면 처리 후 True"""
+    if not line.startswith(CONTROL_PREFIX):
+        return False
+    parts = line.split()
+    if len(parts) == 3 and parts[1] == "advance":
+        try:
+            advance(float(parts[2]))
+        except ValueError:
+            pass
+    return True
+
+
+class _ClockControlledStdin:
+    """제어 줄을 걸러내는 stdin 래퍼 (나머지 속성은 원래 스트림에 위임)"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def readline(self, size=-1):
+        while True:
+            line = self._stream.readline(size)
+            if not _handle_control(line):
+                return line
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def readlines(self, hint=-1):
+        return list(self)
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return "".join(self)
+        return self._stream.read(size)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _shifted(real):
+    def now():
+        return real() + _offset
+    now.__name__ = real.__name__
+    now.__doc__ = real.__doc__
+    return now
+
+
+def _shifted_ns(real):
+    def now_ns():
+        return real() + int(_offset * 1_000_000_000)
+    now_ns.__name__ = real.__name__
+    now_ns.__doc__ = real.__doc__
+    return now_ns
+
+
+class _RealClassMeta(type):
+    """isinstance/issubclass를 원래 datetime 클래스 기준으로 판정 (교체 전에 만든 객체 포함)"""
+
+    def __instancecheck__(cls, obj):
+        return isinstance(obj, cls._real)
+
+    def __subclasscheck__(cls, subclass):
+        return issubclass(subclass, cls._real)
+
+
+def _virtual_datetime_classes():
+    """현재 시각을 time.time()(가상 시계)에서 읽는 date/datetime 하위 클래스"""
+    real_date = datetime.date
+    real_datetime = datetime.datetime
+
+    class date(real_date, metaclass=_RealClassMeta):
+        _real = real_date
+
+        @classmethod
+        def today(cls):
+            return cls.fromtimestamp(time.time())
+
+    class datetime_(real_datetime, metaclass=_RealClassMeta):
+        _real = real_datetime
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.fromtimestamp(time.time(), tz)
+
+        @classmethod
+        def utcnow(cls):
+            return cls.fromtimestamp(time.time(), datetime.timezone.utc).replace(tzinfo=None)
+
+        @classmethod
+        def today(cls):
+            return cls.fromtimestamp(time.time())
+
+    # pickle/copy가 datetime.datetime, datetime.date 이름으로 찾고 repr도 원래와 같도록
+    for cls, name in ((date, "date"), (datetime_, "datetime")):
+        cls.__name__ = cls.__qualname__ = name
+        cls.__module__ = "datetime"
+        cls.__repr__ = _module_qualified_repr(cls.__base__)
+    return date, datetime_
+
+
+def _module_qualified_repr(real):
+    def __repr__(self):
+        return "datetime." + real.__repr__(self)
+    return __repr__
+
+
+def install() -> None:
+    """time·datetime 함수와 sys.stdin을 가상 시계 버전으로 교체 (중복 호출 무시)"""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+
+    for name in ("time", "monotonic", "perf_counter"):
+        setattr(time, name, _shifted(getattr(time, name)))
+    for name in ("time_ns", "monotonic_ns", "perf_counter_ns"):
+        setattr(time, name, _shifted_ns(getattr(time, name)))
+    datetime.date, datetime.datetime = _virtual_datetime_classes()
+
+    if sys.stdin is not None:
+        sys.stdin = _ClockControlledStdin(sys.stdin)
@@ -0,0 +1,72 @@
+"""
+학습자 프로세스용 입력 대기 신호 (input marker)
+
+install()을 호출하면 학습자 코드가 sys.stdin에서 한 줄을 읽으려 할 때마다
+stdout에 INPUT_MARKER를 먼저 출력함. 같은 stdout 스트림에 순서대로 기록되므로
+채점 측(core.async_repl)은 마커까지 읽으면 "직전 명령의 응답 출력이 끝나고
+다음 입력을 기다리는 중"임을 정확히 알 수 있음 (프롬프트 문자열과 무관).
+마커는 채점 측에서 제거되므로 실행 기록에는 남지 않음.
+
+학습자 프로세스 안에서 실행되므로 표준 라이브러리만 사용
+"""
+import os
+import sys
+
+# 학습자 출력과 섞일 일이 없는 바이트열 (NUL로 감쌈)
+INPUT_MARKER = "\x00__grader_input__\x00"
+
+_installed = False
+
+
+def _signal() -> None:
+    """지금까지의 stdout을 비우고 마커 출력"""
+    stream = sys.__stdout__
+    if stream is None:
+        return
+    try:
+        if sys.stdout is not None and sys.stdout is not stream:
+            sys.stdout.flush()
+        stream.flush()
+        os.write(stream.fileno(), INPUT_MARKER.encode("ascii"))
+    except (OSError, ValueError):
+        pass
+
+
+class _InputSignalingStdin:
+    """한 줄(또는 전체)을 읽기 전에 마커를 출력하는 stdin 래퍼"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def readline(self, size=-1):
+        _signal()
+        return self._stream.readline(size)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def readlines(self, hint=-1):
+        return list(self)
+
+    def read(self, size=-1):
+        _signal()
+        return self._stream.read(size)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def install() -> None:
+    """sys.stdin을 마커 출력 버전으로 교체 (중복 호출 무시)"""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    if sys.stdin is not None:
+        sys.stdin = _InputSignalingStdin(sys.stdin)
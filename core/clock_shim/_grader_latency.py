@@ -0,0 +1,61 @@
+"""
+학습자 프로세스용 명령별 처리 시간 기록 (latency recorder)
+
+install(path)을 호출하면 sys.stdin에서 한 줄을 읽을 때마다 시각(perf_counter_ns)을 기록하고,
+프로세스 종료 시(atexit) path에 int64 배열로 저장.
+연속한 두 읽기 시각의 차이가 그 사이에 처리한 명령 1건의 처리 시간(응답 출력 포함)이므로,
+stdin을 일괄 전달해도 주고받기 지연 없이 명령별 지연 시간 분포를 얻을 수 있음 (benchmarks.runner).
+
+학습자 프로세스 안에서 실행되므로 표준 라이브러리만 사용
+"""
+import atexit
+import sys
+import time
+from array import array
+
+_stamps = array("q")
+_installed = False
+
+
+class _LatencyRecordingStdin:
+    """한 줄(또는 전체)을 읽기 전에 시각을 기록하는 stdin 래퍼"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def readline(self, size=-1):
+        _stamps.append(time.perf_counter_ns())
+        return self._stream.readline(size)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def readlines(self, hint=-1):
+        return list(self)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _dump(path: str) -> None:
+    try:
+        with open(path, "wb") as f:
+            _stamps.tofile(f)
+    except OSError:
+        pass
+
+
+def install(path: str) -> None:
+    """sys.stdin을 기록 버전으로 교체하고 종료 시 path에 저장 (중복 호출 무시)"""
+    global _installed
+    if _installed or sys.stdin is None:
+        return
+    _installed = True
+    sys.stdin = _LatencyRecordingStdin(sys.stdin)
+    atexit.register(_dump, path)
@@ -0,0 +1,26 @@
+"""
+학습자 프로세스 훅 자동 설치
+
+이 디렉토리를 PYTHONPATH에 넣고 학습자 스크립트를 실행하면
+인터프리터 기동 시(site 모듈) 학습자 코드보다 먼저 훅이 설치됨
+
+- GRADER_INPUT_MARKER=1: 입력 대기 신호 (core.async_repl 대화형 드라이버용)
+- GRADER_VIRTUAL_CLOCK=1: 가상 시계
+- GRADER_LATENCY_FILE=<경로>: 명령별 처리 시간 기록 (benchmarks.runner용)
+
+입력 대기 신호와 가상 시계가 둘 다 설치되면 가상 시계 stdin 래퍼가 바깥쪽이 되어, 시계 제어 줄을 읽을 때도
+입력 대기 신호가 나감 (드라이버는 제어 줄을 일반 명령과 같은 순서로 보냄)
+"""
+import os
+
+if os.environ.get("GRADER_INPUT_MARKER") == "1":
+    import _grader_input
+    _grader_input.install()
+
+if os.environ.get("GRADER_VIRTUAL_CLOCK") == "1":
+    import _grader_clock
+    _grader_clock.install()
+
+if os.environ.get("GRADER_LATENCY_FILE"):
+    import _grader_latency
+    _grader_latency.install(os.environ["GRADER_LATENCY_FILE"])
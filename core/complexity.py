@@ -0,0 +1,261 @@
+"""
+학습자 자료구조 시간 복잡도 검증 (ComplexityCheckItem)
+
+출력 비교만으로는 O(1) 자료구조 대신 리스트 선형 탐색/min() 탐색으로 구현해도 통과하므로,
+크기 n을 바꿔 가며 같은 수의 연산을 실행하고 연산당 비용이 n에 따라 얼마나 늘어나는지 측정.
+
+크기마다 학습자 REPL을 preload(n)(크기 n의 상태를 만드는 명령) + measured(n)(측정 대상 명령 ops개)로
+1번 실행(core.sandbox)하고, 명령별 처리 시각 기록 훅(core/clock_shim/_grader_latency)으로
+측정 구간만의 처리 시간을 구해 ops로 나눈 값을 연산당 비용으로 사용
+(인터프리터 기동·preload 비용은 포함되지 않음. 측정 구간을 SEGMENT_CHUNKS개로 나눈 구간별 값 중
+최솟값을 써서 일시적인 지연의 영향을 줄임).
+stdin을 한 줄씩 읽지 않아 명령별 시각이 기록되지 않는 REPL은, preload만 / preload+measured 두 실행의
+CPU 시간 차이(각 repeats회 중 최솟값)로 대신 측정.
+log(크기)-log(연산당 비용) 최소제곱 기울기(증가 지수)가 max_exponent 이하이면 통과
+— O(1)/O(log n)은 0 부근, O(n)은 1 부근.
+
+기본 크기는 벤치마크(10^3~10^6)보다 작은 1000/4000/16000이다. REPL은 명령 1건 처리에 30µs 안팎이 들어
+n=10^5이면 preload만으로 실행 1회에 4초 가까이 걸리므로, 학습자 1명당 측정 시간을 2초 남짓으로 유지하면서
+크기 범위를 16배로 두어 O(n) 구현의 연산당 비용 증가가 잡음보다 충분히 크게 함.
+원소당 비용이 작은 O(n)(연결 리스트 순회 등)은 작은 n에서 명령 처리 고정 비용에 묻히므로
+워크로드별로 더 큰 sizes를 넘길 수 있음 (예: DS LRU)
+"""
+import math
+import os
+import subprocess
+import sys
+import tempfile
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from . import sandbox
+from .check_item import CheckItem
+from .grading_context import GradingContext
+from .sandbox import SandboxLimits
+
+# 크기 n → (상태를 만드는 명령 목록, 측정할 명령 목록)
+Workload = Callable[[int], Tuple[List[str], List[str]]]
+
+DEFAULT_SIZES = (1000, 4000, 16000)
+DEFAULT_MAX_EXPONENT = 0.5  # O(1)/O(log n) ≈ 0, O(n) ≈ 1
+DEFAULT_REPEATS = 2
+DEFAULT_TIMEOUT = 10.0      # 실행 1회 벽시계 제한 (초)
+# 이보다 오래 걸린 실행은 잡음 비중이 작으므로 반복하지 않음 (O(n) 구현의 채점 시간 절약)
+_REPEAT_BELOW_SECONDS = 1.0
+# 측정값이 0 이하(잡음)여도 log를 취할 수 있도록 하는 연산당 비용 하한 (초)
+_MIN_PER_OP = 1e-7
+# 측정 구간을 나누는 수 (구간별 연산당 비용의 최솟값 사용)
+SEGMENT_CHUNKS = 5
+
+# 명령별 처리 시각 기록 훅 (core/clock_shim/sitecustomize.py)
+_SHIM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "clock_shim")
+
+
+@dataclass
+class ScalingResult:
+    """
+    크기별 연산당 비용 측정 결과
+
+    Attributes:
+        sizes: 측정한 크기 n 목록
+        per_op: 크기별 연산당 처리 시간 (초)
+        exponent: log-log 기울기 (측정 실패 시 None)
+        max_exponent: 통과 기준 기울기 상한
+        error: 측정 실패 사유 (시간 초과, 실행 실패 등)
+    """
+    sizes: List[int]
+    per_op: List[float]
+    exponent: Optional[float]
+    max_exponent: float
+    error: Optional[str] = None
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and self.exponent is not None \
+            and self.exponent <= self.max_exponent
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sizes": self.sizes,
+            "per_op_us": [round(value * 1e6, 3) for value in self.per_op],
+            "exponent": None if self.exponent is None else round(self.exponent, 3),
+            "max_exponent": self.max_exponent,
+            "error": self.error,
+        }
+
+
+def fit_exponent(sizes: Sequence[float], values: Sequence[float]) -> float:
+    """
+    values ≈ c · sizes^k 의 k (log-log 최소제곱 기울기)
+
+    Raises:
+        ValueError: 서로 다른 크기가 2개 미만이거나 값이 양수가 아닌 경우
+    """
+    if len(set(sizes)) < 2 or len(sizes) != len(values):
+        raise ValueError("서로 다른 크기 2개 이상의 측정값이 필요합니다")
+    if min(values) <= 0:
+        raise ValueError("측정값은 양수여야 합니다")
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(value) for value in values]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    return numerator / denominator
+
+
+def probe_repl_scaling(script_path: Optional[str], workload: Workload, name: str,
+                       cwd: Optional[str] = None,
+                       sizes: Sequence[int] = DEFAULT_SIZES,
+                       max_exponent: float = DEFAULT_MAX_EXPONENT,
+                       repeats: int = DEFAULT_REPEATS,
+                       timeout: float = DEFAULT_TIMEOUT,
+                       context: Optional[GradingContext] = None,
+                       ) -> Optional[ScalingResult]:
+    """
+    학습자 REPL의 연산당 비용이 크기에 따라 늘어나는 정도 측정
+
+    Args:
+        script_path: 학습자 REPL 스크립트 (None이거나 없으면 None 반환)
+        workload: 크기 n → (preload 명령, 측정 명령). 측정 명령 수는 n과 무관하게 고정 권장
+        name: 워크로드 이름 (GradingContext 공유 키)
+        cwd: 작업 디렉토리
+        sizes: 측정할 크기 목록
+        max_exponent: 통과 기준 기울기 상한
+        repeats: CPU 시간 차분으로 대신 측정할 때 실행별 반복 횟수 (최솟값 사용)
+        timeout: 실행 1회 벽시계 제한 (초)
+        context: 채점 컨텍스트 (같은 워크로드 측정 결과 공유 + 자원 제한)
+
+    Returns:
+        ScalingResult (스크립트가 없으면 None)
+    """
+    if not script_path or not os.path.isfile(script_path):
+        return None
+
+    limits = context.sandbox if context is not None else None
+
+    def execute() -> ScalingResult:
+        return _probe(script_path, workload, cwd, list(sizes), max_exponent,
+                      repeats, timeout, limits)
+
+    if context is None:
+        return execute()
+    return context.get_or_create(
+        ("complexity", script_path, name, cwd, tuple(sizes), max_exponent, repeats, timeout),
+        execute,
+    )
+
+
+def _probe(script_path: str, workload: Workload, cwd: Optional[str], sizes: List[int],
+           max_exponent: float, repeats: int, timeout: float,
+           limits: Optional[SandboxLimits]) -> ScalingResult:
+    per_op: List[float] = []
+    for size in sizes:
+        preload, measured = workload(size)
+        try:
+            value = _segment_per_op(script_path, preload, measured, cwd, timeout, limits)
+            if value is None:
+                base = _min_cpu_time(script_path, preload, cwd, repeats, timeout, limits)
+                full = _min_cpu_time(script_path, preload + measured, cwd, repeats, timeout, limits)
+                value = (full - base) / max(len(measured), 1)
+        except subprocess.TimeoutExpired:
+            # O(n²) 이상이면 큰 크기에서 제한 시간을 넘김 → 측정 중단, 실패 처리
+            return ScalingResult(sizes, per_op, None, max_exponent,
+                                 error=f"n={size}에서 {timeout:g}초 제한 시간 초과")
+        except (OSError, RuntimeError) as e:
+            return ScalingResult(sizes, per_op, None, max_exponent, error=str(e))
+        per_op.append(value)
+    per_op = [max(value, _MIN_PER_OP) for value in per_op]
+    return ScalingResult(sizes, per_op, fit_exponent(sizes, per_op), max_exponent)
+
+
+def _segment_per_op(script_path: str, preload: List[str], measured: List[str],
+                    cwd: Optional[str], timeout: float,
+                    limits: Optional[SandboxLimits]) -> Optional[float]:
+    """
+    preload 다음 measured 구간의 연산당 처리 시간 (초, 구간별 최솟값)
+
+    Returns:
+        연산당 처리 시간 또는 None (명령별 시각이 기록되지 않음 — stdin을 한 번에 읽는 REPL 등)
+    """
+    stdin = "\n".join(preload + measured + ["exit"]) + "\n"
+    with tempfile.TemporaryDirectory(prefix="complexity_") as workdir:
+        latency_file = os.path.join(workdir, "latency.bin")
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join([_SHIM_DIR] + ([env["PYTHONPATH"]]
+                                                          if env.get("PYTHONPATH") else []))
+        env["GRADER_LATENCY_FILE"] = latency_file
+        proc = sandbox.run([sys.executable, script_path], input=stdin, cwd=cwd,
+                           timeout=timeout, env=env, limits=limits)
+        if proc.returncode != 0:
+            raise RuntimeError(f"학습자 프로세스 비정상 종료 (종료 코드 {proc.returncode})")
+        stamps = array("q")
+        try:
+            with open(latency_file, "rb") as f:
+                stamps.frombytes(f.read())
+        except OSError:
+            return None
+
+    # stamps[j]: j번째 줄을 읽기 직전 시각 → 명령 j의 처리 시간 = stamps[j+1] - stamps[j]
+    start = len(preload)
+    end = start + len(measured)
+    if not measured or len(stamps) <= end:
+        return None
+    chunks = min(SEGMENT_CHUNKS, len(measured))
+    bounds = [start + len(measured) * k // chunks for k in range(chunks + 1)]
+    return min((stamps[hi] - stamps[lo]) / 1e9 / (hi - lo) for lo, hi in zip(bounds, bounds[1:]))
+
+
+def _min_cpu_time(script_path: str, commands: List[str], cwd: Optional[str], repeats: int,
+                  timeout: float, limits: Optional[SandboxLimits]) -> float:
+    """명령 목록을 stdin으로 전달한 실행을 repeats회(1초 이상 걸리면 1회) 반복한 CPU 시간 최솟값 (초)"""
+    stdin = "\n".join(commands + ["exit"]) + "\n"
+    best = None
+    for _ in range(max(repeats, 1)):
+        proc = sandbox.run([sys.executable, script_path], input=stdin, cwd=cwd,
+                           timeout=timeout, limits=limits)
+        if proc.usage is None:
+            raise RuntimeError("이 플랫폼에서는 CPU 시간을 측정할 수 없습니다")
+        if proc.returncode != 0:
+            raise RuntimeError(f"학습자 프로세스 비정상 종료 (종료 코드 {proc.returncode})")
+        cpu_time = proc.usage.cpu_time
+        best = cpu_time if best is None else min(best, cpu_time)
+        if best >= _REPEAT_BELOW_SECONDS:
+            break
+    return best
+
+
+@dataclass
+class ComplexityCheckItem(CheckItem):
+    """
+    연산당 비용 증가 지수로 채점하는 체크 항목
+
+    validator 대신 probe(→ ScalingResult)를 받아, 증가 지수가 기준 이하이면 통과.
+    결과 딕셔너리에 "complexity"(크기별 연산당 비용, 지수, 기준)를 포함
+
+    Attributes:
+        probe: 측정 함수 (보통 probe_repl_scaling을 감싼 함수, 측정 불가면 None 반환)
+        scaling: 마지막 측정 결과
+    """
+    validator: Optional[Callable[[], bool]] = None
+    probe: Optional[Callable[[], Optional[ScalingResult]]] = None
+    scaling: Optional[ScalingResult] = field(default=None)
+
+    def __post_init__(self):
+        if self.validator is None:
+            self.validator = self._check_scaling
+
+    def _check_scaling(self) -> bool:
+        self.scaling = self.probe() if self.probe else None
+        if self.scaling is None:
+            return False
+        if self.scaling.error:
+            self.error_message = self.scaling.error
+        return self.scaling.passed
+
+    def to_dict(self) -> dict:
+        data = super().to_dict()
+        if self.scaling is not None:
+            data["complexity"] = self.scaling.to_dict()
+        return data
@@ -1,11 +1,18 @@
 """
 채점 엔진 (Grader)
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import importlib
+import time
 from pathlib import Path
 
 from .base_validator import BaseValidator
+from .check_item import CheckStatus
+from .grading_context import REPL_DRIVER_ASYNC, REPL_DRIVER_SUBPROCESS, GradingContext
+from .interpreter_pool import InterpreterPool
+from .sandbox import SandboxLimits
+from .transcript_cache import TranscriptCache
 from .validation_result import ValidationResult
 
 
@@ -15,17 +22,30 @@ class Grader:
     플러그인을 로드하고 실행하여 최종 결과를 생성
     """
 
-    def __init__(self, student_id: str, mission_id: str, mission_config: Dict[str, Any]):
+    def __init__(self, student_id: str, mission_id: str, mission_config: Dict[str, Any],
+                 transcript_cache: Optional[TranscriptCache] = None,
+                 interpreter_pool: Optional[InterpreterPool] = None,
+                 profile_dir: Optional[str] = None):
         """
         Args:
             student_id: 학습자 ID
             mission_id: 미션 ID (예: "linux_level1_mission01")
             mission_config: 미션 설정 (config.yaml에서 로드)
+            transcript_cache: 학습자 스크립트 실행 기록 디스크 캐시 (None이면 매번 실행)
+            interpreter_pool: 학습자 스크립트 실행용 웜 인터프리터 풀 (None이면 subprocess)
+            profile_dir: 검증기별 cProfile 통계(.prof) 저장 디렉토리 (None이면 프로파일링 안 함).
+                프로파일링 중에는 parallel_validators/parallel_items와 관계없이 순차 실행
         """
         self.student_id = student_id
         self.mission_id = mission_id
         self.config = mission_config
         self.result = ValidationResult(student_id, mission_id)
+        self.context = GradingContext(transcript_cache=transcript_cache,
+                                      interpreter_pool=interpreter_pool,
+                                      repl_driver=self._repl_driver(),
+                                      sandbox=SandboxLimits.from_setting(
+                                          (mission_config.get("execution") or {}).get("sandbox")))
+        self.profile_dir = profile_dir
 
     def load_validators(self) -> List[BaseValidator]:
         """
@@ -44,8 +64,17 @@ class Grader:
             module = importlib.import_module(module_path)
             validator_class = getattr(module, class_name)
 
-            # 인스턴스 생성
+            # 인스턴스 생성 (검증기 간 공유 컨텍스트 주입)
             validator = validator_class(self.config)
+            validator.context = self.context
+            validator.requires = list(validator_config.get("requires") or [])
+            if self.profile_dir:
+                validator.profile_path = str(
+                    Path(self.profile_dir)
+                    / f"{self.student_id}_{self.mission_id}_{class_name}.prof"
+                )
+                # 항목 스레드는 검증기 스레드의 프로파일에 잡히지 않으므로 순차 실행
+                validator.checklist.max_workers = 1
             validators.append(validator)
 
         return validators
@@ -57,6 +86,9 @@ class Grader:
         Returns:
             ValidationResult 객체
         """
+        start = time.perf_counter()
+        if self.profile_dir:
+            Path(self.profile_dir).mkdir(parents=True, exist_ok=True)
         validators = self.load_validators()
 
         # validator별 weight 매핑 (config에서 로드)
@@ -64,20 +96,177 @@ class Grader:
         for vc in self.config.get("validators", []):
             weight_map[vc["class"]] = vc.get("weight", 0)
 
-        for validator in validators:
+        workers = self._parallel_workers(len(validators))
+        prerequisites = self._build_prerequisites(validators)
+        try:
+            if workers > 1:
+                outcomes = self._execute_concurrent(validators, prerequisites, workers)
+            else:
+                outcomes = {}
+                for idx in self._execution_order(validators, prerequisites):
+                    outcomes[idx] = self._run_or_skip(validators, idx, outcomes)
+            # 리포트 순서는 validators 목록 순서 그대로 (결정적)
+            results = [outcomes[idx] for idx in range(len(validators))]
+        finally:
+            # 공유 실행 기록/임시 파일 정리
+            self.context.close()
+
+        for validator, result in zip(validators, results):
             validator_name = validator.__class__.__name__
             weight = weight_map.get(validator_name, 0)
+            self.result.add_result(validator_name, result, weight=weight)
 
-            try:
-                result = validator.validate()
-                self.result.add_result(validator_name, result, weight=weight)
-            except Exception as e:
-                # 검증기 실행 중 오류 발생 시 기록
-                self.result.add_result(validator_name, {
-                    "error": f"검증기 실행 실패: {str(e)}",
-                    "is_passed": False,
-                    "score": 0
-                }, weight=weight)
-
+        self.result.elapsed = time.perf_counter() - start
         self.result.finalize()
         return self.result
+
+    def _parallel_workers(self, validator_count: int) -> int:
+        """
+        config.yaml의 execution.parallel_validators 설정으로 동시 실행 수 결정
+
+        - false/미설정: 1 (순차 실행)
+        - true: 검증기 수만큼
+        - 정수 N: 최대 N개
+
+        프로파일링 중에는 항상 1 — 검증기마다 cProfile을 켜므로, 동시에 실행하면
+        Python 3.12부터는 다른 프로파일러가 활성 상태라 ValueError가 남
+        """
+        if self.profile_dir:
+            return 1
+        setting = (self.config.get("execution") or {}).get("parallel_validators", False)
+        if setting is True:
+            return validator_count
+        if isinstance(setting, int) and not isinstance(setting, bool):
+            return max(1, min(setting, validator_count))
+        return 1
+
+    def _repl_driver(self) -> str:
+        """
+        config.yaml의 execution.repl_driver로 학습자 스크립트 실행 방식 결정
+
+        - "subprocess"/미설정: stdin 일괄 전달 (웜 인터프리터 풀 또는 새 프로세스)
+        - "async": asyncio 대화형 드라이버 (명령 1줄씩 주고받음, 명령별 지연 시간 기록)
+        """
+        setting = (self.config.get("execution") or {}).get("repl_driver")
+        if setting == REPL_DRIVER_ASYNC:
+            return REPL_DRIVER_ASYNC
+        return REPL_DRIVER_SUBPROCESS
+
+    # -- 선행 조건 (config.yaml의 validators[].requires) --
+
+    @staticmethod
+    def _build_prerequisites(validators: List[BaseValidator]) -> List[Set[int]]:
+        """
+        검증기별 선행 검증기 인덱스 집합
+
+        requires 항목은 "검증기 클래스명"(검증기 합격 필요) 또는
+        "검증기 클래스명.항목ID"(해당 항목 통과 필요)
+
+        Raises:
+            ValueError: 목록에 없는 검증기 참조
+        """
+        index_of = {v.__class__.__name__: idx for idx, v in enumerate(validators)}
+        prerequisites = []
+        for validator in validators:
+            prereq = set()
+            for requirement in validator.requires:
+                name = requirement.split(".", 1)[0]
+                if name not in index_of:
+                    raise ValueError(f"'{validator.__class__.__name__}'의 선행 조건 "
+                                     f"'{requirement}'이(가) 검증기 목록에 없습니다")
+                prereq.add(index_of[name])
+            prerequisites.append(prereq)
+        return prerequisites
+
+    @staticmethod
+    def _execution_order(validators: List[BaseValidator],
+                         prerequisites: List[Set[int]]) -> List[int]:
+        """
+        선행 검증기가 먼저 오는 실행 순서 (목록 순서 우선 위상 정렬)
+
+        Raises:
+            ValueError: 선행 조건에 순환이 있는 경우
+        """
+        remaining = list(range(len(validators)))
+        done: Set[int] = set()
+        order = []
+        while remaining:
+            for idx in remaining:
+                if prerequisites[idx] <= done:
+                    break
+            else:
+                cycle = ", ".join(validators[i].__class__.__name__ for i in remaining)
+                raise ValueError(f"검증기 선행 조건에 순환이 있습니다: {cycle}")
+            remaining.remove(idx)
+            done.add(idx)
+            order.append(idx)
+        return order
+
+    def _execute_concurrent(self, validators: List[BaseValidator],
+                            prerequisites: List[Set[int]],
+                            workers: int) -> Dict[int, Dict[str, Any]]:
+        """선행 검증기가 끝난 검증기부터 스레드 풀에 제출 (subprocess 대기 위주 작업)"""
+        self._execution_order(validators, prerequisites)
+
+        outcomes: Dict[int, Dict[str, Any]] = {}
+        pending = set(range(len(validators)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            running = {}
+            while pending or running:
+                for idx in sorted(pending):
+                    if prerequisites[idx] <= outcomes.keys():
+                        pending.discard(idx)
+                        reason = self._unmet_requirement(validators, idx, outcomes)
+                        if reason:
+                            # 건너뛰는 검증기는 학습자 코드를 실행하지 않으므로 바로 기록
+                            outcomes[idx] = validators[idx].skip(reason)
+                        else:
+                            running[pool.submit(self._run_validator, validators[idx])] = idx
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    outcomes[running.pop(future)] = future.result()
+        return outcomes
+
+    def _run_or_skip(self, validators: List[BaseValidator], idx: int,
+                     outcomes: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        """선행 조건을 확인한 뒤 검증기 실행 (미충족 시 setup 없이 전 항목 SKIPPED)"""
+        reason = self._unmet_requirement(validators, idx, outcomes)
+        if reason:
+            return validators[idx].skip(reason)
+        return self._run_validator(validators[idx])
+
+    @staticmethod
+    def _unmet_requirement(validators: List[BaseValidator], idx: int,
+                           outcomes: Dict[int, Dict[str, Any]]) -> Optional[str]:
+        """충족되지 않은 선행 조건이 있으면 건너뛰는 사유, 모두 충족하면 None"""
+        index_of = {v.__class__.__name__: i for i, v in enumerate(validators)}
+        unmet = []
+        for requirement in validators[idx].requires:
+            name, _, item_id = requirement.partition(".")
+            result = outcomes[index_of[name]]
+            if item_id:
+                statuses = {item["id"]: item["status"] for item in result.get("items", [])}
+                satisfied = statuses.get(item_id) == CheckStatus.PASSED.value
+            else:
+                satisfied = bool(result.get("is_passed"))
+            if not satisfied:
+                unmet.append(requirement)
+        if unmet:
+            return f"선행 조건 실패: {', '.join(unmet)}"
+        return None
+
+    @staticmethod
+    def _run_validator(validator: BaseValidator) -> Dict[str, Any]:
+        """검증기 1개 실행 (예외 발생 시 실패 결과로 변환)"""
+        try:
+            return validator.validate()
+        except Exception as e:
+            # 검증기 실행 중 오류 발생 시 기록
+            return {
+                "error": f"검증기 실행 실패: {str(e)}",
+                "is_passed": False,
+                "score": 0
+            }
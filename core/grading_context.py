@@ -0,0 +1,92 @@
+"""
+채점 컨텍스트 (GradingContext)
+
+학습자 1명 × 미션 1개 채점 동안 여러 검증기가 공유하는 저장소.
+REPL 실행 기록처럼 비용이 큰 결과를 키 단위로 1회만 계산하여 재사용
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from .interpreter_pool import InterpreterPool
+from .sandbox import SandboxLimits
+from .transcript_cache import TranscriptCache
+
+# 학습자 스크립트 실행 방식 (config.yaml의 execution.repl_driver)
+REPL_DRIVER_SUBPROCESS = "subprocess"  # stdin 일괄 전달 (웜 풀 또는 새 프로세스)
+REPL_DRIVER_ASYNC = "async"            # asyncio 대화형 드라이버 (core.async_repl)
+
+
+class GradingContext:
+    """
+    채점 1회 범위의 공유 저장소
+
+    검증기가 병렬 실행(execution.parallel_validators)되어도 같은 키는
+    정확히 1번만 계산되도록 키별 잠금을 사용
+    """
+
+    def __init__(self, transcript_cache: Optional[TranscriptCache] = None,
+                 interpreter_pool: Optional[InterpreterPool] = None,
+                 repl_driver: str = REPL_DRIVER_SUBPROCESS,
+                 sandbox: Optional[SandboxLimits] = None):
+        """
+        Args:
+            transcript_cache: 채점 간 실행 기록 디스크 캐시 (None이면 사용 안 함)
+            interpreter_pool: 학습자 스크립트 실행용 웜 인터프리터 풀 (None이면 subprocess)
+            repl_driver: 학습자 스크립트 실행 방식 ("subprocess" 또는 "async")
+            sandbox: 학습자 프로세스 자원 제한 (None이면 제한 없음, core.sandbox 참고)
+        """
+        self.transcript_cache = transcript_cache
+        self.interpreter_pool = interpreter_pool
+        self.repl_driver = repl_driver
+        self.sandbox = sandbox
+        self._values: Dict[Hashable, Any] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._cleanups: List[Callable[[], None]] = []
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        key에 저장된 값을 반환하고, 없으면 factory()로 계산하여 저장
+
+        Args:
+            key: 공유 키 (예: ("repl", cli_path, commands, ...))
+            factory: 값이 없을 때 호출할 함수
+
+        Returns:
+            공유 값 (검증기는 읽기 전용으로 사용해야 함)
+        """
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    return self._values[key]
+            value = factory()
+            with self._lock:
+                self._values[key] = value
+            return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        """key 값이 이미 계산되어 있는지"""
+        with self._lock:
+            return key in self._values
+
+    def add_cleanup(self, callback: Callable[[], None]) -> None:
+        """채점 종료 시 호출할 정리 함수 등록 (임시 디렉토리 삭제 등)"""
+        with self._lock:
+            self._cleanups.append(callback)
+
+    def close(self) -> None:
+        """등록된 정리 함수를 역순으로 실행하고 공유 값을 비움"""
+        with self._lock:
+            cleanups, self._cleanups = self._cleanups, []
+            self._values.clear()
+            self._key_locks.clear()
+        for callback in reversed(cleanups):
+            try:
+                callback()
+            except Exception:
+                pass
@@ -0,0 +1,227 @@
+"""
+채점 서비스 HTTP API (TCP 또는 Unix 도메인 소켓)
+
+POST /jobs                      작업 제출
+    - JSON 본문: {"student_id", "mission_id", "submission_dir"}
+    - tarball 본문(application/x-tar, application/gzip 등): ?student_id=...&mission_id=...
+    - ?wait=초: 완료될 때까지 최대 N초 대기 후 응답 (완료 200, 미완료 202)
+GET  /jobs/<job_id>[?wait=초]   작업 상태/결과 조회
+GET  /events[?since=seq]        완료 이벤트를 NDJSON으로 스트리밍 (연결 유지, 15초마다 빈 줄)
+GET  /health                    서비스 상태
+
+대기열이 가득 차면 429 + Retry-After로 응답하므로 LMS는 잠시 후 재시도
+"""
+import json
+import os
+import socket
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .grading_service import GradingService, QueueFullError, ServiceClosedError
+
+# 요청 본문 최대 크기 (tarball 업로드 포함)
+MAX_BODY_BYTES = 50 * 1024 * 1024
+
+# 대기 파라미터 상한 (초)
+MAX_WAIT_SECONDS = 600
+
+# /events 스트림 keep-alive 간격 (초)
+EVENT_KEEPALIVE_SECONDS = 15
+
+_ARCHIVE_TYPES = ("application/x-tar", "application/gzip", "application/x-gzip",
+                  "application/octet-stream")
+
+
+class GradingRequestHandler(BaseHTTPRequestHandler):
+    """채점 API 요청 처리 (server.service에 GradingService 필요)"""
+
+    server_version = "CodyseiGrader/1.0"
+
+    # -- 라우팅 --
+
+    def do_POST(self) -> None:
+        path, query = self._parse_url()
+        if path == "/jobs":
+            self._submit_job(query)
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_GET(self) -> None:
+        path, query = self._parse_url()
+        if path == "/health":
+            self._send_json(200, self.service.stats())
+        elif path == "/events":
+            self._stream_events(query)
+        elif path.startswith("/jobs/"):
+            self._get_job(path[len("/jobs/"):], query)
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    # -- 처리 --
+
+    @property
+    def service(self) -> GradingService:
+        return self.server.service
+
+    def _submit_job(self, query: Dict[str, str]) -> None:
+        header = self.headers.get("Content-Length")
+        if header is None:
+            self._send_json(411, {"error": "Content-Length 헤더가 필요합니다"})
+            return
+        try:
+            length = int(header)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            self._send_json(400, {"error": f"Content-Length 값이 올바르지 않습니다 - {header!r}"})
+            return
+        if length > MAX_BODY_BYTES:
+            self._send_json(413, {"error": f"요청 본문이 너무 큽니다 (최대 {MAX_BODY_BYTES} bytes)"})
+            return
+        body = self.rfile.read(length) if length else b""
+        content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+
+        try:
+            if content_type in _ARCHIVE_TYPES:
+                record = self.service.submit_archive(
+                    query.get("student_id", ""), query.get("mission_id", ""), body)
+            else:
+                payload = json.loads(body.decode("utf-8") or "{}")
+                if not isinstance(payload, dict):
+                    raise ValueError("JSON 객체가 필요합니다")
+                record = self.service.submit(
+                    str(payload.get("student_id", "")),
+                    str(payload.get("mission_id", "")),
+                    str(payload.get("submission_dir", "")),
+                )
+        except QueueFullError as e:
+            self._send_json(429, {"error": str(e)}, headers={"Retry-After": "5"})
+            return
+        except ServiceClosedError as e:
+            self._send_json(503, {"error": str(e)})
+            return
+        except (ValueError, UnicodeDecodeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        wait = _wait_seconds(query)
+        state = self.service.wait(record.job_id, wait) if wait else self.service.get(record.job_id)
+        self._send_job(state, pending_code=202)
+
+    def _get_job(self, job_id: str, query: Dict[str, str]) -> None:
+        wait = _wait_seconds(query)
+        state = self.service.wait(job_id, wait) if wait else self.service.get(job_id)
+        if state is None:
+            self._send_json(404, {"error": f"작업을 찾을 수 없습니다 - {job_id}"})
+            return
+        self._send_job(state, pending_code=200)
+
+    def _stream_events(self, query: Dict[str, str]) -> None:
+        """완료 이벤트를 한 줄에 1건씩 전송 (클라이언트가 끊거나 서비스가 종료될 때까지)"""
+        try:
+            since = int(query.get("since", "0"))
+        except ValueError:
+            self._send_json(400, {"error": "since는 정수여야 합니다"})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            while not self.service.closed:
+                events = self.service.wait_events(since, EVENT_KEEPALIVE_SECONDS)
+                if not events:
+                    self.wfile.write(b"\n")
+                for event in events:
+                    since = max(since, event["seq"])
+                    self.wfile.write(json.dumps(event, ensure_ascii=False).encode("utf-8") + b"\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.close_connection = True
+
+    # -- 응답 헬퍼 --
+
+    def _send_job(self, state: Dict[str, Any], pending_code: int) -> None:
+        finished = state["status"] in ("done", "error")
+        self._send_json(200 if finished else pending_code, state)
+
+    def _send_json(self, code: int, payload: Dict[str, Any],
+                   headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _parse_url(self) -> Tuple[str, Dict[str, str]]:
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        return parts.path.rstrip("/") or "/", query
+
+    def address_string(self) -> str:
+        # Unix 소켓은 클라이언트 주소가 없음
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def _wait_seconds(query: Dict[str, str]) -> float:
+    try:
+        return max(0.0, min(float(query.get("wait", "0")), MAX_WAIT_SECONDS))
+    except ValueError:
+        return 0.0
+
+
+class _ServiceMixin:
+    """HTTP 서버에 GradingService를 연결"""
+
+    daemon_threads = True
+    service: GradingService
+    quiet: bool = False
+
+
+class GradingHTTPServer(_ServiceMixin, ThreadingHTTPServer):
+    """TCP 채점 서버"""
+
+
+class GradingUnixServer(_ServiceMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix 도메인 소켓 채점 서버 (같은 호스트의 LMS 전용)"""
+
+    def server_bind(self) -> None:
+        # 이전 실행에서 남은 소켓 파일 제거
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+
+
+def create_server(service: GradingService, host: str = "127.0.0.1", port: int = 8765,
+                  unix_socket: Optional[str] = None, quiet: bool = False) -> socketserver.BaseServer:
+    """
+    채점 API 서버 생성 (serve_forever()는 호출자가 실행)
+
+    Args:
+        service: 시작된 GradingService
+        host, port: TCP 바인드 주소 (unix_socket이 있으면 무시)
+        unix_socket: Unix 도메인 소켓 경로
+        quiet: True면 요청 로그 출력 안 함
+    """
+    if unix_socket:
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("이 플랫폼은 Unix 도메인 소켓을 지원하지 않습니다")
+        server = GradingUnixServer(unix_socket, GradingRequestHandler)
+    else:
+        server = GradingHTTPServer((host, port), GradingRequestHandler)
+    server.service = service
+    server.quiet = quiet
+    return server
@@ -0,0 +1,376 @@
+"""
+상주 채점 서비스 (GradingService)
+
+LMS가 제출물마다 run_grading.py를 새로 띄우는 대신, 미션 설정·검증기 모듈·
+웜 인터프리터 풀을 데워 둔 워커 프로세스에 작업을 넣어 채점.
+
+- 동시 실행 수는 워커 프로세스 수로 제한
+- 대기 + 실행 중 작업이 max_queue에 도달하면 QueueFullError (백프레셔, HTTP 429)
+- 완료된 작업은 일련번호가 붙은 이벤트로 기록되어 스트리밍 조회 가능 (wait_events)
+
+실제 채점은 배치 채점과 같은 grade_job()을 사용하므로 리포트/증분/캐시 동작이 동일함
+"""
+import io
+import re
+import shutil
+import tarfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from utils.config_loader import get_mission_config_path
+
+from .batch_grader import GradingJob, grade_job, load_mission
+from .interpreter_pool import get_shared_pool
+
+# 작업 상태
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_ERROR = "error"
+
+# 학습자/미션 ID는 리포트 파일명에 들어가므로 경로 구분자 등을 허용하지 않음
+_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-][A-Za-z0-9_.-]*$")
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음 (잠시 후 재시도)"""
+
+
+class ServiceClosedError(Exception):
+    """종료 중인 서비스에 작업 제출"""
+
+
+@dataclass
+class JobRecord:
+    """
+    서비스에 제출된 작업 1건
+
+    Attributes:
+        job_id: 작업 ID
+        job: 채점 작업 (학습자, 미션, 제출물 경로)
+        submitted_at: 제출 시각 (epoch 초)
+        status: queued / running / done / error
+        summary: 완료 시 grade_job() 요약
+        seq: 완료 이벤트 일련번호 (완료 전에는 0)
+        spool_dir: 업로드된 tarball을 푼 임시 디렉토리 (완료 후 삭제)
+    """
+    job_id: str
+    job: GradingJob
+    submitted_at: float
+    status: str = STATUS_QUEUED
+    summary: Optional[Dict[str, Any]] = None
+    seq: int = 0
+    spool_dir: Optional[str] = None
+    future: Optional[Future] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (STATUS_DONE, STATUS_ERROR)
+
+    def to_dict(self) -> Dict[str, Any]:
+        status = self.status
+        # 워커에 전달된 작업은 실행 중으로 표시
+        if status == STATUS_QUEUED and self.future is not None and self.future.running():
+            status = STATUS_RUNNING
+        return {
+            "job_id": self.job_id,
+            "student_id": self.job.student_id,
+            "mission_id": self.job.mission_id,
+            "status": status,
+            "submitted_at": self.submitted_at,
+            "seq": self.seq,
+            "summary": self.summary,
+        }
+
+
+def _warm_worker(mission_ids: Sequence[str], warm_pool: bool) -> None:
+    """
+    워커 프로세스 초기화: 미션 설정과 검증기 모듈을 미리 로드
+
+    첫 채점에서 YAML 파싱·검증기 import·인터프리터 풀 기동 비용이 들지 않도록 함.
+    이후 설정/검증기 소스가 바뀌면 grade_job()이 load_mission()으로 다시 로드
+    """
+    for mission_id in mission_ids:
+        load_mission(mission_id)
+    if warm_pool:
+        pool = get_shared_pool()
+        if pool is not None:
+            try:
+                pool.prestart(1)
+            except OSError:
+                # 기동 실패 시 첫 실행에서 다시 시도
+                pass
+
+
+def _mission_exists(mission_id: str) -> bool:
+    """
+    미션 config.yaml 존재 여부
+
+    인증 없는 제출 요청마다 호출되므로 결과를 캐시하지 않음
+    (없는 ID로 메모리가 늘지 않고, 실행 중 추가된 미션도 바로 받음)
+    """
+    config_path = get_mission_config_path(mission_id)
+    return config_path is not None and config_path.is_file()
+
+
+def extract_submission_archive(data: bytes, dest_dir: str) -> str:
+    """
+    제출물 tarball(.tar / .tar.gz 등)을 dest_dir에 풀고 제출물 루트 경로 반환
+
+    아카이브 최상위에 디렉토리 1개만 있으면 그 디렉토리를 제출물 루트로 사용.
+    절대 경로, 상위 디렉토리(..), 링크/장치 파일 등은 거부
+
+    Raises:
+        ValueError: 읽을 수 없거나 안전하지 않은 아카이브
+    """
+    dest = Path(dest_dir)
+    dest.mkdir(parents=True, exist_ok=True)
+    try:
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:*") as tar:
+            for member in tar.getmembers():
+                if not (member.isfile() or member.isdir()):
+                    raise ValueError(f"지원하지 않는 아카이브 항목: {member.name}")
+                target = (dest / member.name).resolve()
+                if target != dest.resolve() and dest.resolve() not in target.parents:
+                    raise ValueError(f"제출물 밖을 가리키는 경로: {member.name}")
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(dest, filter="data")
+            else:
+                tar.extractall(dest)
+    except (tarfile.TarError, OSError) as e:
+        raise ValueError(f"제출물 아카이브를 풀 수 없습니다: {e}") from e
+
+    entries = [p for p in dest.iterdir() if not p.name.startswith(".")]
+    if len(entries) == 1 and entries[0].is_dir():
+        return str(entries[0])
+    return str(dest)
+
+
+class GradingService:
+    """
+    작업 대기열 + 워커 프로세스 풀
+
+    HTTP 처리 스레드 여러 개가 동시에 submit/get/wait를 호출해도 안전
+    """
+
+    def __init__(self, output_dir: str, workers: int = 2, max_queue: int = 64,
+                 cache_dir: Optional[str] = None, incremental: bool = False,
+                 warm_pool: bool = True, profile_dir: Optional[str] = None,
+                 preload: Sequence[str] = (), spool_dir: Optional[str] = None,
+                 keep_finished: int = 1000):
+        """
+        Args:
+            output_dir: 리포트 저장 디렉토리
+            workers: 채점 워커 프로세스 수 (동시 채점 수)
+            max_queue: 대기 + 실행 중 작업 최대 수 (초과 시 QueueFullError)
+            cache_dir: 실행 기록 캐시 디렉토리 (None이면 미사용)
+            incremental: True면 변경 없는 제출물은 이전 결과 재사용
+            warm_pool: True면 워커마다 웜 인터프리터 풀 사용
+            profile_dir: 검증기별 cProfile 통계 저장 디렉토리
+            preload: 워커 기동 시 미리 로드할 미션 ID 목록
+            spool_dir: 업로드된 tarball을 풀 디렉토리
+            keep_finished: 조회용으로 보관할 완료 작업 수
+        """
+        self.output_dir = output_dir
+        self.workers = max(1, workers)
+        self.max_queue = max(1, max_queue)
+        self.cache_dir = cache_dir
+        self.incremental = incremental
+        self.warm_pool = warm_pool
+        self.profile_dir = profile_dir
+        self.preload = list(preload)
+        self.spool_dir = spool_dir
+        self.keep_finished = keep_finished
+
+        self._jobs: "OrderedDict[str, JobRecord]" = OrderedDict()
+        self._events: List[JobRecord] = []
+        self._seq = 0
+        self._pending = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    # -- 수명 주기 --
+
+    def start(self) -> None:
+        """워커 프로세스 풀 시작"""
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_warm_worker,
+            initargs=(tuple(self.preload), self.warm_pool),
+        )
+        # 빈 작업 1건으로 워커를 기동하여 첫 제출 전에 초기화(_warm_worker)를 끝내 둠
+        self._executor.submit(int).result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """새 작업 거부 후 풀 종료 (wait=False면 대기 중 작업 취소)"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    # -- 작업 제출/조회 --
+
+    def submit(self, student_id: str, mission_id: str, submission_dir: str,
+               spool_dir: Optional[str] = None) -> JobRecord:
+        """
+        채점 작업 제출
+
+        Args:
+            student_id: 학습자 ID
+            mission_id: 미션 ID
+            submission_dir: 제출물 디렉토리
+            spool_dir: 완료 후 삭제할 임시 디렉토리 (업로드 tarball을 푼 위치)
+
+        Returns:
+            JobRecord
+
+        Raises:
+            ValueError: 알 수 없는 미션 또는 제출물 디렉토리 없음
+            QueueFullError: 대기열이 가득 참
+            ServiceClosedError: 종료 중
+        """
+        if not student_id or not mission_id:
+            raise ValueError("student_id와 mission_id가 필요합니다")
+        for value in (student_id, mission_id):
+            if not _ID_PATTERN.match(value):
+                raise ValueError(f"허용되지 않는 ID입니다 - {value!r}")
+        if not _mission_exists(mission_id):
+            raise ValueError(f"미션 설정을 찾을 수 없습니다 - {mission_id}")
+        submission = Path(submission_dir).resolve()
+        if not submission.is_dir():
+            raise ValueError(f"제출물 디렉토리가 없습니다 - {submission_dir}")
+
+        record = JobRecord(
+            job_id=uuid.uuid4().hex,
+            job=GradingJob(student_id, mission_id, str(submission)),
+            submitted_at=time.time(),
+            spool_dir=spool_dir,
+        )
+        with self._cond:
+            if self._closed or self._executor is None:
+                raise ServiceClosedError("채점 서비스가 실행 중이 아닙니다")
+            if self._pending >= self.max_queue:
+                raise QueueFullError(f"대기열이 가득 찼습니다 ({self._pending}/{self.max_queue})")
+            # 워커 프로세스가 죽어 풀이 깨진 경우 등은 예외가 그대로 전달됨
+            record.future = self._executor.submit(
+                grade_job, record.job, self.output_dir, self.cache_dir,
+                self.incremental, self.warm_pool, self.profile_dir,
+            )
+            self._pending += 1
+            self._jobs[record.job_id] = record
+        record.future.add_done_callback(lambda f, r=record: self._on_done(r, f))
+        return record
+
+    def submit_archive(self, student_id: str, mission_id: str, data: bytes) -> JobRecord:
+        """
+        제출물 tarball을 spool 디렉토리에 풀어 채점 작업 제출 (완료 후 삭제)
+
+        Raises:
+            ValueError: spool 디렉토리 미설정, 잘못된 아카이브 등 (submit()과 같은 예외 포함)
+        """
+        if not self.spool_dir:
+            raise ValueError("tarball 제출을 받으려면 spool 디렉토리가 필요합니다")
+        spool = Path(self.spool_dir) / uuid.uuid4().hex
+        try:
+            submission_dir = extract_submission_archive(data, str(spool))
+            return self.submit(student_id, mission_id, submission_dir, spool_dir=str(spool))
+        except Exception:
+            shutil.rmtree(spool, ignore_errors=True)
+            raise
+
+    def _on_done(self, record: JobRecord, future: Future) -> None:
+        """작업 완료 처리 (풀 내부 스레드에서 호출)"""
+        try:
+            summary = future.result()
+            status = STATUS_ERROR if summary.get("error") else STATUS_DONE
+        except Exception as e:
+            # 워커 비정상 종료, 취소 등
+            summary = {**asdict(record.job), "overall_passed": False, "overall_score": 0.0,
+                       "error": f"워커 실행 실패: {str(e) or type(e).__name__}"}
+            status = STATUS_ERROR
+
+        if record.spool_dir:
+            shutil.rmtree(record.spool_dir, ignore_errors=True)
+
+        with self._cond:
+            self._pending -= 1
+            self._seq += 1
+            record.summary = summary
+            record.status = status
+            record.seq = self._seq
+            self._events.append(record)
+            self._trim_finished()
+            self._cond.notify_all()
+
+    def _trim_finished(self) -> None:
+        """보관 한도를 넘은 오래된 완료 작업 삭제 (self._cond 보유 상태에서 호출)"""
+        excess = len(self._events) - self.keep_finished
+        if excess <= 0:
+            return
+        for old in self._events[:excess]:
+            self._jobs.pop(old.job_id, None)
+        del self._events[:excess]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 조회 (없거나 보관 기간이 지나면 None)"""
+        with self._cond:
+            record = self._jobs.get(job_id)
+            return record.to_dict() if record else None
+
+    def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """작업이 끝나거나 timeout초가 지날 때까지 대기 후 상태 반환"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                record = self._jobs.get(job_id)
+                if record is None:
+                    return None
+                remaining = deadline - time.monotonic()
+                if record.finished or self._closed or remaining <= 0:
+                    return record.to_dict()
+                self._cond.wait(remaining)
+
+    def wait_events(self, since: int, timeout: float) -> List[Dict[str, Any]]:
+        """
+        일련번호 since 이후의 완료 이벤트 (없으면 timeout초 동안 대기)
+
+        Returns:
+            완료된 작업 상태 리스트 (seq 오름차순, 없으면 빈 리스트)
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                events = [r.to_dict() for r in self._events if r.seq > since]
+                remaining = deadline - time.monotonic()
+                if events or self._closed or remaining <= 0:
+                    return events
+                self._cond.wait(remaining)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def stats(self) -> Dict[str, Any]:
+        """서비스 상태 (헬스 체크용)"""
+        with self._cond:
+            records = list(self._jobs.values())
+            running = sum(1 for r in records if r.to_dict()["status"] == STATUS_RUNNING)
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "running": running,
+                "queued": self._pending - running,
+                "finished": len(self._events),
+                "last_seq": self._seq,
+                "missions": self.preload,
+                "closed": self._closed,
+            }
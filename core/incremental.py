@@ -0,0 +1,119 @@
+"""
+증분 채점 (incremental re-grading)
+
+제출물 디렉토리 + 미션 config.yaml + 검증기/코어 소스의 지문을 계산하여
+마지막 채점 때와 같으면 다시 채점하지 않고 이전 결과를 재사용.
+지문은 "코어:미션(설정+검증기):제출물" 세 부분으로, 상주 워커는 디스크가 아니라
+실제로 로드한 코드의 지문(core.batch_grader.load_mission)으로 기록한다.
+
+상태 파일: {output_dir}/.incremental/{학습자ID}_{미션ID}.json
+(학습자별 파일 1개이므로 배치 워커 프로세스끼리 충돌하지 않음)
+"""
+import importlib.util
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.config_loader import get_mission_config_path
+from utils.fingerprint import fingerprint_paths, fingerprint_tree
+
+STATE_DIR_NAME = ".incremental"
+
+# 채점 결과에 영향을 주는 프레임워크 코드
+_CORE_DIR = Path(__file__).resolve().parent
+
+
+def validator_source_dirs(config: Dict[str, Any]) -> List[str]:
+    """config에 등록된 검증기 모듈이 속한 패키지 디렉토리 (_helpers 등 포함)"""
+    dirs = set()
+    for vc in config.get("validators", []):
+        try:
+            spec = importlib.util.find_spec(vc["module"])
+        except (ImportError, ValueError):
+            spec = None
+        if spec and spec.origin:
+            dirs.add(str(Path(spec.origin).resolve().parent))
+    return sorted(dirs)
+
+
+def core_fingerprint() -> str:
+    """프레임워크 코드(core/)의 지문"""
+    return fingerprint_paths([str(_CORE_DIR)])
+
+
+def mission_fingerprint(mission_id: str, config: Dict[str, Any]) -> str:
+    """미션 config.yaml + 검증기 패키지 소스의 지문"""
+    sources = validator_source_dirs(config)
+    config_path = get_mission_config_path(mission_id)
+    if config_path is not None:
+        sources.append(str(config_path))
+    return fingerprint_paths(sources)
+
+
+def grading_fingerprint(mission_id: str, config: Dict[str, Any], submission_dir: str,
+                        sources: Optional[Tuple[str, str]] = None) -> str:
+    """
+    채점 결과를 결정하는 입력 전체의 지문
+
+    Args:
+        mission_id: 미션 ID
+        config: 미션 설정 (validators 목록 참조)
+        submission_dir: 제출물 디렉토리 (빈 문자열이면 제외)
+        sources: 채점에 쓴 코드의 (core_fingerprint, mission_fingerprint)
+            (None이면 현재 디스크 기준으로 계산)
+
+    Returns:
+        "코어:미션:제출물" 형식의 SHA-256 hex 문자열
+    """
+    if sources is None:
+        sources = (core_fingerprint(), mission_fingerprint(mission_id, config))
+    submission = fingerprint_tree(submission_dir) if submission_dir else ""
+    return ":".join([*sources, submission])
+
+
+def _state_path(output_dir: str, student_id: str, mission_id: str) -> Path:
+    return Path(output_dir) / STATE_DIR_NAME / f"{student_id}_{mission_id}.json"
+
+
+def load_previous(output_dir: str, student_id: str, mission_id: str,
+                  fingerprint: str) -> Optional[Dict[str, Any]]:
+    """
+    지문이 같은 이전 채점 기록 조회
+
+    이전 리포트 파일이 삭제된 경우에도 재채점 대상으로 간주
+
+    Returns:
+        {"fingerprint", "overall_passed", "overall_score", "json_path", "md_path"} 또는 None
+    """
+    try:
+        with open(_state_path(output_dir, student_id, mission_id), "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if state.get("fingerprint") != fingerprint:
+        return None
+    if not all(state.get(k) and os.path.isfile(state[k]) for k in ("json_path", "md_path")):
+        return None
+    return state
+
+
+def save_state(output_dir: str, student_id: str, mission_id: str, fingerprint: str,
+               overall_passed: bool, overall_score: float,
+               json_path: str, md_path: str) -> None:
+    """채점 완료 후 지문과 결과 위치 기록"""
+    path = _state_path(output_dir, student_id, mission_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    state = {
+        "fingerprint": fingerprint,
+        "overall_passed": overall_passed,
+        "overall_score": round(overall_score, 2),
+        "json_path": str(json_path),
+        "md_path": str(md_path),
+    }
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
@@ -0,0 +1,460 @@
+"""
+웜 인터프리터 풀 (InterpreterPool)
+
+학습자 REPL 스크립트를 실행할 때마다 `python cli.py`로 새 인터프리터를 띄우면
+CPython 기동 + 표준 라이브러리 import 비용이 매번 발생함.
+풀은 표준 라이브러리를 미리 import해 둔 서버 프로세스(forkserver 방식)를 유지하고,
+실행 요청마다 서버가 fork한 자식 프로세스에서 스크립트를 실행.
+
+- 자식은 실행마다 새로 fork되므로 학생 모듈 상태가 다음 실행으로 넘어가지 않음
+- 자식은 지정된 cwd로 이동하고, stdin/stdout/stderr를 임시 파일로 연결
+- 서버 프로세스는 단일 스레드이므로 fork가 안전함
+  (채점 프로세스는 검증기/항목 병렬 실행으로 다중 스레드일 수 있어 직접 fork하지 않음)
+- fork를 지원하지 않는 플랫폼에서는 is_supported()가 False → 호출 측에서 subprocess 사용
+
+이 파일은 서버 프로세스의 진입점(`python interpreter_pool.py --worker`)도 겸하므로
+표준 라이브러리만 import함
+"""
+import sys
+
+# 서버 프로세스에서 인터프리터 기동 직후 이미 로드된 모듈 (새 인터프리터와 동일한 상태)
+_STARTUP_MODULES = frozenset(sys.modules)
+
+import json
+import os
+import select
+import shutil
+import signal
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# 서버 기동 시 미리 import할 표준 라이브러리 (미션 제출물이 주로 쓰는 모듈)
+DEFAULT_PRELOAD = (
+    "argparse", "collections", "csv", "dataclasses", "datetime", "enum",
+    "functools", "hashlib", "heapq", "itertools", "json", "math", "random",
+    "re", "shlex", "sqlite3", "string", "textwrap", "typing",
+)
+
+_HEADER = struct.Struct("!I")
+
+# 가상 시계 구현 (core/clock_shim/_grader_clock.py)
+_CLOCK_MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  "clock_shim", "_grader_clock.py")
+
+# 자원 제한 구현 (core/sandbox.py, 표준 라이브러리만 사용)
+_SANDBOX_MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sandbox.py")
+
+# 서버가 제한 시간 내 응답하지 않을 때 클라이언트가 추가로 기다리는 시간 (초)
+_RESPONSE_GRACE = 5.0
+
+
+# ============================================================
+# 프레임 입출력 (4바이트 길이 + JSON)
+# ============================================================
+
+def _read_exact(fd: int, size: int) -> bytes:
+    chunks = []
+    while size > 0:
+        chunk = os.read(fd, size)
+        if not chunk:
+            raise EOFError("파이프가 닫혔습니다")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _read_frame(fd: int) -> Dict[str, Any]:
+    (length,) = _HEADER.unpack(_read_exact(fd, _HEADER.size))
+    return json.loads(_read_exact(fd, length).decode("utf-8"))
+
+
+def _write_frame(fd: int, payload: Dict[str, Any]) -> None:
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    view = memoryview(_HEADER.pack(len(data)) + data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+# ============================================================
+# 서버 프로세스 (fork 실행기)
+# ============================================================
+
+def _install_virtual_clock() -> None:
+    """가상 시계 설치 (subprocess 경로의 sitecustomize 훅과 같은 구현 사용)"""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("_grader_clock", _CLOCK_MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.install()
+
+
+def _apply_limits(limits: Dict[str, int]) -> None:
+    """자원 제한 적용 (subprocess 경로와 같은 core/sandbox.py의 apply_limits 사용)"""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("_grader_sandbox", _SANDBOX_MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.apply_limits(limits)
+
+
+def _run_child(script: str, stdin_path: str, stdout_path: str, stderr_path: str,
+               cwd: str, preloaded: List[str], virtual_clock: bool = False,
+               limits: Optional[Dict[str, int]] = None) -> None:
+    """fork된 자식에서 스크립트를 __main__으로 실행 (반환하지 않음)"""
+    import atexit
+    import io
+    import random
+    import runpy
+    import traceback
+
+    code = 1
+    try:
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        random.seed()
+        # 서버에서 상속된 종료 핸들러는 실행하지 않음 (학생 코드가 등록한 것만 실행)
+        atexit._clear()
+
+        os.chdir(cwd)
+        for target, path, flags in ((0, stdin_path, os.O_RDONLY),
+                                    (1, stdout_path, os.O_WRONLY),
+                                    (2, stderr_path, os.O_WRONLY)):
+            fd = os.open(path, flags)
+            os.dup2(fd, target)
+            os.close(fd)
+
+        sys.stdin = io.TextIOWrapper(io.FileIO(0, "r", closefd=False), encoding="utf-8")
+        sys.stdout = io.TextIOWrapper(io.FileIO(1, "w", closefd=False), encoding="utf-8")
+        sys.stderr = io.TextIOWrapper(io.FileIO(2, "w", closefd=False), encoding="utf-8",
+                                      errors="backslashreplace", line_buffering=True)
+        if virtual_clock:
+            _install_virtual_clock()
+        if limits:
+            _apply_limits(limits)
+
+        # 새 인터프리터와 같은 import 결과를 위해: 스크립트 디렉토리를 sys.path[0]에 두고,
+        # 미리 import한 모듈과 이름이 같은 학생 파일이 있으면 해당 모듈을 내림
+        script_dir = os.path.dirname(os.path.abspath(script))
+        sys.path[0] = script_dir
+        for name in preloaded:
+            if (os.path.exists(os.path.join(script_dir, name + ".py"))
+                    or os.path.isdir(os.path.join(script_dir, name))):
+                for mod in [m for m in sys.modules if m == name or m.startswith(name + ".")]:
+                    del sys.modules[mod]
+
+        sys.argv = [script]
+        try:
+            runpy.run_path(script, run_name="__main__")
+            code = 0
+        except SystemExit as e:
+            if e.code is None:
+                code = 0
+            elif isinstance(e.code, int):
+                code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except BaseException as e:
+            # 풀 내부(runpy) 프레임을 제외하고 새 인터프리터와 같은 traceback 출력
+            tb = e.__traceback__
+            while tb is not None and tb.tb_frame.f_code.co_filename != script:
+                tb = tb.tb_next
+            traceback.print_exception(type(e), e, tb or e.__traceback__)
+            code = 1
+
+        try:
+            atexit._run_exitfuncs()
+        except BaseException:
+            pass
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except BaseException:
+                pass
+        os._exit(code & 0xFF)
+
+
+def _wait_child(pid: int, timeout: float) -> Tuple[Optional[int], Any]:
+    """자식 종료 대기 → (종료 코드, rusage). 제한 시간 초과 시 (None, None)"""
+    deadline = time.monotonic() + timeout
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            pidfd = None
+    try:
+        while True:
+            done, status, rusage = os.wait4(pid, os.WNOHANG)
+            if done:
+                return os.waitstatus_to_exitcode(status), rusage
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None, None
+            if pidfd is not None:
+                select.select([pidfd], [], [], remaining)
+            else:
+                time.sleep(min(0.005, remaining))
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+
+def _handle_request(request: Dict[str, Any], preloaded: List[str]) -> Dict[str, Any]:
+    """요청 1건: 임시 파일 준비 → fork → 대기 → 출력 수집"""
+    tmp = tempfile.mkdtemp(prefix="grader-run-")
+    try:
+        stdin_path = os.path.join(tmp, "stdin")
+        stdout_path = os.path.join(tmp, "stdout")
+        stderr_path = os.path.join(tmp, "stderr")
+        with open(stdin_path, "w", encoding="utf-8") as f:
+            f.write(request["stdin"])
+        for path in (stdout_path, stderr_path):
+            open(path, "wb").close()
+
+        pid = os.fork()
+        if pid == 0:
+            _run_child(request["script"], stdin_path, stdout_path, stderr_path,
+                       request["cwd"], preloaded, request.get("virtual_clock", False),
+                       request.get("limits"))
+
+        returncode, rusage = _wait_child(pid, request["timeout"])
+        timed_out = returncode is None
+        if timed_out:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+
+        with open(stdout_path, "r", encoding="utf-8", errors="replace") as f:
+            stdout = f.read()
+        with open(stderr_path, "r", encoding="utf-8", errors="replace") as f:
+            stderr = f.read()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    usage = None
+    if rusage is not None:
+        usage = {"user_time": rusage.ru_utime, "system_time": rusage.ru_stime,
+                 "max_rss_kb": rusage.ru_maxrss // (1024 if sys.platform == "darwin" else 1),
+                 "returncode": returncode}
+    return {"stdout": stdout, "stderr": stderr, "usage": usage,
+            "returncode": returncode, "timed_out": timed_out}
+
+
+def _worker_main(preload: List[str]) -> None:
+    """서버 프로세스 루프: stdin 파이프로 요청을 받아 stdout 파이프로 응답"""
+    import importlib
+
+    # 채점 프로세스의 Ctrl+C는 클라이언트가 처리
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for name in preload:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+    # 새 인터프리터에는 없었을 모듈 (학생 파일과 이름이 겹치면 자식에서 내림)
+    preloaded = sorted({m.split(".")[0] for m in set(sys.modules) - _STARTUP_MODULES})
+
+    while True:
+        try:
+            request = _read_frame(0)
+        except EOFError:
+            return
+        try:
+            response = _handle_request(request, preloaded)
+        except Exception as e:
+            response = {"error": f"{type(e).__name__}: {e}"}
+        _write_frame(1, response)
+
+
+# ============================================================
+# 클라이언트 (채점 프로세스 측)
+# ============================================================
+
+class _Worker:
+    """서버 프로세스 1개 (한 번에 요청 1건만 처리)"""
+
+    def __init__(self, preload: List[str]):
+        self.proc = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--worker", json.dumps(list(preload))],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def request(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        _write_frame(self.proc.stdin.fileno(), payload)
+        out_fd = self.proc.stdout.fileno()
+        ready, _, _ = select.select([out_fd], [], [], timeout + _RESPONSE_GRACE)
+        if not ready:
+            raise TimeoutError("인터프리터 풀 서버가 응답하지 않습니다")
+        return _read_frame(out_fd)
+
+    def close(self) -> None:
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=2)
+        except Exception:
+            self.proc.kill()
+            self.proc.wait()
+        finally:
+            self.proc.stdout.close()
+
+
+class InterpreterPool:
+    """
+    미리 워밍된 서버 프로세스 풀
+
+    서버는 첫 요청 시점에 필요한 만큼 띄우며(max_workers까지), 동시 요청 수가
+    max_workers를 넘으면 유휴 서버가 생길 때까지 대기
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, preload=DEFAULT_PRELOAD):
+        """
+        Args:
+            max_workers: 최대 서버 프로세스 수 (기본: CPU 코어 수)
+            preload: 서버 기동 시 미리 import할 모듈 이름 목록
+        """
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.preload = list(preload)
+        self._idle: List[_Worker] = []
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def is_supported() -> bool:
+        """fork 기반 실행이 가능한 플랫폼인지"""
+        return hasattr(os, "fork") and sys.platform != "win32"
+
+    def _acquire(self) -> _Worker:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("인터프리터 풀이 종료되었습니다")
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.alive():
+                        return worker
+                    self._size -= 1
+                if self._size < self.max_workers:
+                    self._size += 1
+                    break
+                self._cond.wait()
+        try:
+            return _Worker(self.preload)
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, worker: _Worker, healthy: bool) -> None:
+        with self._cond:
+            if healthy and not self._closed and worker.alive():
+                self._idle.append(worker)
+            else:
+                self._size -= 1
+                worker.close()
+            self._cond.notify()
+
+    def prestart(self, count: int = 1) -> None:
+        """첫 요청을 기다리지 않고 서버 프로세스를 count개(max_workers 이내) 미리 띄움"""
+        for _ in range(count):
+            with self._cond:
+                if self._closed or self._size >= self.max_workers:
+                    return
+                self._size += 1
+            try:
+                worker = _Worker(self.preload)
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            self._release(worker, healthy=True)
+
+    def run(self, script_path: str, stdin_text: str, cwd: str,
+            timeout: float = 10, virtual_clock: bool = False,
+            limits: Optional[Dict[str, int]] = None) -> subprocess.CompletedProcess:
+        """
+        스크립트를 워밍된 서버에서 fork하여 실행 (subprocess.run과 같은 결과 형식)
+
+        virtual_clock이 True면 학습자 코드 실행 전에 가상 시계를 설치
+        (core/clock_shim 참고), limits가 있으면 자원 제한 적용 (core/sandbox.py 참고).
+        결과의 usage 속성에 자식의 자원 사용량 딕셔너리(wait4 기준)를 담음
+
+        Raises:
+            subprocess.TimeoutExpired: 제한 시간 초과
+            OSError: 서버 통신 실패
+        """
+        args = [sys.executable, script_path]
+        worker = self._acquire()
+        healthy = False
+        try:
+            response = worker.request(
+                {"script": os.path.abspath(script_path), "stdin": stdin_text,
+                 "cwd": os.path.abspath(cwd), "timeout": timeout,
+                 "virtual_clock": virtual_clock, "limits": limits},
+                timeout,
+            )
+            healthy = True
+        except (EOFError, TimeoutError, ValueError, OSError) as e:
+            raise OSError(f"인터프리터 풀 실행 실패: {e}") from e
+        finally:
+            self._release(worker, healthy)
+
+        if "error" in response:
+            raise OSError(f"인터프리터 풀 실행 실패: {response['error']}")
+        if response["timed_out"]:
+            raise subprocess.TimeoutExpired(args, timeout, response["stdout"], response["stderr"])
+        result = subprocess.CompletedProcess(
+            args, response["returncode"], response["stdout"], response["stderr"],
+        )
+        result.usage = response.get("usage")
+        return result
+
+    def close(self) -> None:
+        """모든 서버 프로세스 종료"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.close()
+
+
+_shared_pool: Optional[InterpreterPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_pool() -> Optional[InterpreterPool]:
+    """
+    프로세스 공용 풀 (최초 호출 시 생성, 프로세스 종료 시 정리)
+
+    Returns:
+        InterpreterPool 또는 None (fork 미지원 플랫폼)
+    """
+    global _shared_pool
+    if not InterpreterPool.is_supported():
+        return None
+    with _shared_lock:
+        if _shared_pool is None:
+            import atexit
+            _shared_pool = InterpreterPool()
+            atexit.register(_shared_pool.close)
+        return _shared_pool
+
+
+if __name__ == "__main__" and len(sys.argv) >= 2 and sys.argv[1] == "--worker":
+    _worker_main(json.loads(sys.argv[2]) if len(sys.argv) > 2 else list(DEFAULT_PRELOAD))
@@ -0,0 +1,139 @@
+"""
+학습자 SQLite DB의 쿼리 실행 계획 검증 (QueryPlanCheckItem)
+
+인덱스가 "존재"하는지만 보면 조인 키와 무관한 컬럼에 인덱스를 만들어도 통과하므로,
+리포트의 기준 쿼리를 학습자 DB에 EXPLAIN QUERY PLAN으로 재생하여
+인덱스 SEARCH가 기대되는 테이블을 전체 SCAN(또는 쿼리마다 임시로 만드는 AUTOMATIC 인덱스)으로
+읽는지 확인. 쿼리를 실제로 실행하지 않으므로 DB 크기와 무관하게 빠름
+"""
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .check_item import CheckItem
+
+# "SCAN c", "SEARCH c USING INDEX ...", 구버전 "SCAN TABLE commits AS c"
+_PLAN_STEP = re.compile(r"^(SCAN|SEARCH) (?:TABLE )?(\S+)(?: AS (\S+))?(.*)$")
+
+
+@dataclass
+class PlanExpectation:
+    """
+    기준 쿼리 1개와 기대 접근 방식
+
+    Attributes:
+        name: 쿼리 이름 (예: "author_contributions")
+        sql: 재생할 SELECT 문
+        indexed: 인덱스로 SEARCH해야 하는 테이블 별칭 (나머지는 SCAN 허용)
+    """
+    name: str
+    sql: str
+    indexed: Tuple[str, ...] = ()
+
+
+@dataclass
+class QueryPlanResult:
+    """
+    기준 쿼리 1개의 실행 계획 검증 결과
+
+    Attributes:
+        name: 쿼리 이름
+        plan: EXPLAIN QUERY PLAN의 detail 목록
+        violations: SEARCH가 기대되는데 SCAN/AUTOMATIC 인덱스인 단계
+        error: 계획 조회 실패 사유 (테이블/컬럼 없음 등)
+    """
+    name: str
+    plan: List[str] = field(default_factory=list)
+    violations: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and not self.violations
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "plan": self.plan,
+            "violations": self.violations,
+            "error": self.error,
+        }
+
+
+def explain_query_plan(conn: sqlite3.Connection, sql: str) -> List[str]:
+    """EXPLAIN QUERY PLAN의 detail 열 목록 (실행 순서)"""
+    return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql).fetchall()]
+
+
+def check_query_plan(conn: sqlite3.Connection, expectation: PlanExpectation) -> QueryPlanResult:
+    """
+    기준 쿼리의 실행 계획에서 indexed 별칭을 SCAN하거나 AUTOMATIC 인덱스로 읽는 단계를 찾음
+
+    Args:
+        conn: 학습자 DB 연결 (읽기 전용 권장)
+        expectation: 기준 쿼리와 기대 접근 방식
+
+    Returns:
+        QueryPlanResult
+    """
+    result = QueryPlanResult(expectation.name)
+    try:
+        result.plan = explain_query_plan(conn, expectation.sql)
+    except sqlite3.Error as e:
+        result.error = f"{expectation.name}: {e}"
+        return result
+    for detail in result.plan:
+        match = _PLAN_STEP.match(detail)
+        if not match:
+            continue
+        operation, table, alias, rest = match.groups()
+        if (alias or table) not in expectation.indexed:
+            continue
+        if operation == "SCAN" or "AUTOMATIC" in rest:
+            result.violations.append(detail)
+    return result
+
+
+@dataclass
+class QueryPlanCheckItem(CheckItem):
+    """
+    기준 쿼리들의 실행 계획으로 채점하는 체크 항목
+
+    validator 대신 connect(→ 학습자 DB 연결)와 queries를 받아, 모든 쿼리가 기대한 테이블을
+    인덱스 SEARCH로 읽으면 통과. 결과 딕셔너리에 "query_plans"(쿼리별 계획, 위반 단계)를 포함
+
+    Attributes:
+        connect: DB 연결 함수 (DB가 없으면 None 반환, 연결은 항목이 닫음)
+        queries: 재생할 기준 쿼리 목록
+        results: 마지막 검증 결과
+    """
+    validator: Optional[Callable[[], bool]] = None
+    connect: Optional[Callable[[], Optional[sqlite3.Connection]]] = None
+    queries: Sequence[PlanExpectation] = ()
+    results: List[QueryPlanResult] = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.validator is None:
+            self.validator = self._check_plans
+
+    def _check_plans(self) -> bool:
+        conn = self.connect() if self.connect else None
+        if conn is None:
+            return False
+        try:
+            self.results = [check_query_plan(conn, query) for query in self.queries]
+        finally:
+            conn.close()
+        problems = [result.error for result in self.results if result.error]
+        problems += [f"{result.name}: {', '.join(result.violations)}"
+                     for result in self.results if result.violations]
+        if problems:
+            self.error_message = "; ".join(problems)
+        return all(result.passed for result in self.results)
+
+    def to_dict(self) -> dict:
+        data = super().to_dict()
+        if self.results:
+            data["query_plans"] = [result.to_dict() for result in self.results]
+        return data
@@ -0,0 +1,311 @@
+"""
+REPL 실행 하네스
+
+학습자의 REPL 스크립트(cli.py 등)에 명령어 스크립트를 stdin으로 전달하여 실행하고,
+프롬프트 기준으로 응답을 분리한 실행 기록(ReplTranscript)을 반환.
+
+GradingContext를 넘기면 (스크립트, 명령어, 타임아웃)이 같은 실행은
+채점 1회 동안 1번만 수행되고 여러 검증기가 같은 기록을 공유함.
+컨텍스트에 TranscriptCache가 있으면 제출물 내용이 같은 이전 채점의 기록도 재사용하고,
+InterpreterPool이 있으면 새 인터프리터 대신 웜 서버에서 fork하여 실행.
+
+컨텍스트의 repl_driver가 "async"면 core.async_repl 대화형 드라이버로 실행하고
+(명령 1줄씩 주고받음, 결과 stdout은 동일), run_repls()는 여러 시나리오를 한 이벤트 루프에서 동시에 구동.
+
+virtual_clock=True로 실행하면 학습자 프로세스의 time.time() 등이 가상 시계로 바뀌고,
+명령어 스크립트 중간에 clock_advance(초) 줄을 넣어 sleep 없이 시간을 앞당길 수 있음.
+
+컨텍스트에 sandbox 제한이 있으면 실행 방식과 관계없이 학습자 프로세스에 자원 제한을 걸고,
+실제로 실행한 경우의 자원 사용량을 core.sandbox.record_usage로 기록
+"""
+import asyncio
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence
+
+from utils.fingerprint import fingerprint_file, fingerprint_tree
+from . import sandbox
+from .async_repl import SHIM_DIR, run_script_async, run_scripts_async
+from .grading_context import REPL_DRIVER_ASYNC, GradingContext
+
+# sitecustomize로 가상 시계를 설치하는 PYTHONPATH 디렉토리
+CLOCK_SHIM_DIR = SHIM_DIR
+
+
+@dataclass
+class ReplTranscript:
+    """
+    REPL 1회 실행 기록
+
+    Attributes:
+        stdout: 표준 출력 원문
+        stderr: 표준 에러 원문
+        returncode: 종료 코드
+        prompt: 응답 구분에 사용한 프롬프트 문자열 (예: "mini-redis>")
+        responses: 프롬프트 기준으로 분리한 응답 리스트
+    """
+    stdout: str
+    stderr: str
+    returncode: Optional[int]
+    prompt: str
+    responses: List[str] = field(default_factory=list)
+
+    @property
+    def has_prompt(self) -> bool:
+        """프롬프트가 한 번이라도 출력되었는지 (실행 가능 여부 판단용)"""
+        return self.prompt in self.stdout
+
+
+def parse_responses(stdout: str, prompt: str) -> List[str]:
+    """REPL stdout에서 프롬프트를 제거하고 응답만 추출
+
+    "mini-redis> OK" → "OK"
+    "mini-git> [main abc1234] msg" → "[main abc1234] msg"
+    여러 줄 응답(INFO memory, LOG 등)은 하나로 합침
+    """
+    responses = []
+    lines = stdout.split("\n")
+    current_response_lines = []
+
+    for line in lines:
+        if prompt in line:
+            # 이전 멀티라인 응답이 있으면 저장
+            if current_response_lines:
+                responses.append("\n".join(current_response_lines))
+                current_response_lines = []
+
+            # 프롬프트 이후 텍스트 추출
+            after_prompt = line.split(prompt, 1)[1].strip()
+            if after_prompt:
+                current_response_lines.append(after_prompt)
+        elif line.strip():
+            # 프롬프트 없는 줄 (멀티라인 응답의 일부)
+            current_response_lines.append(line.strip())
+
+    # 마지막 응답 저장
+    if current_response_lines:
+        responses.append("\n".join(current_response_lines))
+
+    return responses
+
+
+def clock_advance(seconds: float) -> str:
+    """명령어 스크립트에 넣을 가상 시계 제어 줄 (학습자 코드에는 전달되지 않음)"""
+    return f"__grader_clock__ advance {seconds}\n"
+
+
+def _virtual_clock_env() -> dict:
+    env = dict(os.environ)
+    paths = [CLOCK_SHIM_DIR] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    env["PYTHONPATH"] = os.pathsep.join(paths)
+    env["GRADER_VIRTUAL_CLOCK"] = "1"
+    return env
+
+
+def run_script(script_path: Optional[str], stdin_text: str, cwd: str,
+               timeout: int = 10,
+               context: Optional[GradingContext] = None,
+               virtual_clock: bool = False) -> Optional[subprocess.CompletedProcess]:
+    """
+    Python 스크립트를 stdin 입력과 함께 실행
+
+    Args:
+        script_path: 실행할 스크립트 경로 (None이면 실행하지 않음)
+        stdin_text: stdin으로 전달할 입력
+        cwd: 작업 디렉토리
+        timeout: 실행 제한 시간 (초)
+        context: 공유 컨텍스트 (지정 시 동일 입력 실행 기록 재사용)
+        virtual_clock: True면 가상 시계를 설치하고 실행 (clock_advance 줄 처리)
+
+    Returns:
+        CompletedProcess 또는 None (스크립트 없음, 타임아웃, 실행 실패)
+    """
+    if not script_path:
+        return None
+
+    if context is None:
+        return _execute(script_path, stdin_text, cwd, timeout, None, virtual_clock)
+
+    return context.get_or_create(
+        _memo_key(script_path, stdin_text, cwd, timeout, virtual_clock),
+        lambda: _execute_cached(script_path, stdin_text, cwd, timeout, context, virtual_clock),
+    )
+
+
+def _memo_key(script_path: str, stdin_text: str, cwd: str, timeout: int,
+              virtual_clock: bool) -> tuple:
+    return ("script", script_path, stdin_text, cwd, timeout, virtual_clock)
+
+
+def _execute(script_path: str, stdin_text: str, cwd: str, timeout: int,
+             context: Optional[GradingContext],
+             virtual_clock: bool) -> Optional[subprocess.CompletedProcess]:
+    """컨텍스트 설정(실행 방식, 웜 풀, 자원 제한)에 따라 스크립트 1회 실행"""
+    limits = context.sandbox if context is not None else None
+    if context is not None and context.repl_driver == REPL_DRIVER_ASYNC:
+        return asyncio.run(run_script_async(script_path, stdin_text, cwd, timeout=timeout,
+                                            virtual_clock=virtual_clock, limits=limits))
+
+    pool = context.interpreter_pool if context is not None else None
+    try:
+        if pool is not None:
+            result = pool.run(script_path, stdin_text, cwd, timeout=timeout,
+                              virtual_clock=virtual_clock,
+                              limits=limits.to_dict() if limits else None)
+            _record_pool_usage(result, limits)
+            return result
+        return sandbox.run(
+            [sys.executable, script_path],
+            input=stdin_text,
+            timeout=timeout,
+            cwd=cwd,
+            env=_virtual_clock_env() if virtual_clock else None,
+            limits=limits,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+
+
+def _record_pool_usage(result: subprocess.CompletedProcess,
+                       limits: Optional[sandbox.SandboxLimits]) -> None:
+    """웜 풀 실행 결과의 자원 사용량을 기록 (subprocess 경로와 같은 형식)"""
+    data = getattr(result, "usage", None)
+    if not data:
+        return
+    usage = sandbox.ResourceUsage.from_dict(data)
+    usage.limit_exceeded = sandbox.detect_limit_exceeded(result.returncode, result.stderr,
+                                                         usage, limits)
+    sandbox.record_usage(usage)
+
+
+def _execute_cached(script_path: str, stdin_text: str, cwd: str, timeout: int,
+                    context: GradingContext, virtual_clock: bool,
+                    executed: Optional[Callable[[], Optional[subprocess.CompletedProcess]]] = None,
+                    ) -> Optional[subprocess.CompletedProcess]:
+    """
+    실행 기록 캐시를 확인한 뒤 실행하고 결과를 캐시에 저장
+
+    executed가 있으면 직접 실행하는 대신 그 결과를 사용 (동시 실행으로 미리 구한 결과)
+    """
+    execute = executed or (lambda: _execute(script_path, stdin_text, cwd, timeout,
+                                            context, virtual_clock))
+    cache = context.transcript_cache
+    if cache is None:
+        return execute()
+
+    key = cache.make_key(
+        _tree_hash(context, cwd), _script_id(script_path, cwd), stdin_text, timeout,
+        virtual_clock, _limits_key(context),
+    )
+    entry = cache.get(key)
+    if entry is not None:
+        return subprocess.CompletedProcess(
+            [sys.executable, script_path], entry["returncode"],
+            entry["stdout"], entry["stderr"],
+        )
+
+    result = execute()
+    # 타임아웃/실행 실패는 일시적일 수 있으므로 저장하지 않음
+    if result is not None:
+        cache.put(key, result.stdout, result.stderr, result.returncode)
+    return result
+
+
+def _limits_key(context: GradingContext) -> Optional[dict]:
+    """캐시 키에 넣을 자원 제한 (제한 결과가 출력에 영향을 줄 수 있음)"""
+    return context.sandbox.to_dict() if context.sandbox is not None else None
+
+
+def _tree_hash(context: GradingContext, cwd: str) -> str:
+    """작업 디렉토리 지문 (채점 1회당 1번만 계산)"""
+    return context.get_or_create(("tree_hash", cwd), lambda: fingerprint_tree(cwd))
+
+
+def _script_id(script_path: str, cwd: str) -> str:
+    """캐시 키용 스크립트 식별자 (작업 디렉토리 밖이면 내용 해시 사용)"""
+    rel = os.path.relpath(script_path, cwd)
+    if rel.startswith(os.pardir):
+        return fingerprint_file(script_path)
+    return rel
+
+
+def run_repl(script_path: Optional[str], commands: str, prompt: str, cwd: str,
+             timeout: int = 10,
+             context: Optional[GradingContext] = None,
+             virtual_clock: bool = False) -> Optional[ReplTranscript]:
+    """
+    REPL 스크립트를 실행하고 실행 기록 반환
+
+    Args:
+        script_path: 실행할 스크립트 경로 (None이면 실행하지 않음)
+        commands: stdin으로 전달할 명령어 스크립트 (줄바꿈 구분)
+        prompt: 응답 구분용 프롬프트 문자열
+        cwd: 작업 디렉토리
+        timeout: 실행 제한 시간 (초)
+        context: 공유 컨텍스트 (지정 시 동일 시나리오 실행 기록 재사용)
+        virtual_clock: True면 가상 시계를 설치하고 실행 (clock_advance 줄 처리)
+
+    Returns:
+        ReplTranscript 또는 None (스크립트 없음, 타임아웃, 실행 실패)
+    """
+    result = run_script(script_path, commands, cwd, timeout=timeout, context=context,
+                        virtual_clock=virtual_clock)
+    if result is None:
+        return None
+    return ReplTranscript(
+        stdout=result.stdout,
+        stderr=result.stderr,
+        returncode=result.returncode,
+        prompt=prompt,
+        responses=parse_responses(result.stdout, prompt),
+    )
+
+
+def run_repls(script_path: Optional[str], scenarios: Sequence[str], prompt: str, cwd: str,
+              timeout: int = 10,
+              context: Optional[GradingContext] = None,
+              virtual_clock: bool = False) -> List[Optional[ReplTranscript]]:
+    """
+    같은 REPL 스크립트로 여러 명령어 시나리오를 실행 (run_repl의 다건 버전)
+
+    컨텍스트의 repl_driver가 "async"면 아직 실행 기록이 없는 시나리오를
+    asyncio로 동시에 실행해 둔 뒤 run_repl과 같은 방식(공유/캐시)으로 반환
+
+    Returns:
+        scenarios와 같은 순서의 ReplTranscript/None 리스트
+    """
+    if script_path and context is not None and context.repl_driver == REPL_DRIVER_ASYNC:
+        _prefetch_async(script_path, scenarios, cwd, timeout, context, virtual_clock)
+    return [run_repl(script_path, commands, prompt, cwd, timeout=timeout, context=context,
+                     virtual_clock=virtual_clock)
+            for commands in scenarios]
+
+
+def _prefetch_async(script_path: str, scenarios: Sequence[str], cwd: str, timeout: int,
+                    context: GradingContext, virtual_clock: bool) -> None:
+    """컨텍스트에 없는 시나리오를 동시에 실행하여 컨텍스트(+캐시)에 채움"""
+    cache = context.transcript_cache
+    missing = []
+    for commands in dict.fromkeys(scenarios):
+        if _memo_key(script_path, commands, cwd, timeout, virtual_clock) in context:
+            continue
+        if cache is not None and cache.get(cache.make_key(
+                _tree_hash(context, cwd), _script_id(script_path, cwd), commands, timeout,
+                virtual_clock, _limits_key(context))) is not None:
+            continue
+        missing.append(commands)
+    if not missing:
+        return
+
+    results = asyncio.run(run_scripts_async(
+        [(script_path, commands, cwd) for commands in missing],
+        timeout=timeout, virtual_clock=virtual_clock, limits=context.sandbox,
+    ))
+    for commands, result in zip(missing, results):
+        context.get_or_create(
+            _memo_key(script_path, commands, cwd, timeout, virtual_clock),
+            lambda c=commands, r=result: _execute_cached(
+                script_path, c, cwd, timeout, context, virtual_clock, executed=lambda: r),
+        )
@@ -0,0 +1,357 @@
+"""
+프롬프트 동기화 대화형 REPL 세션 (expect 방식)
+
+run_repl처럼 명령어 스크립트 전체를 stdin으로 밀어 넣고 stdout을 프롬프트로 자르는 대신,
+명령을 1건 보내고 학습자 REPL이 다음 입력(프롬프트)을 기다릴 때까지의 출력을 그 명령의 응답으로 받음.
+
+- 응답 경계: core.async_repl의 입력 대기 신호(INPUT_MARKER) 기준이므로
+  여러 줄 응답도 명령과 1:1로 대응 (출력 끝의 프롬프트는 제거)
+- 명령별 제한 시간: 응답하지 않는 명령에서 바로 세션을 끝내므로
+  전체 실행 제한 시간을 기다리지 않고, 그 전 명령의 응답은 그대로 채점에 사용
+- 명령별 지연 시간 기록: BaseValidator.command_timings → 결과의 "command_timings"
+
+검증기에서는 보통 run_session()으로 명령 목록을 한 번에 실행하고
+(GradingContext로 같은 세션 결과를 공유), 직접 주고받을 때는 ReplSession을 사용.
+컨텍스트에 TranscriptCache가 있으면 제출물 내용이 같은 이전 채점의 세션 결과도 재사용
+(지연 시간은 처음 실행했을 때의 기록). 명령마다 입력 대기를 확인해야 하므로
+stdin을 파일로 넘기는 웜 인터프리터 풀은 사용하지 않음.
+
+사용 예:
+    with ReplSession(cli_path, "mini-redis>", cwd) as session:
+        if session.send("SET a 1").text != "OK":
+            ...
+"""
+import asyncio
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .async_repl import AsyncReplSession, ReplTimeout
+from .grading_context import GradingContext
+from .repl import _limits_key, _script_id, _tree_hash
+from .sandbox import SandboxLimits
+
+# 명령 1건 응답 제한 시간 기본값 (초) — 일괄 실행(run_repl)의 실행 제한 시간과 같게 두어
+# 느리지만 올바른 구현이 cli_runnable(및 이에 의존하는 항목)에서 떨어지지 않게 함
+DEFAULT_COMMAND_TIMEOUT = 10.0
+# 프로세스 기동 후 첫 프롬프트까지 제한 시간 기본값 (초)
+DEFAULT_STARTUP_TIMEOUT = 10.0
+
+
+def strip_prompt(output: str, prompt: str) -> str:
+    """응답 출력에서 프롬프트를 제거하고 내용 줄만 합침
+
+    '"Alice"\\nmini-redis> ' → '"Alice"'
+    (parse_responses와 같은 규칙: 각 줄 strip, 빈 줄 제외, 프롬프트 뒤 텍스트는 유지)
+    """
+    lines = []
+    for line in output.split("\n"):
+        if prompt in line:
+            line = line.split(prompt, 1)[1]
+        line = line.strip()
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+@dataclass
+class ReplResponse:
+    """
+    명령 1건의 응답
+
+    Attributes:
+        command: 보낸 명령
+        text: 프롬프트를 제거한 응답 (여러 줄이면 줄바꿈으로 연결)
+        output: 다음 입력 대기까지의 stdout 원문 (다음 프롬프트 포함)
+        latency: 명령 전송부터 응답 완료까지 걸린 시간 (초)
+        alive: 응답 후 학습자 REPL이 다음 입력을 기다리는 중인지 (False면 종료됨)
+    """
+    command: str
+    text: str
+    output: str
+    latency: float
+    alive: bool
+
+
+class ReplSession:
+    """
+    학습자 REPL 1개와의 동기식 대화 세션 (core.async_repl.AsyncReplSession 래퍼)
+
+    start()에서 프로세스를 띄우고 첫 프롬프트까지 기다리며,
+    send()는 명령 1건을 보내고 응답(ReplResponse)을 반환.
+    세션 전용 이벤트 루프를 사용하므로 검증기 스레드 어디서든 호출 가능
+    """
+
+    def __init__(self, script_path: str, prompt: str, cwd: str,
+                 command_timeout: float = DEFAULT_COMMAND_TIMEOUT,
+                 startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+                 virtual_clock: bool = False,
+                 limits: Optional[SandboxLimits] = None):
+        self.prompt = prompt
+        self.command_timeout = command_timeout
+        self.startup_timeout = startup_timeout
+        self.banner = ""
+        self.responses: List[ReplResponse] = []
+        self._session = AsyncReplSession(script_path, cwd, virtual_clock=virtual_clock,
+                                         limits=limits)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __enter__(self) -> "ReplSession":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def alive(self) -> bool:
+        """학습자 REPL이 다음 입력을 기다리는 중인지"""
+        return self._loop is not None and self._session.waiting
+
+    @property
+    def has_prompt(self) -> bool:
+        """지금까지의 출력에 프롬프트가 한 번이라도 나왔는지"""
+        return self.prompt in self._session.stdout
+
+    @property
+    def stdout(self) -> str:
+        return self._session.stdout
+
+    @property
+    def stderr(self) -> str:
+        return self._session.stderr
+
+    def start(self) -> str:
+        """
+        프로세스를 띄우고 첫 입력 대기까지의 출력(배너 + 프롬프트) 반환
+
+        Raises:
+            ReplTimeout: startup_timeout초 안에 입력을 기다리지 않음 (프로세스는 종료됨)
+            OSError: 실행 실패
+        """
+        self._loop = asyncio.new_event_loop()
+        try:
+            self.banner = self._run(self._session.start(self.startup_timeout))
+        except ReplTimeout:
+            self._abort()
+            raise
+        return self.banner
+
+    def send(self, command: str, timeout: Optional[float] = None) -> ReplResponse:
+        """
+        명령 1건을 보내고 다음 입력 대기(또는 종료)까지 기다려 응답 반환
+
+        Args:
+            command: 보낼 명령 (줄바꿈 제외)
+            timeout: 응답 제한 시간 (None이면 command_timeout)
+
+        Raises:
+            ReplTimeout: 제한 시간 안에 응답하지 않음 (프로세스는 종료됨)
+        """
+        if self._loop is None:
+            raise RuntimeError("start()를 먼저 호출해야 합니다")
+        limit = self.command_timeout if timeout is None else timeout
+        try:
+            exchange = self._run(self._session.send(command, limit))
+        except ReplTimeout:
+            self._abort()
+            raise
+        response = ReplResponse(
+            command=command,
+            text=strip_prompt(exchange.output, self.prompt),
+            output=exchange.output,
+            latency=exchange.latency,
+            alive=exchange.waiting,
+        )
+        self.responses.append(response)
+        return response
+
+    def close(self, timeout: Optional[float] = None) -> Optional[int]:
+        """stdin을 닫고 종료를 기다림 (제한 시간 초과 시 강제 종료). 종료 코드 반환"""
+        if self._loop is None:
+            return None
+        returncode = None
+        try:
+            _, _, returncode = self._run(self._session.close(
+                self.startup_timeout if timeout is None else timeout))
+        except ReplTimeout:
+            pass
+        finally:
+            self._run(self._session.kill())
+            self._loop.close()
+            self._loop = None
+        return returncode
+
+    def timings(self) -> List[Dict[str, Any]]:
+        """명령별 지연 시간 기록 ({"command", "latency"} 리스트, 초 단위)"""
+        return [{"command": r.command, "latency": round(r.latency, 4)}
+                for r in self.responses]
+
+    def _abort(self) -> None:
+        """응답하지 않는 프로세스를 종료를 기다리지 않고 강제 종료"""
+        try:
+            self._run(self._session.kill())
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    def _run(self, coro):
+        return self._loop.run_until_complete(coro)
+
+
+@dataclass
+class SessionResult:
+    """
+    run_session() 실행 결과
+
+    Attributes:
+        started: 프로세스가 기동되어 첫 입력 대기까지 도달했는지
+        has_prompt: 출력에 프롬프트가 한 번이라도 나왔는지
+        responses: 응답을 받은 명령의 ReplResponse (보낸 순서, 중단 시 앞부분만)
+        timed_out: 어떤 명령이 제한 시간 안에 응답하지 않아 세션을 중단했는지
+        stdout: 세션 전체 stdout (입력 대기 신호 제거)
+        stderr: 세션 전체 stderr
+        timings: 명령별 지연 시간 기록
+    """
+    started: bool
+    has_prompt: bool
+    responses: List[ReplResponse] = field(default_factory=list)
+    timed_out: bool = False
+    stdout: str = ""
+    stderr: str = ""
+    timings: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def texts(self) -> List[str]:
+        """명령 순서대로의 응답 텍스트 (응답을 받은 명령까지만)"""
+        return [r.text for r in self.responses]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """실행 기록 캐시 저장용 (stdout/stderr는 캐시 항목의 기본 필드로 저장)"""
+        return {
+            "started": self.started,
+            "has_prompt": self.has_prompt,
+            "responses": [asdict(r) for r in self.responses],
+            "timed_out": self.timed_out,
+            "timings": self.timings,
+        }
+
+    @classmethod
+    def from_cache_entry(cls, entry: Dict[str, Any]) -> "SessionResult":
+        return cls(
+            started=entry["started"],
+            has_prompt=entry["has_prompt"],
+            responses=[ReplResponse(**r) for r in entry["responses"]],
+            timed_out=entry["timed_out"],
+            stdout=entry["stdout"],
+            stderr=entry["stderr"],
+            timings=entry["timings"],
+        )
+
+
+def run_session(script_path: Optional[str], commands: Sequence[str], prompt: str, cwd: str,
+                command_timeout: float = DEFAULT_COMMAND_TIMEOUT,
+                startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+                context: Optional[GradingContext] = None,
+                virtual_clock: bool = False,
+                stop: Optional[Callable[[ReplResponse], bool]] = None,
+                ) -> Optional[SessionResult]:
+    """
+    명령 목록을 1건씩 주고받으며 실행
+
+    학습자 REPL이 종료되거나, 명령이 제한 시간 안에 응답하지 않거나,
+    stop(응답)이 True를 반환하면 남은 명령을 보내지 않고 끝냄 (fail-fast)
+
+    Args:
+        script_path: 실행할 스크립트 경로 (None이면 실행하지 않음)
+        commands: 보낼 명령 목록 (줄바꿈 제외)
+        prompt: 응답에서 제거할 프롬프트 문자열
+        cwd: 작업 디렉토리
+        command_timeout: 명령 1건의 응답 제한 시간 (초)
+        startup_timeout: 첫 프롬프트까지 제한 시간 (초)
+        context: 공유 컨텍스트 (지정 시 같은 명령 목록의 세션 결과 재사용 — 실행 기록 캐시 포함,
+            자원 제한 적용)
+        virtual_clock: True면 가상 시계를 설치하고 실행
+        stop: 응답을 받은 뒤 남은 명령을 중단할지 판단하는 함수
+
+    Returns:
+        SessionResult 또는 None (스크립트 없음, 실행 실패)
+    """
+    if not script_path:
+        return None
+
+    limits = context.sandbox if context is not None else None
+
+    def execute() -> Optional[SessionResult]:
+        return _run_session(script_path, commands, prompt, cwd, command_timeout,
+                            startup_timeout, virtual_clock, stop, limits)
+
+    # stop 함수는 키로 비교할 수 없으므로 공유하지 않음
+    if context is None or stop is not None:
+        return execute()
+    return context.get_or_create(
+        ("session", script_path, tuple(commands), prompt, cwd, command_timeout,
+         startup_timeout, virtual_clock),
+        lambda: _execute_cached(script_path, commands, prompt, cwd, command_timeout,
+                                startup_timeout, virtual_clock, context, execute),
+    )
+
+
+def _execute_cached(script_path: str, commands: Sequence[str], prompt: str, cwd: str,
+                    command_timeout: float, startup_timeout: float, virtual_clock: bool,
+                    context: GradingContext,
+                    execute: Callable[[], Optional[SessionResult]]) -> Optional[SessionResult]:
+    """실행 기록 캐시를 확인한 뒤 세션을 실행하고 결과를 캐시에 저장"""
+    cache = context.transcript_cache
+    if cache is None:
+        return execute()
+
+    # 일괄 실행(core.repl) 기록과 키가 겹치지 않도록 세션 설정을 스크립트 식별자에 포함
+    script = json.dumps(["session", _script_id(script_path, cwd), prompt, startup_timeout])
+    key = cache.make_key(_tree_hash(context, cwd), script, "\n".join(commands),
+                         command_timeout, virtual_clock, _limits_key(context))
+    entry = cache.get(key)
+    if entry is not None:
+        return SessionResult.from_cache_entry(entry)
+
+    result = execute()
+    # 타임아웃/실행 실패는 일시적일 수 있으므로 저장하지 않음
+    if result is not None and not result.timed_out:
+        cache.put(key, result.stdout, result.stderr, None, extra=result.to_dict())
+    return result
+
+
+def _run_session(script_path: str, commands: Sequence[str], prompt: str, cwd: str,
+                 command_timeout: float, startup_timeout: float, virtual_clock: bool,
+                 stop: Optional[Callable[[ReplResponse], bool]],
+                 limits: Optional[SandboxLimits]) -> Optional[SessionResult]:
+    session = ReplSession(script_path, prompt, cwd, command_timeout=command_timeout,
+                          startup_timeout=startup_timeout, virtual_clock=virtual_clock,
+                          limits=limits)
+    started = False
+    timed_out = False
+    try:
+        session.start()
+        started = True
+        for command in commands:
+            if not session.alive:
+                break
+            response = session.send(command)
+            if stop is not None and stop(response):
+                break
+    except ReplTimeout:
+        timed_out = True
+    except OSError:
+        return None
+    finally:
+        session.close()
+
+    return SessionResult(
+        started=started,
+        has_prompt=session.has_prompt,
+        responses=list(session.responses),
+        timed_out=timed_out,
+        stdout=session.stdout,
+        stderr=session.stderr,
+        timings=session.timings(),
+    )
@@ -0,0 +1,420 @@
+"""
+학습자 프로세스 자원 제한 + 사용량 기록 (sandbox)
+
+run()은 subprocess.run(capture_output=True, text=True)과 같은 방식으로 학습자 스크립트를 실행하되,
+- limits(SandboxLimits)가 있으면 실행 직후 prlimit으로 자식의
+  주소 공간(RLIMIT_AS)·CPU 시간(RLIMIT_CPU)·프로세스 수(RLIMIT_NPROC)·파일 크기(RLIMIT_FSIZE)를 제한하고
+  (prlimit이 없는 플랫폼은 제한을 건 뒤 exec하는 래퍼로 실행)
+- 자식을 os.wait4로 직접 회수하여 CPU 시간과 최대 RSS(ResourceUsage)를 기록.
+
+preexec_fn은 쓰지 않음 — 검증기/항목 병렬 실행(ThreadPoolExecutor) 중 fork된 자식에서
+파이썬 코드를 돌리면 다른 스레드가 쥔 락 때문에 교착될 수 있음.
+
+기록은 collect_usage() 블록 안에서 실행된 것만 모임
+(BaseValidator가 setup/teardown 단계, CheckItem이 항목 실행 단위로 사용 → 결과의 "resource_usage").
+config.yaml의 execution.sandbox가 true(기본 제한) 또는 제한값 딕셔너리면 Grader가 GradingContext.sandbox로 전달.
+
+웜 인터프리터 풀 서버(core/interpreter_pool.py)가 파일 경로로 불러 쓰므로 표준 라이브러리만 import함
+"""
+import io
+import json
+import os
+import select
+import selectors
+import signal
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+try:
+    import resource
+except ImportError:  # Windows: 제한/사용량 기록 없이 실행
+    resource = None
+
+# 기본 제한값 (execution.sandbox: true)
+DEFAULT_MEMORY_MB = 1024
+DEFAULT_CPU_SECONDS = 30
+DEFAULT_MAX_PROCESSES = 512
+DEFAULT_FILE_SIZE_MB = 64
+
+# macOS의 ru_maxrss는 바이트, Linux는 KB
+_MAXRSS_DIVISOR = 1024 if sys.platform == "darwin" else 1
+
+
+@dataclass
+class SandboxLimits:
+    """
+    학습자 프로세스 자원 제한 (0이면 해당 항목 제한 안 함)
+
+    Attributes:
+        memory_mb: 주소 공간 상한 (RLIMIT_AS, MB)
+        cpu_seconds: CPU 시간 상한 (RLIMIT_CPU, 초). 초과 시 SIGXCPU, 1초 뒤 SIGKILL
+        max_processes: 프로세스 수 상한 (RLIMIT_NPROC, 실행 사용자 기준 — fork 폭탄 방지)
+        file_size_mb: 쓸 수 있는 파일 크기 상한 (RLIMIT_FSIZE, MB)
+    """
+    memory_mb: int = DEFAULT_MEMORY_MB
+    cpu_seconds: int = DEFAULT_CPU_SECONDS
+    max_processes: int = DEFAULT_MAX_PROCESSES
+    file_size_mb: int = DEFAULT_FILE_SIZE_MB
+
+    @classmethod
+    def from_setting(cls, setting: Any) -> Optional["SandboxLimits"]:
+        """
+        config.yaml의 execution.sandbox 값으로 생성
+
+        - false/미설정: None (제한 없음)
+        - true: 기본 제한값
+        - 딕셔너리: 지정한 항목만 기본값 대신 사용 (예: {memory_mb: 256})
+
+        Raises:
+            ValueError: 알 수 없는 제한 항목
+        """
+        if not setting:
+            return None
+        if setting is True:
+            return cls()
+        if isinstance(setting, dict):
+            unknown = set(setting) - set(cls.__dataclass_fields__)
+            if unknown:
+                raise ValueError(f"알 수 없는 sandbox 제한 항목: {', '.join(sorted(unknown))}")
+            return cls(**{key: int(value) for key, value in setting.items()})
+        raise ValueError(f"execution.sandbox 값이 올바르지 않습니다: {setting!r}")
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def apply_limits(limits: Dict[str, int], pid: Optional[int] = None) -> None:
+    """
+    자원 제한 적용
+
+    pid가 없으면 현재 프로세스(웜 풀의 fork 자식, exec 래퍼)에 setrlimit으로,
+    있으면 이미 실행 중인 해당 프로세스에 prlimit으로 적용 (Linux).
+    hard limit보다 큰 값은 hard limit으로 낮춰 적용
+    """
+    if resource is None:
+        return
+
+    def _set(kind: int, soft: int, hard: Optional[int] = None) -> None:
+        if pid is None:
+            _, current_hard = resource.getrlimit(kind)
+        else:
+            _, current_hard = resource.prlimit(pid, kind)
+        hard = soft if hard is None else hard
+        if current_hard != resource.RLIM_INFINITY:
+            soft, hard = min(soft, current_hard), min(hard, current_hard)
+        if pid is None:
+            resource.setrlimit(kind, (soft, hard))
+        else:
+            resource.prlimit(pid, kind, (soft, hard))
+
+    if limits.get("memory_mb"):
+        _set(resource.RLIMIT_AS, limits["memory_mb"] * 1024 * 1024)
+    if limits.get("cpu_seconds"):
+        # soft 초과 시 SIGXCPU, 그래도 계속 돌면 hard에서 SIGKILL
+        _set(resource.RLIMIT_CPU, limits["cpu_seconds"], limits["cpu_seconds"] + 1)
+    if limits.get("max_processes") and hasattr(resource, "RLIMIT_NPROC"):
+        _set(resource.RLIMIT_NPROC, limits["max_processes"])
+    if limits.get("file_size_mb"):
+        _set(resource.RLIMIT_FSIZE, limits["file_size_mb"] * 1024 * 1024)
+    # 크래시 시 코어 덤프로 디스크를 채우지 않도록
+    _set(resource.RLIMIT_CORE, 0)
+
+
+@dataclass
+class ResourceUsage:
+    """
+    학습자 프로세스 1회 실행의 자원 사용량
+
+    Attributes:
+        user_time: 사용자 모드 CPU 시간 (초)
+        system_time: 커널 모드 CPU 시간 (초)
+        max_rss_kb: 최대 상주 메모리 (KB)
+        returncode: 종료 코드 (시그널 종료는 음수)
+        limit_exceeded: 초과한 제한 ("cpu" / "memory" / "file_size", 없으면 None)
+    """
+    user_time: float
+    system_time: float
+    max_rss_kb: int
+    returncode: Optional[int] = None
+    limit_exceeded: Optional[str] = None
+
+    @property
+    def cpu_time(self) -> float:
+        return self.user_time + self.system_time
+
+    @classmethod
+    def from_rusage(cls, rusage, returncode: Optional[int] = None) -> "ResourceUsage":
+        return cls(
+            user_time=rusage.ru_utime,
+            system_time=rusage.ru_stime,
+            max_rss_kb=int(rusage.ru_maxrss) // _MAXRSS_DIVISOR,
+            returncode=returncode,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "user_time": round(self.user_time, 4),
+            "system_time": round(self.system_time, 4),
+            "max_rss_kb": self.max_rss_kb,
+            "returncode": self.returncode,
+            "limit_exceeded": self.limit_exceeded,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResourceUsage":
+        return cls(**{key: data.get(key) for key in cls.__dataclass_fields__})
+
+
+def detect_limit_exceeded(returncode: Optional[int], stderr: str,
+                          usage: Optional[ResourceUsage],
+                          limits: Optional[SandboxLimits]) -> Optional[str]:
+    """종료 코드/stderr로 어떤 자원 제한에 걸려 종료됐는지 추정"""
+    if limits is None or returncode is None:
+        return None
+    if returncode == -getattr(signal, "SIGXCPU", 0):
+        return "cpu"
+    if (returncode == -signal.SIGKILL and usage is not None and limits.cpu_seconds
+            and usage.cpu_time >= limits.cpu_seconds):
+        return "cpu"
+    if returncode == -getattr(signal, "SIGXFSZ", 0):
+        return "file_size"
+    if limits.memory_mb and stderr and "MemoryError" in stderr:
+        return "memory"
+    return None
+
+
+# -- 사용량 수집 --
+
+_collector: ContextVar[Optional[List[ResourceUsage]]] = ContextVar("sandbox_usage",
+                                                                  default=None)
+
+
+@contextmanager
+def collect_usage() -> Iterator[List[ResourceUsage]]:
+    """
+    블록 안(같은 스레드)에서 실행된 학습자 프로세스의 사용량을 모으는 리스트 제공
+
+    중첩되면 가장 안쪽 블록에만 기록 (검증기 단계와 항목 실행이 중복 집계되지 않음)
+    """
+    usages: List[ResourceUsage] = []
+    token = _collector.set(usages)
+    try:
+        yield usages
+    finally:
+        _collector.reset(token)
+
+
+def record_usage(usage: Optional[ResourceUsage]) -> None:
+    """현재 collect_usage() 블록에 사용량 추가 (블록 밖이면 무시)"""
+    usages = _collector.get()
+    if usages is not None and usage is not None:
+        usages.append(usage)
+
+
+def summarize_usage(usages: Sequence[ResourceUsage]) -> Dict[str, Any]:
+    """여러 실행의 사용량 요약 (CPU 시간 합계, 최대 RSS 최댓값, 제한 초과 목록)"""
+    return {
+        "runs": len(usages),
+        "cpu_time": round(sum(u.cpu_time for u in usages), 4),
+        "max_rss_kb": max((u.max_rss_kb for u in usages), default=0),
+        "limit_exceeded": sorted({u.limit_exceeded for u in usages if u.limit_exceeded}),
+    }
+
+
+# -- 실행 --
+
+class SandboxedProcess(subprocess.CompletedProcess):
+    """run() 결과 (subprocess.CompletedProcess + 자원 사용량)"""
+
+    def __init__(self, args, returncode, stdout=None, stderr=None,
+                 usage: Optional[ResourceUsage] = None):
+        super().__init__(args, returncode, stdout, stderr)
+        self.usage = usage
+
+
+def _can_prlimit() -> bool:
+    return resource is not None and hasattr(resource, "prlimit")
+
+
+def wrap_command(args: Sequence[str], limits: Optional[SandboxLimits]) -> List[str]:
+    """
+    실행할 명령 (prlimit이 없는 플랫폼에서 제한이 있으면 제한을 건 뒤 exec하는 래퍼 명령)
+
+    spawn 후 limit_process(pid, limits)와 짝으로 사용
+    """
+    if limits is None or resource is None or _can_prlimit():
+        return list(args)
+    return [sys.executable, "-S", os.path.abspath(__file__),
+            json.dumps(limits.to_dict()), *args]
+
+
+def limit_process(pid: int, limits: Optional[SandboxLimits]) -> None:
+    """
+    방금 실행한 자식 프로세스에 자원 제한 적용 (prlimit, Linux)
+
+    Popen/create_subprocess_exec는 exec 성공 후 반환하므로 자식은 인터프리터 시작 단계에 있음.
+    이미 종료했으면 무시
+    """
+    if limits is None or not _can_prlimit():
+        return
+    try:
+        apply_limits(limits.to_dict(), pid)
+    except ProcessLookupError:
+        pass
+
+
+def _exit_code(status: int) -> int:
+    """wait 상태값 → Popen.returncode 규칙 (시그널 종료는 음수)"""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _reap(proc: subprocess.Popen, block: bool):
+    """
+    os.wait4로 자식을 회수하고 proc.returncode 설정 → rusage (아직 실행 중이면 None)
+
+    Popen이 waitpid로 먼저 회수하면 사용량을 얻을 수 없으므로 직접 회수하고,
+    returncode를 채워 두어 Popen.wait()/__exit__이 다시 기다리지 않게 함
+    """
+    try:
+        pid, status, rusage = os.wait4(proc.pid, 0 if block else os.WNOHANG)
+    except ChildProcessError:  # SIGCHLD 무시 등으로 이미 회수됨
+        proc.returncode = 0
+        return None
+    if pid != proc.pid:
+        return None
+    proc.returncode = _exit_code(status)
+    return rusage
+
+
+def _communicate(proc: subprocess.Popen, input: Optional[str], timeout: Optional[float]):
+    """
+    Popen.communicate와 같은 입출력 처리(selectors) 후 os.wait4로 회수 → (stdout, stderr, rusage)
+
+    Raises:
+        subprocess.TimeoutExpired: 제한 시간 안에 출력이 끝나지 않음 (프로세스는 아직 실행 중)
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def _remaining() -> Optional[float]:
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        return remaining
+
+    chunks: Dict[int, List[bytes]] = {proc.stdout.fileno(): [], proc.stderr.fileno(): []}
+    stdin_data = b""
+    if proc.stdin is not None:
+        stdin_data = (input or "").encode(proc.stdin.encoding, proc.stdin.errors)
+        if not stdin_data:
+            proc.stdin.close()
+    offset = 0
+    with selectors.DefaultSelector() as selector:
+        for fd in chunks:
+            selector.register(fd, selectors.EVENT_READ)
+        if stdin_data:
+            selector.register(proc.stdin.fileno(), selectors.EVENT_WRITE)
+        while selector.get_map():
+            for key, _ in selector.select(_remaining()):
+                if key.fd in chunks:
+                    data = os.read(key.fd, 32768)
+                    if data:
+                        chunks[key.fd].append(data)
+                    else:
+                        selector.unregister(key.fd)
+                    continue
+                # PIPE_BUF 이하 쓰기는 쓰기 가능 상태에서 막히지 않음
+                try:
+                    offset += os.write(key.fd, stdin_data[offset:offset + select.PIPE_BUF])
+                except BrokenPipeError:
+                    offset = len(stdin_data)
+                if offset >= len(stdin_data):
+                    selector.unregister(key.fd)
+                    proc.stdin.close()
+
+    # 출력이 끝나면 대개 종료 직전 — 짧게 폴링
+    delay = 0.0005
+    rusage = _reap(proc, block=deadline is None)
+    while proc.returncode is None:
+        time.sleep(min(delay, _remaining()))
+        delay = min(delay * 2, 0.05)
+        rusage = _reap(proc, block=False)
+
+    def _decode(stream) -> str:
+        # text=True와 같은 인코딩·줄바꿈 변환
+        data = b"".join(chunks[stream.fileno()])
+        return io.TextIOWrapper(io.BytesIO(data), stream.encoding, stream.errors).read()
+
+    return _decode(proc.stdout), _decode(proc.stderr), rusage
+
+
+def run(args: Sequence[str], input: Optional[str] = None, cwd: Optional[str] = None,
+        timeout: Optional[float] = None, env: Optional[Dict[str, str]] = None,
+        limits: Optional[SandboxLimits] = None) -> SandboxedProcess:
+    """
+    subprocess.run(args, capture_output=True, text=True, ...)과 같은 실행 + 자원 제한/사용량 기록
+
+    Args:
+        args: 실행 명령
+        input: stdin으로 전달할 입력 (None이면 stdin 상속)
+        cwd: 작업 디렉토리
+        timeout: 벽시계 제한 시간 (초)
+        env: 환경 변수 (None이면 상속)
+        limits: 자원 제한 (None이면 제한 없이 사용량만 기록)
+
+    Returns:
+        SandboxedProcess (usage: ResourceUsage, 플랫폼이 wait4를 지원하지 않으면 None)
+
+    Raises:
+        subprocess.TimeoutExpired: 제한 시간 초과 (프로세스는 종료·회수됨)
+        OSError: 실행 실패
+    """
+    if not hasattr(os, "wait4"):  # Windows: 제한/사용량 기록 없이 실행
+        completed = subprocess.run(args, input=input, capture_output=True, text=True,
+                                   cwd=cwd, timeout=timeout, env=env)
+        return SandboxedProcess(completed.args, completed.returncode,
+                                completed.stdout, completed.stderr)
+
+    with subprocess.Popen(wrap_command(args, limits),
+                          stdin=subprocess.PIPE if input is not None else None,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          cwd=cwd, env=env, text=True) as proc:
+        try:
+            limit_process(proc.pid, limits)
+            stdout, stderr, rusage = _communicate(proc, input, timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            rusage = _reap(proc, block=True)
+            record_usage(_usage_of(rusage, proc.returncode, "", limits))
+            raise
+        except BaseException:
+            proc.kill()
+            _reap(proc, block=True)
+            raise
+        usage = _usage_of(rusage, proc.returncode, stderr, limits)
+
+    record_usage(usage)
+    return SandboxedProcess(list(args), proc.returncode, stdout, stderr, usage)
+
+
+def _usage_of(rusage, returncode: Optional[int], stderr: str,
+              limits: Optional[SandboxLimits]) -> Optional[ResourceUsage]:
+    if rusage is None:
+        return None
+    usage = ResourceUsage.from_rusage(rusage, returncode)
+    usage.limit_exceeded = detect_limit_exceeded(returncode, stderr, usage, limits)
+    return usage
+
+
+if __name__ == "__main__":
+    # wrap_command 래퍼: python -S sandbox.py '<limits json>' cmd args...
+    apply_limits(json.loads(sys.argv[1]))
+    os.execvp(sys.argv[2], sys.argv[2:])
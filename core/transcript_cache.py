@@ -0,0 +1,182 @@
+"""
+실행 기록 디스크 캐시 (TranscriptCache)
+
+(제출물 트리 해시, 실행 스크립트, stdin 스크립트, 타임아웃) → (stdout, stderr, returncode)
+
+CheckItem 판정 로직만 수정하고 코호트를 재채점할 때, 코드와 입력이 그대로인
+학습자 스크립트는 다시 실행하지 않고 저장된 실행 기록을 재사용.
+항목 1건 = JSON 파일 1개이며, 전체 크기가 max_bytes를 넘으면
+가장 오래 사용하지 않은 항목(mtime 기준)부터 삭제 (LRU).
+전체 크기는 인스턴스가 추정치로 누적하여, 디렉토리 전체 재집계(evict)는
+추정치가 제한을 넘거나 EVICT_EVERY회 저장마다(다른 워커 프로세스의 쓰기 반영) 1번만 수행하고,
+제한을 넘으면 EVICT_LOW_WATER 비율까지 줄여 여유를 둔다
+"""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+# 기본 최대 크기: 256MB
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# 캐시 형식이 바뀌면 올려서 이전 항목을 무효화
+CACHE_VERSION = 2
+
+# 추정치와 무관하게 디렉토리를 다시 집계하는 저장 횟수 주기
+EVICT_EVERY = 64
+
+# 제한을 넘으면 max_bytes의 이 비율까지 줄여, 가득 찬 뒤에도 저장마다 재집계하지 않음
+EVICT_LOW_WATER = 0.9
+
+
+class TranscriptCache:
+    """
+    학습자 스크립트 실행 기록의 디스크 캐시
+
+    여러 배치 워커 프로세스가 같은 디렉토리를 공유해도 되도록
+    쓰기는 임시 파일 + os.replace로 원자적으로 수행
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (없으면 생성)
+            max_bytes: 캐시 전체 최대 크기 (바이트)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # 전체 크기 추정치 (None이면 아직 집계 전) + 마지막 집계 이후 저장 횟수
+        self._total: Optional[int] = None
+        self._puts_since_scan = 0
+
+    @staticmethod
+    def make_key(tree_hash: str, script: str, stdin_text: str, timeout: float,
+                 virtual_clock: bool = False,
+                 limits: Optional[Dict[str, int]] = None) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            tree_hash: 제출물 디렉토리 지문 (utils.fingerprint.fingerprint_tree)
+            script: 실행 스크립트 식별자 (제출물 기준 상대 경로 또는 내용 해시)
+            stdin_text: stdin으로 전달한 명령어 스크립트
+            timeout: 실행 제한 시간 (초)
+            virtual_clock: 가상 시계 설치 여부
+            limits: 자원 제한 (core.sandbox.SandboxLimits.to_dict(), 없으면 None)
+        """
+        parts = [CACHE_VERSION, sys.version, tree_hash, script, stdin_text, timeout, virtual_clock]
+        if limits:
+            # 제한 없이 만든 기존 키는 그대로 유지
+            parts.append(limits)
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 실행 기록 조회 (적중 시 mtime 갱신)
+
+        Returns:
+            {"stdout", "stderr", "returncode"} 딕셔너리 (put의 extra 포함) 또는 None
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def put(self, key: str, stdout: str, stderr: str, returncode: Optional[int],
+            extra: Optional[Dict[str, Any]] = None) -> None:
+        """
+        실행 기록 저장 후 크기 제한 초과분 정리 (저장 실패는 무시)
+
+        extra: 함께 저장할 JSON 직렬화 가능한 항목 (예: 대화형 세션의 명령별 응답)
+        """
+        entry = {"stdout": stdout, "stderr": stderr, "returncode": returncode, **(extra or {})}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+            size = os.path.getsize(self._path(key))
+        except OSError:
+            return
+        with self._lock:
+            # 같은 키를 덮어쓰면 과대 추정이 되지만 재집계가 조금 일찍 일어날 뿐
+            scan = self._total is None or self._puts_since_scan >= EVICT_EVERY
+            if not scan:
+                self._total += size
+                self._puts_since_scan += 1
+                scan = self._total > self.max_bytes
+        if scan:
+            self.evict()
+
+    def evict(self) -> None:
+        """전체 크기를 다시 집계하여 max_bytes를 넘으면 EVICT_LOW_WATER까지 오래된 항목부터 삭제"""
+        with self._lock:
+            self._puts_since_scan = 0
+            entries = []
+            total = 0
+            for path in self._entry_files():
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total > self.max_bytes:
+                target = int(self.max_bytes * EVICT_LOW_WATER)
+                for _, size, path in sorted(entries):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        continue
+                    total -= size
+                    if total <= target:
+                        break
+            self._total = total
+
+    def _entry_files(self):
+        """캐시 항목 파일 (작성 중인 임시 파일 제외)"""
+        return list(self.cache_dir.glob("*.json"))
+
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        with self._lock:
+            self._total = None
+        for path in self._entry_files():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+_shared_caches: Dict[str, TranscriptCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache(cache_dir: Union[str, Path]) -> TranscriptCache:
+    """
+    프로세스 공용 인스턴스 (디렉토리별, 최초 호출 시 생성)
+
+    배치 워커가 작업마다 새 인스턴스를 만들면 작업마다 디렉토리를 다시 집계하므로,
+    크기 추정치를 작업 간에 유지하도록 같은 인스턴스를 재사용
+    """
+    key = os.path.abspath(str(cache_dir))
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = _shared_caches[key] = TranscriptCache(cache_dir)
+        return cache
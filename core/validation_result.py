@@ -1,8 +1,9 @@
 """
 검증 결과 클래스
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
+from pathlib import Path
 import json
 
 
@@ -18,6 +19,8 @@ class ValidationResult:
         self.results: List[Dict[str, Any]] = []
         self.overall_passed = False
         self.overall_score = 0.0
+        # 채점 전체 소요 시간 (초, Grader가 기록)
+        self.elapsed = 0.0
 
     def add_result(self, validator_name: str, result: Dict[str, Any],
                    weight: float = 0) -> None:
@@ -57,9 +60,49 @@ class ValidationResult:
             "timestamp": self.timestamp,
             "overall_passed": self.overall_passed,
             "overall_score": round(self.overall_score, 2),
+            "timings": self.timing_summary(),
             "results": self.results
         }, indent=2, ensure_ascii=False)
 
+    def timing_summary(self) -> Dict[str, Any]:
+        """
+        채점 소요 시간 요약
+
+        Returns:
+            {"total": 전체 초, "validators": {검증기명: {setup, build_checklist, execute, teardown, total}}}
+        """
+        return {
+            "total": round(self.elapsed, 4),
+            "validators": {
+                r["validator"]: r["result"].get("timings", {}) for r in self.results
+            },
+        }
+
+    def save(self, output_dir: Path) -> Tuple[Path, Path]:
+        """
+        JSON + Markdown 리포트를 output_dir에 저장
+
+        파일명: {student_id}_{mission_id}_{타임스탬프}.json / .md
+
+        Returns:
+            (JSON 경로, Markdown 경로)
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        timestamp = self.timestamp.replace(":", "").replace("-", "").split(".")[0]
+        stem = f"{self.student_id}_{self.mission_id}_{timestamp}"
+
+        json_path = output_dir / f"{stem}.json"
+        with open(json_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_json())
+
+        md_path = output_dir / f"{stem}.md"
+        with open(md_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_markdown())
+
+        return json_path, md_path
+
     def to_markdown(self) -> str:
         """Markdown 리포트 생성"""
         md = f"# 채점 결과 리포트\n\n"
@@ -78,15 +121,25 @@ class ValidationResult:
             md += f"## {idx}. {validator}\n\n"
             md += f"- **결과**: {'✅ 통과' if result.get('is_passed') else '❌ 실패'}\n"
             md += f"- **점수**: {result.get('earned_points', 0)} / {result.get('total_points', 0)}\n"
-            md += f"- **통과율**: {result.get('passed_items', 0)} / {result.get('total_items', 0)}\n\n"
+            md += f"- **통과율**: {result.get('passed_items', 0)} / {result.get('total_items', 0)}\n"
+            if result.get("skipped"):
+                md += f"- **건너뜀**: {result['skipped']} (학습자 코드 실행 생략)\n"
+            md += "\n"
 
             md += "### 세부 체크리스트\n\n"
             for item in result.get("items", []):
-                status_emoji = "✅" if item["status"] == "passed" else "❌"
+                status_emoji = {"passed": "✅", "skipped": "⏭️"}.get(item["status"], "❌")
                 md += f"{status_emoji} **[{item['points']}점]** {item['description']}\n"
 
                 if item.get("error_message"):
                     md += f"   - 오류: `{item['error_message']}`\n"
+                exceeded = (item.get("resource_usage") or {}).get("limit_exceeded")
+                if exceeded:
+                    md += f"   - 자원 제한 초과: {', '.join(exceeded)}\n"
+                complexity = item.get("complexity")
+                if complexity and complexity.get("exponent") is not None:
+                    md += (f"   - 연산당 비용 증가 지수: {complexity['exponent']} "
+                           f"(기준 ≤ {complexity['max_exponent']}, 크기 {complexity['sizes']})\n")
                 if item.get("hint") and item["status"] != "passed":
                     md += f"   - 힌트: {item['hint']}\n"
 
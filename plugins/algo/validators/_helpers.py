@@ -1,6 +1,10 @@
 """알고리즘 미션 검증 공통 유틸리티"""
 import hashlib
-from typing import List
+import os
+from typing import Optional
+
+# Mini Git REPL 프롬프트
+PROMPT = "mini-git>"
 
 
 def generate_hash(message: str, seq: int) -> str:
@@ -8,29 +12,44 @@ def generate_hash(message: str, seq: int) -> str:
     return hashlib.sha256(f"{message}:{seq}".encode()).hexdigest()[:7]
 
 
-def parse_responses(stdout: str) -> List[str]:
-    """REPL stdout에서 프롬프트를 제거하고 응답만 추출
-
-    "mini-git> [main abc1234] msg" → "[main abc1234] msg"
-    여러 줄 응답(LOG, ANCESTORS 등)은 하나로 합침
-    """
-    responses = []
-    lines = stdout.split("\n")
-    current_response_lines = []
-
-    for line in lines:
-        if "mini-git>" in line:
-            if current_response_lines:
-                responses.append("\n".join(current_response_lines))
-                current_response_lines = []
-
-            after_prompt = line.split("mini-git>", 1)[1].strip()
-            if after_prompt:
-                current_response_lines.append(after_prompt)
-        elif line.strip():
-            current_response_lines.append(line.strip())
-
-    if current_response_lines:
-        responses.append("\n".join(current_response_lines))
-
-    return responses
+def find_cli(submission_dir: str) -> Optional[str]:
+    """제출물의 cli.py 경로 (없으면 None)"""
+    cli_file = os.path.join(submission_dir, "cli.py")
+    return cli_file if os.path.isfile(cli_file) else None
+
+
+# 브랜치 분기 시나리오 — BasicCommandValidator와 GraphAlgorithmValidator가
+# 같은 실행 기록을 공유 (core.repl.run_repl + GradingContext)
+#
+# [0] INIT Alice
+# [1] COMMIT c1 (main)      [2] COMMIT c2 (main)
+# [3] BRANCH feature        [4] SWITCH feature
+# [5] COMMIT c3 (feature)   [6] COMMIT c4 (feature)
+# [7] SWITCH main           [8] LOG (c5 생성 전: 4커밋)
+# [9] COMMIT c5 (main)      [10] ANCESTORS c5
+# [11] PATH c4 c5           [12] ANCESTORS c4
+#
+# LOG를 COMMIT c5 전에 배치하여 트랩2(선형 체인화)가 트랩3(LOG)을 상쇄하지 않도록 함
+# LOG 시점: c1,c2(main) + c3,c4(feature) = 4커밋. main HEAD=c2에서 부모 탐색 시 c3,c4 미도달
+BRANCH_C1 = generate_hash("Initial commit", 1)
+BRANCH_C2 = generate_hash("Add user auth", 2)
+BRANCH_C3 = generate_hash("Add login page", 3)
+BRANCH_C4 = generate_hash("Add dashboard", 4)
+BRANCH_C5 = generate_hash("Add payment", 5)
+
+BRANCH_SCENARIO = (
+    'INIT Alice\n'
+    'COMMIT "Initial commit"\n'
+    'COMMIT "Add user auth"\n'
+    'BRANCH feature\n'
+    'SWITCH feature\n'
+    'COMMIT "Add login page"\n'
+    'COMMIT "Add dashboard"\n'
+    'SWITCH main\n'
+    'LOG\n'
+    'COMMIT "Add payment"\n'
+    f'ANCESTORS {BRANCH_C5}\n'
+    f'PATH {BRANCH_C4} {BRANCH_C5}\n'
+    f'ANCESTORS {BRANCH_C4}\n'
+    'exit\n'
+)
@@ -1,17 +1,23 @@
 """
 기본 명령어 검증 플러그인 (20점)
 
-subprocess.run + stdin pipe로 학습자의 cli.py REPL을 실행하여
+브랜치 분기 시나리오(BRANCH_SCENARIO) 실행 기록의 앞부분으로
 INIT/COMMIT/BRANCH/SWITCH 기본 동작을 검증.
+같은 기록을 GraphAlgorithmValidator와 공유하므로 cli.py를 따로 실행하지 않음.
 """
-import os
-import subprocess
-import sys
 from typing import Dict, Any, Optional, List
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.algo.validators._helpers import generate_hash, parse_responses
+from core.repl import ReplTranscript, run_repl
+from plugins.algo.validators._helpers import (
+    PROMPT,
+    BRANCH_SCENARIO,
+    BRANCH_C1,
+    BRANCH_C2,
+    BRANCH_C3,
+    find_cli,
+)
 
 
 class BasicCommandValidator(BaseValidator):
@@ -21,26 +27,18 @@ class BasicCommandValidator(BaseValidator):
         super().__init__(mission_config)
         self.submission_dir = ""
         self.cli_path: Optional[str] = None
+        self._transcript: Optional[ReplTranscript] = None
         self._responses: Optional[List[str]] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        cli_file = os.path.join(self.submission_dir, "cli.py")
-        if os.path.isfile(cli_file):
-            self.cli_path = cli_file
-
-        # 테스트 시나리오 실행
-        commands = (
-            'INIT Alice\n'
-            'COMMIT "Initial commit"\n'
-            'COMMIT "Add feature"\n'
-            'BRANCH dev\n'
-            'SWITCH dev\n'
-            'COMMIT "Dev work"\n'
-            'SWITCH main\n'
-            'exit\n'
-        )
-        self._responses = self._run_repl(commands)
+        self.cli_path = find_cli(self.submission_dir)
+
+        # 브랜치 분기 시나리오 (GraphAlgorithmValidator와 실행 기록 공유)
+        self._transcript = run_repl(self.cli_path, BRANCH_SCENARIO, PROMPT,
+                                    cwd=self.submission_dir, context=self.context)
+        if self._transcript:
+            self._responses = self._transcript.responses
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -57,6 +55,7 @@ class BasicCommandValidator(BaseValidator):
             points=5,
             validator=self._check_init,
             hint="INIT Alice → 'Initialized repository.' + 'Current user: Alice'",
+            requires=["cli_runnable"],
         ))
 
         self.checklist.add_item(CheckItem(
@@ -65,6 +64,7 @@ class BasicCommandValidator(BaseValidator):
             points=6,
             validator=self._check_commit,
             hint="COMMIT 출력은 '[<branch> <hash>] <message>' 형식",
+            requires=["cli_runnable"],
         ))
 
         self.checklist.add_item(CheckItem(
@@ -73,48 +73,17 @@ class BasicCommandValidator(BaseValidator):
             points=6,
             validator=self._check_branch_switch,
             hint="BRANCH → 'Created branch: <name>', SWITCH → 'Switched to branch: <name>'",
+            requires=["cli_runnable"],
         ))
 
     def teardown(self) -> None:
         pass
 
-    # -- REPL 실행 헬퍼 --
-
-    def _run_repl(self, commands: str, timeout: int = 10) -> Optional[List[str]]:
-        """cli.py REPL을 실행하고 응답 리스트를 반환"""
-        if not self.cli_path:
-            return None
-        try:
-            result = subprocess.run(
-                [sys.executable, self.cli_path],
-                input=commands,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.submission_dir,
-            )
-            return parse_responses(result.stdout)
-        except (subprocess.TimeoutExpired, OSError):
-            return None
-
     # -- 검증 함수 --
 
     def _check_runnable(self) -> bool:
-        """cli.py 실행 가능 + 프롬프트 출력 확인"""
-        if not self.cli_path:
-            return False
-        try:
-            result = subprocess.run(
-                [sys.executable, self.cli_path],
-                input="exit\n",
-                capture_output=True,
-                text=True,
-                timeout=5,
-                cwd=self.submission_dir,
-            )
-            return "mini-git>" in result.stdout
-        except (subprocess.TimeoutExpired, OSError):
-            return False
+        """cli.py 실행 가능 + 프롬프트 출력 확인 (공유 실행 기록 재사용)"""
+        return self._transcript is not None and self._transcript.has_prompt
 
     def _check_init(self) -> bool:
         """INIT Alice → 저장소 초기화 메시지 확인"""
@@ -131,34 +100,29 @@ class BasicCommandValidator(BaseValidator):
         if not self._responses or len(self._responses) < 3:
             return False
 
-        c1_hash = generate_hash("Initial commit", 1)
-        c2_hash = generate_hash("Add feature", 2)
-
         # responses[1] = COMMIT "Initial commit" → "[main <hash>] Initial commit"
-        # responses[2] = COMMIT "Add feature" → "[main <hash>] Add feature"
+        # responses[2] = COMMIT "Add user auth" → "[main <hash>] Add user auth"
         resp1 = self._responses[1]
         resp2 = self._responses[2]
 
-        return (c1_hash in resp1 and "[main" in resp1 and "Initial commit" in resp1
-                and c2_hash in resp2 and "[main" in resp2 and "Add feature" in resp2)
+        return (BRANCH_C1 in resp1 and "[main" in resp1 and "Initial commit" in resp1
+                and BRANCH_C2 in resp2 and "[main" in resp2 and "Add user auth" in resp2)
 
     def _check_branch_switch(self) -> bool:
-        """BRANCH dev → Created branch: dev, SWITCH dev → Switched to branch: dev"""
-        if not self._responses or len(self._responses) < 7:
+        """BRANCH feature → Created branch: feature, SWITCH feature → Switched to branch: feature"""
+        if not self._responses or len(self._responses) < 8:
             return False
 
-        c3_hash = generate_hash("Dev work", 3)
-
-        # responses[3] = BRANCH dev → "Created branch: dev"
-        # responses[4] = SWITCH dev → "Switched to branch: dev"
-        # responses[5] = COMMIT "Dev work" → "[dev <hash>] Dev work"
-        # responses[6] = SWITCH main → "Switched to branch: main"
+        # responses[3] = BRANCH feature → "Created branch: feature"
+        # responses[4] = SWITCH feature → "Switched to branch: feature"
+        # responses[5] = COMMIT "Add login page" → "[feature <hash>] Add login page"
+        # responses[7] = SWITCH main → "Switched to branch: main"
         branch_resp = self._responses[3]
         switch_resp = self._responses[4]
         commit_resp = self._responses[5]
-        switch_back = self._responses[6]
+        switch_back = self._responses[7]
 
-        return ("Created branch: dev" in branch_resp
-                and "Switched to branch: dev" in switch_resp
-                and "[dev" in commit_resp and c3_hash in commit_resp
+        return ("Created branch: feature" in branch_resp
+                and "Switched to branch: feature" in switch_resp
+                and "[feature" in commit_resp and BRANCH_C3 in commit_resp
                 and "Switched to branch: main" in switch_back)
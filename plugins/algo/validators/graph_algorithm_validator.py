@@ -1,7 +1,8 @@
 """
 그래프 알고리즘 검증 플러그인 (35점)
 
-subprocess.run + stdin pipe로 PATH/ANCESTORS/LOG 알고리즘을 검증.
+core.repl 하네스로 PATH/ANCESTORS/LOG 알고리즘을 검증.
+세션 B(브랜치 분기)는 BasicCommandValidator와 실행 기록을 공유.
 
 조정 1 적용: path_same_branch는 독립 세션(선형 체인)으로 테스트하여
 commit_parent 트랩에 의한 연쇄 실패를 방지.
@@ -11,14 +12,22 @@ AI 트랩:
 - log_all_branches: LOG가 현재 브랜치만 출력
 - path_cross_branch: 다른 브랜치 간 PATH 검색 실패
 """
-import os
-import subprocess
-import sys
 from typing import Dict, Any, Optional, List
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.algo.validators._helpers import generate_hash, parse_responses
+from core.repl import run_repls
+from plugins.algo.validators._helpers import (
+    PROMPT,
+    BRANCH_SCENARIO,
+    BRANCH_C1,
+    BRANCH_C2,
+    BRANCH_C3,
+    BRANCH_C4,
+    BRANCH_C5,
+    find_cli,
+    generate_hash,
+)
 
 
 class GraphAlgorithmValidator(BaseValidator):
@@ -39,18 +48,16 @@ class GraphAlgorithmValidator(BaseValidator):
         self._p2 = generate_hash("Second", 2)
         self._p3 = generate_hash("Third", 3)
 
-        # 세션 B: 브랜치 분기
-        self._c1 = generate_hash("Initial commit", 1)
-        self._c2 = generate_hash("Add user auth", 2)
-        self._c3 = generate_hash("Add login page", 3)
-        self._c4 = generate_hash("Add dashboard", 4)
-        self._c5 = generate_hash("Add payment", 5)
+        # 세션 B: 브랜치 분기 (BRANCH_SCENARIO)
+        self._c1 = BRANCH_C1
+        self._c2 = BRANCH_C2
+        self._c3 = BRANCH_C3
+        self._c4 = BRANCH_C4
+        self._c5 = BRANCH_C5
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        cli_file = os.path.join(self.submission_dir, "cli.py")
-        if os.path.isfile(cli_file):
-            self.cli_path = cli_file
+        self.cli_path = find_cli(self.submission_dir)
 
         # 세션 A: 선형 체인 (path_same_branch 독립 테스트)
         # PATH p3 p1: 부모 방향 BFS로 p3→p2→p1 탐색 가능 (트랩4 연쇄 방지)
@@ -62,28 +69,14 @@ class GraphAlgorithmValidator(BaseValidator):
             f'PATH {self._p3} {self._p1}\n'
             'exit\n'
         )
-        self._linear_responses = self._run_repl(linear_commands)
-
-        # 세션 B: 브랜치 분기 (나머지 테스트)
-        # LOG를 COMMIT c5 전에 배치하여 트랩2(선형 체인화)가 트랩3(LOG)을 상쇄하지 않도록 함
-        # LOG 시점: c1,c2(main) + c3,c4(feature) = 4커밋. main HEAD=c2에서 부모 탐색 시 c3,c4 미도달
-        branch_commands = (
-            'INIT Alice\n'
-            'COMMIT "Initial commit"\n'
-            'COMMIT "Add user auth"\n'
-            'BRANCH feature\n'
-            'SWITCH feature\n'
-            'COMMIT "Add login page"\n'
-            'COMMIT "Add dashboard"\n'
-            'SWITCH main\n'
-            'LOG\n'
-            'COMMIT "Add payment"\n'
-            f'ANCESTORS {self._c5}\n'
-            f'PATH {self._c4} {self._c5}\n'
-            f'ANCESTORS {self._c4}\n'
-            'exit\n'
-        )
-        self._branch_responses = self._run_repl(branch_commands)
+        # 세션 B: 브랜치 분기 (나머지 테스트, 명령어 순서는 _helpers.BRANCH_SCENARIO 참고)
+        # 두 세션은 독립적이므로 async 드라이버에서는 동시에 실행
+        linear, branch = run_repls(self.cli_path, [linear_commands, BRANCH_SCENARIO], PROMPT,
+                                   cwd=self.submission_dir, context=self.context)
+        if linear:
+            self._linear_responses = linear.responses
+        if branch:
+            self._branch_responses = branch.responses
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -132,25 +125,6 @@ class GraphAlgorithmValidator(BaseValidator):
     def teardown(self) -> None:
         pass
 
-    # -- REPL 실행 헬퍼 --
-
-    def _run_repl(self, commands: str, timeout: int = 10) -> Optional[List[str]]:
-        """cli.py REPL을 실행하고 응답 리스트를 반환"""
-        if not self.cli_path:
-            return None
-        try:
-            result = subprocess.run(
-                [sys.executable, self.cli_path],
-                input=commands,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.submission_dir,
-            )
-            return parse_responses(result.stdout)
-        except (subprocess.TimeoutExpired, OSError):
-            return None
-
     # -- 검증 함수 --
 
     def _check_commit_parent(self) -> bool:
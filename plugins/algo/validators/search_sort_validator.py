@@ -1,17 +1,33 @@
 """
 검색/정렬 검증 플러그인 (25점)
 
-subprocess.run + stdin pipe로 SEARCH/LOG --sort-by 동작을 검증.
+core.repl 하네스로 SEARCH/LOG --sort-by 동작을 검증.
 분기 없는 선형 시나리오로 독립적으로 테스트.
+커밋 수를 늘려 가며 SEARCH 연산당 비용을 측정하여 역색인(O(1) 조회)인지도 확인 (core.complexity).
 """
-import os
-import subprocess
-import sys
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.algo.validators._helpers import generate_hash, parse_responses
+from core.complexity import ComplexityCheckItem, ScalingResult, probe_repl_scaling
+from core.repl import run_repl
+from plugins.algo.validators._helpers import PROMPT, find_cli, generate_hash
+
+# 복잡도 측정 시 커밋 수와 무관하게 실행하는 SEARCH 명령 수
+COMPLEXITY_OPS = 5000
+
+
+def search_workload(size: int) -> Tuple[List[str], List[str]]:
+    """
+    커밋 size개를 만든 뒤, 없는 키워드와 커밋 1개에만 있는 키워드 SEARCH를 번갈아 실행
+    (결과 수가 커밋 수와 무관하므로 출력 비용이 일정)
+    """
+    preload = ["INIT Alice"] + [f'COMMIT "update module{i}"' for i in range(size)]
+    measured = []
+    for i in range(COMPLEXITY_OPS // 2):
+        measured.append(f'SEARCH "missing{i}"')
+        measured.append(f'SEARCH "module{i % size}"')
+    return preload, measured
 
 
 class SearchSortValidator(BaseValidator):
@@ -31,9 +47,7 @@ class SearchSortValidator(BaseValidator):
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        cli_file = os.path.join(self.submission_dir, "cli.py")
-        if os.path.isfile(cli_file):
-            self.cli_path = cli_file
+        self.cli_path = find_cli(self.submission_dir)
 
         # 검색/정렬 테스트 시나리오 (선형, 브랜치 없음)
         commands = (
@@ -48,13 +62,16 @@ class SearchSortValidator(BaseValidator):
             'LOG --sort-by=date\n'
             'exit\n'
         )
-        self._responses = self._run_repl(commands)
+        transcript = run_repl(self.cli_path, commands, PROMPT,
+                              cwd=self.submission_dir, context=self.context)
+        if transcript:
+            self._responses = transcript.responses
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
             id="search_keyword",
             description="SEARCH 키워드 검색 (정확한 매칭 + 결과 수)",
-            points=7,
+            points=6,
             validator=self._check_search_keyword,
             hint="역색인으로 메시지에 키워드가 포함된 커밋을 검색하세요",
         ))
@@ -62,7 +79,7 @@ class SearchSortValidator(BaseValidator):
         self.checklist.add_item(CheckItem(
             id="search_no_result",
             description="미존재 키워드 SEARCH → 'Found 0 commit(s):'",
-            points=5,
+            points=4,
             validator=self._check_search_no_result,
             hint="검색 결과가 없으면 'Found 0 commit(s):' 출력",
         ))
@@ -70,7 +87,7 @@ class SearchSortValidator(BaseValidator):
         self.checklist.add_item(CheckItem(
             id="search_author",
             description="SEARCH --author 작성자 검색",
-            points=6,
+            points=5,
             validator=self._check_search_author,
             hint="--author=Name 옵션으로 작성자별 커밋 검색",
         ))
@@ -78,35 +95,31 @@ class SearchSortValidator(BaseValidator):
         self.checklist.add_item(CheckItem(
             id="sort_by_date",
             description="LOG --sort-by=date 날짜순 정렬 확인",
-            points=7,
+            points=6,
             validator=self._check_sort_by_date,
             hint="LOG --sort-by=date는 모든 커밋을 시간순으로 출력 (merge sort 직접 구현)",
         ))
 
+        self.checklist.add_item(ComplexityCheckItem(
+            id="search_complexity",
+            description="커밋 수가 늘어도 SEARCH 연산당 비용이 일정한지 확인 (역색인)",
+            points=4,
+            probe=self._probe_search_complexity,
+            hint="SEARCH마다 전체 커밋을 훑으면 O(n)입니다 "
+                 "— COMMIT 시 단어 → 커밋 해시 역색인(dict)을 갱신하고 조회만 하세요",
+            requires=["search_keyword"],
+        ))
+
     def teardown(self) -> None:
         pass
 
-    # -- REPL 실행 헬퍼 --
-
-    def _run_repl(self, commands: str, timeout: int = 10) -> Optional[List[str]]:
-        """cli.py REPL을 실행하고 응답 리스트를 반환"""
-        if not self.cli_path:
-            return None
-        try:
-            result = subprocess.run(
-                [sys.executable, self.cli_path],
-                input=commands,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.submission_dir,
-            )
-            return parse_responses(result.stdout)
-        except (subprocess.TimeoutExpired, OSError):
-            return None
-
     # -- 검증 함수 --
 
+    def _probe_search_complexity(self) -> Optional[ScalingResult]:
+        """커밋 1000/4000/16000개에서 SEARCH 연산당 처리 시간 증가 지수 측정"""
+        return probe_repl_scaling(self.cli_path, search_workload, "search",
+                                  cwd=self.submission_dir, context=self.context)
+
     def _check_search_keyword(self) -> bool:
         """SEARCH "login" → Found 2 commit(s): s3, s4
 
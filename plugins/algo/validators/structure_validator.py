@@ -7,14 +7,11 @@ AST 분석으로 학습자가 Commit 클래스를 올바르게 정의했는지,
 AI 트랩: sorted()/list.sort()/heapq 사용
 """
 import ast
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.python.validators._helpers import (
-    collect_py_files,
-    parse_all_files,
-)
+from plugins.python.validators._ast_facts import AstFacts, get_ast_facts
 
 
 class StructureValidator(BaseValidator):
@@ -23,12 +20,11 @@ class StructureValidator(BaseValidator):
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
-        self.parsed: List[Tuple[str, ast.Module]] = []
+        self.facts: Optional[AstFacts] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        py_files = collect_py_files(self.submission_dir)
-        self.parsed = parse_all_files(py_files)
+        self.facts = get_ast_facts(self.submission_dir, self.context)
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -65,56 +61,20 @@ class StructureValidator(BaseValidator):
         """AST에서 Commit 클래스의 __init__에 hash/message/author/timestamp/parents 할당 확인"""
         required_attrs = {"hash", "message", "author", "timestamp", "parents"}
 
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if not (isinstance(node, ast.ClassDef) and node.name == "Commit"):
-                    continue
-
-                found_attrs = set()
-                for item in node.body:
-                    if isinstance(item, ast.FunctionDef) and item.name == "__init__":
-                        for stmt in ast.walk(item):
-                            if isinstance(stmt, ast.Assign):
-                                for target in stmt.targets:
-                                    if (isinstance(target, ast.Attribute)
-                                            and isinstance(target.value, ast.Name)
-                                            and target.value.id == "self"):
-                                        found_attrs.add(target.attr)
-                            if isinstance(stmt, ast.AnnAssign):
-                                if (isinstance(stmt.target, ast.Attribute)
-                                        and isinstance(stmt.target.value, ast.Name)
-                                        and stmt.target.value.id == "self"):
-                                    found_attrs.add(stmt.target.attr)
-
-                if required_attrs.issubset(found_attrs):
-                    return True
-
-        return False
+        # __init__ 안의 self.attr = ... / self.attr: type = ... 할당
+        return any(
+            required_attrs.issubset(commit_cls.init_attrs)
+            for commit_cls in self.facts.classes_named("Commit")
+        )
 
     def _check_no_builtin_sort(self) -> bool:
         """AST에서 sorted()/list.sort()/heapq 사용 탐지"""
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                # sorted() 호출
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Name) and node.func.id == "sorted":
-                        return False
-                    # .sort() 메서드 호출
-                    if isinstance(node.func, ast.Attribute) and node.func.attr == "sort":
-                        return False
-
-                # import heapq
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name == "heapq":
-                            return False
-
-                # from heapq import ...
-                if isinstance(node, ast.ImportFrom):
-                    if node.module == "heapq":
-                        return False
+        # sorted() 호출 / .sort() 메서드 호출
+        if "sorted" in self.facts.called_names or "sort" in self.facts.called_attributes:
+            return False
 
-        return True
+        # import heapq / from heapq import ...
+        return not any(imp.module == "heapq" for imp in self.facts.imports)
 
     def _check_graph_structure(self) -> bool:
         """클래스 __init__에서 dict 기반 커밋 저장소 사용 확인
@@ -124,44 +84,19 @@ class StructureValidator(BaseValidator):
         """
         dict_attr_names = {"commits", "store", "commit_store", "graph", "nodes"}
 
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if not isinstance(node, ast.ClassDef):
-                    continue
-
-                for item in node.body:
-                    if not (isinstance(item, ast.FunctionDef)
-                            and item.name == "__init__"):
-                        continue
-
-                    for stmt in ast.walk(item):
-                        # self.attr = {} 패턴
-                        if isinstance(stmt, ast.Assign):
-                            for target in stmt.targets:
-                                if (isinstance(target, ast.Attribute)
-                                        and isinstance(target.value, ast.Name)
-                                        and target.value.id == "self"
-                                        and target.attr in dict_attr_names):
-                                    # 값이 {} 또는 dict()인지 확인
-                                    if isinstance(stmt.value, ast.Dict):
-                                        return True
-                                    if (isinstance(stmt.value, ast.Call)
-                                            and isinstance(stmt.value.func, ast.Name)
-                                            and stmt.value.func.id == "dict"):
-                                        return True
-
-                        # self.attr: dict = {} 패턴 (AnnAssign)
-                        if isinstance(stmt, ast.AnnAssign):
-                            if (isinstance(stmt.target, ast.Attribute)
-                                    and isinstance(stmt.target.value, ast.Name)
-                                    and stmt.target.value.id == "self"
-                                    and stmt.target.attr in dict_attr_names):
-                                if stmt.value is not None:
-                                    if isinstance(stmt.value, ast.Dict):
-                                        return True
-                                    if (isinstance(stmt.value, ast.Call)
-                                            and isinstance(stmt.value.func, ast.Name)
-                                            and stmt.value.func.id == "dict"):
-                                        return True
+        for cls in self.facts.classes:
+            # self.attr = {} / self.attr: dict = {} 패턴 (값이 {} 또는 dict()인지 확인)
+            for attr, value in cls.init_assignments:
+                if attr in dict_attr_names and _is_dict_value(value):
+                    return True
 
         return False
+
+
+def _is_dict_value(value: Optional[ast.expr]) -> bool:
+    """값 노드가 {} 리터럴 또는 dict() 호출인지"""
+    if isinstance(value, ast.Dict):
+        return True
+    return (isinstance(value, ast.Call)
+            and isinstance(value.func, ast.Name)
+            and value.func.id == "dict")
@@ -0,0 +1,132 @@
+"""
+DB 미션 공유 실행 결과 (채점 1회당 commit_analyzer.py 1회 실행)
+
+스키마/리포트/분석 검증기가 같은 CSV로 같은 스크립트를 각자 실행하던 것을
+GradingContext에 저장한 실행 결과 1개로 공유.
+commits를 지정하면 고정 CSV 대신 규모별 합성 저장소(_synthetic)로 실행하며, 규모마다 따로 1회 실행.
+임시 디렉토리는 채점 종료 시(GradingContext.close) 삭제되며, 검증기는 읽기 전용으로 사용.
+"""
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from core import sandbox
+from core.grading_context import GradingContext
+from plugins.db.validators._data import write_csv_files
+from plugins.db.validators._synthetic import ExpectedAnswers, generate_repository
+
+SCRIPT_NAME = "commit_analyzer.py"
+RUN_TIMEOUT = 15
+
+
+@dataclass
+class AnalyzerArtifacts:
+    """
+    commit_analyzer.py 실행 1회의 산출물
+
+    Attributes:
+        db_path: --db로 넘긴 DB 파일 경로 (생성되지 않았을 수 있음)
+        report_path: --output으로 넘긴 리포트 파일 경로
+        report_content: 리포트 내용 (없거나 읽기 실패 시 None)
+        stdout: 표준 출력
+        stderr: 표준 에러
+        returncode: 종료 코드 (실행하지 못했으면 None)
+        elapsed: 벽시계 실행 시간 (초)
+        exec_success: 제한 시간 안에 프로세스가 종료됨
+        timed_out: 제한 시간 초과로 종료됨
+        report_lines: 리포트 내용의 줄 목록 (검증기 공유, 없으면 빈 리스트)
+        expected: 합성 저장소의 기대 정답값 (고정 CSV로 실행했으면 None)
+    """
+    db_path: str
+    report_path: str
+    report_content: Optional[str] = None
+    stdout: str = ""
+    stderr: str = ""
+    returncode: Optional[int] = None
+    elapsed: float = 0.0
+    exec_success: bool = False
+    timed_out: bool = False
+    report_lines: List[str] = field(default_factory=list)
+    expected: Optional[ExpectedAnswers] = None
+
+    def open_db(self) -> Optional[sqlite3.Connection]:
+        """DB를 읽기 전용으로 연결 (파일이 없으면 None)"""
+        if not os.path.isfile(self.db_path):
+            return None
+        return sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+
+
+def run_analyzer(submission_dir: str, context: GradingContext,
+                 commits: Optional[int] = None, seed: int = 0,
+                 timeout: float = RUN_TIMEOUT) -> Optional[AnalyzerArtifacts]:
+    """
+    제출물의 commit_analyzer.py를 검증용 CSV로 실행한 결과 (같은 인자면 채점 1회당 1번만 실행)
+
+    Args:
+        submission_dir: 제출물 디렉토리
+        context: 채점 공유 컨텍스트 (실행 결과 저장 + 임시 디렉토리 정리 등록)
+        commits: 합성 저장소 커밋 수 (None이면 _data의 고정 CSV)
+        seed: 합성 저장소 seed
+        timeout: 벽시계 제한 (초)
+
+    Returns:
+        AnalyzerArtifacts 또는 None (commit_analyzer.py 없음)
+    """
+    script_path = os.path.join(submission_dir, SCRIPT_NAME)
+    if not os.path.isfile(script_path):
+        return None
+    return context.get_or_create(
+        ("db_artifacts", os.path.abspath(submission_dir), commits, seed, timeout),
+        lambda: _execute(script_path, submission_dir, context, commits, seed, timeout),
+    )
+
+
+def _execute(script_path: str, submission_dir: str, context: GradingContext,
+             commits: Optional[int], seed: int, timeout: float) -> AnalyzerArtifacts:
+    tmpdir = tempfile.TemporaryDirectory()
+    context.add_cleanup(tmpdir.cleanup)
+    data_dir = os.path.join(tmpdir.name, "data")
+    os.makedirs(data_dir)
+    artifacts = AnalyzerArtifacts(
+        db_path=os.path.join(tmpdir.name, "analysis.db"),
+        report_path=os.path.join(tmpdir.name, "report.txt"),
+    )
+    if commits is None:
+        write_csv_files(data_dir)
+    else:
+        artifacts.expected = generate_repository(data_dir, commits, seed)
+
+    start = time.perf_counter()
+    try:
+        proc = sandbox.run(
+            [sys.executable, script_path,
+             "--data-dir", data_dir,
+             "--output", artifacts.report_path,
+             "--db", artifacts.db_path],
+            timeout=timeout,
+            cwd=submission_dir,
+            limits=context.sandbox,
+        )
+        artifacts.stdout = proc.stdout or ""
+        artifacts.stderr = proc.stderr or ""
+        artifacts.returncode = proc.returncode
+        artifacts.exec_success = True
+    except subprocess.TimeoutExpired:
+        artifacts.timed_out = True
+    except OSError:
+        pass
+    artifacts.elapsed = time.perf_counter() - start
+
+    if os.path.isfile(artifacts.report_path):
+        try:
+            with open(artifacts.report_path, "r", encoding="utf-8") as f:
+                artifacts.report_content = f.read()
+            artifacts.report_lines = artifacts.report_content.splitlines()
+        except (OSError, UnicodeDecodeError):
+            pass
+    return artifacts
@@ -0,0 +1,237 @@
+"""
+DB 미션 합성 저장소 생성기 (성능 등급용)
+
+seed로 결정적인 authors/commits/branches/commit_files CSV를 규모(커밋 10^3~10^6개)에 맞춰 생성하고,
+생성하면서 리포트 기대 정답값(ExpectedAnswers)을 함께 계산.
+CSV는 한 행씩 스트리밍으로 쓰므로 메모리는 커밋 수가 아닌 작성자·파일·main 이력 크기에 비례.
+
+생성되는 저장소 형태:
+- main은 root commit에서 시작하는 단일 체인, feature 브랜치는 main 또는 다른 feature에서 분기
+- 고아 브랜치(docs/site)는 자체 root commit을 가짐 → root commit이 2개
+- 커밋이 없는 작성자(LEFT JOIN 트랩)와 자체 커밋이 없는 브랜치(hotfix/idle) 포함
+- 파일 변경은 소수 파일에 몰리는 분포 (Most Changed Files 순위가 의미 있도록)
+- 커밋 메시지에 쉼표·따옴표 포함 (CSV 인용 처리 확인)
+"""
+import csv
+import hashlib
+import os
+import random
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+MIN_COMMITS = 10
+
+_SURNAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임"]
+_GIVEN_NAMES = ["민수", "지혜", "동현", "유나", "서진", "태환", "수빈", "현우", "예린", "도윤",
+                "하은", "준호", "서연", "지훈", "채원", "민재", "소희", "건우", "다은", "시우"]
+_TEAMS = ["backend", "frontend", "devops", "data"]
+_MODULES = ["api", "auth", "core", "dashboard", "db", "jobs", "pages", "utils"]
+_TOP_LEVEL_FILES = ["README.md", "requirements.txt", "Dockerfile", "CHANGELOG.md", ".gitignore"]
+_VERBS = ["Add", "Fix", "Refactor", "Update", "Remove", "Tune"]
+_START = datetime(2026, 1, 1, 9, 0, 0)
+
+
+@dataclass
+class ExpectedAnswers:
+    """
+    생성된 저장소에 대한 리포트 기대 정답값 (모범 답안 쿼리와 같은 정렬)
+
+    Attributes:
+        table_rows: 테이블별 행 수 (authors, commits, branches, commit_files)
+        root_commits: parent_hash가 NULL인 커밋 수
+        author_contributions: (이름, 커밋 수, 고유 파일 수) — 커밋 수 내림차순, author_id 오름차순
+        branch_analysis: (브랜치, 커밋 수, head) — 커밋 수 내림차순, 이름 오름차순
+        main_history: (hash, message) — main head → root
+        most_changed_files: (파일, 커밋 수) — 2회 이상, 커밋 수 내림차순, 경로 오름차순
+    """
+    table_rows: Dict[str, int] = field(default_factory=dict)
+    root_commits: int = 0
+    author_contributions: List[Tuple[str, int, int]] = field(default_factory=list)
+    branch_analysis: List[Tuple[str, int, str]] = field(default_factory=list)
+    main_history: List[Tuple[str, str]] = field(default_factory=list)
+    most_changed_files: List[Tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.table_rows.values())
+
+    def report(self) -> str:
+        """모범 답안 generate_report()와 같은 형식의 기대 리포트"""
+        lines = ["=== Commit Statistics ===",
+                 f"Total Commits: {self.table_rows['commits']}",
+                 f"Total Authors: {self.table_rows['authors']}",
+                 f"Total Branches: {self.table_rows['branches']}",
+                 "",
+                 "Author Contributions (commits, files changed):"]
+        for i, (name, commits, files) in enumerate(self.author_contributions, 1):
+            lines.append(f"  {i}. {name}: {commits} commits, {files} files changed")
+        lines += ["", "=== Branch Analysis ==="]
+        for name, count, head in self.branch_analysis:
+            lines.append(f"  {name}: {count} commits (head: {head})")
+        lines += ["", "=== Commit History (main) ==="]
+        for hash_val, message in self.main_history:
+            lines.append(f"  {hash_val} {message}")
+        lines += ["", "=== File Change Analysis ===", "Most Changed Files:"]
+        for i, (path, count) in enumerate(self.most_changed_files, 1):
+            lines.append(f"  {i}. {path}: {count} commits")
+        lines += ["", "=== Summary ==="]
+        top_author = self.author_contributions[0] if self.author_contributions else ("N/A", 0, 0)
+        lines.append(f"Most Active Author: {top_author[0]} ({top_author[1]} commits)")
+        top_branch = self.branch_analysis[0] if self.branch_analysis else ("N/A", 0, "")
+        lines.append(f"Largest Branch: {top_branch[0]} ({top_branch[1]} commits)")
+        top_file = self.most_changed_files[0] if self.most_changed_files else ("N/A", 0)
+        lines.append(f"Most Changed File: {top_file[0]} ({top_file[1]} commits)")
+        return "\n".join(lines)
+
+
+def generate_repository(data_dir: str, commits: int, seed: int = 0) -> ExpectedAnswers:
+    """
+    data_dir에 CSV 4개를 생성하고 기대 정답값 반환
+
+    Args:
+        data_dir: CSV를 쓸 디렉토리 (없으면 생성)
+        commits: 커밋 수 (최소 MIN_COMMITS)
+        seed: 같은 seed·규모면 같은 CSV
+
+    Returns:
+        ExpectedAnswers
+    """
+    commits = max(commits, MIN_COMMITS)
+    rng = random.Random(seed)
+    os.makedirs(data_dir, exist_ok=True)
+    expected = ExpectedAnswers()
+
+    # -- authors (마지막 1/10은 커밋 없음) --
+    active_authors = max(commits // 50, 5)
+    idle_authors = max(active_authors // 10, 1)
+    authors = [_author_name(i) for i in range(active_authors + idle_authors)]
+    with _csv_writer(data_dir, "authors.csv", ["author_id", "name", "email", "team"]) as writer:
+        for author_id, name in enumerate(authors, 1):
+            writer.writerow([author_id, name, f"dev{author_id}@dev.com", rng.choice(_TEAMS)])
+    expected.table_rows["authors"] = len(authors)
+
+    files = _file_pool(max(commits // 20, 20))
+    branch_count = commits // 1000 + 2
+    salt = f"{seed}:{commits}"
+
+    heads: Dict[str, str] = {}
+    created: Dict[str, str] = {}
+    branch_names: List[str] = []
+    commit_counts: Counter = Counter()
+    branch_commits: Counter = Counter()
+    author_files: Dict[int, Set[int]] = {}
+    file_changes: Counter = Counter()
+    main_history: List[Tuple[str, str]] = []
+    orphan_at = commits // 3
+    file_id = 0
+
+    with _csv_writer(data_dir, "commits.csv",
+                     ["hash", "message", "author_id", "parent_hash", "branch_name", "created_at"]
+                     ) as commit_writer, \
+            _csv_writer(data_dir, "commit_files.csv",
+                        ["id", "commit_hash", "file_path"]) as file_writer:
+        for i in range(commits):
+            timestamp = (_START + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S")
+            if i == 0:
+                branch = "main"
+            elif i == orphan_at:
+                branch = "docs/site"
+            elif len(branch_names) < branch_count and rng.random() < branch_count / commits:
+                # main(70%) 또는 기존 feature에서 분기
+                base = "main" if len(branch_names) == 1 or rng.random() < 0.7 \
+                    else rng.choice(branch_names[1:])
+                branch = f"feature/f{len(branch_names)}"
+                heads[branch] = heads[base]
+            else:
+                branch = "main" if rng.random() < 0.5 else rng.choice(branch_names)
+            if branch not in created:
+                created[branch] = timestamp
+                branch_names.append(branch)
+
+            hash_val = hashlib.sha1(f"{salt}:{i}".encode()).hexdigest()[:12]
+            parent = heads.get(branch, "")
+            author_id = rng.randint(1, active_authors)
+            message = _message(rng, i)
+            commit_writer.writerow([hash_val, message, author_id, parent, branch, timestamp])
+            heads[branch] = hash_val
+            if not parent:
+                expected.root_commits += 1
+            if branch == "main":
+                main_history.append((hash_val, message))
+            commit_counts[author_id] += 1
+            branch_commits[branch] += 1
+
+            touched = author_files.setdefault(author_id, set())
+            for index in _changed_files(rng, len(files)):
+                file_id += 1
+                file_writer.writerow([file_id, hash_val, files[index]])
+                touched.add(index)
+                file_changes[index] += 1
+
+    # -- branches (자체 커밋이 없는 hotfix/idle: head = main 중간 커밋) --
+    heads["hotfix/idle"] = main_history[len(main_history) // 2][0]
+    created["hotfix/idle"] = created["main"]
+    branch_names.append("hotfix/idle")
+    with _csv_writer(data_dir, "branches.csv", ["name", "head_hash", "created_at"]) as writer:
+        for name in branch_names:
+            writer.writerow([name, heads[name], created[name]])
+
+    expected.table_rows.update(commits=commits, branches=len(branch_names), commit_files=file_id)
+    expected.author_contributions = [
+        (name, commit_counts[author_id], len(author_files.get(author_id, ())))
+        for author_id, name in sorted(enumerate(authors, 1),
+                                      key=lambda pair: (-commit_counts[pair[0]], pair[0]))
+    ]
+    expected.branch_analysis = sorted(
+        ((name, branch_commits[name], heads[name]) for name in branch_names),
+        key=lambda row: (-row[1], row[0]),
+    )
+    expected.main_history = main_history[::-1]
+    expected.most_changed_files = sorted(
+        ((files[index], count) for index, count in file_changes.items() if count >= 2),
+        key=lambda row: (-row[1], row[0]),
+    )
+    return expected
+
+
+@contextmanager
+def _csv_writer(data_dir: str, filename: str, header: List[str]) -> Iterator[Any]:
+    """CSV 파일을 열고 헤더를 쓴 writer"""
+    with open(os.path.join(data_dir, filename), "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(header)
+        yield writer
+
+
+def _author_name(index: int) -> str:
+    """성·이름 조합 (200명 이후에는 번호를 붙여 중복 방지)"""
+    base = _SURNAMES[index % len(_SURNAMES)] + _GIVEN_NAMES[index // len(_SURNAMES) % len(_GIVEN_NAMES)]
+    combos = len(_SURNAMES) * len(_GIVEN_NAMES)
+    return base if index < combos else f"{base}{index // combos}"
+
+
+def _file_pool(size: int) -> List[str]:
+    pool = list(_TOP_LEVEL_FILES)
+    for i in range(size - len(pool)):
+        pool.append(f"src/{_MODULES[i % len(_MODULES)]}/file{i}.py")
+    return pool
+
+
+def _changed_files(rng: random.Random, pool_size: int) -> Set[int]:
+    """커밋 1개가 바꾼 파일 1~3개 (앞쪽 파일일수록 자주 선택)"""
+    count = rng.randint(1, 3)
+    chosen: Set[int] = set()
+    while len(chosen) < count:
+        chosen.add(int(pool_size * rng.random() ** 3))
+    return chosen
+
+
+def _message(rng: random.Random, index: int) -> str:
+    verb = rng.choice(_VERBS)
+    module = rng.choice(_MODULES)
+    if index % 17 == 0:
+        return f'{verb} {module}, "step {index}"'
+    return f"{verb} {module} change {index}"
@@ -5,15 +5,12 @@
 
 AI 트랩: LEFT JOIN 누락(황서진/hotfix), COUNT(DISTINCT) 미사용, root commit 누락
 """
-import os
-import subprocess
-import sys
-import tempfile
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, List
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.db.validators._data import write_csv_files, EXPECTED_MAIN_HISTORY
+from plugins.db.validators._artifacts import run_analyzer
+from plugins.db.validators._data import EXPECTED_MAIN_HISTORY
 
 
 class AnalysisValidator(BaseValidator):
@@ -23,41 +20,12 @@ class AnalysisValidator(BaseValidator):
         super().__init__(mission_config)
         self.submission_dir = ""
         self.report_lines: List[str] = []
-        self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        script_path = os.path.join(self.submission_dir, "commit_analyzer.py")
-        if not os.path.isfile(script_path):
-            return
-
-        self._tmpdir = tempfile.TemporaryDirectory()
-        tmp = self._tmpdir.name
-        data_dir = os.path.join(tmp, "data")
-        os.makedirs(data_dir)
-        write_csv_files(data_dir)
-
-        db_path = os.path.join(tmp, "analysis.db")
-        report_path = os.path.join(tmp, "report.txt")
-
-        try:
-            subprocess.run(
-                [sys.executable, script_path,
-                 "--data-dir", data_dir,
-                 "--output", report_path,
-                 "--db", db_path],
-                capture_output=True, text=True, timeout=15,
-                cwd=self.submission_dir,
-            )
-        except (subprocess.TimeoutExpired, OSError):
-            pass
-
-        if os.path.isfile(report_path):
-            try:
-                with open(report_path, "r", encoding="utf-8") as f:
-                    self.report_lines = f.read().splitlines()
-            except (OSError, UnicodeDecodeError):
-                pass
+        artifacts = run_analyzer(self.submission_dir, self.context)
+        if artifacts is not None:
+            self.report_lines = artifacts.report_lines
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -121,10 +89,6 @@ class AnalysisValidator(BaseValidator):
             hint="main 브랜치의 head에서 root까지 모든 커밋이 포함되어야 합니다",
         ))
 
-    def teardown(self) -> None:
-        if self._tmpdir:
-            self._tmpdir.cleanup()
-
     # -- 헬퍼 --
 
     def _find_section_lines(self, section_header: str) -> List[str]:
@@ -141,6 +105,9 @@ class AnalysisValidator(BaseValidator):
                 lines.append(line)
         return lines
 
+    def teardown(self) -> None:
+        pass  # 임시 디렉토리는 채점 종료 시 GradingContext가 정리
+
     # -- 검증 함수 --
 
     def _check_author_commit_count(self) -> bool:
@@ -3,15 +3,11 @@
 
 리포트 파일의 존재, 섹션 구조, 요약 통계를 검증.
 """
-import os
-import subprocess
-import sys
-import tempfile
 from typing import Dict, Any, Optional, List
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.db.validators._data import write_csv_files
+from plugins.db.validators._artifacts import run_analyzer
 
 
 class ReportValidator(BaseValidator):
@@ -22,42 +18,13 @@ class ReportValidator(BaseValidator):
         self.submission_dir = ""
         self.report_content: Optional[str] = None
         self.report_lines: List[str] = []
-        self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        script_path = os.path.join(self.submission_dir, "commit_analyzer.py")
-        if not os.path.isfile(script_path):
-            return
-
-        self._tmpdir = tempfile.TemporaryDirectory()
-        tmp = self._tmpdir.name
-        data_dir = os.path.join(tmp, "data")
-        os.makedirs(data_dir)
-        write_csv_files(data_dir)
-
-        db_path = os.path.join(tmp, "analysis.db")
-        report_path = os.path.join(tmp, "report.txt")
-
-        try:
-            subprocess.run(
-                [sys.executable, script_path,
-                 "--data-dir", data_dir,
-                 "--output", report_path,
-                 "--db", db_path],
-                capture_output=True, text=True, timeout=15,
-                cwd=self.submission_dir,
-            )
-        except (subprocess.TimeoutExpired, OSError):
-            pass
-
-        if os.path.isfile(report_path):
-            try:
-                with open(report_path, "r", encoding="utf-8") as f:
-                    self.report_content = f.read()
-                    self.report_lines = self.report_content.splitlines()
-            except (OSError, UnicodeDecodeError):
-                pass
+        artifacts = run_analyzer(self.submission_dir, self.context)
+        if artifacts is not None:
+            self.report_content = artifacts.report_content
+            self.report_lines = artifacts.report_lines
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -104,8 +71,7 @@ class ReportValidator(BaseValidator):
         ))
 
     def teardown(self) -> None:
-        if self._tmpdir:
-            self._tmpdir.cleanup()
+        pass  # 임시 디렉토리는 채점 종료 시 GradingContext가 정리
 
     # -- 검증 함수 --
 
@@ -2,19 +2,57 @@
 커밋 이력 DB 분석기 — 스키마 검증 플러그인 (20점)
 
 DB 파일을 sqlite3로 열어 테이블 구조, FK, 인덱스, 데이터 적재를 검증.
+성능 항목: 리포트 기준 쿼리의 실행 계획(EXPLAIN QUERY PLAN)이 조인 키를 인덱스로 찾는지,
+합성 저장소(커밋 LARGE_COMMITS개)를 제한 시간 안에 정확히 처리하는지.
 
 AI 트랩: parent_hash NOT NULL 정의 → root commit INSERT 실패
 """
-import os
 import sqlite3
-import subprocess
-import sys
-import tempfile
 from typing import Dict, Any, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.db.validators._data import write_csv_files
+from core.query_plan import PlanExpectation, QueryPlanCheckItem
+from plugins.db.validators._artifacts import AnalyzerArtifacts, run_analyzer
+
+LARGE_COMMITS = 5000
+LARGE_SEED = 2026
+LARGE_TIME_LIMIT = 3.0  # 초 (모범 답안 약 0.3초, 행마다 커밋하면 디스크에 따라 수 초~수십 초)
+
+# 리포트 기준 쿼리 (모범 답안과 같은 SQL) — indexed 별칭은 인덱스 SEARCH여야 함.
+# 파일 변경 집계는 commit_files 전체를 읽는 것이 정상이므로 계획만 기록
+CANONICAL_QUERIES = [
+    PlanExpectation("author_contributions", """
+        SELECT a.name, COUNT(DISTINCT c.hash), COUNT(DISTINCT cf.file_path)
+        FROM authors a
+        LEFT JOIN commits c ON a.author_id = c.author_id
+        LEFT JOIN commit_files cf ON c.hash = cf.commit_hash
+        GROUP BY a.author_id
+    """, indexed=("c", "cf")),
+    PlanExpectation("branch_analysis", """
+        SELECT b.name, COUNT(c.hash), b.head_hash
+        FROM branches b
+        LEFT JOIN commits c ON b.name = c.branch_name
+        GROUP BY b.name
+    """, indexed=("c",)),
+    PlanExpectation("commit_history_main", """
+        WITH RECURSIVE history(hash, message, parent_hash) AS (
+            SELECT c.hash, c.message, c.parent_hash
+            FROM branches b JOIN commits c ON b.head_hash = c.hash
+            WHERE b.name = 'main'
+            UNION ALL
+            SELECT c.hash, c.message, c.parent_hash
+            FROM history h JOIN commits c ON h.parent_hash = c.hash
+        )
+        SELECT hash, message FROM history
+    """, indexed=("c",)),
+    PlanExpectation("most_changed_files", """
+        SELECT file_path, COUNT(DISTINCT commit_hash) AS change_count
+        FROM commit_files
+        GROUP BY file_path
+        HAVING change_count >= 2
+    """),
+]
 
 
 class SchemaValidator(BaseValidator):
@@ -23,51 +61,25 @@ class SchemaValidator(BaseValidator):
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
-        self.db_path: Optional[str] = None
-        self.report_path: Optional[str] = None
-        self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
-        self._exec_success = False
+        self.artifacts: Optional[AnalyzerArtifacts] = None
+        self._large_item: Optional[CheckItem] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        script_path = os.path.join(self.submission_dir, "commit_analyzer.py")
-        if not os.path.isfile(script_path):
-            return
-
-        self._tmpdir = tempfile.TemporaryDirectory()
-        tmp = self._tmpdir.name
-        data_dir = os.path.join(tmp, "data")
-        os.makedirs(data_dir)
-        write_csv_files(data_dir)
-
-        self.db_path = os.path.join(tmp, "analysis.db")
-        self.report_path = os.path.join(tmp, "report.txt")
-
-        try:
-            subprocess.run(
-                [sys.executable, script_path,
-                 "--data-dir", data_dir,
-                 "--output", self.report_path,
-                 "--db", self.db_path],
-                capture_output=True, text=True, timeout=15,
-                cwd=self.submission_dir,
-            )
-            self._exec_success = True
-        except (subprocess.TimeoutExpired, OSError):
-            pass
+        self.artifacts = run_analyzer(self.submission_dir, self.context)
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
             id="db_created",
             description="analysis.db 생성 + 4개 테이블 존재",
-            points=4,
+            points=3,
             validator=self._check_db_created,
             hint="sqlite3.connect()로 DB 파일을 생성하고 authors, commits, branches, commit_files 테이블을 만드세요",
         ))
         self.checklist.add_item(CheckItem(
             id="foreign_keys",
             description="commits 테이블에 FK 제약조건 존재",
-            points=4,
+            points=3,
             validator=self._check_foreign_keys,
             hint="commits 테이블에서 author_id → authors, parent_hash → commits FK를 정의하세요",
         ))
@@ -82,28 +94,46 @@ class SchemaValidator(BaseValidator):
         self.checklist.add_item(CheckItem(
             id="data_loaded",
             description="테이블별 행 수 정확성 (6, 12, 4, 25)",
-            points=4,
+            points=3,
             validator=self._check_data_loaded,
             hint="CSV 파일 4개를 빠짐없이 읽어 DB에 INSERT하세요",
         ))
         self.checklist.add_item(CheckItem(
             id="index_exists",
             description="최소 1개 사용자 정의 인덱스 존재",
-            points=3,
+            points=2,
             validator=self._check_index_exists,
             hint="자주 조회하는 컬럼(author_id, branch_name 등)에 인덱스를 생성하세요",
         ))
+        self.checklist.add_item(QueryPlanCheckItem(
+            id="query_plan_index",
+            description="분석 쿼리가 조인 키를 인덱스로 조회 (EXPLAIN QUERY PLAN에 전체 SCAN 없음)",
+            points=2,
+            connect=self._open_db,
+            queries=CANONICAL_QUERIES,
+            hint="commits(author_id), commits(branch_name), commit_files(commit_hash)에 인덱스를 만들고 "
+                 "commits.hash를 PRIMARY KEY로 두세요",
+            requires=["db_created"],
+        ))
+        self._large_item = CheckItem(
+            id="large_dataset",
+            description=f"커밋 {LARGE_COMMITS}개 합성 저장소를 {LARGE_TIME_LIMIT:g}초 안에 정확히 분석",
+            points=2,
+            validator=self._check_large_dataset,
+            hint="행마다 commit하지 말고 한 트랜잭션 안에서 executemany로 적재하세요",
+            requires=["data_loaded"],
+        )
+        self.checklist.add_item(self._large_item)
 
     def teardown(self) -> None:
-        if self._tmpdir:
-            self._tmpdir.cleanup()
+        pass  # 임시 디렉토리는 채점 종료 시 GradingContext가 정리
 
     # -- 검증 함수 --
 
     def _open_db(self) -> Optional[sqlite3.Connection]:
-        if self.db_path and os.path.isfile(self.db_path):
-            return sqlite3.connect(self.db_path)
-        return None
+        if self.artifacts is None:
+            return None
+        return self.artifacts.open_db()
 
     def _check_db_created(self) -> bool:
         conn = self._open_db()
@@ -171,3 +201,46 @@ class SchemaValidator(BaseValidator):
             return len(indexes) >= 1
         finally:
             conn.close()
+
+    def _check_large_dataset(self) -> bool:
+        """합성 저장소: 제한 시간 안에 종료 + 테이블별 행 수 + 리포트 합계·요약 수치 일치"""
+        large = run_analyzer(self.submission_dir, self.context, commits=LARGE_COMMITS,
+                             seed=LARGE_SEED, timeout=LARGE_TIME_LIMIT)
+        if large is None or large.expected is None:
+            return False
+        if large.timed_out:
+            self._large_item.error_message = (f"커밋 {LARGE_COMMITS}개 처리가 "
+                                              f"{LARGE_TIME_LIMIT:g}초 제한 시간 초과")
+            return False
+        if large.returncode != 0:
+            return False
+        expected = large.expected
+
+        conn = large.open_db()
+        if not conn:
+            return False
+        try:
+            for table, count in expected.table_rows.items():
+                if conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] != count:
+                    return False
+        except sqlite3.Error:
+            return False
+        finally:
+            conn.close()
+
+        lines = [line.strip() for line in large.report_lines]
+        totals = [f"Total Commits: {expected.table_rows['commits']}",
+                  f"Total Authors: {expected.table_rows['authors']}",
+                  f"Total Branches: {expected.table_rows['branches']}"]
+        if not all(total in lines for total in totals):
+            return False
+        # 동점 순서는 명세에 없으므로 요약은 이름 대신 수치만 비교
+        summary = {
+            "Most Active Author:": expected.author_contributions[0][1],
+            "Largest Branch:": expected.branch_analysis[0][1],
+            "Most Changed File:": expected.most_changed_files[0][1],
+        }
+        return all(
+            any(line.startswith(prefix) and line.endswith(f"({count} commits)") for line in lines)
+            for prefix, count in summary.items()
+        )
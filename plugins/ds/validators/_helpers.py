@@ -0,0 +1,31 @@
+"""자료구조 미션 검증 공통 유틸리티"""
+import os
+from typing import Optional
+
+# Mini Redis REPL 프롬프트
+PROMPT = "mini-redis>"
+
+
+def find_cli(submission_dir: str) -> Optional[str]:
+    """제출물의 cli.py 경로 (없으면 None)"""
+    cli_file = os.path.join(submission_dir, "cli.py")
+    return cli_file if os.path.isfile(cli_file) else None
+
+
+def extract_int_value(response: str) -> Optional[int]:
+    """'(integer) N' 또는 'N' 형식에서 정수 추출"""
+    response = response.strip()
+    if response.startswith("(integer)"):
+        try:
+            return int(response.split("(integer)")[1].strip())
+        except (ValueError, IndexError):
+            return None
+    try:
+        return int(response)
+    except ValueError:
+        return None
+
+
+def is_nil_response(response: str) -> bool:
+    """(nil) 또는 None을 nil 응답으로 인식"""
+    return response.strip().lower() in ("(nil)", "none", "nil", "null")
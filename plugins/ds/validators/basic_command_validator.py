@@ -1,18 +1,24 @@
 """
 기본 명령어 검증 플러그인 (25점)
 
-subprocess.run + stdin pipe로 학습자의 cli.py REPL을 실행하여
+core.repl_session 대화형 세션으로 학습자의 cli.py REPL에 명령을 1건씩 보내
 SET/GET/DEL/EXISTS/DBSIZE 기본 동작과 Redis 출력 형식을 검증.
+응답은 명령과 1:1로 대응하고, 응답하지 않는 명령이 있으면 그 전 응답까지만 채점.
+실행 가능 여부(cli_runnable)도 같은 세션의 프롬프트 출력으로 판단.
 
 AI 트랩: Redis 출력 형식 미준수
 """
-import os
-import subprocess
-import sys
 from typing import Dict, Any, Optional, List
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
+from core.repl_session import SessionResult, run_session
+from plugins.ds.validators._helpers import (
+    PROMPT,
+    find_cli,
+    extract_int_value,
+    is_nil_response,
+)
 
 
 class BasicCommandValidator(BaseValidator):
@@ -22,28 +28,31 @@ class BasicCommandValidator(BaseValidator):
         super().__init__(mission_config)
         self.submission_dir = ""
         self.cli_path: Optional[str] = None
+        self._session: Optional[SessionResult] = None
         self._responses: Optional[List[str]] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        cli_file = os.path.join(self.submission_dir, "cli.py")
-        if os.path.isfile(cli_file):
-            self.cli_path = cli_file
+        self.cli_path = find_cli(self.submission_dir)
 
         # 기본 테스트 시나리오 실행
-        commands = (
-            "SET name Alice\n"
-            "GET name\n"
-            "SET count 42\n"
-            "GET count\n"
-            "DEL name\n"
-            "GET name\n"
-            "EXISTS name\n"
-            "EXISTS count\n"
-            "DBSIZE\n"
-            "exit\n"
-        )
-        self._responses = self._run_repl(commands)
+        commands = [
+            "SET name Alice",
+            "GET name",
+            "SET count 42",
+            "GET count",
+            "DEL name",
+            "GET name",
+            "EXISTS name",
+            "EXISTS count",
+            "DBSIZE",
+            "exit",
+        ]
+        self._session = run_session(self.cli_path, commands, PROMPT,
+                                    cwd=self.submission_dir, context=self.context)
+        if self._session:
+            self._responses = self._session.texts
+            self.command_timings.extend(self._session.timings)
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -60,6 +69,7 @@ class BasicCommandValidator(BaseValidator):
             points=8,
             validator=self._check_set_get,
             hint="SET key value → OK, GET key → \"value\" 형식으로 구현하세요",
+            requires=["cli_runnable"],
         ))
 
         self.checklist.add_item(CheckItem(
@@ -68,6 +78,7 @@ class BasicCommandValidator(BaseValidator):
             points=4,
             validator=self._check_del,
             hint="DEL key → (integer) 1, 이후 GET key → (nil)",
+            requires=["cli_runnable"],
         ))
 
         self.checklist.add_item(CheckItem(
@@ -76,6 +87,7 @@ class BasicCommandValidator(BaseValidator):
             points=5,
             validator=self._check_exists_dbsize,
             hint="EXISTS → (integer) 0/1, DBSIZE → (integer) N 형식",
+            requires=["cli_runnable"],
         ))
 
         self.checklist.add_item(CheckItem(
@@ -85,48 +97,17 @@ class BasicCommandValidator(BaseValidator):
             validator=self._check_output_format,
             hint="GET 값은 \"value\" (쌍따옴표), 미존재는 (nil), 정수는 (integer) N 형식",
             ai_trap=True,
+            requires=["cli_runnable"],
         ))
 
     def teardown(self) -> None:
         pass
 
-    # -- REPL 실행 헬퍼 --
-
-    def _run_repl(self, commands: str, timeout: int = 10) -> Optional[List[str]]:
-        """cli.py REPL을 실행하고 응답 리스트를 반환"""
-        if not self.cli_path:
-            return None
-        try:
-            result = subprocess.run(
-                [sys.executable, self.cli_path],
-                input=commands,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.submission_dir,
-            )
-            return _parse_responses(result.stdout)
-        except (subprocess.TimeoutExpired, OSError):
-            return None
-
     # -- 검증 함수 --
 
     def _check_runnable(self) -> bool:
-        """cli.py 실행 가능 + 프롬프트 출력 확인"""
-        if not self.cli_path:
-            return False
-        try:
-            result = subprocess.run(
-                [sys.executable, self.cli_path],
-                input="exit\n",
-                capture_output=True,
-                text=True,
-                timeout=5,
-                cwd=self.submission_dir,
-            )
-            return "mini-redis>" in result.stdout
-        except (subprocess.TimeoutExpired, OSError):
-            return False
+        """cli.py 실행 가능 + 프롬프트 출력 확인 (기본 시나리오 세션 재사용)"""
+        return self._session is not None and self._session.has_prompt
 
     def _check_set_get(self) -> bool:
         """SET name Alice → OK, GET name → "Alice"
@@ -156,8 +137,8 @@ class BasicCommandValidator(BaseValidator):
         del_resp = self._responses[4].strip()
         get_resp = self._responses[5].strip()
 
-        del_ok = _extract_int_value(del_resp) == 1
-        get_nil = _is_nil_response(get_resp)
+        del_ok = extract_int_value(del_resp) == 1
+        get_nil = is_nil_response(get_resp)
 
         return del_ok and get_nil
 
@@ -169,9 +150,9 @@ class BasicCommandValidator(BaseValidator):
         # responses[6] = EXISTS name → "(integer) 0" 또는 "0"
         # responses[7] = EXISTS count → "(integer) 1" 또는 "1"
         # responses[8] = DBSIZE → "(integer) 1" 또는 "1"
-        exists_name = _extract_int_value(self._responses[6].strip())
-        exists_count = _extract_int_value(self._responses[7].strip())
-        dbsize = _extract_int_value(self._responses[8].strip())
+        exists_name = extract_int_value(self._responses[6].strip())
+        exists_count = extract_int_value(self._responses[7].strip())
+        dbsize = extract_int_value(self._responses[8].strip())
 
         return exists_name == 0 and exists_count == 1 and dbsize == 1
 
@@ -206,54 +187,3 @@ class BasicCommandValidator(BaseValidator):
 
         return True
 
-
-def _extract_int_value(response: str) -> Optional[int]:
-    """'(integer) N' 또는 'N' 형식에서 정수 추출"""
-    response = response.strip()
-    if response.startswith("(integer)"):
-        try:
-            return int(response.split("(integer)")[1].strip())
-        except (ValueError, IndexError):
-            return None
-    try:
-        return int(response)
-    except ValueError:
-        return None
-
-
-def _is_nil_response(response: str) -> bool:
-    """(nil) 또는 None을 nil 응답으로 인식"""
-    return response.strip().lower() in ("(nil)", "none", "nil", "null")
-
-
-def _parse_responses(stdout: str) -> List[str]:
-    """REPL stdout에서 프롬프트를 제거하고 응답만 추출
-
-    "mini-redis> OK" → "OK"
-    "mini-redis> \"Alice\"" → "\"Alice\""
-    여러 줄 응답(INFO memory 등)은 하나로 합침
-    """
-    responses = []
-    lines = stdout.split("\n")
-    current_response_lines = []
-
-    for line in lines:
-        if "mini-redis>" in line:
-            # 이전 멀티라인 응답이 있으면 저장
-            if current_response_lines:
-                responses.append("\n".join(current_response_lines))
-                current_response_lines = []
-
-            # 프롬프트 이후 텍스트 추출
-            after_prompt = line.split("mini-redis>", 1)[1].strip()
-            if after_prompt:
-                current_response_lines.append(after_prompt)
-        elif line.strip():
-            # 프롬프트 없는 줄 (멀티라인 응답의 일부)
-            current_response_lines.append(line.strip())
-
-    # 마지막 응답 저장
-    if current_response_lines:
-        responses.append("\n".join(current_response_lines))
-
-    return responses
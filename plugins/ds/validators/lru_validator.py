@@ -1,18 +1,51 @@
 """
 LRU 동작 검증 플러그인 (30점)
 
-subprocess.run + stdin pipe로 LRU 제거, GET 접근 시 LRU 갱신,
-INFO memory 통계를 검증.
+core.repl 하네스로 cli.py REPL을 실행하여 LRU 제거, GET 접근 시 LRU 갱신,
+INFO memory 통계를 검증. 키 수를 늘려 가며 SET/GET 연산당 비용을 측정하여
+O(1) 구현인지도 확인 (core.complexity).
 
 AI 트랩: GET 시 LRU 순서 미갱신
 """
-import os
-import subprocess
-import sys
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
+from core.complexity import ComplexityCheckItem, ScalingResult, probe_repl_scaling
+from core.repl import run_repl
+from plugins.ds.validators._helpers import (
+    PROMPT,
+    find_cli,
+    extract_int_value,
+    is_nil_response,
+)
+
+# 복잡도 측정 시 크기와 무관하게 실행하는 SET/GET 명령 수
+COMPLEXITY_OPS = 5000
+# 노드 순회 1회는 수십 ns라 n이 작으면 명령 처리 고정 비용(30µs 안팎)에 묻히므로 기본값보다 크게
+COMPLEXITY_SIZES = (2000, 8000, 32000)
+
+
+def lru_workload(size: int) -> Tuple[List[str], List[str]]:
+    """
+    maxmemory=size로 키 size개를 채운 뒤, 매번 제거가 일어나는 SET과
+    남아 있는 키 중 가장 오래 접근하지 않은 키의 GET(LRU 갱신)을 번갈아 실행
+
+    GET 대상은 최근 사용 순서의 반대쪽 끝이므로, 갱신할 노드를 최근 쪽부터
+    선형 탐색하는 구현은 GET마다 O(n)이 됨 (LRU 순서는 OrderedDict로 모사)
+    """
+    preload = [f"CONFIG SET maxmemory {size}"] + [f"SET k{i} v{i}" for i in range(size)]
+    order = OrderedDict.fromkeys(f"k{i}" for i in range(size))
+    measured = []
+    for i in range(COMPLEXITY_OPS // 2):
+        measured.append(f"SET n{i} v{i}")
+        order[f"n{i}"] = None
+        order.popitem(last=False)
+        oldest = next(iter(order))
+        order.move_to_end(oldest)
+        measured.append(f"GET {oldest}")
+    return preload, measured
 
 
 class LRUValidator(BaseValidator):
@@ -26,9 +59,7 @@ class LRUValidator(BaseValidator):
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        cli_file = os.path.join(self.submission_dir, "cli.py")
-        if os.path.isfile(cli_file):
-            self.cli_path = cli_file
+        self.cli_path = find_cli(self.submission_dir)
 
         # LRU GET 갱신 핵심 테스트 시나리오
         commands = (
@@ -45,13 +76,16 @@ class LRUValidator(BaseValidator):
             "DBSIZE\n"
             "exit\n"
         )
-        self._lru_responses = self._run_repl(commands)
+        transcript = run_repl(self.cli_path, commands, PROMPT,
+                              cwd=self.submission_dir, context=self.context)
+        if transcript:
+            self._lru_responses = transcript.responses
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
             id="config_maxmemory",
             description="CONFIG SET maxmemory 설정이 동작하는지 확인",
-            points=5,
+            points=4,
             validator=self._check_config_maxmemory,
             hint="CONFIG SET maxmemory N → OK 반환하고, 최대 N개의 키만 유지",
         ))
@@ -59,7 +93,7 @@ class LRUValidator(BaseValidator):
         self.checklist.add_item(CheckItem(
             id="lru_eviction",
             description="메모리 초과 시 LRU 키가 제거되는지 확인",
-            points=11,
+            points=9,
             validator=self._check_lru_eviction,
             hint="maxmemory 초과 시 가장 오래 접근하지 않은 키부터 제거",
         ))
@@ -76,35 +110,32 @@ class LRUValidator(BaseValidator):
         self.checklist.add_item(CheckItem(
             id="info_memory",
             description="INFO memory 통계 (used_memory/maxmemory/evicted_keys) 정확성 확인",
-            points=7,
+            points=5,
             validator=self._check_info_memory,
             hint="INFO memory 출력에 used_memory:N, maxmemory:N, evicted_keys:N 포함",
         ))
 
+        self.checklist.add_item(ComplexityCheckItem(
+            id="lru_complexity",
+            description="키 수가 늘어도 SET(제거 포함)/GET 연산당 비용이 일정한지 확인",
+            points=5,
+            probe=self._probe_lru_complexity,
+            hint="리스트 remove/pop(0)이나 min()으로 제거 대상을 찾으면 O(n)입니다 "
+                 "— dict + 이중 연결 리스트로 O(1) 구현",
+            requires=["lru_eviction"],
+        ))
+
     def teardown(self) -> None:
         pass
 
-    # -- REPL 실행 헬퍼 --
-
-    def _run_repl(self, commands: str, timeout: int = 10) -> Optional[List[str]]:
-        """cli.py REPL을 실행하고 응답 리스트를 반환"""
-        if not self.cli_path:
-            return None
-        try:
-            result = subprocess.run(
-                [sys.executable, self.cli_path],
-                input=commands,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.submission_dir,
-            )
-            return _parse_responses(result.stdout)
-        except (subprocess.TimeoutExpired, OSError):
-            return None
-
     # -- 검증 함수 --
 
+    def _probe_lru_complexity(self) -> Optional[ScalingResult]:
+        """키 2000/8000/32000개에서 SET/GET 연산당 처리 시간 증가 지수 측정"""
+        return probe_repl_scaling(self.cli_path, lru_workload, "lru",
+                                  cwd=self.submission_dir, sizes=COMPLEXITY_SIZES,
+                                  context=self.context)
+
     def _check_config_maxmemory(self) -> bool:
         """CONFIG SET maxmemory 3 → OK"""
         if not self._lru_responses or len(self._lru_responses) < 1:
@@ -123,7 +154,7 @@ class LRUValidator(BaseValidator):
 
         # responses[10] = DBSIZE → "(integer) 3" 또는 "3"
         dbsize_resp = self._lru_responses[10].strip()
-        return _extract_int_value(dbsize_resp) == 3
+        return extract_int_value(dbsize_resp) == 3
 
     def _check_lru_get_refresh(self) -> bool:
         """GET k1 후 SET k4 → k2가 제거되어야 함 (k1이 아님)
@@ -144,7 +175,7 @@ class LRUValidator(BaseValidator):
         get_k2 = self._lru_responses[6].strip()
         get_k1 = self._lru_responses[7].strip()
 
-        k2_removed = _is_nil_response(get_k2)
+        k2_removed = is_nil_response(get_k2)
         k1_alive = "v1" in get_k1
 
         return k2_removed and k1_alive
@@ -162,45 +193,3 @@ class LRUValidator(BaseValidator):
 
         return has_used and has_max and has_evicted
 
-
-def _extract_int_value(response: str) -> Optional[int]:
-    """'(integer) N' 또는 'N' 형식에서 정수 추출"""
-    response = response.strip()
-    if response.startswith("(integer)"):
-        try:
-            return int(response.split("(integer)")[1].strip())
-        except (ValueError, IndexError):
-            return None
-    try:
-        return int(response)
-    except ValueError:
-        return None
-
-
-def _is_nil_response(response: str) -> bool:
-    """(nil) 또는 None을 nil 응답으로 인식"""
-    return response.strip().lower() in ("(nil)", "none", "nil", "null")
-
-
-def _parse_responses(stdout: str) -> List[str]:
-    """REPL stdout에서 프롬프트를 제거하고 응답만 추출"""
-    responses = []
-    lines = stdout.split("\n")
-    current_response_lines = []
-
-    for line in lines:
-        if "mini-redis>" in line:
-            if current_response_lines:
-                responses.append("\n".join(current_response_lines))
-                current_response_lines = []
-
-            after_prompt = line.split("mini-redis>", 1)[1].strip()
-            if after_prompt:
-                current_response_lines.append(after_prompt)
-        elif line.strip():
-            current_response_lines.append(line.strip())
-
-    if current_response_lines:
-        responses.append("\n".join(current_response_lines))
-
-    return responses
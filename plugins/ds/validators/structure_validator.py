@@ -6,15 +6,11 @@ OrderedDict/deque/functools.lru_cache를 사용하지 않았는지 검증.
 
 AI 트랩: OrderedDict/deque 사용
 """
-import ast
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.python.validators._helpers import (
-    collect_py_files,
-    parse_all_files,
-)
+from plugins.python.validators._ast_facts import AstFacts, get_ast_facts
 
 
 class StructureValidator(BaseValidator):
@@ -23,12 +19,11 @@ class StructureValidator(BaseValidator):
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
-        self.parsed: List[Tuple[str, ast.Module]] = []
+        self.facts: Optional[AstFacts] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        py_files = collect_py_files(self.submission_dir)
-        self.parsed = parse_all_files(py_files)
+        self.facts = get_ast_facts(self.submission_dir, self.context)
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -65,59 +60,26 @@ class StructureValidator(BaseValidator):
         """AST에서 Node 클래스의 __init__에 prev/next/key/value 할당 확인"""
         required_attrs = {"prev", "next", "key", "value"}
 
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if not (isinstance(node, ast.ClassDef) and node.name == "Node"):
-                    continue
-
-                # __init__ 메서드 찾기
-                found_attrs = set()
-                for item in node.body:
-                    if isinstance(item, ast.FunctionDef) and item.name == "__init__":
-                        for stmt in ast.walk(item):
-                            # self.attr = ... 패턴 탐색
-                            if isinstance(stmt, ast.Assign):
-                                for target in stmt.targets:
-                                    if (isinstance(target, ast.Attribute)
-                                            and isinstance(target.value, ast.Name)
-                                            and target.value.id == "self"):
-                                        found_attrs.add(target.attr)
-                            # self.attr: type = ... (AnnAssign)
-                            if isinstance(stmt, ast.AnnAssign):
-                                if (isinstance(stmt.target, ast.Attribute)
-                                        and isinstance(stmt.target.value, ast.Name)
-                                        and stmt.target.value.id == "self"):
-                                    found_attrs.add(stmt.target.attr)
-
-                if required_attrs.issubset(found_attrs):
-                    return True
-
-        return False
+        # __init__ 안의 self.attr = ... / self.attr: type = ... 할당
+        return any(
+            required_attrs.issubset(node_cls.init_attrs)
+            for node_cls in self.facts.classes_named("Node")
+        )
 
     def _check_no_builtin_cache(self) -> bool:
         """AST에서 OrderedDict/deque/functools.lru_cache import 탐지"""
         forbidden_names = {"OrderedDict", "deque", "lru_cache"}
         forbidden_modules = {"collections", "functools"}
 
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                # import collections / import functools
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name in forbidden_modules:
-                            return False
-
-                # from collections import OrderedDict / from collections import deque
-                if isinstance(node, ast.ImportFrom):
-                    if node.module in forbidden_modules:
-                        for alias in node.names:
-                            if alias.name in forbidden_names:
-                                return False
-                    # from functools import lru_cache
-                    if node.module == "functools":
-                        for alias in node.names:
-                            if alias.name == "lru_cache":
-                                return False
+        for imp in self.facts.imports:
+            # import collections / import functools
+            if not imp.is_from and imp.module in forbidden_modules:
+                return False
+
+            # from collections import OrderedDict / from functools import lru_cache
+            if imp.is_from and imp.module in forbidden_modules:
+                if forbidden_names.intersection(imp.names):
+                    return False
 
         return True
 
@@ -134,13 +96,7 @@ class StructureValidator(BaseValidator):
             "remove_tail", "remove_last", "push_front", "pop_back",
         }
 
-        found_methods = set()
-
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    if node.name in linked_list_methods:
-                        found_methods.add(node.name)
+        found_methods = linked_list_methods & self.facts.function_names(include_async=False)
 
         # 최소 2개 이상의 연결 리스트 메서드가 있어야 함
         return len(found_methods) >= 2
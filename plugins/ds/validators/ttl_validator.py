@@ -1,19 +1,23 @@
 """
 TTL 검증 플러그인 (20점)
 
-subprocess.Popen + time.sleep로 TTL 만료, lazy deletion,
-미존재/미설정 키의 TTL 반환값을 검증.
+core.repl 하네스로 TTL 동작을 검증.
+EXPIRE/TTL 기본 + 미존재/미설정 키는 한 세션으로, lazy deletion은 가상 시계
+(virtual_clock)를 2초 앞당기는 별도 세션으로 실행 (실제 sleep 없음).
 
 AI 트랩: 만료 키 lazy deletion 미구현
 """
-import os
-import subprocess
-import sys
-import time
 from typing import Dict, Any, Optional, List
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
+from core.repl import clock_advance, run_repl
+from plugins.ds.validators._helpers import (
+    PROMPT,
+    find_cli,
+    extract_int_value,
+    is_nil_response,
+)
 
 
 class TTLValidator(BaseValidator):
@@ -32,30 +36,26 @@ class TTLValidator(BaseValidator):
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        cli_file = os.path.join(self.submission_dir, "cli.py")
-        if os.path.isfile(cli_file):
-            self.cli_path = cli_file
+        self.cli_path = find_cli(self.submission_dir)
 
-        # Phase 1: EXPIRE/TTL 기본
-        basic_commands = (
+        # Phase 1 + 3: EXPIRE/TTL 기본 + 미존재/미설정 키 (키가 겹치지 않으므로 한 세션)
+        commands = (
             "SET session abc\n"
             "EXPIRE session 100\n"
             "TTL session\n"
-            "exit\n"
-        )
-        self._basic_responses = self._run_repl(basic_commands)
-
-        # Phase 2: Lazy deletion (Popen + sleep)
-        self._lazy_responses = self._run_lazy_deletion_test()
-
-        # Phase 3: 미존재/미설정 키
-        edge_commands = (
             "TTL nonexist\n"
             "SET noexpire val\n"
             "TTL noexpire\n"
             "exit\n"
         )
-        self._edge_responses = self._run_repl(edge_commands)
+        transcript = run_repl(self.cli_path, commands, PROMPT,
+                              cwd=self.submission_dir, context=self.context)
+        if transcript:
+            self._basic_responses = transcript.responses[:3]
+            self._edge_responses = transcript.responses[3:6]
+
+        # Phase 2: Lazy deletion (가상 시계)
+        self._lazy_responses = self._run_lazy_deletion_test()
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -88,63 +88,21 @@ class TTLValidator(BaseValidator):
 
     # -- REPL 실행 헬퍼 --
 
-    def _run_repl(self, commands: str, timeout: int = 10) -> Optional[List[str]]:
-        """cli.py REPL을 subprocess.run으로 실행"""
-        if not self.cli_path:
-            return None
-        try:
-            result = subprocess.run(
-                [sys.executable, self.cli_path],
-                input=commands,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.submission_dir,
-            )
-            return _parse_responses(result.stdout)
-        except (subprocess.TimeoutExpired, OSError):
-            return None
-
     def _run_lazy_deletion_test(self) -> Optional[List[str]]:
-        """Popen으로 REPL 실행 → EXPIRE 1초 설정 → sleep(2) → GET 확인"""
-        if not self.cli_path:
-            return None
-
-        try:
-            proc = subprocess.Popen(
-                [sys.executable, "-u", self.cli_path],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=self.submission_dir,
-            )
-
-            # Phase 1: SET + EXPIRE 1초
-            proc.stdin.write("SET temp val\n")
-            proc.stdin.write("EXPIRE temp 1\n")
-            proc.stdin.write("DBSIZE\n")
-            proc.stdin.flush()
-
-            # 2초 대기 (TTL 만료)
-            time.sleep(2)
-
-            # Phase 2: 만료 확인
-            proc.stdin.write("GET temp\n")
-            proc.stdin.write("DBSIZE\n")
-            proc.stdin.write("exit\n")
-            proc.stdin.flush()
-
-            stdout, _ = proc.communicate(timeout=5)
-            return _parse_responses(stdout)
-
-        except (subprocess.TimeoutExpired, OSError, BrokenPipeError):
-            try:
-                proc.kill()
-                proc.wait(timeout=2)
-            except Exception:
-                pass
-            return None
+        """EXPIRE 1초 설정 → 가상 시계 2초 경과 → GET 확인"""
+        commands = (
+            "SET temp val\n"
+            "EXPIRE temp 1\n"
+            "DBSIZE\n"
+            # 2초 경과 (TTL 만료, 제어 줄은 학습자 코드에 전달되지 않음)
+            + clock_advance(2)
+            + "GET temp\n"
+            "DBSIZE\n"
+            "exit\n"
+        )
+        transcript = run_repl(self.cli_path, commands, PROMPT, cwd=self.submission_dir,
+                              context=self.context, virtual_clock=True)
+        return transcript.responses if transcript else None
 
     # -- 검증 함수 --
 
@@ -158,12 +116,12 @@ class TTLValidator(BaseValidator):
         # responses[2] = TTL session → "(integer) 98~100"
 
         expire_resp = self._basic_responses[1].strip()
-        expire_val = _extract_integer(expire_resp)
+        expire_val = extract_int_value(expire_resp)
         if expire_val != 1:
             return False
 
         ttl_resp = self._basic_responses[2].strip()
-        ttl_val = _extract_integer(ttl_resp)
+        ttl_val = extract_int_value(ttl_resp)
         if ttl_val is None:
             return False
 
@@ -178,15 +136,15 @@ class TTLValidator(BaseValidator):
         # responses[0] = SET temp val → "OK"
         # responses[1] = EXPIRE temp 1 → "(integer) 1"
         # responses[2] = DBSIZE → "(integer) 1" (만료 전)
-        # --- sleep(2) ---
+        # --- 가상 시계 +2초 ---
         # responses[3] = GET temp → "(nil)" (만료!)
         # responses[4] = DBSIZE → "(integer) 0" (lazy deletion)
 
         get_resp = self._lazy_responses[3].strip()
         dbsize_resp = self._lazy_responses[4].strip()
 
-        get_nil = _is_nil_response(get_resp)
-        dbsize_zero = _extract_integer(dbsize_resp) == 0
+        get_nil = is_nil_response(get_resp)
+        dbsize_zero = extract_int_value(dbsize_resp) == 0
 
         return get_nil and dbsize_zero
 
@@ -202,47 +160,5 @@ class TTLValidator(BaseValidator):
         ttl_nonexist = self._edge_responses[0].strip()
         ttl_noexpire = self._edge_responses[2].strip()
 
-        return _extract_integer(ttl_nonexist) == -2 and _extract_integer(ttl_noexpire) == -1
-
-
-def _parse_responses(stdout: str) -> List[str]:
-    """REPL stdout에서 프롬프트를 제거하고 응답만 추출"""
-    responses = []
-    lines = stdout.split("\n")
-    current_response_lines = []
-
-    for line in lines:
-        if "mini-redis>" in line:
-            if current_response_lines:
-                responses.append("\n".join(current_response_lines))
-                current_response_lines = []
-
-            after_prompt = line.split("mini-redis>", 1)[1].strip()
-            if after_prompt:
-                current_response_lines.append(after_prompt)
-        elif line.strip():
-            current_response_lines.append(line.strip())
-
-    if current_response_lines:
-        responses.append("\n".join(current_response_lines))
-
-    return responses
-
-
-def _is_nil_response(response: str) -> bool:
-    """(nil) 또는 None을 nil 응답으로 인식"""
-    return response.strip().lower() in ("(nil)", "none", "nil", "null")
-
+        return extract_int_value(ttl_nonexist) == -2 and extract_int_value(ttl_noexpire) == -1
 
-def _extract_integer(response: str) -> Optional[int]:
-    """'(integer) N' 또는 'N' 형식에서 정수 추출"""
-    response = response.strip()
-    if response.startswith("(integer)"):
-        try:
-            return int(response.split("(integer)")[1].strip())
-        except (ValueError, IndexError):
-            return None
-    try:
-        return int(response)
-    except ValueError:
-        return None
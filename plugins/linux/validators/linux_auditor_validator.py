@@ -14,6 +14,7 @@ import sys
 import tempfile
 from typing import Dict, Any, Optional
 
+from core import sandbox
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
 
@@ -108,14 +109,13 @@ class LinuxAuditorValidator(BaseValidator):
 
         # subprocess로 학생 코드 실행
         try:
-            subprocess.run(
+            sandbox.run(
                 [sys.executable, script_path,
                  "--config-dir", tmp_path,
                  "--output", report_path],
-                capture_output=True,
-                text=True,
                 timeout=10,
                 cwd=self.submission_dir,
+                limits=self.context.sandbox,
             )
         except (subprocess.TimeoutExpired, OSError):
             pass
@@ -0,0 +1,389 @@
+"""
+단일 순회 AST 분석 엔진
+
+검증 함수마다 ast.walk()로 전체 트리를 다시 순회하던 방식 대신,
+파일당 1번만 순회하면서 노드 타입별로 등록된 방문자(handler)에 노드를 전달하고
+구조 검증에 필요한 사실(fact)을 미리 모아 둔 표(AstFacts)를 만든다.
+
+- AstVisitorEngine: 노드 타입 → 방문자 디스패치, 현재 클래스/함수 스코프 추적
+- AstFacts: 클래스, 함수/메서드, import, __init__의 self 속성 할당, yield, 데코레이터,
+  annotation, 호출 이름, list/dict 리터럴
+- get_ast_facts(): 채점 1회 동안 제출물당 1번만 계산하여 검증기 간 공유 (읽기 전용)
+
+ast.walk() 기반 기존 판정과 같은 결과가 나오도록, 중첩 정의에 포함된 노드도
+바깥 스코프의 사실로 함께 집계한다 (예: __init__ 안의 중첩 함수에서 한 self 할당)
+"""
+import ast
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
+
+from core.grading_context import GradingContext
+from plugins.python.validators._helpers import parse_submission
+
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+
+def decorator_name(deco: ast.expr) -> str:
+    """데코레이터 노드에서 이름 추출 (@name, @name(...), @module.name)"""
+    if isinstance(deco, ast.Name):
+        return deco.id
+    if isinstance(deco, ast.Call):
+        return decorator_name(deco.func)
+    if isinstance(deco, ast.Attribute):
+        return deco.attr
+    return ""
+
+
+@dataclass
+class FunctionFact:
+    """
+    함수/메서드 1개
+
+    Attributes:
+        name: 함수 이름
+        filepath: 정의된 파일 경로
+        is_async: async def 여부
+        class_name: 클래스 본문에 직접 정의된 메서드면 클래스 이름
+        decorators: 데코레이터 이름 목록
+        returns: 반환 annotation (없으면 None)
+        arg_annotations: 위치/키워드 전용 매개변수 annotation 목록 (annotation 있는 것만)
+        has_yield: 함수 본문(중첩 정의 포함)에 yield/yield from이 있는지
+        node: 원본 AST 노드 (읽기 전용)
+    """
+    name: str
+    filepath: str
+    is_async: bool
+    class_name: Optional[str]
+    decorators: List[str]
+    returns: Optional[ast.expr]
+    arg_annotations: List[ast.expr]
+    has_yield: bool = False
+    node: Optional[FunctionNode] = None
+
+    @property
+    def has_type_hints(self) -> bool:
+        """반환 또는 매개변수 annotation이 하나라도 있는지"""
+        return self.returns is not None or bool(self.arg_annotations)
+
+
+@dataclass
+class ClassFact:
+    """
+    클래스 1개
+
+    Attributes:
+        name: 클래스 이름
+        filepath: 정의된 파일 경로
+        decorators: 데코레이터 이름 목록
+        methods: 본문에 직접 정의된 메서드 이름 목록 (async 포함)
+        field_annotations: 본문의 `name: type [= value]` 필드 이름 목록
+        init_assignments: __init__(본문 직속 def) 안의 self 속성 할당 (속성명, 값 노드)
+            AnnAssign에서 값이 없으면 값 노드는 None
+        node: 원본 AST 노드 (읽기 전용)
+    """
+    name: str
+    filepath: str
+    decorators: List[str]
+    methods: List[str] = field(default_factory=list)
+    field_annotations: List[str] = field(default_factory=list)
+    init_assignments: List[Tuple[str, Optional[ast.expr]]] = field(default_factory=list)
+    node: Optional[ast.ClassDef] = None
+
+    @property
+    def init_attrs(self) -> Set[str]:
+        """__init__에서 할당한 self 속성 이름 집합"""
+        return {attr for attr, _ in self.init_assignments}
+
+
+@dataclass
+class ImportFact:
+    """
+    import 문 1개
+
+    Attributes:
+        module: `import a.b`면 "a.b", `from a import b`면 "a" (상대 import는 None일 수 있음)
+        names: `from` import의 가져온 이름 목록 (`import` 문은 빈 리스트)
+        is_from: from ... import 여부
+        filepath: 파일 경로
+    """
+    module: Optional[str]
+    names: List[str]
+    is_from: bool
+    filepath: str
+
+    @property
+    def top_module(self) -> Optional[str]:
+        """최상위 패키지 이름 (예: "os.path" → "os")"""
+        return self.module.split(".")[0] if self.module else None
+
+
+@dataclass
+class AstFacts:
+    """제출물 전체의 AST 사실 표"""
+    classes: List[ClassFact] = field(default_factory=list)
+    functions: List[FunctionFact] = field(default_factory=list)
+    imports: List[ImportFact] = field(default_factory=list)
+    called_names: Set[str] = field(default_factory=set)       # sorted(...) 등 이름 호출
+    called_attributes: Set[str] = field(default_factory=set)  # obj.sort(...) 등 속성 호출
+    names: Set[str] = field(default_factory=set)              # 참조된 모든 이름 (ast.Name)
+    attributes: Set[str] = field(default_factory=set)         # 참조된 모든 속성 (ast.Attribute)
+    list_literals: List[ast.List] = field(default_factory=list)
+    dict_literal_count: int = 0
+
+    def classes_named(self, name: str) -> List[ClassFact]:
+        return [c for c in self.classes if c.name == name]
+
+    def functions_named(self, name: str, include_async: bool = True) -> List[FunctionFact]:
+        return [f for f in self.functions
+                if f.name == name and (include_async or not f.is_async)]
+
+    def function_names(self, include_async: bool = True) -> Set[str]:
+        return {f.name for f in self.functions if include_async or not f.is_async}
+
+    def imports_module(self, module: str) -> bool:
+        """module 또는 그 하위 모듈을 import하는지 (import/from 모두)"""
+        return any(
+            imp.module and (imp.module == module or imp.module.startswith(module + "."))
+            for imp in self.imports
+        )
+
+
+# ============================================================
+# 방문자 디스패치 엔진
+# ============================================================
+
+@dataclass
+class Scope:
+    """
+    순회 중인 위치의 스코프 정보
+
+    Attributes:
+        filepath: 현재 파일 경로
+        stack: 바깥 → 안쪽 순서의 (정의 노드, 사실 객체, 클래스 본문 직속 여부)
+    """
+    filepath: str
+    stack: List[Tuple[ast.AST, Any, bool]] = field(default_factory=list)
+
+    def functions(self) -> List[FunctionFact]:
+        """현재 위치를 감싸는 모든 함수 (바깥 → 안쪽)"""
+        return [fact for node, fact, _ in self.stack
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+
+    def init_owners(self) -> List[ClassFact]:
+        """현재 위치를 감싸는 `__init__`(클래스 본문 직속 def)의 소유 클래스 목록"""
+        owners = []
+        for idx, (node, _, direct) in enumerate(self.stack):
+            if (isinstance(node, ast.FunctionDef) and node.name == "__init__"
+                    and direct and idx > 0):
+                owners.append(self.stack[idx - 1][1])
+        return owners
+
+
+Handler = Callable[[ast.AST, Scope], None]
+
+
+class AstVisitorEngine:
+    """
+    노드 타입별 방문자를 등록받아 파일당 1번의 순회로 모두 실행
+
+    방문자는 노드를 만났을 때 handler(node, scope)로 호출되며,
+    정의 노드(ClassDef/FunctionDef)는 스코프에 들어가기 전에 전달됨
+    """
+
+    def __init__(self):
+        self._handlers: Dict[Type[ast.AST], List[Handler]] = {}
+        self._scope_factories: Dict[Type[ast.AST], Callable[[ast.AST, Scope, bool], Any]] = {}
+
+    def register(self, node_types: Union[Type[ast.AST], Tuple[Type[ast.AST], ...]],
+                 handler: Handler) -> None:
+        """node_types 노드를 만날 때마다 handler(node, scope) 호출"""
+        if not isinstance(node_types, tuple):
+            node_types = (node_types,)
+        for node_type in node_types:
+            self._handlers.setdefault(node_type, []).append(handler)
+
+    def register_scope(self, node_type: Type[ast.AST],
+                       factory: Callable[[ast.AST, Scope, bool], Any]) -> None:
+        """
+        정의 노드(ClassDef/FunctionDef 등)를 스코프로 등록
+
+        factory(node, scope, direct_in_class)가 반환한 객체가 하위 노드 순회 동안
+        scope.stack에 쌓임
+        """
+        self._scope_factories[node_type] = factory
+
+    def run(self, parsed: List[Tuple[str, ast.Module]]) -> None:
+        """모든 파일을 1번씩 순회"""
+        for filepath, tree in parsed:
+            self._visit(tree, Scope(filepath))
+
+    def _visit(self, root: ast.AST, scope: Scope) -> None:
+        """
+        명시적 스택으로 전위 순회 (재귀 호출 순서와 같음)
+
+        깊게 중첩된 식(예: 1+1+…+1)도 RecursionError 없이 순회하도록 재귀를 쓰지 않음.
+        스택 항목 (node, direct) 중 node가 None이면 정의 노드의 스코프 종료 표시
+        """
+        pending: List[Tuple[Optional[ast.AST], bool]] = [(root, False)]
+        while pending:
+            node, direct = pending.pop()
+            if node is None:
+                scope.stack.pop()
+                continue
+
+            for handler in self._handlers.get(type(node), ()):
+                handler(node, scope)
+
+            factory = self._scope_factories.get(type(node))
+            if factory is not None:
+                scope.stack.append((node, factory(node, scope, direct), direct))
+                pending.append((None, False))
+
+            # 클래스 본문 직속 정의 여부 (메서드/ __init__ 판정용)
+            body_ids = {id(stmt) for stmt in node.body} if isinstance(node, ast.ClassDef) else ()
+            children = list(ast.iter_child_nodes(node))
+            pending.extend((child, id(child) in body_ids) for child in reversed(children))
+
+
+# ============================================================
+# 사실 표 구성
+# ============================================================
+
+def _self_attr(target: ast.expr) -> Optional[str]:
+    """`self.attr` 대상이면 attr 이름"""
+    if (isinstance(target, ast.Attribute)
+            and isinstance(target.value, ast.Name)
+            and target.value.id == "self"):
+        return target.attr
+    return None
+
+
+def build_ast_facts(parsed: List[Tuple[str, ast.Module]],
+                    engine: Optional[AstVisitorEngine] = None) -> AstFacts:
+    """
+    파싱된 파일들을 1번씩 순회하여 AstFacts 구성
+
+    Args:
+        parsed: (파일 경로, AST 모듈) 리스트
+        engine: 추가 방문자를 등록해 둔 엔진 (같은 순회에서 함께 실행)
+
+    Returns:
+        AstFacts
+    """
+    facts = AstFacts()
+    engine = engine or AstVisitorEngine()
+
+    def on_class(node: ast.ClassDef, scope: Scope, direct: bool) -> ClassFact:
+        fact = ClassFact(
+            name=node.name,
+            filepath=scope.filepath,
+            decorators=[decorator_name(d) for d in node.decorator_list],
+            field_annotations=[item.target.id for item in node.body
+                               if isinstance(item, ast.AnnAssign)
+                               and isinstance(item.target, ast.Name)],
+            node=node,
+        )
+        facts.classes.append(fact)
+        return fact
+
+    def on_function(node: FunctionNode, scope: Scope, direct: bool) -> FunctionFact:
+        owner = scope.stack[-1][1] if direct and scope.stack else None
+        fact = FunctionFact(
+            name=node.name,
+            filepath=scope.filepath,
+            is_async=isinstance(node, ast.AsyncFunctionDef),
+            class_name=owner.name if owner is not None else None,
+            decorators=[decorator_name(d) for d in node.decorator_list],
+            returns=node.returns,
+            arg_annotations=[a.annotation for a in node.args.args + node.args.kwonlyargs
+                             if a.annotation is not None],
+            node=node,
+        )
+        if owner is not None:
+            owner.methods.append(node.name)
+        facts.functions.append(fact)
+        return fact
+
+    def on_yield(node: ast.AST, scope: Scope) -> None:
+        for fn in scope.functions():
+            fn.has_yield = True
+
+    def on_assign(node: ast.Assign, scope: Scope) -> None:
+        owners = scope.init_owners()
+        if not owners:
+            return
+        for target in node.targets:
+            attr = _self_attr(target)
+            if attr:
+                for owner in owners:
+                    owner.init_assignments.append((attr, node.value))
+
+    def on_ann_assign(node: ast.AnnAssign, scope: Scope) -> None:
+        attr = _self_attr(node.target)
+        if attr:
+            for owner in scope.init_owners():
+                owner.init_assignments.append((attr, node.value))
+
+    def on_import(node: ast.Import, scope: Scope) -> None:
+        for alias in node.names:
+            facts.imports.append(ImportFact(alias.name, [], False, scope.filepath))
+
+    def on_import_from(node: ast.ImportFrom, scope: Scope) -> None:
+        facts.imports.append(ImportFact(
+            node.module, [alias.name for alias in node.names], True, scope.filepath,
+        ))
+
+    def on_call(node: ast.Call, scope: Scope) -> None:
+        if isinstance(node.func, ast.Name):
+            facts.called_names.add(node.func.id)
+        elif isinstance(node.func, ast.Attribute):
+            facts.called_attributes.add(node.func.attr)
+
+    def on_name(node: ast.Name, scope: Scope) -> None:
+        facts.names.add(node.id)
+
+    def on_attribute(node: ast.Attribute, scope: Scope) -> None:
+        facts.attributes.add(node.attr)
+
+    def on_list(node: ast.List, scope: Scope) -> None:
+        facts.list_literals.append(node)
+
+    def on_dict(node: ast.Dict, scope: Scope) -> None:
+        facts.dict_literal_count += 1
+
+    engine.register_scope(ast.ClassDef, on_class)
+    engine.register_scope(ast.FunctionDef, on_function)
+    engine.register_scope(ast.AsyncFunctionDef, on_function)
+    engine.register((ast.Yield, ast.YieldFrom), on_yield)
+    engine.register(ast.Assign, on_assign)
+    engine.register(ast.AnnAssign, on_ann_assign)
+    engine.register(ast.Import, on_import)
+    engine.register(ast.ImportFrom, on_import_from)
+    engine.register(ast.Call, on_call)
+    engine.register(ast.Name, on_name)
+    engine.register(ast.Attribute, on_attribute)
+    engine.register(ast.List, on_list)
+    engine.register(ast.Dict, on_dict)
+
+    engine.run(parsed)
+    return facts
+
+
+def get_ast_facts(submission_dir: str,
+                  context: Optional[GradingContext] = None) -> AstFacts:
+    """
+    제출물의 AstFacts (context가 있으면 채점 1회 동안 1번만 계산하여 공유)
+
+    Args:
+        submission_dir: 제출물 루트 디렉토리 경로
+        context: 채점 컨텍스트
+
+    Returns:
+        AstFacts (공유 객체이므로 읽기 전용으로 사용)
+    """
+    if context is None:
+        return build_ast_facts(parse_submission(submission_dir))
+    return context.get_or_create(
+        ("ast_facts", submission_dir),
+        lambda: build_ast_facts(parse_submission(submission_dir, context)),
+    )
@@ -14,6 +14,8 @@ from typing import List, Optional, Tuple
 # 모듈 타입 힌트 (importlib에서 반환)
 from types import ModuleType
 
+from core.grading_context import GradingContext
+
 
 def import_student_module(submission_dir: str, module_name: str) -> Optional[ModuleType]:
     """
@@ -79,6 +81,32 @@ def parse_all_files(py_files: List[str]) -> List[Tuple[str, ast.Module]]:
                 source = f.read()
             tree = ast.parse(source, filename=filepath)
             results.append((filepath, tree))
-        except (SyntaxError, UnicodeDecodeError):
+        except (SyntaxError, UnicodeDecodeError, ValueError, OSError):
             continue
     return results
+
+
+def parse_submission(submission_dir: str,
+                     context: Optional[GradingContext] = None) -> List[Tuple[str, ast.Module]]:
+    """
+    제출물의 모든 .py 파일을 수집·파싱 (collect_py_files + parse_all_files)
+
+    context를 넘기면 채점 1회 동안 디렉토리당 1번만 읽고 파싱하여 여러 검증기가 공유.
+    반환된 리스트와 AST는 공유 객체이므로 읽기 전용으로 사용해야 함
+
+    Args:
+        submission_dir: 제출물 루트 디렉토리 경로
+        context: 채점 컨텍스트 (None이면 매번 파싱)
+
+    Returns:
+        (파일 경로, AST 모듈) 튜플 리스트 (submission_dir이 비어 있으면 빈 리스트)
+    """
+    if not submission_dir:
+        return []
+    if context is None:
+        return parse_all_files(collect_py_files(submission_dir))
+
+    return context.get_or_create(
+        ("ast", submission_dir),
+        lambda: parse_all_files(collect_py_files(submission_dir)),
+    )
@@ -13,6 +13,7 @@ import sys
 import tempfile
 from typing import Dict, Any, Optional
 
+from core import sandbox
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
 
@@ -47,6 +48,7 @@ class CLIValidator(BaseValidator):
             points=5,
             validator=self._check_runnable,
             hint="cli.py 파일을 제출 디렉토리에 포함하세요",
+            independent=True,
         ))
 
         self.checklist.add_item(CheckItem(
@@ -56,6 +58,8 @@ class CLIValidator(BaseValidator):
             validator=self._check_help,
             hint="argparse를 사용하여 --help 옵션을 지원하세요",
             ai_trap=True,
+            independent=True,
+            requires=["cli_runnable"],
         ))
 
         self.checklist.add_item(CheckItem(
@@ -64,6 +68,8 @@ class CLIValidator(BaseValidator):
             points=8,
             validator=self._check_add,
             hint="add 서브커맨드에 --isbn, --title, --author, --price 옵션을 구현하세요",
+            independent=True,
+            requires=["cli_runnable"],
         ))
 
         self.checklist.add_item(CheckItem(
@@ -72,6 +78,9 @@ class CLIValidator(BaseValidator):
             points=7,
             validator=self._check_list,
             hint="list 서브커맨드를 구현하세요",
+            independent=True,
+            depends_on=["cli_add"],  # 같은 데이터 파일을 쓰므로 add 검증 이후 실행
+            requires=["cli_runnable"],
         ))
 
         self.checklist.add_item(CheckItem(
@@ -80,6 +89,8 @@ class CLIValidator(BaseValidator):
             points=5,
             validator=self._check_no_crash,
             hint="예외 처리로 잘못된 입력에도 Traceback 없이 안내 메시지를 출력하세요",
+            independent=True,
+            requires=["cli_runnable"],
         ))
 
     def teardown(self) -> None:
@@ -90,16 +101,15 @@ class CLIValidator(BaseValidator):
     # -- subprocess 실행 헬퍼 --
 
     def _run(self, args: list, timeout: int = 10) -> Optional[subprocess.CompletedProcess]:
-        """학생 cli.py를 subprocess로 실행"""
+        """학생 cli.py를 core.sandbox로 실행 (자원 제한 + 사용량 기록)"""
         if not self.cli_path:
             return None
         try:
-            return subprocess.run(
+            return sandbox.run(
                 [sys.executable, self.cli_path] + args,
-                capture_output=True,
-                text=True,
                 timeout=timeout,
                 cwd=self._work_dir or self.submission_dir,
+                limits=self.context.sandbox,
             )
         except (subprocess.TimeoutExpired, OSError):
             return None
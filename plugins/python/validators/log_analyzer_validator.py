@@ -13,6 +13,7 @@ import sys
 import tempfile
 from typing import Dict, Any, Optional, List, Tuple
 
+from core import sandbox
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
 
@@ -105,14 +106,13 @@ class LogAnalyzerValidator(BaseValidator):
 
         # subprocess로 학생 코드 실행
         try:
-            subprocess.run(
+            sandbox.run(
                 [sys.executable, script_path,
                  "--log", csv_path,
                  "--output", report_path],
-                capture_output=True,
-                text=True,
                 timeout=10,
                 cwd=self.submission_dir,
+                limits=self.context.sandbox,
             )
         except (subprocess.TimeoutExpired, OSError):
             pass
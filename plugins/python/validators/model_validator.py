@@ -4,16 +4,12 @@
 학습자가 Book 데이터 모델을 @dataclass로 올바르게 정의했는지,
 필수 필드·타입 힌트·유효성 검증(__post_init__)이 구현되어 있는지 확인.
 """
-import ast
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.python.validators._helpers import (
-    import_student_module,
-    collect_py_files,
-    parse_all_files,
-)
+from plugins.python.validators._ast_facts import AstFacts, get_ast_facts
+from plugins.python.validators._helpers import import_student_module
 
 
 class ModelValidator(BaseValidator):
@@ -23,13 +19,12 @@ class ModelValidator(BaseValidator):
         super().__init__(mission_config)
         self.submission_dir = ""
         self.models_module = None
-        self.parsed: List[Tuple[str, ast.Module]] = []
+        self.facts: Optional[AstFacts] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
         self.models_module = import_student_module(self.submission_dir, "models")
-        py_files = collect_py_files(self.submission_dir)
-        self.parsed = parse_all_files(py_files)
+        self.facts = get_ast_facts(self.submission_dir, self.context)
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -72,15 +67,9 @@ class ModelValidator(BaseValidator):
     def _check_dataclass(self) -> bool:
         """AST에서 @dataclass 데코레이터 확인 + 런타임 __dataclass_fields__ 확인"""
         # AST 확인: Book 클래스에 @dataclass 데코레이터가 있는지
-        has_decorator = False
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef) and node.name == "Book":
-                    for deco in node.decorator_list:
-                        name = _extract_decorator_name(deco)
-                        if name == "dataclass":
-                            has_decorator = True
-                            break
+        has_decorator = any(
+            "dataclass" in cls.decorators for cls in self.facts.classes_named("Book")
+        )
         if not has_decorator:
             return False
 
@@ -132,18 +121,11 @@ class ModelValidator(BaseValidator):
         """AST에서 Book 클래스 필드의 annotation 존재 확인"""
         required_fields = {"isbn", "title", "author", "price", "is_available"}
 
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if not (isinstance(node, ast.ClassDef) and node.name == "Book"):
-                    continue
-                annotated_fields = set()
-                for item in node.body:
-                    if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
-                        annotated_fields.add(item.target.id)
-                # 필수 필드가 모두 annotation을 가지고 있는지
-                if required_fields.issubset(annotated_fields):
-                    return True
-        return False
+        # 필수 필드가 모두 annotation을 가지고 있는지
+        return any(
+            required_fields.issubset(cls.field_annotations)
+            for cls in self.facts.classes_named("Book")
+        )
 
     def _check_post_init(self) -> bool:
         """price < 0으로 Book 생성 시 ValueError 발생 확인"""
@@ -167,13 +149,3 @@ class ModelValidator(BaseValidator):
         except Exception:
             return False
 
-
-def _extract_decorator_name(deco: ast.expr) -> str:
-    """데코레이터 노드에서 이름 추출"""
-    if isinstance(deco, ast.Name):
-        return deco.id
-    if isinstance(deco, ast.Call):
-        return _extract_decorator_name(deco.func)
-    if isinstance(deco, ast.Attribute):
-        return deco.attr
-    return ""
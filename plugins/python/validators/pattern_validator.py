@@ -8,15 +8,12 @@ AI 트랩: yield 미사용(리스트 반환), Any 타입 남용
 """
 import ast
 import inspect
-from typing import Dict, Any, List, Set, Tuple
+from typing import Dict, Any, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.python.validators._helpers import (
-    import_student_module,
-    collect_py_files,
-    parse_all_files,
-)
+from plugins.python.validators._ast_facts import AstFacts, get_ast_facts
+from plugins.python.validators._helpers import import_student_module
 
 
 class PatternValidator(BaseValidator):
@@ -25,13 +22,12 @@ class PatternValidator(BaseValidator):
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
-        self.parsed: List[Tuple[str, ast.Module]] = []
+        self.facts: Optional[AstFacts] = None
         self.filters_module = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        py_files = collect_py_files(self.submission_dir)
-        self.parsed = parse_all_files(py_files)
+        self.facts = get_ast_facts(self.submission_dir, self.context)
         self.filters_module = import_student_module(self.submission_dir, "filters")
 
     def build_checklist(self) -> None:
@@ -80,14 +76,10 @@ class PatternValidator(BaseValidator):
         AST에서 search_books 함수 내 Yield 확인 + isgeneratorfunction + 호출 테스트
         """
         # 1. AST에서 search_books 함수 내 yield 확인
-        has_yield_in_search = False
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) and node.name == "search_books":
-                    for child in ast.walk(node):
-                        if isinstance(child, (ast.Yield, ast.YieldFrom)):
-                            has_yield_in_search = True
-                            break
+        has_yield_in_search = any(
+            fn.has_yield
+            for fn in self.facts.functions_named("search_books", include_async=False)
+        )
         if not has_yield_in_search:
             return False
 
@@ -141,46 +133,27 @@ class PatternValidator(BaseValidator):
         }
 
         # 1. AST: 정의된 함수 중 데코레이터로 사용된 것 확인
-        defined_funcs: Set[str] = set()
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    defined_funcs.add(node.name)
-
-        decorator_found = False
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                    continue
-                for deco in node.decorator_list:
-                    name = _extract_decorator_name(deco)
-                    if name and name not in stdlib_decorators and name in defined_funcs:
-                        decorator_found = True
-                        break
+        defined_funcs = self.facts.function_names(include_async=False)
+
+        decorated = self.facts.functions + self.facts.classes
+        decorator_found = any(
+            name and name not in stdlib_decorators and name in defined_funcs
+            for item in decorated
+            for name in item.decorators
+        )
 
         if not decorator_found:
             return False
 
         # 2. functools.wraps 사용 확인 (선택적 가산)
-        has_wraps = False
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Attribute) and node.attr == "wraps":
-                    has_wraps = True
-                elif isinstance(node, ast.Name) and node.id == "wraps":
-                    has_wraps = True
+        has_wraps = "wraps" in self.facts.attributes or "wraps" in self.facts.names
 
         # 데코레이터가 존재하면 통과 (wraps 없어도)
         return True
 
     def _check_type_hints(self) -> bool:
         """전체 제출 파일에서 타입 힌트가 있는 함수 3개 이상"""
-        hinted_count = 0
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if _has_type_hints(node):
-                        hinted_count += 1
+        hinted_count = sum(1 for fn in self.facts.functions if fn.has_type_hints)
         return hinted_count >= 3
 
     def _check_no_any(self) -> bool:
@@ -191,21 +164,11 @@ class PatternValidator(BaseValidator):
         total_annotations = 0
         any_count = 0
 
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    continue
-                # 반환 타입
-                if node.returns:
-                    total_annotations += 1
-                    if _is_any_annotation(node.returns):
-                        any_count += 1
-                # 매개변수 타입
-                for arg in node.args.args + node.args.kwonlyargs:
-                    if arg.annotation:
-                        total_annotations += 1
-                        if _is_any_annotation(arg.annotation):
-                            any_count += 1
+        for fn in self.facts.functions:
+            # 반환 타입 + 매개변수 타입
+            annotations = ([fn.returns] if fn.returns else []) + fn.arg_annotations
+            total_annotations += len(annotations)
+            any_count += sum(1 for ann in annotations if _is_any_annotation(ann))
 
         # annotation이 없으면 통과
         if total_annotations == 0:
@@ -215,27 +178,6 @@ class PatternValidator(BaseValidator):
 
 # -- 모듈 레벨 헬퍼 --
 
-def _extract_decorator_name(deco: ast.expr) -> str:
-    """데코레이터 노드에서 함수 이름 추출"""
-    if isinstance(deco, ast.Name):
-        return deco.id
-    if isinstance(deco, ast.Call):
-        return _extract_decorator_name(deco.func)
-    if isinstance(deco, ast.Attribute):
-        return deco.attr
-    return ""
-
-
-def _has_type_hints(func_node: ast.FunctionDef) -> bool:
-    """함수에 하나라도 타입 힌트가 있는지"""
-    if func_node.returns:
-        return True
-    for arg in func_node.args.args + func_node.args.kwonlyargs:
-        if arg.annotation:
-            return True
-    return False
-
-
 def _is_any_annotation(ann: ast.expr) -> bool:
     """annotation이 Any인지 확인"""
     if isinstance(ann, ast.Name) and ann.id == "Any":
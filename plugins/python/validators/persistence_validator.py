@@ -7,22 +7,18 @@ JSONL/JSON/CSV 형식을 사용하는지, pickle을 사용하지 않는지,
 
 AI 트랩: pickle 사용
 """
-import ast
 import csv
 import glob
 import io
 import json
 import os
 import tempfile
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.python.validators._helpers import (
-    import_student_module,
-    collect_py_files,
-    parse_all_files,
-)
+from plugins.python.validators._ast_facts import AstFacts, get_ast_facts
+from plugins.python.validators._helpers import import_student_module
 
 
 class PersistenceValidator(BaseValidator):
@@ -33,7 +29,7 @@ class PersistenceValidator(BaseValidator):
         self.submission_dir = ""
         self.storage_module = None
         self.models_module = None
-        self.parsed_trees: List[Tuple[str, ast.Module]] = []
+        self.facts: Optional[AstFacts] = None
         # save 후 생성된 파일 경로
         self.saved_file: Optional[str] = None
         # 임시 디렉토리 (save 테스트용)
@@ -44,8 +40,7 @@ class PersistenceValidator(BaseValidator):
         self.models_module = import_student_module(self.submission_dir, "models")
         self.storage_module = import_student_module(self.submission_dir, "storage")
 
-        py_files = collect_py_files(self.submission_dir)
-        self.parsed_trees = parse_all_files(py_files)
+        self.facts = get_ast_facts(self.submission_dir, self.context)
 
         # 미리 save를 실행하여 format/integrity가 roundtrip과 독립 동작하도록 함
         books = self._make_test_books()
@@ -224,16 +219,8 @@ class PersistenceValidator(BaseValidator):
         AST에서 pickle import 탐색 + .pkl/.pickle 파일 존재 확인
         """
         # 1. AST에서 pickle import 탐색
-        for _, tree in self.parsed_trees:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name == "pickle" or alias.name.startswith("pickle."):
-                            return False
-                if isinstance(node, ast.ImportFrom):
-                    if node.module and (node.module == "pickle"
-                                        or node.module.startswith("pickle.")):
-                        return False
+        if self.facts.imports_module("pickle"):
+            return False
 
         # 2. .pkl / .pickle 파일 존재 확인
         for pattern in ["*.pkl", "*.pickle"]:
@@ -1,18 +1,17 @@
 """
 프롬프트 관리 프로그램 CLI 검증 플러그인 (45점)
 
-subprocess.run + stdin pipe로 학습자의 prompt_manager.py REPL을 실행하여
+core.repl.run_script + stdin pipe로 학습자의 prompt_manager.py REPL을 실행하여
 메뉴 출력, 프롬프트 추가/목록/검색 등 기본 기능을 검증.
 
 AI 트랩: search_content (내용 검색 미포함), add_validation (빈 제목 검증 미구현)
 """
 import os
-import subprocess
-import sys
 from typing import Dict, Any, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
+from core.repl import run_script
 
 
 class PMCLIValidator(BaseValidator):
@@ -36,6 +35,7 @@ class PMCLIValidator(BaseValidator):
             points=5,
             validator=self._check_menu_display,
             hint="프로그램 실행 시 메뉴를 출력하고, '0' 입력으로 종료되어야 합니다",
+            independent=True,
         ))
 
         self.checklist.add_item(CheckItem(
@@ -44,6 +44,7 @@ class PMCLIValidator(BaseValidator):
             points=8,
             validator=self._check_add_prompt,
             hint="프롬프트를 추가한 후 목록에서 확인 가능해야 합니다",
+            independent=True,
         ))
 
         self.checklist.add_item(CheckItem(
@@ -52,6 +53,7 @@ class PMCLIValidator(BaseValidator):
             points=7,
             validator=self._check_list_prompts,
             hint="프로그램 시작 시 3개의 초기 프롬프트가 목록에 표시되어야 합니다",
+            independent=True,
         ))
 
         self.checklist.add_item(CheckItem(
@@ -60,6 +62,7 @@ class PMCLIValidator(BaseValidator):
             points=7,
             validator=self._check_category_filter,
             hint="카테고리를 선택하면 해당 카테고리의 프롬프트만 출력되어야 합니다",
+            independent=True,
         ))
 
         self.checklist.add_item(CheckItem(
@@ -68,6 +71,7 @@ class PMCLIValidator(BaseValidator):
             points=8,
             validator=self._check_search_title,
             hint="키워드로 검색하면 제목에 해당 키워드가 포함된 프롬프트를 출력하세요",
+            independent=True,
         ))
 
         self.checklist.add_item(CheckItem(
@@ -77,6 +81,7 @@ class PMCLIValidator(BaseValidator):
             validator=self._check_search_content,
             hint="검색 시 제목뿐 아니라 내용(content)에서도 키워드를 찾아야 합니다",
             ai_trap=True,
+            independent=True,
         ))
 
         self.checklist.add_item(CheckItem(
@@ -86,6 +91,7 @@ class PMCLIValidator(BaseValidator):
             validator=self._check_add_validation,
             hint="빈 제목을 입력하면 프롬프트를 추가하지 않고 안내 메시지를 출력하세요",
             ai_trap=True,
+            independent=True,
         ))
 
     def teardown(self) -> None:
@@ -95,20 +101,9 @@ class PMCLIValidator(BaseValidator):
 
     def _run_session(self, stdin_text: str, timeout: int = 5) -> Optional[str]:
         """prompt_manager.py를 subprocess로 실행하고 stdout 반환"""
-        if not self.script_path:
-            return None
-        try:
-            result = subprocess.run(
-                [sys.executable, self.script_path],
-                input=stdin_text,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.submission_dir,
-            )
-            return result.stdout
-        except (subprocess.TimeoutExpired, OSError):
-            return None
+        result = run_script(self.script_path, stdin_text, self.submission_dir,
+                            timeout=timeout, context=self.context)
+        return result.stdout if result else None
 
     # -- 검증 함수 --
 
@@ -1,18 +1,17 @@
 """
 프롬프트 관리 프로그램 상호작용 검증 플러그인 (30점)
 
-subprocess.run + stdin pipe로 상세 보기, 즐겨찾기 토글/목록,
+core.repl.run_script + stdin pipe로 상세 보기, 즐겨찾기 토글/목록,
 잘못된 입력 처리, 종료 메시지를 검증.
 
 AI 트랩: favorite_toggle (즐겨찾기 해제 불가 — True→False 토글 미구현)
 """
 import os
-import subprocess
-import sys
 from typing import Dict, Any, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
+from core.repl import run_script
 
 
 class PMInteractionValidator(BaseValidator):
@@ -36,6 +35,7 @@ class PMInteractionValidator(BaseValidator):
             points=8,
             validator=self._check_detail_view,
             hint="번호를 입력하면 제목, 카테고리, 내용을 모두 출력하세요",
+            independent=True,
         ))
 
         self.checklist.add_item(CheckItem(
@@ -45,6 +45,7 @@ class PMInteractionValidator(BaseValidator):
             validator=self._check_favorite_toggle,
             hint="이미 즐겨찾기인 프롬프트를 선택하면 즐겨찾기를 해제해야 합니다 (토글)",
             ai_trap=True,
+            independent=True,
         ))
 
         self.checklist.add_item(CheckItem(
@@ -53,6 +54,7 @@ class PMInteractionValidator(BaseValidator):
             points=7,
             validator=self._check_favorite_list,
             hint="즐겨찾기로 등록된 프롬프트만 목록에 표시하세요",
+            independent=True,
         ))
 
         self.checklist.add_item(CheckItem(
@@ -61,6 +63,7 @@ class PMInteractionValidator(BaseValidator):
             points=3,
             validator=self._check_invalid_input,
             hint="존재하지 않는 메뉴 번호 입력 시 안내 메시지를 출력하세요",
+            independent=True,
         ))
 
         self.checklist.add_item(CheckItem(
@@ -69,6 +72,7 @@ class PMInteractionValidator(BaseValidator):
             points=5,
             validator=self._check_exit_message,
             hint="'0'을 입력하여 종료할 때 종료 안내 메시지를 출력하세요",
+            independent=True,
         ))
 
     def teardown(self) -> None:
@@ -78,20 +82,9 @@ class PMInteractionValidator(BaseValidator):
 
     def _run_session(self, stdin_text: str, timeout: int = 5) -> Optional[str]:
         """prompt_manager.py를 subprocess로 실행하고 stdout 반환"""
-        if not self.script_path:
-            return None
-        try:
-            result = subprocess.run(
-                [sys.executable, self.script_path],
-                input=stdin_text,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.submission_dir,
-            )
-            return result.stdout
-        except (subprocess.TimeoutExpired, OSError):
-            return None
+        result = run_script(self.script_path, stdin_text, self.submission_dir,
+                            timeout=timeout, context=self.context)
+        return result.stdout if result else None
 
     # -- 검증 함수 --
 
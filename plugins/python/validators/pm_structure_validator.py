@@ -5,11 +5,11 @@ AST 분석으로 학습자의 prompt_manager.py 소스코드를 검증.
 함수 분리, list+dict 데이터 구조, 초기 데이터, 외부 라이브러리 미사용을 확인.
 """
 import ast
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.python.validators._helpers import collect_py_files, parse_all_files
+from plugins.python.validators._ast_facts import AstFacts, get_ast_facts
 
 
 # 허용 import 목록 (표준 라이브러리)
@@ -27,12 +27,11 @@ class PMStructureValidator(BaseValidator):
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
-        self.parsed: List[Tuple[str, ast.Module]] = []
+        self.facts: Optional[AstFacts] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        py_files = collect_py_files(self.submission_dir)
-        self.parsed = parse_all_files(py_files)
+        self.facts = get_ast_facts(self.submission_dir, self.context)
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -74,54 +73,28 @@ class PMStructureValidator(BaseValidator):
 
     def _check_func_separation(self) -> bool:
         """소스코드에 def 5개 이상 존재하는지 확인"""
-        total_funcs = 0
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    total_funcs += 1
+        total_funcs = sum(1 for fn in self.facts.functions if not fn.is_async)
         return total_funcs >= 5
 
     def _check_data_structure(self) -> bool:
         """AST에서 List + Dict 리터럴 사용 확인"""
-        has_list = False
-        has_dict = False
-
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.List):
-                    has_list = True
-                if isinstance(node, ast.Dict):
-                    has_dict = True
-                if has_list and has_dict:
-                    return True
-
-        return has_list and has_dict
+        return bool(self.facts.list_literals) and self.facts.dict_literal_count > 0
 
     def _check_initial_data(self) -> bool:
         """dict 3개 이상을 포함하는 list 리터럴이 있는지 확인"""
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.List):
-                    dict_count = sum(
-                        1 for elt in node.elts
-                        if isinstance(elt, ast.Dict)
-                    )
-                    if dict_count >= 3:
-                        return True
+        for node in self.facts.list_literals:
+            dict_count = sum(
+                1 for elt in node.elts
+                if isinstance(elt, ast.Dict)
+            )
+            if dict_count >= 3:
+                return True
         return False
 
     def _check_no_external_lib(self) -> bool:
         """import 문에서 외부 라이브러리를 사용하지 않는지 확인"""
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        top_module = alias.name.split(".")[0]
-                        if top_module not in _ALLOWED_MODULES:
-                            return False
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        top_module = node.module.split(".")[0]
-                        if top_module not in _ALLOWED_MODULES:
-                            return False
+        for imp in self.facts.imports:
+            # 상대 import(from . import x)는 module이 없으므로 제외
+            if imp.top_module is not None and imp.top_module not in _ALLOWED_MODULES:
+                return False
         return True
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+상주 채점 데몬
+
+미션 설정·검증기·웜 인터프리터 풀을 데워 둔 워커 프로세스를 유지하면서
+HTTP(TCP) 또는 Unix 도메인 소켓으로 채점 작업을 받음 (API는 core/grading_server.py 참고)
+
+예:
+    python scripts/grading_daemon.py --port 8765 --workers 4
+    python scripts/grading_daemon.py --unix-socket /run/grader.sock
+"""
+import argparse
+import os
+import signal
+import sys
+import threading
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.grading_server import create_server
+from core.grading_service import GradingService
+from utils.config_loader import list_mission_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="코디세이 상주 채점 데몬")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP 바인드 주소")
+    parser.add_argument("--port", type=int, default=8765, help="HTTP 포트")
+    parser.add_argument("--unix-socket", default=None,
+                        help="Unix 도메인 소켓 경로 (지정 시 TCP 대신 사용)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="채점 워커 프로세스 수 (동시 채점 수, 기본: CPU 코어 수)")
+    parser.add_argument("--max-queue", type=int, default=256,
+                        help="대기 + 실행 중 작업 최대 수 (초과 시 429 응답)")
+    parser.add_argument("--missions", nargs="*", default=None,
+                        help="미리 로드할 미션 ID (기본: missions/ 아래 전체)")
+    parser.add_argument("--output-dir", default="results", help="결과 저장 디렉토리")
+    parser.add_argument("--spool-dir", default=".grading_spool",
+                        help="업로드된 제출물 tarball을 풀 임시 디렉토리")
+    parser.add_argument("--cache-dir", default=".grading_cache",
+                        help="학습자 스크립트 실행 기록 캐시 디렉토리")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="실행 기록 캐시를 사용하지 않음")
+    parser.add_argument("--incremental", action="store_true",
+                        help="제출물/미션 설정/검증기 코드가 마지막 채점과 같으면 채점 생략")
+    parser.add_argument("--no-warm-pool", action="store_true",
+                        help="웜 인터프리터 풀 대신 매 실행마다 새 Python 프로세스 사용")
+    parser.add_argument("--profile-dir", default=None,
+                        help="검증기별 cProfile 통계(.prof)를 저장할 디렉토리")
+    parser.add_argument("--quiet", action="store_true", help="요청 로그 출력 안 함")
+    args = parser.parse_args()
+
+    missions = args.missions if args.missions else list_mission_ids()
+    service = GradingService(
+        output_dir=str(project_root / args.output_dir),
+        workers=args.workers,
+        max_queue=args.max_queue,
+        cache_dir=None if args.no_cache else str(project_root / args.cache_dir),
+        incremental=args.incremental,
+        warm_pool=not args.no_warm_pool,
+        profile_dir=str(project_root / args.profile_dir) if args.profile_dir else None,
+        preload=missions,
+        spool_dir=str(project_root / args.spool_dir),
+    )
+
+    print(f"🔥 워커 {args.workers}개 기동 중 (미션 {len(missions)}개 미리 로드)")
+    service.start()
+    try:
+        server = create_server(service, args.host, args.port,
+                               unix_socket=args.unix_socket, quiet=args.quiet)
+    except OSError as e:
+        service.shutdown(wait=False)
+        print(f"❌ Error: 서버를 열 수 없습니다 - {e}")
+        sys.exit(1)
+
+    # SIGTERM/SIGINT: 새 요청을 멈추고 진행 중 작업을 마친 뒤 종료
+    def on_signal(signum, frame):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, on_signal)
+    signal.signal(signal.SIGINT, on_signal)
+
+    address = args.unix_socket or f"http://{args.host}:{args.port}"
+    print(f"✅ 채점 데몬 대기 중: {address} (대기열 최대 {args.max_queue}건)")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        print("⏹️  종료 중: 진행 중인 채점을 마무리합니다")
+        service.shutdown(wait=True)
+        if args.unix_socket and os.path.exists(args.unix_socket):
+            os.unlink(args.unix_socket)
+
+
+if __name__ == "__main__":
+    main()
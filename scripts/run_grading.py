@@ -1,29 +1,89 @@
 #!/usr/bin/env python3
 """
 메인 채점 실행 스크립트
+
+단일 채점: --student-id + --mission-id (+ --submission-dir)
+배치 채점: --batch + (--mission-id + --submissions-root) 또는 --manifest
 """
+import os
 import sys
 import argparse
+import time
 from pathlib import Path
+from typing import Optional
 
 # 프로젝트 루트를 sys.path에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from core.grader import Grader
+from core.incremental import grading_fingerprint, load_previous, save_state
+from core.interpreter_pool import get_shared_pool
+from core.transcript_cache import TranscriptCache
+from core.batch_grader import (
+    discover_jobs,
+    load_manifest,
+    run_batch,
+    build_cohort_summary,
+    save_cohort_summary,
+)
 from utils.config_loader import load_mission_config
 
 
 def main():
     parser = argparse.ArgumentParser(description="코디세이 시험 자동 채점 시스템")
-    parser.add_argument("--student-id", required=True, help="학습자 ID")
-    parser.add_argument("--mission-id", required=True, help="미션 ID (예: linux_level1_mission01)")
+    parser.add_argument("--student-id", help="학습자 ID (단일 채점 시 필수)")
+    parser.add_argument("--mission-id", help="미션 ID (예: linux_level1_mission01)")
     parser.add_argument("--output-dir", default="results", help="결과 저장 디렉토리")
     parser.add_argument("--submission-dir", default=None,
                         help="학습자 제출물 디렉토리 경로 (Python 미션 등)")
+    parser.add_argument("--cache-dir", default=".grading_cache",
+                        help="학습자 스크립트 실행 기록 캐시 디렉토리")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="실행 기록 캐시를 사용하지 않고 모든 스크립트를 다시 실행")
+    parser.add_argument("--incremental", action="store_true",
+                        help="제출물/미션 설정/검증기 코드가 마지막 채점과 같으면 채점 생략")
+    parser.add_argument("--no-warm-pool", action="store_true",
+                        help="웜 인터프리터 풀 대신 매 실행마다 새 Python 프로세스 사용")
+    parser.add_argument("--profile-dir", default=None,
+                        help="검증기별 cProfile 통계(.prof)를 저장할 디렉토리 (지정 시 프로파일링)")
+
+    batch_group = parser.add_argument_group("배치 채점")
+    batch_group.add_argument("--batch", action="store_true",
+                             help="제출물 루트(또는 매니페스트)의 모든 학습자를 일괄 채점")
+    batch_group.add_argument("--submissions-root", default="submissions",
+                             help="학습자별 제출물 디렉토리가 모인 루트 (디렉토리 이름 = 학습자 ID)")
+    batch_group.add_argument("--manifest", default=None,
+                             help="매니페스트 CSV 경로 (student_id,mission_id,submission_dir)")
+    batch_group.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                             help="배치 채점 워커 프로세스 수 (기본: CPU 코어 수)")
 
     args = parser.parse_args()
 
+    if args.batch:
+        run_batch_mode(parser, args)
+    else:
+        if not args.student_id or not args.mission_id:
+            parser.error("단일 채점에는 --student-id와 --mission-id가 필요합니다")
+        run_single_mode(args)
+
+
+def resolve_cache_dir(args: argparse.Namespace) -> Optional[str]:
+    """--no-cache가 아니면 실행 기록 캐시 디렉토리 절대 경로 반환"""
+    if args.no_cache:
+        return None
+    return str(project_root / args.cache_dir)
+
+
+def resolve_profile_dir(args: argparse.Namespace) -> Optional[str]:
+    """--profile-dir 절대 경로 (미지정 시 None)"""
+    if not args.profile_dir:
+        return None
+    return str(project_root / args.profile_dir)
+
+
+def run_single_mode(args: argparse.Namespace) -> None:
+    """학습자 1명 채점"""
     # 1. 미션 설정 로드
     print(f"📝 미션 설정 로드 중: {args.mission_id}")
     config = load_mission_config(args.mission_id)
@@ -40,29 +100,40 @@ def main():
     print(f"   합격 기준: {config.get('passing_score', 70)}점 이상")
     print()
 
+    output_dir = project_root / args.output_dir
+
+    # 증분 모드: 마지막 채점 이후 변경이 없으면 이전 결과 재사용
+    fingerprint = None
+    if args.incremental:
+        fingerprint = grading_fingerprint(args.mission_id, config, config.get("submission_dir", ""))
+        previous = load_previous(str(output_dir), args.student_id, args.mission_id, fingerprint)
+        if previous:
+            print(f"⏭️  변경 없음: 이전 채점 결과를 재사용합니다")
+            print(f"결과: {'✅ PASS' if previous['overall_passed'] else '❌ FAIL'}")
+            print(f"점수: {previous['overall_score']:.2f}점")
+            print(f"\n결과 파일:")
+            print(f"  - {previous['json_path']}")
+            print(f"  - {previous['md_path']}")
+            sys.exit(0 if previous["overall_passed"] else 1)
+
     # 2. Grader 인스턴스 생성
-    grader = Grader(args.student_id, args.mission_id, config)
+    cache_dir = resolve_cache_dir(args)
+    cache = TranscriptCache(cache_dir) if cache_dir else None
+    pool = None if args.no_warm_pool else get_shared_pool()
+    grader = Grader(args.student_id, args.mission_id, config,
+                    transcript_cache=cache, interpreter_pool=pool,
+                    profile_dir=resolve_profile_dir(args))
 
     # 3. 채점 실행
     print(f"🔍 채점 시작: {args.student_id}")
     print("="*60)
     result = grader.execute()
 
-    # 4. 결과 저장
-    output_dir = project_root / args.output_dir
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    timestamp = result.timestamp.replace(":", "").replace("-", "").split(".")[0]
-
-    # JSON 저장
-    json_path = output_dir / f"{args.student_id}_{args.mission_id}_{timestamp}.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        f.write(result.to_json())
-
-    # Markdown 저장
-    md_path = output_dir / f"{args.student_id}_{args.mission_id}_{timestamp}.md"
-    with open(md_path, 'w', encoding='utf-8') as f:
-        f.write(result.to_markdown())
+    # 4. 결과 저장 (JSON + Markdown)
+    json_path, md_path = result.save(output_dir)
+    if fingerprint:
+        save_state(str(output_dir), args.student_id, args.mission_id, fingerprint,
+                   result.overall_passed, result.overall_score, json_path, md_path)
 
     # 5. 결과 출력
     print()
@@ -73,6 +144,11 @@ def main():
     print(f"미션: {args.mission_id}")
     print(f"결과: {'✅ PASS' if result.overall_passed else '❌ FAIL'}")
     print(f"점수: {result.overall_score:.2f}점")
+    print(f"소요 시간: {result.elapsed:.2f}초")
+    slowest = sorted(result.timing_summary()["validators"].items(),
+                     key=lambda kv: kv[1].get("total", 0), reverse=True)
+    for name, timings in slowest:
+        print(f"  - {name}: {timings.get('total', 0):.3f}초 (setup {timings.get('setup', 0):.3f}초)")
     print(f"\n결과 파일:")
     print(f"  - {json_path}")
     print(f"  - {md_path}")
@@ -82,5 +158,76 @@ def main():
     sys.exit(0 if result.overall_passed else 1)
 
 
+def run_batch_mode(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """제출물 루트 또는 매니페스트의 모든 학습자를 프로세스 풀로 채점"""
+    # 1. 작업 목록 수집
+    if args.manifest:
+        try:
+            jobs = load_manifest(args.manifest, default_mission_id=args.mission_id)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: 매니페스트 로드 실패 - {e}")
+            sys.exit(1)
+        label = args.mission_id or Path(args.manifest).stem
+    else:
+        if not args.mission_id:
+            parser.error("--manifest 없이 배치 채점하려면 --mission-id가 필요합니다")
+        jobs = discover_jobs(str(project_root / args.submissions_root), args.mission_id)
+        label = args.mission_id
+
+    if not jobs:
+        print("❌ Error: 채점할 제출물이 없습니다")
+        sys.exit(1)
+
+    output_dir = project_root / args.output_dir
+    workers = max(1, args.workers)
+    print(f"📦 배치 채점: {len(jobs)}명, 워커 {min(workers, len(jobs))}개")
+    print("="*60)
+
+    # 2. 프로세스 풀 채점 (완료 순서대로 진행 상황 출력)
+    done_count = 0
+
+    def on_done(summary):
+        nonlocal done_count
+        done_count += 1
+        if summary.get("error"):
+            status = f"⚠️ {summary['error']}"
+        elif summary.get("skipped"):
+            status = f"⏭️ 변경 없음 {summary['overall_score']:.2f}점"
+        else:
+            status = f"{'✅ PASS' if summary['overall_passed'] else '❌ FAIL'} {summary['overall_score']:.2f}점"
+        print(f"[{done_count}/{len(jobs)}] {summary['student_id']} ({summary['mission_id']}): "
+              f"{status} ({summary['elapsed']:.1f}s)")
+
+    start = time.perf_counter()
+    summaries = run_batch(jobs, str(output_dir), workers=workers, on_done=on_done,
+                          cache_dir=resolve_cache_dir(args), incremental=args.incremental,
+                          warm_pool=not args.no_warm_pool,
+                          profile_dir=resolve_profile_dir(args))
+    cohort = build_cohort_summary(summaries, time.perf_counter() - start)
+
+    # 3. 코호트 요약 저장
+    json_path, md_path = save_cohort_summary(cohort, str(output_dir), label)
+
+    print()
+    print(f"{'='*60}")
+    print(f"배치 채점 완료!")
+    print(f"{'='*60}")
+    print(f"학습자: {cohort['total_students']}명 (오류 {cohort['errors']}명)")
+    if args.incremental:
+        print(f"변경 없음: {cohort['skipped']}명")
+    print(f"합격: {cohort['passed']}명")
+    print(f"평균 점수: {cohort['average_score']:.2f}점")
+    print(f"소요 시간: {cohort['elapsed']:.1f}초")
+    for name, t in list(cohort["timing_summary"].items())[:3]:
+        print(f"  - {name}: 평균 {t['mean']:.3f}초, 최대 {t['max']:.3f}초")
+    print(f"\n코호트 요약:")
+    print(f"  - {json_path}")
+    print(f"  - {md_path}")
+    print(f"{'='*60}\n")
+
+    # 채점 자체가 실패한 작업이 있으면 비정상 종료 코드
+    sys.exit(1 if cohort["errors"] else 0)
+
+
 if __name__ == "__main__":
     main()
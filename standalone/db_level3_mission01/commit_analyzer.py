@@ -4,16 +4,36 @@
 
 CSV 데이터를 SQLite DB로 적재한 뒤,
 SQL 쿼리로 커밋 이력을 분석하고 텍스트 리포트를 생성한다.
+
+--bulk 모드는 대용량 저장소용 적재 경로: CSV 행을 스트리밍하여 executemany로 한 트랜잭션 안에서
+넣고, 인덱스는 적재 후에 만들며, 적재 중에만 PRAGMA(journal_mode, synchronous, cache_size)를
+조정한다. FK는 커밋 직전에 한 번에 확인하고, 진행 상황·처리량은 stderr로 출력한다.
+리포트는 기본 모드와 바이트 단위로 같다.
+
+--incremental 모드는 --db 파일을 실행 간에 유지하며 새 행만 적재한다 (CSV는 이어 쓰기 전제):
+작성자·파일 행은 id 최댓값(high-water mark) 초과분, 커밋은 DB에 없는 hash만 넣고,
+작성자/브랜치/파일별 요약 테이블을 새 행만큼 갱신하여 리포트가 commits·commit_files를 다시 훑지 않는다.
+브랜치는 head가 움직이므로 매번 최신 값으로 갱신한다.
 """
 import argparse
 import csv
 import os
 import sqlite3
+import sys
+import time
+
+BULK_PRAGMAS = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "cache_size": -65536,  # KiB 단위 (64MB)
+}
+PROGRESS_EVERY = 100_000
 
 
 # ── DB 스키마 생성 ──
 
-def create_tables(conn: sqlite3.Connection) -> None:
+def create_tables(conn: sqlite3.Connection, indexes: bool = True) -> None:
+    """테이블 생성 (indexes=False면 인덱스는 적재 후 create_indexes로 — --bulk)"""
     cur = conn.cursor()
     cur.executescript("""
         CREATE TABLE IF NOT EXISTS authors (
@@ -47,7 +67,14 @@ def create_tables(conn: sqlite3.Connection) -> None:
             file_path   TEXT NOT NULL,
             FOREIGN KEY (commit_hash) REFERENCES commits(hash)
         );
+    """)
+    conn.commit()
+    if indexes:
+        create_indexes(conn)
 
+
+def create_indexes(conn: sqlite3.Connection) -> None:
+    conn.executescript("""
         CREATE INDEX IF NOT EXISTS idx_commits_author ON commits(author_id);
         CREATE INDEX IF NOT EXISTS idx_commits_branch ON commits(branch_name);
         CREATE INDEX IF NOT EXISTS idx_commit_files_hash ON commit_files(commit_hash);
@@ -101,6 +128,290 @@ def load_csv(conn: sqlite3.Connection, data_dir: str) -> None:
     conn.commit()
 
 
+# ── 대량 적재 (--bulk) ──
+
+def _nullable(value: str):
+    return value if value else None
+
+
+# (테이블, CSV 파일, [(CSV 열, 변환 함수 또는 None=문자열 그대로), ...]) — load_csv와 같은 값 변환
+BULK_SOURCES = [
+    ("authors", "authors.csv",
+     [("author_id", int), ("name", None), ("email", None), ("team", None)]),
+    ("commits", "commits.csv",
+     [("hash", None), ("message", None), ("author_id", int), ("parent_hash", _nullable),
+      ("branch_name", None), ("created_at", None)]),
+    ("branches", "branches.csv",
+     [("name", None), ("head_hash", None), ("created_at", None)]),
+    ("commit_files", "commit_files.csv",
+     [("id", int), ("commit_hash", None), ("file_path", None)]),
+]
+
+
+class LoadProgress:
+    """테이블별 적재 행 수와 처리량(행/초)을 stream에 출력"""
+
+    def __init__(self, stream=sys.stderr, every: int = PROGRESS_EVERY):
+        self.stream = stream
+        self.every = every
+        self.total_rows = 0
+        self.started = time.perf_counter()
+
+    def track(self, table: str, rows):
+        """rows를 그대로 넘기면서 every행마다 진행 상황 출력"""
+        start = time.perf_counter()
+        count = 0
+        for row in rows:
+            yield row
+            count += 1
+            if count % self.every == 0:
+                self._report(table, count, start, done=False)
+        self.total_rows += count
+        self._report(table, count, start, done=True)
+
+    def finish(self, step: str) -> None:
+        elapsed = time.perf_counter() - self.started
+        print(f"[bulk] {step}: 누적 {self.total_rows:,}행, {elapsed:.2f}s", file=self.stream)
+
+    def _report(self, table: str, count: int, start: float, done: bool) -> None:
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed if elapsed > 0 else 0.0
+        state = "완료" if done else "진행"
+        print(f"[bulk] {table} {state}: {count:,}행 ({rate:,.0f}행/s)", file=self.stream)
+
+
+def read_csv_rows(path: str, columns):
+    """CSV를 한 행씩 읽어 columns 순서·변환을 적용한 값 목록으로 반환 (빈 줄 무시)"""
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        positions = [header.index(name) for name, _ in columns]
+        converters = [(slot, convert) for slot, (_, convert) in enumerate(columns) if convert]
+        for row in reader:
+            if not row:
+                continue
+            values = [row[i] for i in positions]
+            for slot, convert in converters:
+                values[slot] = convert(values[slot])
+            yield values
+
+
+def bulk_load_csv(conn: sqlite3.Connection, data_dir: str, progress=None) -> None:
+    """
+    CSV 4개를 executemany로 한 트랜잭션 안에서 적재한 뒤 인덱스 생성
+
+    create_tables(conn, indexes=False) 다음에 호출. 적재하는 동안만 BULK_PRAGMAS를 적용하고
+    끝나면 이전 값으로 되돌린다. FK는 행마다 확인하지 않고 커밋 전에 foreign_key_check로
+    한 번에 확인한다 (위반이 있으면 롤백 후 sqlite3.IntegrityError).
+    """
+    progress = progress or LoadProgress()
+    saved = {name: conn.execute(f"PRAGMA {name}").fetchone()[0]
+             for name in list(BULK_PRAGMAS) + ["foreign_keys"]}
+    for name, value in BULK_PRAGMAS.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+    conn.execute("PRAGMA foreign_keys = OFF")  # 트랜잭션 밖에서만 바꿀 수 있음
+    try:
+        conn.execute("BEGIN")
+        for table, filename, columns in BULK_SOURCES:
+            placeholders = ",".join("?" * len(columns))
+            rows = read_csv_rows(os.path.join(data_dir, filename), columns)
+            conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})",
+                             progress.track(table, rows))
+        violation = conn.execute("PRAGMA foreign_key_check").fetchone()
+        if violation is not None:
+            table, rowid, parent, _ = violation
+            raise sqlite3.IntegrityError(
+                f"FOREIGN KEY constraint failed: {table} rowid {rowid} → {parent}")
+        conn.commit()
+        progress.finish("적재")
+        create_indexes(conn)
+        progress.finish("인덱스 생성")
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        for name, value in saved.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+
+
+# ── 증분 적재 (--incremental) ──
+
+def _execute_statements(conn: sqlite3.Connection, script: str) -> None:
+    """script의 SQL 문을 하나씩 실행 (executescript와 달리 열린 트랜잭션을 먼저 커밋하지 않음)"""
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            conn.execute(statement)
+            statement = ""
+
+
+def create_summary_tables(conn: sqlite3.Connection) -> bool:
+    """
+    요약 테이블 생성 (이미 있으면 그대로, 커밋은 호출자가)
+
+    Returns:
+        새로 만들었으면 True (기존 DB라면 rebuild_summaries로 채워야 함)
+    """
+    existed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='author_summary'"
+    ).fetchone() is not None
+    _execute_statements(conn, """
+        CREATE TABLE IF NOT EXISTS author_summary (
+            author_id    INTEGER PRIMARY KEY REFERENCES authors(author_id),
+            commit_count INTEGER NOT NULL,
+            file_count   INTEGER NOT NULL
+        );
+
+        -- 작성자별 고유 파일 (file_count를 증분으로 세기 위한 집합)
+        CREATE TABLE IF NOT EXISTS author_files (
+            author_id INTEGER NOT NULL,
+            file_path TEXT NOT NULL,
+            PRIMARY KEY (author_id, file_path)
+        ) WITHOUT ROWID;
+
+        CREATE TABLE IF NOT EXISTS branch_summary (
+            name         TEXT PRIMARY KEY,
+            commit_count INTEGER NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS file_summary (
+            file_path    TEXT PRIMARY KEY,
+            change_count INTEGER NOT NULL
+        );
+    """)
+    return not existed
+
+
+def rebuild_summaries(conn: sqlite3.Connection) -> None:
+    """기본 모드로 만든 DB를 처음 --incremental로 열 때 요약 테이블을 전체 집계로 채움 (커밋은 호출자가)"""
+    _execute_statements(conn, """
+        DELETE FROM author_summary;
+        DELETE FROM author_files;
+        DELETE FROM branch_summary;
+        DELETE FROM file_summary;
+
+        INSERT INTO author_files
+        SELECT DISTINCT c.author_id, cf.file_path
+        FROM commits c JOIN commit_files cf ON c.hash = cf.commit_hash;
+
+        INSERT INTO author_summary
+        SELECT a.author_id,
+               (SELECT COUNT(*) FROM commits c WHERE c.author_id = a.author_id),
+               (SELECT COUNT(*) FROM author_files af WHERE af.author_id = a.author_id)
+        FROM authors a;
+
+        INSERT INTO branch_summary
+        SELECT branch_name, COUNT(*) FROM commits GROUP BY branch_name;
+
+        INSERT INTO file_summary
+        SELECT file_path, COUNT(DISTINCT commit_hash) FROM commit_files GROUP BY file_path;
+    """)
+
+
+def _stage(conn: sqlite3.Connection, table: str, rows, width: int) -> None:
+    """TEMP 테이블 staged_<table>에 rows 적재 (열 이름은 원본 테이블과 같음)"""
+    conn.execute(f"DROP TABLE IF EXISTS temp.staged_{table}")
+    conn.execute(f"CREATE TEMP TABLE staged_{table} AS SELECT * FROM {table} WHERE 0")
+    conn.executemany(f"INSERT INTO staged_{table} VALUES ({','.join('?' * width)})", rows)
+
+
+def incremental_import(conn: sqlite3.Connection, data_dir: str, stream=sys.stderr) -> dict:
+    """
+    CSV에서 아직 적재하지 않은 행만 넣고 요약 테이블 갱신 (한 트랜잭션)
+
+    create_tables(conn) 다음에 호출. 새 행은 TEMP 테이블에 모은 뒤 집합 연산으로 반영하므로
+    기존 행은 PRIMARY KEY/인덱스 조회로만 확인한다. 요약 테이블 생성·재집계까지 명시적 BEGIN 안에서
+    한 문장씩 실행하므로, 중간에 제약 위반이 나면 DB는 호출 전 상태로 돌아간다.
+
+    Returns:
+        테이블별 새로 적재한 행 수
+    """
+    sources = {table: (filename, columns) for table, filename, columns in BULK_SOURCES}
+
+    def rows(table, new_only=None):
+        filename, columns = sources[table]
+        for row in read_csv_rows(os.path.join(data_dir, filename), columns):
+            if new_only is None or row[0] > new_only:
+                yield row
+
+    try:
+        conn.execute("BEGIN")
+        if create_summary_tables(conn) and conn.execute("SELECT 1 FROM commits LIMIT 1").fetchone():
+            rebuild_summaries(conn)
+        author_hw = conn.execute("SELECT COALESCE(MAX(author_id), 0) FROM authors").fetchone()[0]
+        file_hw = conn.execute("SELECT COALESCE(MAX(id), 0) FROM commit_files").fetchone()[0]
+        _stage(conn, "authors", rows("authors", author_hw), 4)
+        _stage(conn, "commits", rows("commits"), 6)
+        _stage(conn, "branches", rows("branches"), 3)
+        _stage(conn, "commit_files", rows("commit_files", file_hw), 3)
+        _execute_statements(conn, """
+            -- 작성자: id high-water mark 초과분
+            INSERT INTO authors SELECT * FROM staged_authors;
+            INSERT OR IGNORE INTO author_summary
+            SELECT author_id, 0, 0 FROM staged_authors;
+
+            -- 커밋: DB에 없는 hash만 (PRIMARY KEY 조회)
+            CREATE TEMP TABLE new_commits AS
+            SELECT s.* FROM staged_commits s
+            WHERE NOT EXISTS (SELECT 1 FROM commits c WHERE c.hash = s.hash);
+            INSERT INTO commits SELECT * FROM new_commits;
+
+            INSERT INTO author_summary (author_id, commit_count, file_count)
+            SELECT author_id, COUNT(*), 0 FROM new_commits WHERE 1 GROUP BY author_id
+            ON CONFLICT (author_id) DO UPDATE SET commit_count = commit_count + excluded.commit_count;
+
+            INSERT INTO branch_summary (name, commit_count)
+            SELECT branch_name, COUNT(*) FROM new_commits WHERE 1 GROUP BY branch_name
+            ON CONFLICT (name) DO UPDATE SET commit_count = commit_count + excluded.commit_count;
+
+            -- 브랜치: head가 움직이므로 최신 값으로 갱신
+            INSERT INTO branches SELECT * FROM staged_branches WHERE 1
+            ON CONFLICT (name) DO UPDATE SET head_hash = excluded.head_hash,
+                                             created_at = excluded.created_at;
+
+            -- 파일 변경: id high-water mark 초과분 (같은 커밋·파일 쌍은 한 번만 셈)
+            CREATE TEMP TABLE new_changes AS
+            SELECT DISTINCT s.commit_hash, s.file_path FROM staged_commit_files s
+            WHERE NOT EXISTS (SELECT 1 FROM commit_files cf
+                              WHERE cf.commit_hash = s.commit_hash AND cf.file_path = s.file_path);
+            INSERT INTO commit_files SELECT * FROM staged_commit_files;
+
+            INSERT INTO file_summary (file_path, change_count)
+            SELECT file_path, COUNT(*) FROM new_changes WHERE 1 GROUP BY file_path
+            ON CONFLICT (file_path) DO UPDATE SET change_count = change_count + excluded.change_count;
+
+            CREATE TEMP TABLE new_author_files AS
+            SELECT DISTINCT c.author_id, n.file_path
+            FROM new_changes n JOIN commits c ON c.hash = n.commit_hash
+            WHERE NOT EXISTS (SELECT 1 FROM author_files af
+                              WHERE af.author_id = c.author_id AND af.file_path = n.file_path);
+            INSERT INTO author_files SELECT * FROM new_author_files;
+
+            INSERT INTO author_summary (author_id, commit_count, file_count)
+            SELECT author_id, 0, COUNT(*) FROM new_author_files WHERE 1 GROUP BY author_id
+            ON CONFLICT (author_id) DO UPDATE SET file_count = file_count + excluded.file_count;
+        """)
+        added = {
+            "authors": conn.execute("SELECT COUNT(*) FROM staged_authors").fetchone()[0],
+            "commits": conn.execute("SELECT COUNT(*) FROM new_commits").fetchone()[0],
+            "commit_files": conn.execute("SELECT COUNT(*) FROM staged_commit_files").fetchone()[0],
+        }
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        for table in ("staged_authors", "staged_commits", "staged_branches",
+                      "staged_commit_files", "new_commits", "new_changes", "new_author_files"):
+            conn.execute(f"DROP TABLE IF EXISTS temp.{table}")
+    print(f"[incremental] 신규 작성자 {added['authors']:,}, 커밋 {added['commits']:,}, "
+          f"파일 변경 {added['commit_files']:,}행", file=stream)
+    return added
+
+
 # ── 분석 쿼리 ──
 
 def author_contributions(conn: sqlite3.Connection):
@@ -171,13 +482,66 @@ def total_stats(conn: sqlite3.Connection):
     return total_commits, total_authors, total_branches
 
 
+# ── 요약 테이블 조회 (--incremental, 정렬은 위 쿼리와 동일) ──
+
+def summary_author_contributions(conn: sqlite3.Connection):
+    sql = """
+        SELECT a.name,
+               COALESCE(s.commit_count, 0) AS commit_count,
+               COALESCE(s.file_count, 0) AS file_count
+        FROM authors a
+        LEFT JOIN author_summary s ON a.author_id = s.author_id
+        ORDER BY commit_count DESC, a.author_id ASC
+    """
+    return conn.execute(sql).fetchall()
+
+
+def summary_branch_analysis(conn: sqlite3.Connection):
+    sql = """
+        SELECT b.name,
+               COALESCE(s.commit_count, 0) AS commit_count,
+               b.head_hash
+        FROM branches b
+        LEFT JOIN branch_summary s ON b.name = s.name
+        ORDER BY commit_count DESC, b.name ASC
+    """
+    return conn.execute(sql).fetchall()
+
+
+def summary_most_changed_files(conn: sqlite3.Connection):
+    sql = """
+        SELECT file_path, change_count
+        FROM file_summary
+        WHERE change_count >= 2
+        ORDER BY change_count DESC, file_path ASC
+    """
+    return conn.execute(sql).fetchall()
+
+
+def summary_total_stats(conn: sqlite3.Connection):
+    # 모든 커밋은 FK로 작성자 1명에 속하므로 작성자별 커밋 수의 합 = 전체 커밋 수
+    total_commits = conn.execute(
+        "SELECT COALESCE(SUM(commit_count), 0) FROM author_summary").fetchone()[0]
+    total_authors = conn.execute("SELECT COUNT(*) FROM authors").fetchone()[0]
+    total_branches = conn.execute("SELECT COUNT(*) FROM branches").fetchone()[0]
+    return total_commits, total_authors, total_branches
+
+
 # ── 리포트 생성 ──
 
-def generate_report(conn: sqlite3.Connection) -> str:
+def generate_report(conn: sqlite3.Connection, summaries: bool = False) -> str:
+    """리포트 텍스트 (summaries=True면 집계를 요약 테이블에서 읽음 — --incremental)"""
+    if summaries:
+        total_stats_fn, contributions_fn, branches_fn, files_fn = (
+            summary_total_stats, summary_author_contributions,
+            summary_branch_analysis, summary_most_changed_files)
+    else:
+        total_stats_fn, contributions_fn, branches_fn, files_fn = (
+            total_stats, author_contributions, branch_analysis, most_changed_files)
     lines = []
 
     # 전체 통계
-    t_commits, t_authors, t_branches = total_stats(conn)
+    t_commits, t_authors, t_branches = total_stats_fn(conn)
     lines.append("=== Commit Statistics ===")
     lines.append(f"Total Commits: {t_commits}")
     lines.append(f"Total Authors: {t_authors}")
@@ -185,7 +549,7 @@ def generate_report(conn: sqlite3.Connection) -> str:
     lines.append("")
 
     # 작성자별 기여
-    contribs = author_contributions(conn)
+    contribs = contributions_fn(conn)
     lines.append("Author Contributions (commits, files changed):")
     for i, (name, commits, files) in enumerate(contribs, 1):
         lines.append(f"  {i}. {name}: {commits} commits, {files} files changed")
@@ -193,7 +557,7 @@ def generate_report(conn: sqlite3.Connection) -> str:
 
     # 브랜치 분석
     lines.append("=== Branch Analysis ===")
-    branches = branch_analysis(conn)
+    branches = branches_fn(conn)
     for name, count, head in branches:
         lines.append(f"  {name}: {count} commits (head: {head})")
     lines.append("")
@@ -208,7 +572,7 @@ def generate_report(conn: sqlite3.Connection) -> str:
     # 파일 변경 분석
     lines.append("=== File Change Analysis ===")
     lines.append("Most Changed Files:")
-    files = most_changed_files(conn)
+    files = files_fn(conn)
     for i, (fp, cnt) in enumerate(files, 1):
         lines.append(f"  {i}. {fp}: {cnt} commits")
     lines.append("")
@@ -235,15 +599,28 @@ def main():
     parser.add_argument("--data-dir", required=True, help="CSV 데이터 디렉토리")
     parser.add_argument("--output", required=True, help="리포트 출력 경로")
     parser.add_argument("--db", required=True, help="SQLite DB 파일 경로")
+    parser.add_argument("--bulk", action="store_true",
+                        help="대량 적재 (executemany + 단일 트랜잭션 + 적재 후 인덱스, 진행 상황은 stderr)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="기존 --db를 유지하고 새 행만 적재 + 요약 테이블로 리포트 생성")
     args = parser.parse_args()
+    if args.bulk and args.incremental:
+        parser.error("--bulk와 --incremental은 함께 쓸 수 없습니다")
 
     conn = sqlite3.connect(args.db)
     conn.execute("PRAGMA foreign_keys = ON")
 
-    create_tables(conn)
-    load_csv(conn, args.data_dir)
-
-    report = generate_report(conn)
+    if args.bulk:
+        create_tables(conn, indexes=False)
+        bulk_load_csv(conn, args.data_dir)
+    elif args.incremental:
+        create_tables(conn)
+        incremental_import(conn, args.data_dir)
+    else:
+        create_tables(conn)
+        load_csv(conn, args.data_dir)
+
+    report = generate_report(conn, summaries=args.incremental)
 
     with open(args.output, "w", encoding="utf-8") as f:
         f.write(report)
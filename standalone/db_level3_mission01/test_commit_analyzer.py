@@ -486,3 +486,220 @@ class TestReport:
         pytest.fail(
             "File Change Analysis 섹션에서 순위 1위 항목을 찾을 수 없습니다"
         )
+
+
+# ---------------------------------------------------------------------------
+# --bulk 모드 (executemany + 단일 트랜잭션 + 적재 후 인덱스)
+# ---------------------------------------------------------------------------
+
+def _run_analyzer(data_dir, tmp_path, name, *extra):
+    """commit_analyzer 실행 → (리포트 바이트, stderr)"""
+    report_path = str(tmp_path / f"{name}.txt")
+    result = subprocess.run(
+        [sys.executable, SCRIPT_PATH,
+         "--data-dir", data_dir,
+         "--output", report_path,
+         "--db", str(tmp_path / f"{name}.db"), *extra],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        cwd=SUBMISSION_DIR,
+    )
+    assert result.returncode == 0, f"실행 실패: {result.stderr}"
+    with open(report_path, "rb") as f:
+        return f.read(), result.stderr
+
+
+def _write_generated_csv_files(data_dir, commits=3000):
+    """브랜치 분기·root commit 2개·커밋 없는 작성자·쉼표/따옴표 메시지가 섞인 저장소"""
+    import csv
+    import random
+
+    rng = random.Random(11)
+
+    def write(filename, header, rows):
+        with open(os.path.join(data_dir, filename), "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(header)
+            writer.writerows(rows)
+
+    write("authors.csv", ["author_id", "name", "email", "team"],
+          [(i, f"dev{i}", f"dev{i}@dev.com", "backend") for i in range(1, 42)])
+    heads = {}
+    commit_rows, file_rows = [], []
+    for i in range(commits):
+        branch = "main" if i == 0 else rng.choice(["main", "main", "feature/a", "feature/b", "docs"])
+        if branch not in heads:
+            heads[branch] = "" if branch in ("main", "docs") else heads["main"]
+        hash_val = f"{i:08x}"
+        message = f'Fix, "part {i}"' if i % 7 == 0 else f"Change {i}"
+        commit_rows.append((hash_val, message, rng.randint(1, 40), heads[branch], branch,
+                            f"2026-01-01 {i // 60 % 24:02d}:{i % 60:02d}:00"))
+        heads[branch] = hash_val
+        for path in rng.sample(range(300), rng.randint(1, 3)):
+            file_rows.append((len(file_rows) + 1, hash_val, f"src/file{path}.py"))
+    write("commits.csv", ["hash", "message", "author_id", "parent_hash", "branch_name", "created_at"],
+          commit_rows)
+    write("branches.csv", ["name", "head_hash", "created_at"],
+          [(name, head, "2026-01-01 00:00:00") for name, head in heads.items()]
+          + [("hotfix/idle", commit_rows[10][0], "2026-01-01 00:00:00")])
+    write("commit_files.csv", ["id", "commit_hash", "file_path"], file_rows)
+
+
+def test_bulk_mode_same_report(tmp_path):
+    """기본 CSV에서 --bulk 리포트가 기본 모드와 바이트 단위로 동일"""
+    data_dir = str(tmp_path / "data")
+    os.makedirs(data_dir)
+    _write_csv_files(data_dir)
+
+    default_report, _ = _run_analyzer(data_dir, tmp_path, "default")
+    bulk_report, stderr = _run_analyzer(data_dir, tmp_path, "bulk", "--bulk")
+    assert bulk_report == default_report
+    assert "[bulk] commit_files 완료: 25행" in stderr
+
+
+def test_bulk_mode_generated_csv(tmp_path):
+    """생성한 3000커밋 저장소에서 두 모드의 리포트·인덱스·PRAGMA 복원"""
+    data_dir = str(tmp_path / "data")
+    os.makedirs(data_dir)
+    _write_generated_csv_files(data_dir)
+
+    default_report, _ = _run_analyzer(data_dir, tmp_path, "default")
+    bulk_report, _ = _run_analyzer(data_dir, tmp_path, "bulk", "--bulk")
+    assert bulk_report == default_report
+
+    conn = sqlite3.connect(str(tmp_path / "bulk.db"))
+    try:
+        indexes = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'")}
+        assert indexes == {"idx_commits_author", "idx_commits_branch", "idx_commit_files_hash"}
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    finally:
+        conn.close()
+
+
+def test_bulk_mode_rolls_back_on_fk_violation(tmp_path):
+    """없는 커밋을 가리키는 commit_files 행이 있으면 아무 행도 남기지 않고 실패"""
+    data_dir = str(tmp_path / "data")
+    os.makedirs(data_dir)
+    _write_csv_files(data_dir)
+    with open(os.path.join(data_dir, "commit_files.csv"), "a", encoding="utf-8") as f:
+        f.write("26,zzzzzzz,src/ghost.py\n")
+
+    db_path = str(tmp_path / "bulk.db")
+    result = subprocess.run(
+        [sys.executable, SCRIPT_PATH, "--data-dir", data_dir,
+         "--output", str(tmp_path / "bulk.txt"), "--db", db_path, "--bulk"],
+        capture_output=True, text=True, timeout=15, cwd=SUBMISSION_DIR,
+    )
+    assert result.returncode != 0
+    assert "FOREIGN KEY" in result.stderr
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM commits").fetchone()[0] == 0
+    finally:
+        conn.close()
+
+
+def _truncate_generated_csv_files(src_dir, dst_dir, commits):
+    """생성 저장소의 앞쪽 commits개 커밋 시점 스냅샷 (CSV 이어 쓰기 전 상태)"""
+    import csv
+
+    def read(filename):
+        with open(os.path.join(src_dir, filename), encoding="utf-8", newline="") as f:
+            return list(csv.reader(f))
+
+    def write(filename, rows):
+        with open(os.path.join(dst_dir, filename), "w", encoding="utf-8", newline="") as f:
+            csv.writer(f, lineterminator="\n").writerows(rows)
+
+    commit_rows = read("commits.csv")[:commits + 1]
+    kept = {row[0] for row in commit_rows[1:]}
+    heads = {row[4]: row[0] for row in commit_rows[1:]}
+    write("commits.csv", commit_rows)
+    write("commit_files.csv", [row for i, row in enumerate(read("commit_files.csv"))
+                               if i == 0 or row[1] in kept])
+    last_author = max(int(row[2]) for row in commit_rows[1:])
+    write("authors.csv", [row for i, row in enumerate(read("authors.csv"))
+                          if i == 0 or int(row[0]) <= last_author])
+    write("branches.csv", [row[:1] + [heads[row[0]]] + row[2:] if row[0] in heads else row
+                           for row in read("branches.csv")])
+
+
+def test_incremental_mode_two_stage_import(tmp_path):
+    """스냅샷 → 이어 쓴 CSV 순서로 증분 적재해도 기본 모드 전체 적재와 같은 리포트"""
+    full_dir = str(tmp_path / "full")
+    partial_dir = str(tmp_path / "partial")
+    os.makedirs(full_dir)
+    os.makedirs(partial_dir)
+    _write_generated_csv_files(full_dir)
+    _truncate_generated_csv_files(full_dir, partial_dir, 1200)
+
+    baseline, _ = _run_analyzer(full_dir, tmp_path, "full")
+    partial_baseline, _ = _run_analyzer(partial_dir, tmp_path, "partial")
+    first, first_log = _run_analyzer(partial_dir, tmp_path, "inc", "--incremental")
+    second, second_log = _run_analyzer(full_dir, tmp_path, "inc", "--incremental")
+    assert first == partial_baseline
+    assert second == baseline
+    assert "커밋 1,200" in first_log
+    assert "커밋 1,800" in second_log
+    assert "신규 작성자 0," not in second_log  # 커밋 없는 작성자는 스냅샷 이후 추가됨
+
+    # 변경 없이 다시 실행하면 새 행 없음, 리포트 동일
+    again, again_log = _run_analyzer(full_dir, tmp_path, "inc", "--incremental")
+    assert again == baseline
+    assert "신규 작성자 0, 커밋 0, 파일 변경 0행" in again_log
+
+
+def test_incremental_mode_on_existing_db(tmp_path):
+    """기본 모드로 만든 DB에 --incremental을 쓰면 요약 테이블을 한 번 채워 같은 리포트"""
+    data_dir = str(tmp_path / "data")
+    os.makedirs(data_dir)
+    _write_csv_files(data_dir)
+    baseline, _ = _run_analyzer(data_dir, tmp_path, "shared")
+    report, log = _run_analyzer(data_dir, tmp_path, "shared", "--incremental")
+    assert report == baseline
+    assert "커밋 0" in log
+
+    conn = sqlite3.connect(str(tmp_path / "shared.db"))
+    try:
+        assert conn.execute("SELECT SUM(commit_count) FROM author_summary").fetchone()[0] == \
+            conn.execute("SELECT COUNT(*) FROM commits").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_incremental_mode_rolls_back_on_constraint_violation(tmp_path):
+    """이어 쓴 CSV에 중복 id가 있으면 새 커밋·요약 갱신을 남기지 않고 실패, 다음 실행은 이전 상태 그대로"""
+    data_dir = str(tmp_path / "data")
+    os.makedirs(data_dir)
+    _write_csv_files(data_dir)
+    baseline, _ = _run_analyzer(data_dir, tmp_path, "inc", "--incremental")
+
+    with open(os.path.join(data_dir, "commits.csv"), "a", encoding="utf-8") as f:
+        f.write("zzz999,Broken append,1,a1b2c3d,main,2026-01-20 09:00:00\n")
+    with open(os.path.join(data_dir, "commit_files.csv"), "a", encoding="utf-8") as f:
+        f.write("26,zzz999,src/a.py\n26,zzz999,src/b.py\n")
+
+    db_path = str(tmp_path / "inc.db")
+    result = subprocess.run(
+        [sys.executable, SCRIPT_PATH, "--data-dir", data_dir,
+         "--output", str(tmp_path / "broken.txt"), "--db", db_path, "--incremental"],
+        capture_output=True, text=True, timeout=15, cwd=SUBMISSION_DIR,
+    )
+    assert result.returncode != 0
+    assert "UNIQUE constraint failed" in result.stderr
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM commits WHERE hash = 'zzz999'").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM commit_files WHERE id = 26").fetchone()[0] == 0
+        assert conn.execute("SELECT SUM(commit_count) FROM author_summary").fetchone()[0] == \
+            conn.execute("SELECT COUNT(*) FROM commits").fetchone()[0]
+    finally:
+        conn.close()
+
+    # 깨진 줄을 걷어내면 실패 전 상태에서 다시 적재 — 리포트는 첫 실행과 같음
+    _write_csv_files(data_dir)
+    again, again_log = _run_analyzer(data_dir, tmp_path, "inc", "--incremental")
+    assert again == baseline
+    assert "신규 작성자 0, 커밋 0, 파일 변경 0행" in again_log
@@ -1,7 +1,23 @@
-"""서버 접근 로그 분석기 — 모범 답안"""
+"""서버 접근 로그 분석기 — 모범 답안
+
+기본 모드는 레코드 리스트를 만든 뒤 분석 함수별로 순회하고,
+--stream 모드는 파일을 한 번만 읽으며 집계(LogStats)하여 메모리가 행 수가 아닌
+고유 키(IP, 엔드포인트) 수에 비례함.
+--workers N 모드는 파일을 줄 경계에 맞춘 바이트 구간으로 나눠 프로세스 풀에서 구간별로
+집계한 뒤 파일 순서대로 병합함. 세 모드의 리포트는 동일.
+
+응답시간 합은 두 모드 모두 정확한 합(math.fsum / 부분합 목록)으로 계산하여
+더하는 순서와 무관하게 같은 평균이 나옴.
+"""
 import argparse
 import csv
+import io
+import math
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+STATUS_GROUPS = ["1xx", "2xx", "3xx", "4xx", "5xx"]
 
 
 def parse_log(filepath):
@@ -21,28 +37,36 @@ def analyze_ip_access(records):
         ip = r["ip"].strip()
         if ip:
             ip_count[ip] += 1
+    return top_ips_from_counts(ip_count)
+
+
+def top_ips_from_counts(ip_count):
+    """IP별 횟수 → 횟수 내림차순(동점 시 IP 내림차순) TOP 5"""
     sorted_ips = sorted(ip_count.items(), key=lambda x: (x[1], x[0]), reverse=True)
     return sorted_ips[:5]
 
 
 def analyze_status_codes(records):
     """HTTP 상태코드 그룹별 비율 계산 (1xx 포함)"""
-    total = len(records)
     groups = defaultdict(int)
     for r in records:
-        code = int(r["status_code"])
-        if 100 <= code < 200:
-            groups["1xx"] += 1
-        elif 200 <= code < 300:
-            groups["2xx"] += 1
-        elif 300 <= code < 400:
-            groups["3xx"] += 1
-        elif 400 <= code < 500:
-            groups["4xx"] += 1
-        elif 500 <= code < 600:
-            groups["5xx"] += 1
+        group = status_group(int(r["status_code"]))
+        if group:
+            groups[group] += 1
+    return status_ratios_from_counts(groups, len(records))
+
+
+def status_group(code):
+    """상태코드 → "1xx"~"5xx" (범위 밖이면 None)"""
+    if 100 <= code < 600:
+        return STATUS_GROUPS[code // 100 - 1]
+    return None
+
+
+def status_ratios_from_counts(groups, total):
+    """그룹별 횟수 → 전체 행 수 대비 비율(%) (0건 그룹 제외)"""
     result = {}
-    for group in ["1xx", "2xx", "3xx", "4xx", "5xx"]:
+    for group in STATUS_GROUPS:
         count = groups.get(group, 0)
         if count > 0:
             result[group] = round(count / total * 100, 1)
@@ -58,11 +82,162 @@ def analyze_slow_endpoints(records):
         endpoint_times[endpoint].append(response_time)
     averages = {}
     for endpoint, times in endpoint_times.items():
-        averages[endpoint] = round(sum(times) / len(times), 1)
+        averages[endpoint] = round(math.fsum(times) / len(times), 1)
+    return slow_endpoints_from_averages(averages)
+
+
+def slow_endpoints_from_averages(averages):
+    """엔드포인트별 평균 → 평균 내림차순 TOP 3 (동점 시 처음 등장한 순서)"""
     sorted_endpoints = sorted(averages.items(), key=lambda x: x[1], reverse=True)
     return sorted_endpoints[:3]
 
 
+def add_exact(partials, x):
+    """부분합 목록에 x를 오차 없이 더함 (Shewchuk — math.fsum(partials)가 정확한 합)"""
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+
+
+class LogStats:
+    """한 번 읽으며 누적하는 집계 (메모리: 고유 IP·엔드포인트 수에 비례)"""
+
+    def __init__(self):
+        self.total = 0
+        self.ip_count = defaultdict(int)
+        self.status_groups = defaultdict(int)
+        # 엔드포인트 → [응답시간 부분합 목록, 건수] (처음 등장한 순서 유지)
+        self.endpoint_totals = {}
+
+    def add(self, ip, status_code, endpoint, response_time_ms):
+        """CSV 1행 반영"""
+        self.total += 1
+        ip = ip.strip()
+        if ip:
+            self.ip_count[ip] += 1
+        group = status_group(int(status_code))
+        if group:
+            self.status_groups[group] += 1
+        totals = self.endpoint_totals.get(endpoint)
+        if totals is None:
+            totals = self.endpoint_totals[endpoint] = [[], 0]
+        add_exact(totals[0], float(response_time_ms))
+        totals[1] += 1
+
+    def merge(self, other):
+        """다른 구간의 집계를 합침 (파일 순서대로 합치면 엔드포인트 등장 순서도 보존)"""
+        self.total += other.total
+        for ip, count in other.ip_count.items():
+            self.ip_count[ip] += count
+        for group, count in other.status_groups.items():
+            self.status_groups[group] += count
+        for endpoint, (partials, count) in other.endpoint_totals.items():
+            totals = self.endpoint_totals.get(endpoint)
+            if totals is None:
+                self.endpoint_totals[endpoint] = [list(partials), count]
+                continue
+            for partial in partials:
+                add_exact(totals[0], partial)
+            totals[1] += count
+
+    def top_ips(self):
+        return top_ips_from_counts(self.ip_count)
+
+    def status_ratios(self):
+        return status_ratios_from_counts(self.status_groups, self.total)
+
+    def slow_endpoints(self):
+        averages = {endpoint: round(math.fsum(partials) / count, 1)
+                    for endpoint, (partials, count) in self.endpoint_totals.items()}
+        return slow_endpoints_from_averages(averages)
+
+
+def stream_log(filepath):
+    """CSV 로그를 한 행씩 읽으며 집계 (레코드 리스트를 만들지 않음)"""
+    stats = LogStats()
+    with open(filepath, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return stats
+        _aggregate_rows(stats, reader, _column_indexes(header))
+    return stats
+
+
+def _column_indexes(header):
+    return tuple(header.index(name) for name in ("ip", "status_code", "endpoint",
+                                                 "response_time_ms"))
+
+
+def _aggregate_rows(stats, rows, columns):
+    ip_idx, status_idx, endpoint_idx, time_idx = columns
+    for row in rows:
+        if not row:
+            continue  # DictReader와 같이 빈 줄 무시
+        stats.add(row[ip_idx], row[status_idx], row[endpoint_idx], row[time_idx])
+
+
+def chunk_ranges(filepath, chunks):
+    """
+    헤더 다음부터 파일 끝까지를 chunks개의 바이트 구간으로 나눔
+
+    각 경계는 다음 줄 시작으로 옮겨 한 줄이 두 구간에 걸치지 않게 함
+    (접근 로그는 따옴표 안 줄바꿈이 없다고 가정).
+
+    Returns:
+        (헤더 열 이름 목록, [(시작, 끝), ...]) — 빈 구간은 제외
+    """
+    size = os.path.getsize(filepath)
+    with open(filepath, "rb") as f:
+        header_line = f.readline()
+        header = next(csv.reader([header_line.decode("utf-8")]), None)
+        start = f.tell()
+        boundaries = [start]
+        for i in range(1, chunks):
+            offset = start + (size - start) * i // chunks
+            if offset <= boundaries[-1]:
+                continue
+            f.seek(offset - 1)
+            f.readline()  # offset-1부터 읽어 offset이 줄 시작이면 그대로 유지
+            boundaries.append(f.tell())
+        boundaries.append(size)
+    ranges = [(lo, hi) for lo, hi in zip(boundaries, boundaries[1:]) if lo < hi]
+    return header, ranges
+
+
+def _aggregate_chunk(filepath, start, end, columns):
+    """바이트 구간 [start, end)의 행 집계 (프로세스 풀 작업)"""
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    stats = LogStats()
+    _aggregate_rows(stats, csv.reader(io.StringIO(data.decode("utf-8"), newline="")), columns)
+    return stats
+
+
+def parallel_stream_log(filepath, workers):
+    """바이트 구간별 집계를 프로세스 풀에서 실행하고 파일 순서대로 병합"""
+    header, ranges = chunk_ranges(filepath, workers * 4)
+    stats = LogStats()
+    if header is None:
+        return stats
+    columns = _column_indexes(header)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_aggregate_chunk, filepath, start, end, columns)
+                   for start, end in ranges]
+        for future in futures:
+            stats.merge(future.result())
+    return stats
+
+
 def generate_report(top_ips, status_ratios, slow_endpoints):
     """리포트 텍스트 생성"""
     lines = []
@@ -84,12 +259,25 @@ def main():
     parser = argparse.ArgumentParser(description="서버 접근 로그 분석기")
     parser.add_argument("--log", required=True, help="입력 CSV 로그 파일 경로")
     parser.add_argument("--output", required=True, help="출력 리포트 파일 경로")
+    parser.add_argument("--stream", action="store_true",
+                        help="한 번 읽으며 집계 (대용량 로그용, 메모리가 행 수와 무관)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="2 이상이면 파일을 구간으로 나눠 N개 프로세스로 집계 (--stream 포함)")
     args = parser.parse_args()
 
-    records = parse_log(args.log)
-    top_ips = analyze_ip_access(records)
-    status_ratios = analyze_status_codes(records)
-    slow_endpoints = analyze_slow_endpoints(records)
+    if args.workers > 1 or args.stream:
+        if args.workers > 1:
+            stats = parallel_stream_log(args.log, args.workers)
+        else:
+            stats = stream_log(args.log)
+        top_ips = stats.top_ips()
+        status_ratios = stats.status_ratios()
+        slow_endpoints = stats.slow_endpoints()
+    else:
+        records = parse_log(args.log)
+        top_ips = analyze_ip_access(records)
+        status_ratios = analyze_status_codes(records)
+        slow_endpoints = analyze_slow_endpoints(records)
 
     report = generate_report(top_ips, status_ratios, slow_endpoints)
     with open(args.output, "w", encoding="utf-8") as f:
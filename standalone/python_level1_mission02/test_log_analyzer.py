@@ -262,3 +262,88 @@ def test_slow_values(report_content):
         assert value in report_content, (
             f"평균 응답시간 {value}ms가 리포트에 없습니다"
         )
+
+
+# ---------------------------------------------------------------------------
+# --stream 모드 (한 번 읽으며 집계) — 기본 모드와 같은 리포트
+# ---------------------------------------------------------------------------
+
+def _run_analyzer(csv_path, report_path, *extra):
+    result = subprocess.run(
+        [sys.executable, SCRIPT_PATH, "--log", csv_path, "--output", report_path, *extra],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        cwd=SUBMISSION_DIR,
+    )
+    assert result.returncode == 0, f"실행 실패: {result.stderr}"
+    with open(report_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_stream_mode_trap_csv(report_content, tmp_path):
+    """함정 CSV에서 --stream 리포트가 기본 모드와 동일"""
+    csv_path = str(tmp_path / "access_log.csv")
+    with open(csv_path, "w", encoding="utf-8") as f:
+        f.write(TRAP_CSV_HEADER + "\n")
+        for row in TRAP_CSV_ROWS:
+            f.write(",".join(row) + "\n")
+
+    assert _run_analyzer(csv_path, str(tmp_path / "report.txt"), "--stream") == report_content
+
+
+def _write_generated_csv(csv_path, rows=5000):
+    """소수 응답시간·빈 IP·동점이 섞인 로그"""
+    import random
+
+    rng = random.Random(7)
+    with open(csv_path, "w", encoding="utf-8") as f:
+        f.write(TRAP_CSV_HEADER + "\n")
+        for i in range(rows):
+            ip = "" if rng.random() < 0.05 else f"10.0.{rng.randrange(4)}.{rng.randrange(8)}"
+            f.write(f"2025-03-15T09:00:{i % 60:02d},{ip},GET,/api/e{rng.randrange(6)},"
+                    f"{rng.choice(['101', '200', '302', '404', '503'])},"
+                    f"{rng.uniform(0, 500):.3f}\n")
+
+
+def test_stream_mode_generated_csv(tmp_path):
+    """생성한 5000행에서 두 모드의 리포트가 동일"""
+    csv_path = str(tmp_path / "access_log.csv")
+    _write_generated_csv(csv_path)
+
+    default_report = _run_analyzer(csv_path, str(tmp_path / "default.txt"))
+    stream_report = _run_analyzer(csv_path, str(tmp_path / "stream.txt"), "--stream")
+    assert stream_report == default_report
+
+
+# ---------------------------------------------------------------------------
+# --workers 모드 (바이트 구간별 병렬 집계 + 병합)
+# ---------------------------------------------------------------------------
+
+def test_parallel_mode_same_report(tmp_path):
+    """구간을 나눠 병렬 집계해도 IP 동점 순서·엔드포인트 순서까지 기본 모드와 동일"""
+    csv_path = str(tmp_path / "access_log.csv")
+    _write_generated_csv(csv_path)
+
+    default_report = _run_analyzer(csv_path, str(tmp_path / "default.txt"))
+    for workers in ("2", "3"):
+        parallel_report = _run_analyzer(csv_path, str(tmp_path / f"p{workers}.txt"),
+                                        "--workers", workers)
+        assert parallel_report == default_report
+
+
+def test_chunk_ranges_align_on_lines(tmp_path):
+    """구간 경계가 모두 줄 시작이고, 구간을 이으면 헤더 뒤 전체와 같음"""
+    from log_analyzer import chunk_ranges
+
+    csv_path = str(tmp_path / "access_log.csv")
+    _write_generated_csv(csv_path, rows=100)
+    with open(csv_path, "rb") as f:
+        data = f.read()
+
+    header, ranges = chunk_ranges(csv_path, 7)
+    assert header == TRAP_CSV_HEADER.split(",")
+    body = data[data.index(b"\n") + 1:]
+    assert b"".join(data[lo:hi] for lo, hi in ranges) == body
+    for lo, _ in ranges:
+        assert data[lo - 1:lo] == b"\n"
@@ -0,0 +1,93 @@
+"""
+배치/상주 채점 작업(core.batch_grader.grade_job) 테스트
+"""
+import json
+import sys
+
+from core import batch_grader, incremental
+from core.batch_grader import GradingJob, grade_job
+from utils import config_loader
+
+CONFIG = """\
+name: "fake"
+passing_score: {passing}
+validators:
+  - module: "fakepkg.validators.fake_validator"
+    class: "FakeValidator"
+    weight: 100
+"""
+
+VALIDATOR = '''
+from core.base_validator import BaseValidator
+from core.check_item import CheckItem
+from fakepkg.validators._helpers import PASSED
+
+
+class FakeValidator(BaseValidator):
+    def setup(self):
+        pass
+
+    def build_checklist(self):
+        self.checklist.add_item(CheckItem(id="fake", description="fake", points=10,
+                                          validator=lambda: PASSED))
+
+    def teardown(self):
+        pass
+'''
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_worker_reloads_edited_config_and_validators(tmp_path, monkeypatch):
+    """상주 워커가 로드한 뒤 config.yaml/검증기 소스가 바뀌면 새 내용으로 다시 채점·기록"""
+    package = tmp_path / "src" / "fakepkg"
+    _write(package / "__init__.py", "")
+    _write(package / "validators" / "__init__.py", "")
+    _write(package / "validators" / "_helpers.py", "PASSED = False\n")
+    _write(package / "validators" / "fake_validator.py", VALIDATOR)
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, CONFIG.format(passing=70))
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+    monkeypatch.setattr(config_loader, "get_mission_config_path", lambda mission_id: config_path)
+    monkeypatch.setattr(incremental, "get_mission_config_path", lambda mission_id: config_path)
+    monkeypatch.setattr(batch_grader, "_loaded_missions", {})
+    submission = tmp_path / "submission"
+    submission.mkdir()
+    job = GradingJob("s1", "fake_level1_mission01", str(submission))
+    output_dir = str(tmp_path / "out")
+
+    def grade():
+        summary = grade_job(job, output_dir, incremental=True)
+        assert summary["error"] is None
+        return summary
+
+    try:
+        first = grade()
+        assert (first["overall_score"], first["skipped"]) == (0.0, False)
+        assert grade()["skipped"]
+
+        # 검증기가 import하는 helper만 바뀌어도 새 코드로 재채점
+        _write(package / "validators" / "_helpers.py", "PASSED = True\n")
+        second = grade()
+        assert (second["overall_score"], second["overall_passed"], second["skipped"]) == \
+            (100.0, True, False)
+        assert grade()["skipped"]
+
+        _write(config_path, CONFIG.format(passing=101))
+        third = grade()
+        assert (third["overall_passed"], third["skipped"]) == (False, False)
+        with open(third["json_path"], encoding="utf-8") as f:
+            assert json.load(f)["overall_score"] == 100.0
+
+        # 기록된 지문은 현재 디스크 기준 지문과 같음 (이전 코드 결과가 새 지문으로 남지 않음)
+        state = incremental._state_path(output_dir, "s1", job.mission_id)
+        with open(state, encoding="utf-8") as f:
+            recorded = json.load(f)["fingerprint"]
+        config = config_loader.load_mission_config(job.mission_id)
+        assert recorded == incremental.grading_fingerprint(job.mission_id, config, str(submission))
+    finally:
+        for name in [n for n in sys.modules if n == "fakepkg" or n.startswith("fakepkg.")]:
+            del sys.modules[name]
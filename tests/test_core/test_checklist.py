@@ -0,0 +1,176 @@
+"""
+체크리스트 실행 스케줄링(core.checklist) 테스트
+"""
+import threading
+
+import pytest
+
+from core.check_item import CheckItem
+from core.checklist import Checklist
+
+
+def _build(max_workers: int, log: list, wait_timeout: float) -> Checklist:
+    """
+    독립/비독립 항목이 섞인 체크리스트
+
+    a는 b가 끝날 때까지 기다리므로 동시 실행하면 b → a 순서로 끝남
+    (순차 실행에서는 기다리지 않음). c는 앞선 항목이 모두 끝났는지 확인
+    """
+    b_done = threading.Event()
+    checklist = Checklist("test", "test", passing_score=50, max_workers=max_workers)
+
+    def a():
+        b_done.wait(wait_timeout)
+        log.append("a")
+        return True
+
+    def b():
+        log.append("b")
+        b_done.set()
+        return False
+
+    def c():
+        passed = {"a", "b"} <= set(log)
+        log.append("c")
+        return passed
+
+    def d():
+        log.append("d")
+        return "c" in log
+
+    def e():
+        log.append("e")
+        raise RuntimeError("boom")
+
+    checklist.add_item(CheckItem(id="a", description="a", points=10, validator=a,
+                                 independent=True))
+    checklist.add_item(CheckItem(id="b", description="b", points=20, validator=b,
+                                 independent=True))
+    checklist.add_item(CheckItem(id="c", description="c", points=30, validator=c))
+    checklist.add_item(CheckItem(id="d", description="d", points=40, validator=d,
+                                 independent=True, depends_on=["c"]))
+    checklist.add_item(CheckItem(id="e", description="e", points=5, validator=e,
+                                 independent=True))
+    return checklist
+
+
+def _without_timing(result: dict) -> dict:
+    result = dict(result)
+    result["items"] = [{k: v for k, v in item.items() if k != "execution_time"}
+                       for item in result["items"]]
+    return result
+
+
+def test_concurrent_result_matches_sequential():
+    """max_workers>1이어도 items 순서, 점수, passed_items가 순차 실행과 같음"""
+    sequential_log, concurrent_log = [], []
+    sequential = _build(1, sequential_log, wait_timeout=0).execute_all()
+    concurrent = _build(4, concurrent_log, wait_timeout=5).execute_all()
+
+    assert sequential_log == ["a", "b", "c", "d", "e"]
+    assert concurrent_log.index("b") < concurrent_log.index("a") < concurrent_log.index("c")
+    assert concurrent_log.index("c") < concurrent_log.index("d")
+
+    assert _without_timing(concurrent) == _without_timing(sequential)
+    assert [item["id"] for item in concurrent["items"]] == ["a", "b", "c", "d", "e"]
+    assert [item["status"] for item in concurrent["items"]] == \
+        ["passed", "failed", "passed", "passed", "error"]
+    assert (concurrent["passed_items"], concurrent["earned_points"], concurrent["score"]) == \
+        (3, 80, round(80 / 105 * 100, 2))
+
+
+def test_non_independent_item_waits_for_all_previous():
+    """독립 항목 뒤의 비독립 항목은 앞선 항목이 모두 끝난 뒤 실행"""
+    log = []
+    release = threading.Event()
+    checklist = Checklist("test", "test", max_workers=4)
+
+    def slow():
+        release.wait(5)
+        log.append("slow")
+        return True
+
+    def fast():
+        log.append("fast")
+        release.set()
+        return True
+
+    checklist.add_item(CheckItem(id="slow", description="", points=1, validator=slow,
+                                 independent=True))
+    checklist.add_item(CheckItem(id="fast", description="", points=1, validator=fast,
+                                 independent=True))
+    checklist.add_item(CheckItem(id="after", description="", points=1,
+                                 validator=lambda: log.append("after") is None))
+
+    result = checklist.execute_all()
+    assert log == ["fast", "slow", "after"]
+    assert result["passed_items"] == 3
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_dependency_cycle_rejected(max_workers):
+    log = []
+    checklist = Checklist("test", "test", max_workers=max_workers)
+    checklist.add_item(CheckItem(id="x", description="", points=1, independent=True,
+                                 validator=lambda: log.append("x") is None, depends_on=["y"]))
+    checklist.add_item(CheckItem(id="y", description="", points=1, independent=True,
+                                 validator=lambda: log.append("y") is None, requires=["x"]))
+
+    with pytest.raises(ValueError, match="순환"):
+        checklist.execute_all()
+    assert log == []  # 순환은 실행 전에 검출
+
+
+@pytest.mark.parametrize("field", ["depends_on", "requires"])
+def test_unknown_dependency_rejected(field):
+    checklist = Checklist("test", "test", max_workers=4)
+    checklist.add_item(CheckItem(id="x", description="", points=1, independent=True,
+                                 validator=lambda: True, **{field: ["missing"]}))
+
+    with pytest.raises(ValueError, match="missing"):
+        checklist.execute_all()
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_failed_requirement_skips_chain(max_workers):
+    """requires 항목이 실패하면 그 항목을 requires로 둔 항목까지 연쇄로 SKIPPED"""
+    calls = []
+
+    def check(item_id, passed):
+        def validator():
+            calls.append(item_id)
+            return passed
+        return validator
+
+    checklist = Checklist("test", "test", max_workers=max_workers)
+    checklist.add_item(CheckItem(id="build", description="", points=10,
+                                 validator=check("build", False), independent=True))
+    checklist.add_item(CheckItem(id="run", description="", points=20,
+                                 validator=check("run", True), independent=True,
+                                 requires=["build"]))
+    checklist.add_item(CheckItem(id="report", description="", points=30,
+                                 validator=check("report", True), independent=True,
+                                 requires=["run"]))
+    checklist.add_item(CheckItem(id="style", description="", points=40,
+                                 validator=check("style", True), independent=True))
+
+    result = checklist.execute_all()
+    assert sorted(calls) == ["build", "style"]
+    assert [item["status"] for item in result["items"]] == \
+        ["failed", "skipped", "skipped", "passed"]
+    assert [item["error_message"] for item in result["items"][1:3]] == \
+        ["선행 항목 실패: build", "선행 항목 실패: run"]
+    assert (result["passed_items"], result["skipped_items"]) == (1, 2)
+    assert (result["earned_points"], result["total_points"]) == (40, 100)
+
+
+def test_skip_all_keeps_total_points():
+    checklist = Checklist("test", "test")
+    for item_id, points in (("a", 10), ("b", 30)):
+        checklist.add_item(CheckItem(id=item_id, description="", points=points,
+                                     validator=lambda: pytest.fail("실행되면 안 됨")))
+
+    result = checklist.skip_all("선행 조건 실패: Gate")
+    assert (result["score"], result["earned_points"], result["total_points"]) == (0, 0, 40)
+    assert (result["passed_items"], result["skipped_items"]) == (0, 2)
+    assert {item["error_message"] for item in result["items"]} == {"선행 조건 실패: Gate"}
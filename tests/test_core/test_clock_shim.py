@@ -0,0 +1,37 @@
+"""
+학습자 프로세스용 가상 시계(core/clock_shim) 테스트
+"""
+import os
+import subprocess
+import sys
+
+SHIM_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                        "core", "clock_shim")
+
+# 줄마다 time.time()/datetime.now()의 가상 경과 초와 date.today()가 가상 시각의 날짜인지 출력
+SCRIPT = """
+import pickle
+import time
+from datetime import date, datetime, timedelta
+
+start_time, start_dt = time.time(), datetime.now()
+for line in iter(input, "exit"):
+    now = datetime.now()
+    assert isinstance(now, datetime) and isinstance(datetime(2026, 1, 1), datetime)
+    assert pickle.loads(pickle.dumps(now)) == now
+    print(int(time.time() - start_time), int((now - start_dt).total_seconds()),
+          date.today() == date.fromtimestamp(time.time()), repr(now).startswith("datetime.datetime("))
+"""
+
+
+def _run(stdin_text: str) -> list:
+    env = dict(os.environ, PYTHONPATH=SHIM_DIR, GRADER_VIRTUAL_CLOCK="1")
+    proc = subprocess.run([sys.executable, "-c", SCRIPT], input=stdin_text, env=env,
+                          capture_output=True, text=True, timeout=10)
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout.splitlines()
+
+
+def test_time_and_datetime_advance_together():
+    lines = _run("tick\n__grader_clock__ advance 2\ntick\n__grader_clock__ advance 86400\ntick\nexit\n")
+    assert lines == ["0 0 True True", "2 2 True True", "86402 86402 True True"]
@@ -0,0 +1,140 @@
+"""
+시간 복잡도 검증(core.complexity) 테스트
+
+실제 실행 시간 대신 크기별 연산당 비용을 합성하여 결정적으로 확인
+"""
+import math
+import subprocess
+
+import pytest
+
+from core import complexity
+from core.check_item import CheckStatus
+from core.complexity import ComplexityCheckItem, ScalingResult, fit_exponent, probe_repl_scaling
+from core.sandbox import ResourceUsage
+
+SIZES = [1000, 4000, 16000]
+OPS = 200
+
+
+def constant_cost(size):
+    return 3e-5
+
+
+def linear_cost(size):
+    return 5e-6 + 2e-8 * size
+
+
+def log_cost(size):
+    return 3e-5 * (1 + 0.1 * math.log(size))
+
+
+def _workload(size):
+    return [f"SET k{i} v" for i in range(size)], [f"GET k{i}" for i in range(OPS)]
+
+
+def test_fit_exponent():
+    assert fit_exponent(SIZES, [constant_cost(n) for n in SIZES]) == pytest.approx(0.0)
+    assert fit_exponent(SIZES, [5e-9 * n for n in SIZES]) == pytest.approx(1.0)
+    assert fit_exponent(SIZES, [1e-12 * n * n for n in SIZES]) == pytest.approx(2.0)
+    assert abs(fit_exponent(SIZES, [log_cost(n) for n in SIZES])) < 0.1
+
+
+@pytest.mark.parametrize("sizes, values", [
+    ([1000, 1000], [1.0, 2.0]),
+    ([1000, 4000], [1.0]),
+    ([1000, 4000], [1.0, 0.0]),
+])
+def test_fit_exponent_rejects_invalid(sizes, values):
+    with pytest.raises(ValueError):
+        fit_exponent(sizes, values)
+
+
+def _item(probe, **kwargs):
+    return ComplexityCheckItem(id="complexity", description="", points=5, probe=probe, **kwargs)
+
+
+@pytest.mark.parametrize("cost, passed", [(constant_cost, True), (log_cost, True),
+                                          (linear_cost, False)])
+def test_check_item_max_exponent(cost, passed):
+    """O(1)/O(log n)은 통과, O(n)은 max_exponent=0.5에서 실패"""
+    per_op = [cost(n) for n in SIZES]
+    item = _item(lambda: ScalingResult(SIZES, per_op, fit_exponent(SIZES, per_op), 0.5))
+
+    assert item.execute() is passed
+    assert item.status == (CheckStatus.PASSED if passed else CheckStatus.FAILED)
+    data = item.to_dict()
+    assert data["complexity"]["max_exponent"] == 0.5
+    assert data["complexity"]["per_op_us"] == [round(v * 1e6, 3) for v in per_op]
+
+
+def test_check_item_probe_error_and_missing_script():
+    item = _item(lambda: ScalingResult(SIZES, [], None, 0.5, error="n=16000에서 10초 제한 시간 초과"))
+    assert item.execute() is False
+    assert item.to_dict()["error_message"] == "n=16000에서 10초 제한 시간 초과"
+
+    missing = _item(lambda: None)
+    assert missing.execute() is False
+    assert "complexity" not in missing.to_dict()
+
+
+class _FakeSandbox:
+    """
+    sandbox.run 대체: stdin 명령 수로 CPU 시간을 합성
+
+    명령별 시각 기록 파일을 쓰지 않으므로 CPU 시간 차분 경로로 측정됨.
+    짝수 번째 실행에는 잡음을 더해 반복 측정의 최솟값이 쓰이는지 확인
+    """
+
+    STARTUP = 0.02
+    PRELOAD_COST = 1e-6
+    NOISE = 0.003
+
+    def __init__(self, cost, timeout_size=None):
+        self.cost = cost
+        self.timeout_size = timeout_size
+        self.calls = []
+
+    def run(self, args, input=None, timeout=None, limits=None, **kwargs):
+        lines = input.splitlines()[:-1]  # 마지막 "exit" 제외
+        preload = [line for line in lines if line.startswith("SET")]
+        measured = len(lines) - len(preload)
+        size = len(preload)
+        if size == self.timeout_size:
+            raise subprocess.TimeoutExpired(args, timeout)
+        self.calls.append((size, measured))
+        noise = self.NOISE if len(self.calls) % 2 == 0 else 0.0
+        cpu = self.STARTUP + size * self.PRELOAD_COST + measured * self.cost(size) + noise
+        proc = subprocess.CompletedProcess(args, 0, "", "")
+        proc.usage = ResourceUsage(user_time=cpu, system_time=0.0, max_rss_kb=1, returncode=0)
+        return proc
+
+
+@pytest.mark.parametrize("cost, passed", [(constant_cost, True), (linear_cost, False)])
+def test_cpu_time_fallback(tmp_path, monkeypatch, cost, passed):
+    """명령별 시각이 없으면 preload만 / preload+측정 실행의 CPU 시간 차이로 측정"""
+    fake = _FakeSandbox(cost)
+    monkeypatch.setattr(complexity.sandbox, "run", fake.run)
+    script = tmp_path / "cli.py"
+    script.write_text("", encoding="utf-8")
+
+    result = probe_repl_scaling(str(script), _workload, "kv", cwd=str(tmp_path),
+                                sizes=SIZES, max_exponent=0.5, repeats=2)
+
+    # 크기마다 명령별 시각 측정 1회 + (preload만, preload+측정) 각 repeats회
+    assert [size for size, _ in fake.calls] == [n for n in SIZES for _ in range(5)]
+    assert result.per_op == pytest.approx([cost(n) for n in SIZES])
+    assert result.passed is passed
+    assert result.exponent == pytest.approx(fit_exponent(SIZES, [cost(n) for n in SIZES]))
+
+
+def test_timeout_stops_probe(tmp_path, monkeypatch):
+    fake = _FakeSandbox(linear_cost, timeout_size=SIZES[-1])
+    monkeypatch.setattr(complexity.sandbox, "run", fake.run)
+    script = tmp_path / "cli.py"
+    script.write_text("", encoding="utf-8")
+
+    result = probe_repl_scaling(str(script), _workload, "kv", sizes=SIZES, timeout=3)
+    assert not result.passed
+    assert result.error == "n=16000에서 3초 제한 시간 초과"
+    assert len(result.per_op) == 2
@@ -0,0 +1,237 @@
+"""
+채점 엔진(core.grader) 검증기 실행 테스트
+"""
+import importlib
+import sys
+
+import pytest
+import yaml
+
+from core.grader import Grader
+
+VALIDATORS = '''
+import threading
+
+from core.base_validator import BaseValidator
+from core.check_item import CheckItem
+
+# setup()이 호출된 검증기 (학습자 코드 실행 여부)
+CALLS = []
+# teardown()까지 끝난 검증기 (완료 순서)
+FINISHED = []
+FAST_DONE = threading.Event()
+
+
+class _Fake(BaseValidator):
+    """ITEMS의 항목별 통과 여부는 config의 fake.<클래스명>.<항목ID> (기본 통과)"""
+
+    ITEMS = ()
+
+    def setup(self):
+        CALLS.append(type(self).__name__)
+
+    def build_checklist(self):
+        passing = (self.config.get("fake") or {}).get(type(self).__name__) or {}
+        for item_id, points in self.ITEMS:
+            self.checklist.add_item(CheckItem(id=item_id, description=item_id, points=points,
+                                              validator=lambda ok=passing.get(item_id, True): ok))
+
+    def teardown(self):
+        FINISHED.append(type(self).__name__)
+
+
+class Gate(_Fake):
+    ITEMS = (("compile", 10), ("style", 10))
+
+
+class Dependent(_Fake):
+    ITEMS = (("run", 30),)
+
+
+class Chained(_Fake):
+    ITEMS = (("report", 20), ("extra", 20))
+
+
+class Slow(_Fake):
+    """Fast가 끝날 때까지 기다림 (동시 실행하면 목록 순서와 반대로 완료)"""
+
+    ITEMS = (("slow", 10),)
+
+    def setup(self):
+        super().setup()
+        FAST_DONE.wait(self.config.get("wait_timeout", 0))
+
+
+class Fast(_Fake):
+    ITEMS = (("fast", 10),)
+
+    def teardown(self):
+        super().teardown()
+        FAST_DONE.set()
+'''
+
+REQUIRES_CONFIG = """\
+name: "fake"
+passing_score: 50
+execution:
+  parallel_validators: {parallel}
+validators:
+  - module: "fakegrader.validators"
+    class: "Gate"
+    weight: 40
+  - module: "fakegrader.validators"
+    class: "Dependent"
+    weight: 30
+    requires: ["Gate.compile"]
+  - module: "fakegrader.validators"
+    class: "Chained"
+    weight: 30
+    requires: ["Dependent"]
+"""
+
+
+@pytest.fixture
+def fake_validators(tmp_path, monkeypatch):
+    """테스트용 검증기 패키지 (fakegrader.validators)"""
+    package = tmp_path / "src" / "fakegrader"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "validators.py").write_text(VALIDATORS, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+    try:
+        yield importlib.import_module("fakegrader.validators")
+    finally:
+        for name in [n for n in sys.modules if n == "fakegrader" or n.startswith("fakegrader.")]:
+            del sys.modules[name]
+
+
+def _results(result):
+    return {r["validator"]: r for r in result.results}
+
+
+@pytest.mark.parametrize("parallel", ["false", "true"])
+def test_requires_from_config_all_passed(fake_validators, parallel):
+    config = yaml.safe_load(REQUIRES_CONFIG.format(parallel=parallel))
+
+    result = Grader("s", "fake", config).execute()
+    assert sorted(fake_validators.CALLS) == ["Chained", "Dependent", "Gate"]
+    assert result.overall_score == 100.0
+    assert not any(r["result"].get("skipped") for r in result.results)
+
+
+@pytest.mark.parametrize("parallel", ["false", "true"])
+def test_failed_item_requirement_skips_validator_chain(fake_validators, parallel):
+    """검증기.항목ID 선행 조건이 실패하면 해당 검증기와 그 검증기를 requires로 둔 검증기까지 SKIPPED"""
+    config = yaml.safe_load(REQUIRES_CONFIG.format(parallel=parallel))
+    config["fake"] = {"Gate": {"compile": False}}
+
+    result = Grader("s", "fake", config).execute()
+    assert fake_validators.CALLS == ["Gate"]  # 건너뛴 검증기는 setup(학습자 코드 실행) 안 함
+
+    by_name = _results(result)
+    dependent = by_name["Dependent"]["result"]
+    assert dependent["skipped"] == "선행 조건 실패: Gate.compile"
+    assert by_name["Chained"]["result"]["skipped"] == "선행 조건 실패: Dependent"
+
+    # 건너뛴 검증기는 0점이지만 배점(total_points)과 가중치는 그대로 유지
+    for name, total in (("Dependent", 30), ("Chained", 40)):
+        skipped = by_name[name]["result"]
+        assert (skipped["score"], skipped["earned_points"], skipped["total_points"]) == \
+            (0, 0, total)
+        assert skipped["skipped_items"] == skipped["total_items"]
+        assert {item["status"] for item in skipped["items"]} == {"skipped"}
+        assert by_name[name]["weight"] == 30
+    assert result.overall_score == pytest.approx(50.0 * 0.4)
+    assert not result.overall_passed
+
+
+def test_item_requirement_ignores_other_items(fake_validators):
+    """선행 항목만 통과하면 검증기 자체가 불합격이어도 실행"""
+    config = yaml.safe_load(REQUIRES_CONFIG.format(parallel="false"))
+    config["passing_score"] = 100
+    config["fake"] = {"Gate": {"style": False}}
+
+    result = Grader("s", "fake", config).execute()
+    by_name = _results(result)
+    assert not by_name["Gate"]["result"]["is_passed"]
+    assert by_name["Dependent"]["result"]["is_passed"]
+    assert fake_validators.CALLS == ["Gate", "Dependent", "Chained"]
+
+
+def test_unknown_requirement_rejected(fake_validators):
+    config = yaml.safe_load(REQUIRES_CONFIG.format(parallel="false"))
+    config["validators"][1]["requires"] = ["Missing.compile"]
+
+    with pytest.raises(ValueError, match="Missing.compile"):
+        Grader("s", "fake", config).execute()
+    assert fake_validators.CALLS == []
+
+
+PARALLEL_CONFIG = """\
+name: "fake"
+passing_score: 50
+execution:
+  parallel_validators: {parallel}
+fake:
+  Fast: {{fast: false}}
+validators:
+  - module: "fakegrader.validators"
+    class: "Slow"
+    weight: 20
+  - module: "fakegrader.validators"
+    class: "Gate"
+    weight: 30
+  - module: "fakegrader.validators"
+    class: "Fast"
+    weight: 50
+"""
+
+
+def _without_timings(result):
+    return [(r["validator"], r["weight"],
+             {k: v for k, v in r["result"].items() if k not in ("timings", "items")},
+             [{k: v for k, v in item.items() if k != "execution_time"}
+              for item in r["result"]["items"]])
+            for r in result.results]
+
+
+def test_parallel_validators_keep_result_order(fake_validators):
+    """parallel_validators: true에서 완료 순서가 달라도 결과는 config 순서, 점수는 순차 실행과 같음"""
+    sequential = Grader("s", "fake", yaml.safe_load(PARALLEL_CONFIG.format(parallel="false")))
+    sequential_result = sequential.execute()
+    assert fake_validators.FINISHED == ["Slow", "Gate", "Fast"]
+
+    del fake_validators.FINISHED[:]
+    fake_validators.FAST_DONE.clear()
+    config = yaml.safe_load(PARALLEL_CONFIG.format(parallel="true"))
+    config["wait_timeout"] = 5
+    parallel_result = Grader("s", "fake", config).execute()
+
+    assert fake_validators.FINISHED.index("Fast") < fake_validators.FINISHED.index("Slow")
+    assert [r["validator"] for r in parallel_result.results] == ["Slow", "Gate", "Fast"]
+    assert _without_timings(parallel_result) == _without_timings(sequential_result)
+    assert parallel_result.overall_score == sequential_result.overall_score == 50.0
+
+
+@pytest.mark.parametrize("parallel", ["false", "true"])
+def test_requires_cycle_raised_from_execute(fake_validators, parallel):
+    config = yaml.safe_load(REQUIRES_CONFIG.format(parallel=parallel))
+    config["validators"][0]["requires"] = ["Chained"]
+
+    with pytest.raises(ValueError, match="순환"):
+        Grader("s", "fake", config).execute()
+    assert fake_validators.CALLS == []
+
+
+@pytest.mark.parametrize("setting, workers", [
+    (None, 1), (False, 1), (True, 3), (2, 2), (10, 3), (0, 1), (-2, 1), ("yes", 1),
+])
+def test_parallel_workers_setting(setting, workers):
+    """True는 검증기 수, 정수 N은 최대 N개, 그 외(bool 제외)는 순차 실행"""
+    config = {"validators": [], "execution": {"parallel_validators": setting}}
+    assert Grader("s", "fake", config)._parallel_workers(3) == workers
+
+
+def test_parallel_workers_sequential_when_profiling(tmp_path):
+    config = {"validators": [], "execution": {"parallel_validators": True}}
+    assert Grader("s", "fake", config, profile_dir=str(tmp_path))._parallel_workers(3) == 1
@@ -0,0 +1,48 @@
+"""
+프로파일링(Grader profile_dir)과 병렬 실행 설정 테스트
+"""
+import cProfile
+import threading
+from pathlib import Path
+
+from core import base_validator
+from core.grader import Grader
+from utils.config_loader import load_mission_config
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+MISSION_ID = "python_level1_mission03"  # parallel_validators: true + parallel_items: 4
+
+
+class _ExclusiveProfile(cProfile.Profile):
+    """Python 3.12+처럼 다른 프로파일러가 켜져 있으면 enable()에서 ValueError"""
+
+    active = None
+    lock = threading.Lock()
+
+    def enable(self, *args, **kwargs):
+        with self.lock:
+            if _ExclusiveProfile.active not in (None, self):
+                raise ValueError("Another profiling tool is already active")
+            _ExclusiveProfile.active = self
+        super().enable(*args, **kwargs)
+
+    def disable(self):
+        # dump_stats()도 내부에서 disable()을 부름
+        super().disable()
+        with self.lock:
+            if _ExclusiveProfile.active is self:
+                _ExclusiveProfile.active = None
+
+
+def test_profiling_runs_validators_and_items_sequentially(tmp_path, monkeypatch):
+    monkeypatch.setattr(base_validator.cProfile, "Profile", _ExclusiveProfile)
+    config = load_mission_config(MISSION_ID)
+    config["submission_dir"] = str(PROJECT_ROOT / "sample_submissions" / MISSION_ID)
+
+    grader = Grader("s", MISSION_ID, config, profile_dir=str(tmp_path))
+    result = grader.execute()
+
+    assert not [r for r in result.results if r["result"].get("error")]
+    assert result.overall_score == 100.0
+    profiles = sorted(p.name for p in tmp_path.glob("*.prof"))
+    assert profiles == sorted(f"s_{MISSION_ID}_{vc['class']}.prof" for vc in config["validators"])
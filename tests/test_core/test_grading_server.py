@@ -0,0 +1,70 @@
+"""
+채점 API 서버(core.grading_server) 요청 검증 테스트
+"""
+import json
+import socket
+import threading
+
+import pytest
+
+from core import grading_service
+from core.grading_server import create_server
+from core.grading_service import GradingService
+
+
+@pytest.fixture
+def server(tmp_path):
+    # 워커 풀은 시작하지 않음 (요청 검증만 확인, 통과한 제출은 503)
+    service = GradingService(str(tmp_path / "out"))
+    server = create_server(service, port=0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _request(server, head: str, body: bytes = b""):
+    """원시 HTTP 요청을 보내고 (상태 코드, JSON 본문) 반환"""
+    with socket.create_connection(server.server_address, timeout=10) as sock:
+        sock.sendall(head.encode("latin-1") + b"\r\n" + body)
+        sock.shutdown(socket.SHUT_WR)
+        data = b""
+        while chunk := sock.recv(65536):
+            data += chunk
+    status_line, _, rest = data.partition(b"\r\n")
+    return int(status_line.split()[1]), json.loads(rest.partition(b"\r\n\r\n")[2])
+
+
+def _post_jobs(server, payload: dict):
+    body = json.dumps(payload).encode("utf-8")
+    return _request(server, "POST /jobs HTTP/1.1\r\nHost: x\r\nContent-Type: application/json\r\n"
+                            f"Content-Length: {len(body)}\r\n", body)
+
+
+@pytest.mark.parametrize("length, status", [(None, 411), ("abc", 400), ("-5", 400)])
+def test_invalid_content_length_rejected(server, length, status):
+    head = "POST /jobs HTTP/1.1\r\nHost: x\r\n"
+    if length is not None:
+        head += f"Content-Length: {length}\r\n"
+    code, payload = _request(server, head, b'{"student_id": "s"}')
+    assert code == status
+    assert "Content-Length" in payload["error"]
+
+
+def test_mission_lookup_not_cached(server, tmp_path, monkeypatch):
+    """없는 미션은 400으로 거부하되, 실행 중 추가되면 다음 요청부터 받음"""
+    config_path = tmp_path / "missions" / "config.yaml"
+    monkeypatch.setattr(grading_service, "get_mission_config_path",
+                        lambda mission_id: config_path if mission_id == "new_mission" else None)
+    payload = {"student_id": "s", "mission_id": "new_mission", "submission_dir": str(tmp_path)}
+
+    code, body = _post_jobs(server, payload)
+    assert (code, "미션 설정" in body["error"]) == (400, True)
+
+    config_path.parent.mkdir()
+    config_path.write_text("name: new\n", encoding="utf-8")
+    code, _ = _post_jobs(server, payload)
+    assert code == 503  # 미션 확인은 통과, 워커 풀이 없어 거부
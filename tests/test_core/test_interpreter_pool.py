@@ -0,0 +1,142 @@
+"""
+웜 인터프리터 풀(core.interpreter_pool) 테스트
+
+풀 실행 결과는 `python script.py`로 새 인터프리터를 띄운 결과와 같아야 함
+"""
+import os
+import signal
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from core import sandbox
+from core.interpreter_pool import InterpreterPool
+
+pytestmark = pytest.mark.skipif(not InterpreterPool.is_supported(), reason="fork 미지원 플랫폼")
+
+RAISE_SCRIPT = '''
+import sys
+
+def parse(text):
+    return int(text)
+
+print("before")
+print("warn", file=sys.stderr)
+parse(sys.stdin.readline())
+'''
+
+
+@pytest.fixture
+def pool():
+    pool = InterpreterPool(max_workers=1)
+    try:
+        yield pool
+    finally:
+        pool.close()
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _fresh(script, stdin_text, cwd):
+    return subprocess.run([sys.executable, str(script)], input=stdin_text, cwd=str(cwd),
+                          capture_output=True, text=True, timeout=30)
+
+
+def test_student_module_shadows_preloaded(pool, tmp_path):
+    """미리 import한 json과 이름이 같은 학생 파일이 있으면 학생 파일이 import됨"""
+    _write(tmp_path / "json.py", "SOURCE = 'student'\n")
+    script = _write(tmp_path / "cli.py", "import json\nprint(json.SOURCE)\n")
+
+    result = pool.run(str(script), "", str(tmp_path), timeout=30)
+    assert (result.returncode, result.stdout, result.stderr) == (0, "student\n", "")
+
+    # 같은 서버의 다음 실행(다른 디렉토리)에는 학생 모듈이 남지 않음
+    other = tmp_path / "other"
+    other.mkdir()
+    script = _write(other / "cli.py", "import json\nprint(json.dumps([1]))\n")
+    assert pool.run(str(script), "", str(other), timeout=30).stdout == "[1]\n"
+
+
+@pytest.mark.parametrize("stdin_text", ["12\n", "abc\n"])
+def test_output_matches_fresh_interpreter(pool, tmp_path, stdin_text):
+    """stdout/stderr(traceback 포함)와 종료 코드가 새 인터프리터와 같음"""
+    script = _write(tmp_path / "cli.py", RAISE_SCRIPT)
+
+    result = pool.run(str(script), stdin_text, str(tmp_path), timeout=30)
+    expected = _fresh(script, stdin_text, tmp_path)
+    assert (result.returncode, result.stdout, result.stderr) == \
+        (expected.returncode, expected.stdout, expected.stderr)
+
+
+@pytest.mark.parametrize("code, stderr", [("sys.exit(3)", ""), ("sys.exit('bye')", "bye\n")])
+def test_exit_code_matches_fresh_interpreter(pool, tmp_path, code, stderr):
+    script = _write(tmp_path / "cli.py", f"import sys\n{code}\n")
+
+    result = pool.run(str(script), "", str(tmp_path), timeout=30)
+    expected = _fresh(script, "", tmp_path)
+    assert (result.returncode, result.stderr) == (expected.returncode, expected.stderr)
+    assert result.stderr == stderr
+
+
+def test_reused_after_timeout(pool, tmp_path):
+    """제한 시간 초과 후에도 같은 서버로 다음 실행을 처리"""
+    slow = _write(tmp_path / "slow.py", "import time\nprint('start', flush=True)\ntime.sleep(30)\n")
+    fast = _write(tmp_path / "fast.py", "print(input())\n")
+
+    with pytest.raises(subprocess.TimeoutExpired) as excinfo:
+        pool.run(str(slow), "", str(tmp_path), timeout=0.5)
+    assert excinfo.value.output == "start\n"
+
+    server = pool._idle[0].proc.pid
+    assert pool.run(str(fast), "ok\n", str(tmp_path), timeout=30).stdout == "ok\n"
+    assert [w.proc.pid for w in pool._idle] == [server]
+
+
+@pytest.mark.skipif(sandbox.resource is None, reason="resource 모듈 없음")
+def test_limits_applied_in_child(pool, tmp_path):
+    """자원 제한은 fork된 자식에만 적용되고 서버에는 남지 않음"""
+    script = _write(tmp_path / "cli.py",
+                    "import resource\nprint(*resource.getrlimit(resource.RLIMIT_AS))\n")
+    limits = sandbox.SandboxLimits(memory_mb=256).to_dict()
+
+    result = pool.run(str(script), "", str(tmp_path), timeout=30, limits=limits)
+    assert result.stdout.split() == [str(256 * 1024 * 1024)] * 2
+    assert result.usage["max_rss_kb"] > 0
+
+    unlimited = pool.run(str(script), "", str(tmp_path), timeout=30)
+    assert unlimited.stdout == _fresh(script, "", tmp_path).stdout
+
+    hog = _write(tmp_path / "hog.py", "data = bytearray(512 * 1024 * 1024)\n")
+    result = pool.run(str(hog), "", str(tmp_path), timeout=30, limits=limits)
+    assert result.returncode == 1 and "MemoryError" in result.stderr
+
+
+def test_recovers_from_dead_server(pool, tmp_path):
+    """유휴 서버가 죽었거나 실행 중 죽으면 다음 요청은 새 서버로 처리"""
+    script = _write(tmp_path / "cli.py", "print('ok')\n")
+    assert pool.run(str(script), "", str(tmp_path), timeout=30).stdout == "ok\n"
+
+    # 유휴 상태에서 죽은 서버
+    dead = pool._idle[0].proc
+    dead.kill()
+    dead.wait()
+    assert pool.run(str(script), "", str(tmp_path), timeout=30).stdout == "ok\n"
+    assert pool._idle[0].proc is not dead and pool._size == 1
+
+    # 실행 도중 죽은 서버 → OSError, 풀에서 빠지고 다음 요청은 새 서버로 처리
+    slow = _write(tmp_path / "slow.py", "import time\ntime.sleep(5)\n")
+    server = pool._idle[0].proc
+    timer = threading.Timer(0.5, os.kill, (server.pid, signal.SIGKILL))
+    timer.start()
+    try:
+        with pytest.raises(OSError):
+            pool.run(str(slow), "", str(tmp_path), timeout=10)
+    finally:
+        timer.cancel()
+    assert pool._size == 0
+    assert pool.run(str(script), "", str(tmp_path), timeout=30).stdout == "ok\n"
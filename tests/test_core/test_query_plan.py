@@ -0,0 +1,108 @@
+"""
+쿼리 실행 계획 검증(core.query_plan) 테스트
+"""
+import sqlite3
+
+import pytest
+
+from core.check_item import CheckStatus
+from core.query_plan import PlanExpectation, QueryPlanCheckItem, check_query_plan
+
+JOIN = PlanExpectation("join", "SELECT 1", indexed=("c",))
+
+SCHEMA = """
+    CREATE TABLE authors (author_id INTEGER PRIMARY KEY, name TEXT);
+    CREATE TABLE commits (hash TEXT PRIMARY KEY, author_id INTEGER);
+"""
+AUTHOR_COMMITS = PlanExpectation("author_commits", """
+    SELECT a.name, COUNT(c.hash)
+    FROM authors a LEFT JOIN commits c ON a.author_id = c.author_id
+    GROUP BY a.author_id
+""", indexed=("c",))
+
+
+class _PlanConnection:
+    """EXPLAIN QUERY PLAN 결과(detail)를 고정해 둔 연결"""
+
+    def __init__(self, details):
+        self.rows = [(i, 0, 0, detail) for i, detail in enumerate(details)]
+
+    def execute(self, sql):
+        assert sql.startswith("EXPLAIN QUERY PLAN ")
+        return self
+
+    def fetchall(self):
+        return self.rows
+
+
+@pytest.mark.parametrize("details, violations", [
+    # SQLite 3.36+ 형식
+    (["SCAN a", "SEARCH c USING INDEX idx_commits_author (author_id=?)"], []),
+    (["SCAN a", "SCAN c"], ["SCAN c"]),
+    # 구버전 형식 (TABLE 키워드 + AS 별칭)
+    (["SCAN TABLE authors AS a", "SEARCH TABLE commits AS c USING INDEX idx (author_id=?)"], []),
+    (["SCAN TABLE authors AS a", "SCAN TABLE commits AS c"], ["SCAN TABLE commits AS c"]),
+    # 쿼리마다 임시로 만드는 인덱스는 인덱스가 없는 것과 같음
+    (["SCAN a", "SEARCH c USING AUTOMATIC COVERING INDEX (author_id=?) LEFT-JOIN"],
+     ["SEARCH c USING AUTOMATIC COVERING INDEX (author_id=?) LEFT-JOIN"]),
+    (["SCAN TABLE authors AS a", "SEARCH TABLE commits AS c USING AUTOMATIC INDEX (author_id=?)"],
+     ["SEARCH TABLE commits AS c USING AUTOMATIC INDEX (author_id=?)"]),
+    # 별칭 없이 테이블 이름으로 나오는 경우, indexed가 아닌 테이블의 SCAN은 허용
+    (["SCAN commits"], []),
+])
+def test_plan_formats(details, violations):
+    result = check_query_plan(_PlanConnection(details), JOIN)
+    assert result.violations == violations
+    assert result.passed is (not violations)
+
+
+def test_table_name_without_alias():
+    expectation = PlanExpectation("files", "SELECT 1", indexed=("commit_files",))
+    result = check_query_plan(_PlanConnection(["SCAN TABLE commit_files"]), expectation)
+    assert result.violations == ["SCAN TABLE commit_files"]
+
+
+def _database(path, indexes):
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    if indexes:
+        conn.execute("CREATE INDEX idx_commits_author ON commits(author_id)")
+    conn.close()
+    return str(path)
+
+
+@pytest.mark.parametrize("indexes", [True, False])
+def test_check_item_on_sqlite(tmp_path, indexes):
+    """실제 SQLite에서 조인 키 인덱스가 없으면 AUTOMATIC 인덱스로 읽어 실패"""
+    db_path = _database(tmp_path / "test.db", indexes)
+    item = QueryPlanCheckItem(id="plan", description="", points=2,
+                              connect=lambda: sqlite3.connect(db_path),
+                              queries=[AUTHOR_COMMITS])
+
+    assert item.execute() is indexes
+    plans = item.to_dict()["query_plans"]
+    assert [plan["name"] for plan in plans] == ["author_commits"]
+    if indexes:
+        assert plans[0]["violations"] == []
+    else:
+        assert item.status == CheckStatus.FAILED
+        assert "AUTOMATIC" in plans[0]["violations"][0]
+        assert item.error_message.startswith("author_commits: ")
+
+
+def test_check_item_plan_error(tmp_path):
+    db_path = _database(tmp_path / "test.db", True)
+    missing = PlanExpectation("missing", "SELECT * FROM branches b", indexed=("b",))
+    item = QueryPlanCheckItem(id="plan", description="", points=2,
+                              connect=lambda: sqlite3.connect(db_path),
+                              queries=[AUTHOR_COMMITS, missing])
+
+    assert item.execute() is False
+    assert "no such table: branches" in item.error_message
+
+
+def test_check_item_without_db():
+    item = QueryPlanCheckItem(id="plan", description="", points=2, connect=lambda: None,
+                              queries=[AUTHOR_COMMITS])
+    assert item.execute() is False
+    assert "query_plans" not in item.to_dict()
@@ -0,0 +1,47 @@
+"""
+프롬프트 동기화 대화형 세션(core.repl_session) 테스트
+"""
+from core.grading_context import GradingContext
+from core.repl_session import run_session
+from core.transcript_cache import TranscriptCache
+
+ECHO_REPL = '''
+import time
+time.sleep(0.5)  # 느린 기동
+while True:
+    try:
+        line = input("> ")
+    except EOFError:
+        break
+    if line == "exit":
+        break
+    print(line.upper())
+'''
+
+
+def test_slow_startup_and_transcript_cache(tmp_path):
+    """기동이 느려도 기본 제한 시간 안에서 응답하고, 두 번째 채점은 캐시에서 같은 결과"""
+    submission = tmp_path / "submission"
+    submission.mkdir()
+    script = submission / "cli.py"
+    script.write_text(ECHO_REPL, encoding="utf-8")
+    cache = TranscriptCache(tmp_path / "cache")
+
+    first = run_session(str(script), ["a", "b c", "exit"], ">", cwd=str(submission),
+                        context=GradingContext(transcript_cache=cache))
+    assert first.started and first.has_prompt and not first.timed_out
+    assert first.texts == ["A", "B C", ""]
+    assert len(list(cache.cache_dir.glob("*.json"))) == 1
+
+    # 스크립트가 바뀌지 않았으면 다시 실행하지 않음 (실행하면 출력이 달라짐)
+    script.write_text(ECHO_REPL.replace("line.upper()", "line"), encoding="utf-8")
+    changed = run_session(str(script), ["a", "b c", "exit"], ">", cwd=str(submission),
+                          context=GradingContext(transcript_cache=cache))
+    assert changed.texts == ["a", "b c", ""]
+
+    script.write_text(ECHO_REPL, encoding="utf-8")
+    cached = run_session(str(script), ["a", "b c", "exit"], ">", cwd=str(submission),
+                         context=GradingContext(transcript_cache=cache))
+    assert cached.texts == first.texts
+    assert cached.timings == first.timings
+    assert cached.stdout == first.stdout
@@ -0,0 +1,52 @@
+"""
+학습자 프로세스 자원 제한/사용량 기록(core.sandbox) 테스트
+"""
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core import sandbox
+
+pytestmark = pytest.mark.skipif(sandbox.resource is None, reason="resource 모듈 없음 (Windows)")
+
+PRINT_LIMITS = "import resource; print(*resource.getrlimit(resource.RLIMIT_AS))"
+
+
+def test_limits_applied_from_worker_threads():
+    """병렬 검증기처럼 여러 스레드에서 동시에 실행해도 자식마다 제한이 걸리고 사용량이 기록됨"""
+    limits = sandbox.SandboxLimits(memory_mb=256)
+
+    def run(_):
+        with sandbox.collect_usage() as usages:
+            proc = sandbox.run([sys.executable, "-c", PRINT_LIMITS], timeout=30, limits=limits)
+        return proc, usages
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(run, range(8)))
+    for proc, usages in results:
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.split() == [str(256 * 1024 * 1024)] * 2
+        assert proc.usage is not None and proc.usage.max_rss_kb > 0
+        assert usages == [proc.usage]
+
+
+def test_stdin_and_output_roundtrip():
+    script = "import sys; data = sys.stdin.read(); print(len(data)); print('err', file=sys.stderr)"
+    proc = sandbox.run([sys.executable, "-c", script], input="x" * 200_000, timeout=30)
+    assert (proc.stdout, proc.stderr, proc.returncode) == ("200000\n", "err\n", 0)
+
+
+def test_timeout_kills_and_records_usage():
+    with sandbox.collect_usage() as usages:
+        with pytest.raises(subprocess.TimeoutExpired):
+            sandbox.run([sys.executable, "-c", "import time; time.sleep(30)"], timeout=0.5)
+    assert len(usages) == 1
+    assert usages[0].returncode < 0
+
+
+def test_cpu_limit_exceeded():
+    proc = sandbox.run([sys.executable, "-c", "while True: pass"], timeout=30,
+                       limits=sandbox.SandboxLimits(cpu_seconds=1))
+    assert proc.usage.limit_exceeded == "cpu"
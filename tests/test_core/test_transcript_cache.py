@@ -0,0 +1,33 @@
+"""
+실행 기록 디스크 캐시(core.transcript_cache) 테스트
+"""
+from core.transcript_cache import EVICT_EVERY, TranscriptCache
+
+
+def _dir_size(cache: TranscriptCache) -> int:
+    return sum(path.stat().st_size for path in cache.cache_dir.glob("*.json"))
+
+
+def test_put_get_roundtrip(tmp_path):
+    cache = TranscriptCache(tmp_path)
+    key = TranscriptCache.make_key("tree", "cli.py", "SET a 1\n", 10)
+    assert cache.get(key) is None
+    cache.put(key, "OK\n", "", 0)
+    assert cache.get(key) == {"stdout": "OK\n", "stderr": "", "returncode": 0}
+
+
+def test_size_limit_without_rescanning_every_put(tmp_path, monkeypatch):
+    """크기 제한은 지키면서 디렉토리 전체 재집계는 추정치 초과/주기마다만"""
+    cache = TranscriptCache(tmp_path, max_bytes=20_000)
+    scans = []
+    original = cache.evict
+    monkeypatch.setattr(cache, "evict", lambda: (scans.append(1), original())[1])
+
+    puts = EVICT_EVERY * 4
+    for i in range(puts):
+        cache.put(f"k{i:04d}", "x" * 100, "", 0)
+        assert _dir_size(cache) <= cache.max_bytes
+    assert 0 < len(scans) < puts // 4
+    # 가장 최근 항목은 남고 가장 오래된 항목은 삭제됨
+    assert cache.get(f"k{puts - 1:04d}") is not None
+    assert cache.get("k0000") is None
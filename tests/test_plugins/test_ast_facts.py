@@ -0,0 +1,51 @@
+"""
+단일 순회 AST 분석 엔진(plugins.python.validators._ast_facts) 테스트
+"""
+import ast
+import sys
+
+from plugins.python.validators._ast_facts import build_ast_facts
+
+SOURCE = '''
+from dataclasses import dataclass
+
+
+@dataclass
+class Book:
+    title: str
+
+    def __init__(self, title):
+        self.title = title
+
+        def nested():
+            self.cache = {}
+
+    def pages(self):
+        yield from [1, 2]
+'''
+
+
+def _facts(source: str):
+    return build_ast_facts([("book.py", ast.parse(source))])
+
+
+def test_scope_facts():
+    facts = _facts(SOURCE)
+    (book,) = facts.classes_named("Book")
+    assert book.decorators == ["dataclass"]
+    assert book.methods == ["__init__", "pages"]
+    assert book.field_annotations == ["title"]
+    # 중첩 함수의 self 할당도 __init__ 소유 클래스로 집계 (ast.walk 기반 판정과 동일)
+    assert book.init_attrs == {"title", "cache"}
+    assert [f.name for f in facts.functions if f.has_yield] == ["pages"]
+    assert facts.functions_named("nested")[0].class_name is None
+    assert facts.imports_module("dataclasses")
+    assert facts.dict_literal_count == 1
+
+
+def test_deeply_nested_expression():
+    """재귀 한도보다 깊은 식(1+1+…+1)도 RecursionError 없이 순회"""
+    depth = sys.getrecursionlimit() + 500
+    facts = _facts("BIG = " + "+".join(["1"] * depth) + "\nprint(BIG)\n")
+    assert "BIG" in facts.names
+    assert "print" in facts.called_names
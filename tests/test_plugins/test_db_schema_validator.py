@@ -0,0 +1,59 @@
+"""
+DB 미션 스키마 검증기(plugins.db.validators.schema_validator) 성능 항목 테스트
+"""
+from pathlib import Path
+
+from plugins.db.validators.schema_validator import SchemaValidator
+
+REFERENCE = (Path(__file__).resolve().parents[2]
+             / "standalone" / "db_level3_mission01" / "commit_analyzer.py")
+
+
+def _validate(tmp_path, replace=None):
+    """모범 답안(replace로 일부 수정)을 제출물로 채점한 항목별 결과"""
+    source = REFERENCE.read_text(encoding="utf-8")
+    if replace:
+        old, new = replace
+        assert old in source
+        source = source.replace(old, new)
+    submission = tmp_path / "submission"
+    submission.mkdir()
+    (submission / "commit_analyzer.py").write_text(source, encoding="utf-8")
+
+    validator = SchemaValidator({"submission_dir": str(submission)})
+    try:
+        result = validator.validate()
+    finally:
+        validator.context.close()
+    return {item["id"]: item for item in result["items"]}
+
+
+def test_reference_passes(tmp_path):
+    items = _validate(tmp_path)
+    assert {item_id: item["status"] for item_id, item in items.items()} == \
+        dict.fromkeys(items, "passed")
+    plans = {plan["name"]: plan for plan in items["query_plan_index"]["query_plans"]}
+    assert not any(plan["violations"] for plan in plans.values())
+
+
+def test_without_user_indexes_fails_query_plan(tmp_path):
+    """조인 키 인덱스가 없으면 SQLite가 AUTOMATIC 인덱스를 만들어 읽으므로 실패"""
+    items = _validate(tmp_path, (
+        "def create_indexes(conn: sqlite3.Connection) -> None:\n",
+        "def create_indexes(conn: sqlite3.Connection) -> None:\n    return\n",
+    ))
+    assert items["db_created"]["status"] == "passed"
+    assert items["index_exists"]["status"] == "failed"
+    plan_item = items["query_plan_index"]
+    assert plan_item["status"] == "failed"
+    violations = {plan["name"]: plan["violations"] for plan in plan_item["query_plans"]}
+    assert violations["author_contributions"] and violations["branch_analysis"]
+    assert all("AUTOMATIC" in step for steps in violations.values() for step in steps)
+
+
+def test_large_dataset_wrong_total(tmp_path):
+    """고정 CSV 항목은 통과해도 합성 저장소 리포트 합계가 틀리면 large_dataset 실패"""
+    items = _validate(tmp_path, ('f"Total Commits: {t_commits}"',
+                                 'f"Total Commits: {t_commits + 1}"'))
+    assert items["data_loaded"]["status"] == "passed"
+    assert items["large_dataset"]["status"] == "failed"
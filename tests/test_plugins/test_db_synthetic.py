@@ -0,0 +1,27 @@
+"""
+DB 미션 합성 저장소(plugins.db.validators._synthetic) 기대 정답값 테스트
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from plugins.db.validators._synthetic import generate_repository
+
+REFERENCE = (Path(__file__).resolve().parents[2]
+             / "standalone" / "db_level3_mission01" / "commit_analyzer.py")
+
+
+@pytest.mark.parametrize("commits, seed", [(300, 1), (1200, 2026)])
+def test_expected_report_matches_reference(tmp_path, commits, seed):
+    """기대 리포트가 모범 답안이 같은 CSV로 만든 리포트와 바이트 단위로 같음"""
+    data_dir = tmp_path / "data"
+    expected = generate_repository(str(data_dir), commits, seed)
+    report_path = tmp_path / "report.txt"
+    subprocess.run([sys.executable, str(REFERENCE), "--data-dir", str(data_dir),
+                    "--output", str(report_path), "--db", str(tmp_path / "analysis.db")],
+                   check=True, capture_output=True, timeout=60)
+
+    assert report_path.read_bytes() == expected.report().encode("utf-8")
+    assert expected.root_commits == 2
@@ -3,7 +3,7 @@ YAML 설정 파일 로더
 """
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 def load_mission_config(mission_id: str) -> Optional[Dict[str, Any]]:
@@ -16,6 +16,30 @@ def load_mission_config(mission_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         설정 딕셔너리 또는 None (파일 없을 경우)
     """
+    config_path = get_mission_config_path(mission_id)
+    if config_path is None or not config_path.exists():
+        return None
+
+    # YAML 파일 로드
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f)
+        return config
+    except Exception as e:
+        print(f"설정 파일 로드 실패: {e}")
+        return None
+
+
+def get_mission_config_path(mission_id: str) -> Optional[Path]:
+    """
+    미션 ID에 해당하는 config.yaml 경로
+
+    Args:
+        mission_id: 미션 ID (예: "linux_level1_mission01")
+
+    Returns:
+        config.yaml 경로 또는 None (미션 ID 형식 오류)
+    """
     # 미션 ID 파싱 (예: "linux_level1_mission01" → "linux/level1/mission_01")
     parts = mission_id.split("_")
     if len(parts) < 3:
@@ -27,21 +51,25 @@ def load_mission_config(mission_id: str) -> Optional[Dict[str, Any]]:
 
     # 프로젝트 루트 찾기
     project_root = Path(__file__).parent.parent
-    config_path = project_root / "missions" / category / level / mission / "config.yaml"
-
-    if not config_path.exists():
-        return None
-
-    # YAML 파일 로드
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-        return config
-    except Exception as e:
-        print(f"설정 파일 로드 실패: {e}")
-        return None
+    return project_root / "missions" / category / level / mission / "config.yaml"
 
 
 def get_project_root() -> Path:
     """프로젝트 루트 디렉토리 반환"""
     return Path(__file__).parent.parent
+
+
+def list_mission_ids() -> List[str]:
+    """
+    missions/ 아래 config.yaml이 있는 모든 미션 ID (이름순)
+
+    Returns:
+        미션 ID 리스트 (예: ["algo_level2_mission01", "ds_level1_mission01", ...])
+    """
+    missions_root = get_project_root() / "missions"
+    mission_ids = []
+    for config_path in missions_root.glob("*/*/*/config.yaml"):
+        mission_dir = config_path.parent
+        category, level = mission_dir.parent.parent.name, mission_dir.parent.name
+        mission_ids.append(f"{category}_{level}_{mission_dir.name}")
+    return sorted(mission_ids)
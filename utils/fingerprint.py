@@ -0,0 +1,79 @@
+"""
+파일/디렉토리 내용 지문(fingerprint) 계산
+
+제출물이 바뀌었는지 판단하기 위한 SHA-256 해시.
+경로 순서와 무관하게 같은 내용이면 같은 지문이 나오도록 정렬 후 계산
+"""
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable, Union
+
+# 실행 중 생성되는 캐시 파일은 지문에서 제외
+IGNORED_DIRS = {"__pycache__", ".pytest_cache", ".mypy_cache", ".git"}
+IGNORED_SUFFIXES = (".pyc", ".pyo")
+
+_CHUNK_SIZE = 1 << 16
+
+
+def _update_with_file(digest, path: Path) -> None:
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+
+def fingerprint_file(path: Union[str, Path]) -> str:
+    """
+    파일 1개의 내용 해시
+
+    Returns:
+        SHA-256 hex 문자열 (파일이 없으면 빈 문자열)
+    """
+    path = Path(path)
+    if not path.is_file():
+        return ""
+    digest = hashlib.sha256()
+    _update_with_file(digest, path)
+    return digest.hexdigest()
+
+
+def fingerprint_tree(root: Union[str, Path]) -> str:
+    """
+    디렉토리 전체의 내용 해시 (상대 경로 + 파일 내용)
+
+    __pycache__ 등 실행 부산물은 제외하므로, 채점 실행 전후로 지문이 달라지지 않음
+
+    Returns:
+        SHA-256 hex 문자열 (디렉토리가 없으면 빈 문자열)
+    """
+    root = Path(root)
+    if not root.is_dir():
+        return ""
+
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in IGNORED_DIRS)
+        for name in sorted(filenames):
+            if name.endswith(IGNORED_SUFFIXES):
+                continue
+            path = Path(dirpath) / name
+            rel = path.relative_to(root).as_posix()
+            digest.update(rel.encode("utf-8") + b"\0")
+            _update_with_file(digest, path)
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def fingerprint_paths(paths: Iterable[Union[str, Path]]) -> str:
+    """
+    여러 파일/디렉토리의 지문을 하나로 합친 해시 (입력 순서 무관)
+
+    Returns:
+        SHA-256 hex 문자열
+    """
+    digest = hashlib.sha256()
+    for path in sorted(set(str(p) for p in paths)):
+        p = Path(path)
+        part = fingerprint_tree(p) if p.is_dir() else fingerprint_file(p)
+        digest.update(f"{path}\0{part}\0".encode("utf-8"))
+    return digest.hexdigest()